@@ -1,6 +1,5 @@
 """AI Agents module for resume analysis using LangGraph."""
 
-from .orchestrator import ResumeAnalysisOrchestrator
 from .models import (
     ResumeAnalysisRequest,
     ResumeAnalysisResponse,
@@ -29,4 +28,16 @@ __all__ = [
     "get_industry_config"
 ]
 
-__version__ = "2.0.0"
\ No newline at end of file
+__version__ = "2.0.0"
+
+
+def __getattr__(name):
+    """Import the orchestrator (LangGraph, OpenAI SDK) on first use.
+
+    Importing ai_agents for its config or utils then stays cheap, which
+    keeps the API process's cold start short.
+    """
+    if name == "ResumeAnalysisOrchestrator":
+        from .orchestrator import ResumeAnalysisOrchestrator
+        return ResumeAnalysisOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
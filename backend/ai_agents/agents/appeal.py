@@ -2,11 +2,13 @@
 
 import logging
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from .base import BaseAgent
-from ai_agents.config import get_industry_config
-from ai_agents.utils import log_agent_start, log_agent_complete, build_structure_context
+from ai_agents.utils import (
+    log_agent_start, log_agent_complete, build_metrics_context, build_resume_text, build_structure_context,
+    CompiledPrompt
+)
 from ai_agents.services import ScoreCalculator, SummaryGenerator
 
 logger = logging.getLogger(__name__)
@@ -15,23 +17,25 @@ logger = logging.getLogger(__name__)
 class AppealAgent(BaseAgent):
     """Agent that analyzes resume appeal and competitiveness for specific industries."""
 
-    def __init__(self, api_key: Optional[str] = None, agent_config=None):
+    def __init__(self, api_key: Optional[str] = None, agent_config=None, config_snapshot=None):
         """Initialize the Appeal Agent.
 
         Args:
             api_key: OpenAI API key (defaults to environment variable)
             agent_config: Optional AgentBehaviorConfig instance
+            config_snapshot: Optional ConfigSnapshot (defaults to the current one)
         """
-        super().__init__(api_key, agent_config)
+        super().__init__(api_key, agent_config, config_snapshot)
         self.prompt_template = self._load_prompt_template("appeal_prompt")
         self.parsing_config = self.prompt_template.get("parsing", {})
-        self.industry_config_loader = get_industry_config()
+        self.industry_config_loader = self.config_snapshot.industry_config
 
         # Initialize services
         self.score_calculator = ScoreCalculator(self.agent_config.scoring_weights)
         self.summary_generator = SummaryGenerator(
             self.agent_config.market_tier_thresholds,
-            self.agent_config.score_categories
+            self.agent_config.score_categories,
+            config_snapshot=self.config_snapshot
         )
     
     async def analyze(self, state: Dict[str, Any]) -> Dict[str, Any]:
@@ -53,28 +57,18 @@ class AppealAgent(BaseAgent):
             # Build structure context from previous analysis using utility
             structure_context = build_structure_context(state)
 
-            # Format appeal_points_description from industries.yaml
-            appeal_points_desc = self._format_appeal_points(industry_data.get("appeal_points", []))
+            # Industry fragments are pre-rendered once per template and industry
+            system_template, user_template = self._industry_prompts(industry, industry_data)
 
-            # Prepare prompt variables
+            # Render the per-analysis variables (single pass)
             industry_name = industry_data["display_name"]
             prompt_vars = {
-                "{resume_text}": state["resume_text"],
-                "{industry}": industry,
-                "{industry_title}": industry_name,
-                "{industry_upper}": industry_name.upper(),
-                "{key_skills_list}": ", ".join(industry_data["key_skills"]),
-                "{appeal_points_description}": appeal_points_desc,
-                "{structure_context_section}": structure_context
+                "resume_text": build_resume_text(state, self.agent_config.get_agent_sections("appeal")),
+                "structure_context_section": structure_context,
+                "resume_metrics_section": build_metrics_context(state)
             }
-
-            # Get the prompts from template and replace variables
-            system_prompt = self.prompt_template["prompts"]["system"]
-            user_prompt = self.prompt_template["prompts"]["user"]
-
-            for placeholder, value in prompt_vars.items():
-                system_prompt = system_prompt.replace(placeholder, value)
-                user_prompt = user_prompt.replace(placeholder, value)
+            system_prompt = system_template.render(prompt_vars)
+            user_prompt = user_template.render(prompt_vars)
 
             # Call OpenAI with retry logic (uses agent config for temp/tokens)
             response = await self._call_openai_with_retry(
@@ -125,6 +119,38 @@ class AppealAgent(BaseAgent):
 
         return state
     
+    def _industry_prompts(
+        self,
+        industry: str,
+        industry_data: Dict[str, Any]
+    ) -> Tuple[CompiledPrompt, CompiledPrompt]:
+        """Get the system and user prompts with the industry variables rendered.
+
+        Memoized on the compiled template, so key skills and appeal points are
+        formatted once per industry for the life of the process.
+
+        Args:
+            industry: Industry code (memoization key)
+            industry_data: Industry configuration from industries.yaml
+
+        Returns:
+            (system, user) prompts with only per-analysis variables left
+        """
+        industry_name = industry_data["display_name"]
+        industry_vars = {
+            "industry": industry,
+            "industry_title": industry_name,
+            "industry_upper": industry_name.upper(),
+            "key_skills_list": ", ".join(industry_data["key_skills"]),
+            "appeal_points_description": self._format_appeal_points(industry_data.get("appeal_points", []))
+        }
+
+        prompts = self.prompt_template["compiled"]
+        return (
+            prompts["system"].partial(industry_vars, key=industry),
+            prompts["user"].partial(industry_vars, key=industry)
+        )
+
     def _format_appeal_points(self, appeal_points: list) -> str:
         """Format appeal points from industries.yaml into a readable description.
 
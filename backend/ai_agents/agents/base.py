@@ -2,20 +2,39 @@
 
 import logging
 import re
-import yaml
 import json
 import asyncio
-from pathlib import Path
 from typing import Dict, Any, List, Optional
 from openai import AsyncOpenAI
 
 from ai_agents.settings import get_settings
-from ai_agents.config import get_agent_config
+from ai_agents.config.registry import ConfigSnapshot, get_config_snapshot
 from ai_agents.utils import log_api_call, log_api_response, log_prompts
 from app.core.config import ai_config
 
 logger = logging.getLogger(__name__)
 
+# One client (and HTTP connection pool) per API key, shared by all agents so
+# warm connections to the LLM endpoint are reused across analyses
+_openai_clients: Dict[str, AsyncOpenAI] = {}
+
+
+def get_openai_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """Get the shared OpenAI client for an API key.
+
+    Args:
+        api_key: OpenAI API key (defaults to centralized config)
+
+    Returns:
+        AsyncOpenAI client
+    """
+    api_key = api_key or ai_config.OPENAI_API_KEY
+    client = _openai_clients.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(api_key=api_key)
+        _openai_clients[api_key] = client
+    return client
+
 
 class BaseAgent:
     """Base class for all analysis agents.
@@ -27,18 +46,26 @@ class BaseAgent:
     - Text parsing utilities
     """
 
-    def __init__(self, api_key: Optional[str] = None, agent_config=None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        agent_config=None,
+        config_snapshot: Optional[ConfigSnapshot] = None
+    ):
         """Initialize the base agent.
 
         Args:
             api_key: OpenAI API key (defaults to centralized config)
             agent_config: Optional AgentBehaviorConfig instance
+            config_snapshot: Config and prompt version to use (defaults to
+                the registry's current snapshot)
         """
         self.settings = get_settings()
-        self.agent_config = agent_config or get_agent_config()
+        self.config_snapshot = config_snapshot or get_config_snapshot()
+        self.agent_config = agent_config or self.config_snapshot.agent_config
 
         # Use centralized OpenAI API key from app.core.config
-        self.client = AsyncOpenAI(api_key=api_key or ai_config.OPENAI_API_KEY)
+        self.client = get_openai_client(api_key)
         self.max_retries = self.settings.resilience.max_retries
         self.backoff_multiplier = self.settings.resilience.backoff_multiplier
 
@@ -46,14 +73,15 @@ class BaseAgent:
         self.parsing_config = {}
 
     def _load_prompt_template(self, template_base: str) -> Dict[str, Any]:
-        """Load a prompt template from YAML file.
+        """Get a prompt template from the config snapshot.
 
         Args:
             template_base: Base name without version (e.g., "structure_prompt")
                           Version and language suffix will be added automatically
 
         Returns:
-            Loaded template dictionary
+            Loaded template dictionary; ``template["compiled"]`` holds the
+            precompiled system and user prompts
         """
         # Get language and version from settings (single source of truth)
         lang = self.settings.prompt_language
@@ -65,17 +93,13 @@ class BaseAgent:
         # Extract agent type from template_base (e.g., "appeal_prompt" → "appeal")
         agent_type = template_base.split('_')[0]
 
-        template_path = (
-            Path(__file__).parent.parent
-            / self.settings.paths.prompts_dir
-            / agent_type
-            / template_name
-        )
+        # Parsed, compiled and fingerprinted once per config version (shared, read-only)
+        template = self.config_snapshot.get_prompt(f"{agent_type}/{template_name}")
 
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = yaml.safe_load(f)
-
-        logger.info(f"Loaded prompt template: {template_name} (version: {version}, language: {lang})")
+        logger.info(
+            f"Loaded prompt template: {template_name} "
+            f"(version: {version}, language: {lang}, fingerprint: {template['fingerprint']})"
+        )
         return template
 
     async def _call_openai_with_retry(
@@ -5,22 +5,26 @@ import re
 from typing import Dict, Any, List, Optional
 
 from .base import BaseAgent
-from ai_agents.utils import log_agent_start, log_agent_complete
+from ai_agents.utils import log_agent_start, log_agent_complete, build_metrics_context, build_resume_text
 
 logger = logging.getLogger(__name__)
 
+# Structure metadata fields taken from the local resume metrics
+METADATA_KEYS = ("total_sections", "word_count", "reading_time")
+
 
 class StructureAgent(BaseAgent):
     """Agent that analyzes resume structure, formatting, and professional presentation."""
 
-    def __init__(self, api_key: Optional[str] = None, agent_config=None):
+    def __init__(self, api_key: Optional[str] = None, agent_config=None, config_snapshot=None):
         """Initialize the Structure Agent.
 
         Args:
             api_key: OpenAI API key (defaults to environment variable)
             agent_config: Optional AgentBehaviorConfig instance
+            config_snapshot: Optional ConfigSnapshot (defaults to the current one)
         """
-        super().__init__(api_key, agent_config)
+        super().__init__(api_key, agent_config, config_snapshot)
         self.prompt_template = self._load_prompt_template("structure_prompt")
         self.parsing_config = self.prompt_template.get("parsing", {})
     
@@ -36,11 +40,14 @@ class StructureAgent(BaseAgent):
         log_agent_start(logger, "structure")
 
         try:
-            # Get the prompts from template
-            system_prompt = self.prompt_template["prompts"]["system"]
-            user_prompt = self.prompt_template["prompts"]["user"].replace(
-                "{resume_text}", state["resume_text"]
-            )
+            # Render the precompiled prompts (single pass)
+            prompts = self.prompt_template["compiled"]
+            prompt_vars = {
+                "resume_text": build_resume_text(state, self.agent_config.get_agent_sections("structure")),
+                "resume_metrics_section": build_metrics_context(state)
+            }
+            system_prompt = prompts["system"].render(prompt_vars)
+            user_prompt = prompts["user"].render(prompt_vars)
 
             # Call OpenAI with retry logic (uses agent config)
             response = await self._call_openai_with_retry(
@@ -55,12 +62,12 @@ class StructureAgent(BaseAgent):
             # Update state with results
             state["structure_scores"] = parsed_results.get("scores", {})
             state["structure_feedback"] = parsed_results.get("feedback", {})
-            state["structure_metadata"] = parsed_results.get("metadata", {})
+            state["structure_metadata"] = self._build_metadata(state, parsed_results)
 
             # === DATA SIZE CHECKPOINT 3: STRUCTURE AGENT STATE ===
             logger.debug(f"=== CHECKPOINT 3: STRUCTURE AGENT STATE ===")
             logger.debug(f"Scores: {parsed_results['scores']}")
-            logger.debug(f"Metadata: {parsed_results['metadata']}")
+            logger.debug(f"Metadata: {state['structure_metadata']}")
             total_feedback_items = sum(len(v) if isinstance(v, list) else 0 for v in parsed_results['feedback'].values())
             logger.debug(f"Total feedback items: {total_feedback_items}")
             for key, value in parsed_results['feedback'].items():
@@ -80,6 +87,21 @@ class StructureAgent(BaseAgent):
 
         return state
 
+    def _build_metadata(self, state: Dict[str, Any], parsed_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the structure metadata, preferring the locally computed metrics.
+
+        Args:
+            state: Current workflow state with optional resume_metrics
+            parsed_results: Parsed LLM response (older prompts return metadata)
+
+        Returns:
+            Metadata with total_sections, word_count and reading_time
+        """
+        metrics = state.get("resume_metrics") or {}
+        metadata = dict(parsed_results.get("metadata") or {})
+        metadata.update({key: metrics[key] for key in METADATA_KEYS if key in metrics})
+        return metadata
+
     def _get_error_defaults(self) -> Dict[str, Any]:
         """Get default values for structure analysis errors.
 
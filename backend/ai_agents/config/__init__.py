@@ -3,18 +3,22 @@
 import yaml
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from functools import lru_cache
 
 
 class AgentBehaviorConfig:
     """Domain configuration for agent behavior and scoring."""
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, data: Optional[Dict[str, Any]] = None):
         """Load agent behavior configuration from YAML.
 
         Args:
             config_path: Path to agents.yaml (defaults to config/agents.yaml)
+            data: Already parsed configuration (skips reading the file)
         """
+        if data is not None:
+            self._config = data
+            return
+
         if config_path is None:
             config_path = Path(__file__).parent / "agents.yaml"
 
@@ -32,6 +36,17 @@ class AgentBehaviorConfig:
         """
         return self._config.get("agents", {}).get(agent_name, {})
 
+    def get_agent_sections(self, agent_name: str) -> Optional[List[str]]:
+        """Get the resume section types an agent reads.
+
+        Args:
+            agent_name: Name of the agent (e.g., 'structure', 'appeal')
+
+        Returns:
+            Section types, or None if the agent reads the whole resume
+        """
+        return self.get_agent_params(agent_name).get("sections") or None
+
     @property
     def scoring_weights(self) -> Dict[str, float]:
         """Get score calculation weights."""
@@ -65,12 +80,17 @@ class AgentBehaviorConfig:
 class IndustryConfig:
     """Domain configuration for industries."""
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(self, config_path: Optional[Path] = None, data: Optional[Dict[str, Any]] = None):
         """Load industry configuration from YAML.
 
         Args:
             config_path: Path to industries.yaml (defaults to config/industries.yaml)
+            data: Already parsed configuration (skips reading the file)
         """
+        if data is not None:
+            self._config = data
+            return
+
         if config_path is None:
             config_path = Path(__file__).parent / "industries.yaml"
 
@@ -98,17 +118,17 @@ class IndustryConfig:
         return list(self._config.get("industries", {}).keys())
 
 
-# Singleton instances with caching
-@lru_cache(maxsize=1)
+# Current instances from the hot-reloadable registry (see registry.py)
 def get_agent_config() -> AgentBehaviorConfig:
-    """Get cached agent behavior configuration."""
-    return AgentBehaviorConfig()
+    """Get the current agent behavior configuration."""
+    from .registry import get_config_snapshot
+    return get_config_snapshot().agent_config
 
 
-@lru_cache(maxsize=1)
 def get_industry_config() -> IndustryConfig:
-    """Get cached industry configuration."""
-    return IndustryConfig()
+    """Get the current industry configuration."""
+    from .registry import get_config_snapshot
+    return get_config_snapshot().industry_config
 
 
 __all__ = ["AgentBehaviorConfig", "IndustryConfig", "get_agent_config", "get_industry_config"]
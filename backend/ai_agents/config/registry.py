@@ -0,0 +1,280 @@
+"""Versioned registry of agent configuration and prompt templates.
+
+Everything the agents read from disk (agents.yaml, industries.yaml and the
+prompt and summary templates) is loaded once into an immutable
+``ConfigSnapshot``. Each file is hashed, so a result can be stamped with
+the exact configuration that produced it and caches or A/B comparisons can
+key on the fingerprint without touching the files.
+
+Reloading builds a complete new snapshot and swaps it in with a single
+assignment: an analysis keeps the snapshot it started with, and a broken
+file leaves the previous snapshot in place.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+from ai_agents.settings import get_settings
+from ai_agents.utils.prompt_template import compile_template
+
+from . import AgentBehaviorConfig, IndustryConfig
+
+logger = logging.getLogger(__name__)
+
+AGENTS_FILE = "agents.yaml"
+INDUSTRIES_FILE = "industries.yaml"
+
+# Hex digits kept from the SHA-256 digest
+FINGERPRINT_LENGTH = 16
+
+# File identity used for change detection: (mtime_ns, size)
+FileStamp = Tuple[int, int]
+
+
+def fingerprint(data: bytes) -> str:
+    """Fingerprint file contents (truncated SHA-256 hex digest)."""
+    return hashlib.sha256(data).hexdigest()[:FINGERPRINT_LENGTH]
+
+
+def _combine(fingerprints: Dict[str, str]) -> str:
+    """Fingerprint a set of files from their names and fingerprints."""
+    joined = "\n".join(f"{name}:{value}" for name, value in sorted(fingerprints.items()))
+    return fingerprint(joined.encode("utf-8"))
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """One consistent, read-only version of the AI configuration.
+
+    Prompt and summary templates are keyed by their path relative to the
+    prompts directory (e.g. ``appeal/appeal_prompt_v1.1_en.yaml``).
+    """
+
+    agent_config: AgentBehaviorConfig
+    industry_config: IndustryConfig
+    prompts: Dict[str, Dict[str, Any]]
+    fingerprints: Dict[str, str]
+    version: str
+    loaded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def get_prompt(self, template_key: str) -> Dict[str, Any]:
+        """Get a parsed template (with ``compiled`` prompts) by its key.
+
+        Raises:
+            FileNotFoundError: If the template does not exist
+        """
+        try:
+            return self.prompts[template_key]
+        except KeyError:
+            raise FileNotFoundError(f"Prompt template not found: {template_key}") from None
+
+    def fingerprints_for(self, prompt_version: str, language: str) -> Dict[str, str]:
+        """Fingerprints of the files an analysis uses for a prompt version and language.
+
+        These are agents.yaml, industries.yaml and every template with the
+        ``_{version}_{language}.yaml`` suffix.
+        """
+        suffix = f"_{prompt_version}_{language}.yaml"
+        return {
+            name: value
+            for name, value in self.fingerprints.items()
+            if name in (AGENTS_FILE, INDUSTRIES_FILE) or name.endswith(suffix)
+        }
+
+    def fingerprint_for(self, prompt_version: str, language: str) -> str:
+        """Combined fingerprint of the files used for a prompt version and language.
+
+        Edits to other versions or languages leave it unchanged.
+        """
+        return _combine(self.fingerprints_for(prompt_version, language))
+
+
+class ConfigRegistry:
+    """Holds the current ConfigSnapshot and reloads it when files change."""
+
+    def __init__(self, config_dir: Optional[Path] = None, prompts_dir: Optional[Path] = None):
+        """Create a registry (files are read on first access).
+
+        Args:
+            config_dir: Directory with agents.yaml and industries.yaml
+            prompts_dir: Directory with the prompt templates
+        """
+        settings = get_settings()
+        module_root = Path(__file__).parent.parent
+        self.config_dir = config_dir or module_root / settings.paths.config_dir
+        self.prompts_dir = prompts_dir or module_root / settings.paths.prompts_dir
+
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._stamps: Dict[str, FileStamp] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """The current snapshot (loaded on first access)."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.reload(force=True)
+            snapshot = self._snapshot
+        return snapshot
+
+    def reload(self, force: bool = False) -> bool:
+        """Reload the configuration if any file changed.
+
+        The new snapshot is installed only once every file loaded; on error
+        the current snapshot stays active.
+
+        Args:
+            force: Rebuild even if no file changed
+
+        Returns:
+            True if a snapshot with a new version was installed
+
+        Raises:
+            Exception: If a file cannot be read or parsed
+        """
+        with self._lock:
+            stamps = self._scan()
+            if not force and self._snapshot is not None and stamps == self._stamps:
+                return False
+
+            snapshot = self._load(stamps)
+            previous = self._snapshot
+            self._stamps = stamps
+            if previous is not None and previous.version == snapshot.version:
+                # Touched but unchanged files
+                return False
+
+            self._snapshot = snapshot
+            logger.info(
+                f"Loaded AI config version {snapshot.version} "
+                f"({len(snapshot.fingerprints)} files"
+                f"{'' if previous is None else f', was {previous.version}'})"
+            )
+            return True
+
+    def _files(self) -> Dict[str, Path]:
+        """Map registry file names to their paths."""
+        files = {
+            AGENTS_FILE: self.config_dir / AGENTS_FILE,
+            INDUSTRIES_FILE: self.config_dir / INDUSTRIES_FILE,
+        }
+        for path in sorted(self.prompts_dir.glob("*/*.yaml")):
+            files[path.relative_to(self.prompts_dir).as_posix()] = path
+        return files
+
+    def _scan(self) -> Dict[str, FileStamp]:
+        """Stat every file (cheap change detection)."""
+        stamps = {}
+        for name, path in self._files().items():
+            stat = path.stat()
+            stamps[name] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+    def _load(self, stamps: Dict[str, FileStamp]) -> ConfigSnapshot:
+        """Read, parse and fingerprint every file into a new snapshot."""
+        files = self._files()
+        fingerprints: Dict[str, str] = {}
+        parsed: Dict[str, Any] = {}
+
+        for name in stamps:
+            data = files[name].read_bytes()
+            fingerprints[name] = fingerprint(data)
+            parsed[name] = yaml.safe_load(data) or {}
+
+        prompts = {}
+        for name, template in parsed.items():
+            if name in (AGENTS_FILE, INDUSTRIES_FILE):
+                continue
+            template["fingerprint"] = fingerprints[name]
+            prompts[name] = compile_template(template)
+
+        return ConfigSnapshot(
+            agent_config=AgentBehaviorConfig(data=parsed[AGENTS_FILE]),
+            industry_config=IndustryConfig(data=parsed[INDUSTRIES_FILE]),
+            prompts=prompts,
+            fingerprints=fingerprints,
+            version=_combine(fingerprints),
+        )
+
+
+_registry: Optional[ConfigRegistry] = None
+_watcher: Optional[asyncio.Task] = None
+
+
+def get_config_registry() -> ConfigRegistry:
+    """Get the process-wide configuration registry."""
+    global _registry
+    if _registry is None:
+        _registry = ConfigRegistry()
+    return _registry
+
+
+def get_config_snapshot() -> ConfigSnapshot:
+    """Get the current configuration snapshot."""
+    return get_config_registry().snapshot
+
+
+async def _watch(interval: float) -> None:
+    """Poll the configuration files and reload on change."""
+    registry = get_config_registry()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            # Stats a few dozen files; kept off the event loop anyway
+            await asyncio.to_thread(registry.reload)
+        except Exception as e:
+            logger.error(f"AI config reload failed, keeping version {registry.snapshot.version}: {e}")
+
+
+def start_config_watcher(interval: Optional[float] = None) -> bool:
+    """Start reloading the configuration when its files change.
+
+    Args:
+        interval: Seconds between checks (defaults to the
+            ``config_reload_seconds`` setting; 0 disables the watcher)
+
+    Returns:
+        True if the watcher was started
+    """
+    global _watcher
+    if interval is None:
+        interval = get_settings().config_reload_seconds
+    if interval <= 0 or (_watcher is not None and not _watcher.done()):
+        return False
+
+    # Load now so the first analysis does not pay for it
+    get_config_registry().snapshot
+    _watcher = asyncio.create_task(_watch(interval))
+    return True
+
+
+async def stop_config_watcher() -> None:
+    """Stop the configuration watcher if it is running."""
+    global _watcher
+    if _watcher is None:
+        return
+    _watcher.cancel()
+    try:
+        await _watcher
+    except asyncio.CancelledError:
+        pass
+    _watcher = None
+
+
+__all__ = [
+    "ConfigSnapshot",
+    "ConfigRegistry",
+    "fingerprint",
+    "get_config_registry",
+    "get_config_snapshot",
+    "start_config_watcher",
+    "stop_config_watcher",
+]
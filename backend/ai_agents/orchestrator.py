@@ -1,15 +1,16 @@
 """Main orchestrator for the AI resume analysis workflow."""
 
+import asyncio
 import logging
 import time
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Awaitable, Callable, List, Optional
 
 from .agents import StructureAgent, AppealAgent
 from .workflows import create_workflow, ResumeAnalysisState
 from .settings import get_settings
-from .config import get_agent_config
-from .utils import log_analysis_start, log_analysis_complete, log_analysis_error
+from .config.registry import get_config_snapshot
+from .utils import log_analysis_start, log_analysis_complete, log_analysis_error, AnalysisCancelledError
 from app.core.config import ai_config
 
 logger = logging.getLogger(__name__)
@@ -24,18 +25,34 @@ class ResumeAnalysisOrchestrator:
         Args:
             api_key: Optional OpenAI API key (defaults to centralized config)
         """
-        # Get settings and config
+        # Get settings and config; both agents use the same config snapshot
+        # even if it is reloaded while they are created
         settings = get_settings()
-        agent_config = get_agent_config()
+        self.config_snapshot = get_config_snapshot()
+        agent_config = self.config_snapshot.agent_config
+
+        # Fingerprint of the exact config and prompts this run uses
+        self.config_info = {
+            "prompt_version": settings.prompt_version,
+            "prompt_language": settings.prompt_language,
+            "fingerprint": self.config_snapshot.fingerprint_for(
+                settings.prompt_version, settings.prompt_language
+            ),
+            "files": self.config_snapshot.fingerprints_for(
+                settings.prompt_version, settings.prompt_language
+            )
+        }
 
         # Initialize agents with config - use centralized OpenAI API key
         self.structure_agent = StructureAgent(
             api_key=api_key or ai_config.OPENAI_API_KEY,
-            agent_config=agent_config
+            agent_config=agent_config,
+            config_snapshot=self.config_snapshot
         )
         self.appeal_agent = AppealAgent(
             api_key=api_key or ai_config.OPENAI_API_KEY,
-            agent_config=agent_config
+            agent_config=agent_config,
+            config_snapshot=self.config_snapshot
         )
 
         # Create the workflow
@@ -48,7 +65,10 @@ class ResumeAnalysisOrchestrator:
         self,
         resume_text: str,
         industry: str,
-        analysis_id: Optional[str] = None
+        analysis_id: Optional[str] = None,
+        should_cancel: Optional[Callable[[], Awaitable[bool]]] = None,
+        resume_sections: Optional[List[Dict[str, Any]]] = None,
+        resume_metrics: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Run the complete resume analysis workflow.
         
@@ -56,9 +76,20 @@ class ResumeAnalysisOrchestrator:
             resume_text: The resume text to analyze
             industry: Target industry for appeal analysis
             analysis_id: Optional analysis ID for tracking
+            should_cancel: Optional async check run before each agent; the
+                workflow stops when it returns True
+            resume_sections: Optional typed sections of the resume
+                (section_type, section_title, content); agents configured
+                with ``sections`` in agents.yaml read only those
+            resume_metrics: Optional locally computed metrics (word count,
+                sections, bullets, dates); given to the agents as facts and
+                used as the structure metadata
             
         Returns:
             Complete analysis results with scores and feedback
+
+        Raises:
+            AnalysisCancelledError: If should_cancel reported a cancellation
         """
         # Generate analysis ID if not provided
         if not analysis_id:
@@ -71,6 +102,8 @@ class ResumeAnalysisOrchestrator:
         initial_state: ResumeAnalysisState = {
             "resume_text": resume_text,
             "industry": industry,
+            "resume_sections": resume_sections,
+            "resume_metrics": resume_metrics,
             "structure_scores": None,
             "structure_feedback": None,
             "structure_metadata": None,
@@ -85,7 +118,10 @@ class ResumeAnalysisOrchestrator:
 
         try:
             # Run the workflow
-            final_state = await self.workflow.ainvoke(initial_state)
+            final_state = await self.workflow.ainvoke(
+                initial_state,
+                config={"configurable": {"should_cancel": should_cancel}}
+            )
 
             # Check for errors in the final state
             if final_state.get("error"):
@@ -99,6 +135,10 @@ class ResumeAnalysisOrchestrator:
             log_analysis_complete(logger, analysis_id, overall_score, elapsed)
             return self._format_success_response(final_state, analysis_id)
 
+        except AnalysisCancelledError:
+            logger.info(f"Analysis {analysis_id} cancelled after {time.time() - start_time:.1f}s")
+            raise
+
         except Exception as e:
             # Handle unexpected errors
             elapsed = time.time() - start_time
@@ -129,7 +169,8 @@ class ResumeAnalysisOrchestrator:
             "appeal": {
                 "scores": state.get("appeal_scores", {}),
                 "feedback": state.get("appeal_feedback", {})
-            }
+            },
+            "config": self.config_info
         }
 
         # === DATA SIZE CHECKPOINT 5: ORCHESTRATOR FORMATTED RESPONSE ===
@@ -137,6 +178,7 @@ class ResumeAnalysisOrchestrator:
         logger.debug(f"Analysis ID: {analysis_id}")
         logger.debug(f"Overall score: {response['overall_score']}")
         logger.debug(f"Market tier: {response['market_tier']}")
+        logger.debug(f"Config fingerprint: {self.config_info['fingerprint']}")
 
         # Count structure feedback items
         structure_feedback = response['structure']['feedback']
@@ -185,4 +227,60 @@ class ResumeAnalysisOrchestrator:
                 "scores": {},
                 "feedback": {}
             }
-        }
\ No newline at end of file
+        }
+
+
+_orchestrator: Optional[ResumeAnalysisOrchestrator] = None
+
+
+def get_orchestrator() -> ResumeAnalysisOrchestrator:
+    """Get the shared orchestrator.
+
+    Agents and the compiled workflow hold no per-analysis state, so one
+    instance serves every analysis. It is rebuilt when the config snapshot
+    or the prompt version/language changes.
+
+    Returns:
+        ResumeAnalysisOrchestrator for the current configuration
+    """
+    global _orchestrator
+    settings = get_settings()
+    current = _orchestrator
+    if (
+        current is None
+        or current.config_snapshot is not get_config_snapshot()
+        or current.config_info["prompt_version"] != settings.prompt_version
+        or current.config_info["prompt_language"] != settings.prompt_language
+    ):
+        current = ResumeAnalysisOrchestrator()
+        _orchestrator = current
+    return current
+
+
+async def warm_up(llm_keepalive: bool = True, timeout: float = 10.0) -> Dict[str, Any]:
+    """Pre-load everything the first analysis would otherwise pay for.
+
+    Parses the config and prompt YAML, compiles the workflow and, unless
+    disabled, opens the connection to the LLM endpoint with a cheap model
+    lookup (no tokens are generated).
+
+    Args:
+        llm_keepalive: Contact the LLM endpoint (disable locally or in tests)
+        timeout: Seconds to wait for the LLM endpoint
+
+    Returns:
+        Config fingerprint and whether the LLM endpoint was reached
+    """
+    # YAML parsing and graph compilation are CPU-bound; keep them off the loop
+    orchestrator = await asyncio.to_thread(get_orchestrator)
+    result = {"config_fingerprint": orchestrator.config_info["fingerprint"], "llm": "skipped"}
+
+    if llm_keepalive and ai_config.OPENAI_API_KEY:
+        model = get_settings().llm.model
+        await asyncio.wait_for(
+            orchestrator.structure_agent.client.models.retrieve(model),
+            timeout=timeout
+        )
+        result["llm"] = "connected"
+
+    return result
@@ -1,51 +1,53 @@
 """Summary generation service for resume analysis."""
 
-import yaml
-from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from ai_agents.settings import get_settings
+from ai_agents.config.registry import ConfigSnapshot, get_config_snapshot
 
 
 class SummaryGenerator:
     """Handles executive summary generation for resume analysis."""
 
-    def __init__(self, thresholds: Dict[str, int], categories: Dict[str, str]):
+    def __init__(
+        self,
+        thresholds: Dict[str, int],
+        categories: Dict[str, str],
+        config_snapshot: Optional[ConfigSnapshot] = None
+    ):
         """Initialize the summary generator.
 
         Args:
             thresholds: Score thresholds (e.g., {"excellent": 80, "strong": 70, ...})
             categories: Category labels (e.g., {"excellent": "excellent candidate", ...})
+            config_snapshot: Optional ConfigSnapshot (defaults to the current one)
         """
         self.thresholds = thresholds
         self.categories = categories
 
         # Load language-aware summary templates
         settings = get_settings()
-        self.templates = self._load_summary_templates(settings.prompt_language)
+        self.templates = self._load_summary_templates(settings.prompt_language, config_snapshot)
 
-    def _load_summary_templates(self, language: str) -> Dict[str, str]:
-        """Load summary templates from YAML file based on language.
+    def _load_summary_templates(
+        self,
+        language: str,
+        config_snapshot: Optional[ConfigSnapshot] = None
+    ) -> Dict[str, str]:
+        """Get summary templates for a language from the config snapshot.
 
         Args:
             language: Language code (e.g., "en", "ja")
+            config_snapshot: Optional ConfigSnapshot (defaults to the current one)
 
         Returns:
             Dictionary of template strings
         """
-        settings = get_settings()
-        version = settings.prompt_version
+        snapshot = config_snapshot or get_config_snapshot()
+        version = get_settings().prompt_version
         template_name = f"summary_templates_{version}_{language}.yaml"
-        template_path = (
-            Path(__file__).parent.parent
-            / "prompts"
-            / "summary"
-            / template_name
-        )
-
-        with open(template_path, "r", encoding="utf-8") as f:
-            template_data = yaml.safe_load(f)
 
+        template_data = snapshot.get_prompt(f"summary/{template_name}")
         return template_data.get("templates", {})
 
     def generate_summary(
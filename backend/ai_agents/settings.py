@@ -74,6 +74,10 @@ class AIAgentSettings(BaseSettings):
     # v1.1: Enhanced prompts with structured feedback (SCR, quantitative, appeal points)
     prompt_version: str = "v1.1"  # Default: v1.1 (enhanced feedback)
 
+    # Seconds between checks for edited config/prompt files (0 disables
+    # hot reload; the admin reload endpoint works either way)
+    config_reload_seconds: float = 0.0
+
 
 # Singleton pattern
 _settings: Optional[AIAgentSettings] = None
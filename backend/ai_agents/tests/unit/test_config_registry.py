@@ -0,0 +1,78 @@
+"""Unit tests for the hot-reloadable AI config registry."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from ai_agents.config.registry import ConfigRegistry, fingerprint
+
+AI_AGENTS_DIR = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Registry over a copy of the shipped config and prompt files."""
+    shutil.copytree(AI_AGENTS_DIR / "config", tmp_path / "config", ignore=shutil.ignore_patterns("*.py", "__pycache__"))
+    shutil.copytree(AI_AGENTS_DIR / "prompts", tmp_path / "prompts", ignore=shutil.ignore_patterns("*.py", "__pycache__"))
+    return ConfigRegistry(config_dir=tmp_path / "config", prompts_dir=tmp_path / "prompts")
+
+
+def _edit(path: Path, text: str) -> None:
+    """Append to a file and move its mtime forward."""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_snapshot_fingerprints_every_file(registry):
+    snapshot = registry.snapshot
+
+    prompt_path = registry.prompts_dir / "appeal" / "appeal_prompt_v1.1_en.yaml"
+    assert snapshot.fingerprints["appeal/appeal_prompt_v1.1_en.yaml"] == fingerprint(prompt_path.read_bytes())
+    assert {"agents.yaml", "industries.yaml"} <= set(snapshot.fingerprints)
+
+    template = snapshot.get_prompt("appeal/appeal_prompt_v1.1_en.yaml")
+    assert set(template["compiled"]) == {"system", "user"}
+    assert template["fingerprint"] == snapshot.fingerprints["appeal/appeal_prompt_v1.1_en.yaml"]
+
+
+def test_unknown_template_raises(registry):
+    with pytest.raises(FileNotFoundError):
+        registry.snapshot.get_prompt("appeal/appeal_prompt_v9_xx.yaml")
+
+
+def test_reload_without_changes_keeps_snapshot(registry):
+    snapshot = registry.snapshot
+
+    assert registry.reload() is False
+    assert registry.snapshot is snapshot
+
+
+def test_reload_swaps_in_new_version(registry):
+    old = registry.snapshot
+    old_fingerprint = old.fingerprint_for("v1.1", "en")
+
+    _edit(registry.prompts_dir / "structure" / "structure_prompt_v1.1_en.yaml", "\n# tweak\n")
+
+    assert registry.reload() is True
+    new = registry.snapshot
+    assert new is not old
+    assert new.version != old.version
+    assert new.fingerprint_for("v1.1", "en") != old_fingerprint
+    # Other prompt versions and languages are unaffected
+    assert new.fingerprint_for("v1.1", "ja") == old.fingerprint_for("v1.1", "ja")
+    # The previous snapshot is untouched for analyses still using it
+    assert old.fingerprint_for("v1.1", "en") == old_fingerprint
+
+
+def test_failed_reload_keeps_current_snapshot(registry):
+    snapshot = registry.snapshot
+
+    _edit(registry.config_dir / "agents.yaml", "\nagents: [unclosed\n")
+
+    with pytest.raises(Exception):
+        registry.reload()
+    assert registry.snapshot is snapshot
@@ -0,0 +1,83 @@
+"""Unit tests for precompiled prompt templates."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from ai_agents.utils.prompt_template import compile_prompt, compile_template
+
+PROMPTS_DIR = Path(__file__).resolve().parents[2] / "prompts"
+
+
+def test_render_matches_sequential_replace():
+    """Rendering gives the same text as replacing each placeholder in turn."""
+    template = "Industry: {industry_title}\n{resume_text}\nAgain: {industry_title}"
+    values = {"industry_title": "Tech Consulting", "resume_text": "Resume body"}
+
+    expected = template
+    for name, value in values.items():
+        expected = expected.replace("{" + name + "}", value)
+
+    assert compile_prompt(template).render(values) == expected
+
+
+def test_undeclared_braces_stay_literal():
+    """JSON examples in prompts are not treated as variables."""
+    template = 'Return {"scores": {format}} for {resume_text}'
+    compiled = compile_prompt(template, variables=["resume_text"])
+
+    assert compiled.variables == ("resume_text",)
+    assert compiled.render({"resume_text": "X"}) == 'Return {"scores": {format}} for X'
+
+
+def test_values_are_not_rescanned():
+    """Placeholder-like text inside a value is sent as-is."""
+    compiled = compile_prompt("{resume_text} / {industry}")
+
+    rendered = compiled.render({"resume_text": "I wrote {industry} here", "industry": "finance"})
+
+    assert rendered == "I wrote {industry} here / finance"
+
+
+def test_missing_value_raises():
+    with pytest.raises(KeyError):
+        compile_prompt("{resume_text}").render({})
+
+
+def test_partial_prerenders_and_memoizes():
+    compiled = compile_prompt("{industry_title}: {key_skills_list}\n{resume_text}")
+
+    first = compiled.partial({"industry_title": "Finance", "key_skills_list": "Modeling"}, key="finance")
+    second = compiled.partial({"industry_title": "ignored", "key_skills_list": "ignored"}, key="finance")
+
+    assert first is second
+    assert first.variables == ("resume_text",)
+    assert first.render({"resume_text": "Body"}) == "Finance: Modeling\nBody"
+
+
+def test_partial_without_key_is_not_memoized():
+    compiled = compile_prompt("{a}{b}")
+
+    assert compiled.partial({"a": "1"}).render({"b": "2"}) == "12"
+    assert compiled.partial({"a": "3"}).render({"b": "4"}) == "34"
+
+
+def test_compile_template_compiles_declared_variables():
+    with open(PROMPTS_DIR / "appeal" / "appeal_prompt_v1.1_en.yaml", "r", encoding="utf-8") as f:
+        template = yaml.safe_load(f)
+
+    assert compile_template(template) is template
+    assert set(template["compiled"]) == {"system", "user"}
+    assert "resume_text" in template["compiled"]["user"].variables
+    rendered = template["compiled"]["user"].render({
+        "resume_text": "Body",
+        "industry": "tech_consulting",
+        "industry_title": "Tech",
+        "industry_upper": "TECH",
+        "key_skills_list": "Cloud",
+        "appeal_points_description": "1. Delivery",
+        "structure_context_section": "",
+        "resume_metrics_section": "",
+    })
+    assert "{resume_text}" not in rendered
@@ -29,6 +29,22 @@ async def test_structure_agent_analyze_success(mock_structure_agent, initial_sta
     assert result["structure_metadata"]["word_count"] == 250
 
 
+def test_structure_agent_uses_local_metrics():
+    """Test that locally computed metrics replace the LLM metadata."""
+    from ai_agents.agents.structure import StructureAgent
+
+    # _build_metadata needs no client or prompts
+    agent = StructureAgent.__new__(StructureAgent)
+    state = {"resume_metrics": {"total_sections": 4, "word_count": 312, "reading_time": 2, "bullet_count": 9}}
+    parsed = {"metadata": {"total_sections": 5, "word_count": 250, "reading_time": 1, "page_count": 2}}
+
+    metadata = agent._build_metadata(state, parsed)
+
+    assert metadata == {"total_sections": 4, "word_count": 312, "reading_time": 2, "page_count": 2}
+    # Without local metrics the LLM metadata is kept
+    assert agent._build_metadata({}, parsed) == parsed["metadata"]
+
+
 @pytest.mark.asyncio
 async def test_structure_agent_analyze_with_error(initial_state):
     """Test structure analysis with API error."""
@@ -2,6 +2,7 @@
 
 import pytest
 from ai_agents.utils import (
+    build_resume_text,
     validate_industry,
     validate_resume_text,
     InvalidInputError
@@ -67,4 +68,29 @@ def test_validate_resume_text_too_long():
     with pytest.raises(InvalidInputError) as exc_info:
         validate_resume_text("A" * 50001)
 
-    assert "too long" in str(exc_info.value)
\ No newline at end of file
+    assert "too long" in str(exc_info.value)
+
+def test_build_resume_text_selects_sections():
+    """Test that only the requested sections are sent, in document order."""
+    state = {
+        "resume_text": "full text",
+        "resume_sections": [
+            {"section_type": "contact", "section_title": None, "content": "john@example.com"},
+            {"section_type": "experience", "section_title": "Experience", "content": "Acme"},
+            {"section_type": "skills", "section_title": "Skills", "content": "Python"},
+        ]
+    }
+
+    assert build_resume_text(state, ["skills", "experience"]) == "Experience\nAcme\n\nSkills\nPython"
+
+
+def test_build_resume_text_falls_back_to_full_text():
+    """Test the whole resume is used without sections or matching sections."""
+    state = {
+        "resume_text": "full text",
+        "resume_sections": [{"section_type": "other", "section_title": None, "content": "full text"}]
+    }
+
+    assert build_resume_text(state, None) == "full text"
+    assert build_resume_text(state, ["experience"]) == "full text"
+    assert build_resume_text({"resume_text": "full text"}, ["experience"]) == "full text"
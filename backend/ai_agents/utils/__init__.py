@@ -5,10 +5,12 @@ from .exceptions import (
     RetryableError,
     FatalError,
     APIRateLimitError,
-    InvalidInputError
+    InvalidInputError,
+    AnalysisCancelledError
 )
 from .validation import validate_industry, validate_resume_text
-from .context_builder import build_structure_context
+from .context_builder import build_metrics_context, build_resume_text, build_structure_context
+from .prompt_template import CompiledPrompt, compile_prompt, compile_template
 from .logging import (
     log_agent_start,
     log_agent_complete,
@@ -27,11 +29,18 @@ __all__ = [
     "FatalError",
     "APIRateLimitError",
     "InvalidInputError",
+    "AnalysisCancelledError",
     # Validation
     "validate_industry",
     "validate_resume_text",
     # Context building
+    "build_metrics_context",
+    "build_resume_text",
     "build_structure_context",
+    # Prompt templates
+    "CompiledPrompt",
+    "compile_prompt",
+    "compile_template",
     # Logging
     "log_agent_start",
     "log_agent_complete",
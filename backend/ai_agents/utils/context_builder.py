@@ -1,6 +1,6 @@
 """Context building utilities for AI agents."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 
 def build_structure_context(state: Dict[str, Any]) -> str:
@@ -35,3 +35,57 @@ def build_structure_context(state: Dict[str, Any]) -> str:
         context_parts.append(f"- Strengths: {', '.join(strengths)}")
 
     return "\n".join(context_parts)
+
+
+def build_metrics_context(state: Dict[str, Any]) -> str:
+    """Build context string from the locally computed resume metrics.
+
+    Args:
+        state: Current state with optional resume_metrics
+
+    Returns:
+        Formatted context string for use in prompts (empty without metrics)
+    """
+    metrics = state.get("resume_metrics")
+    if not metrics:
+        return ""
+
+    return "\n".join([
+        "PRE-COMPUTED RESUME METRICS (exact counts; use them as facts, do not recount):",
+        f"- Word Count: {metrics.get('word_count', 0)} "
+        f"({metrics.get('latin_word_count', 0)} words, "
+        f"{metrics.get('japanese_character_count', 0)} Japanese characters)",
+        f"- Sections: {metrics.get('total_sections', 0)} "
+        f"({', '.join(metrics.get('section_types') or []) or 'none detected'})",
+        f"- Bullet Points: {metrics.get('bullet_count', 0)}",
+        f"- Lines With Quantified Achievements: {metrics.get('quantified_achievement_count', 0)}",
+        f"- Dates: {metrics.get('date_count', 0)} "
+        f"(formats: {', '.join(metrics.get('date_formats') or []) or 'none'})"
+    ])
+
+
+def build_resume_text(state: Dict[str, Any], section_types: Optional[List[str]] = None) -> str:
+    """Build the resume text an agent reads from the selected sections.
+
+    Args:
+        state: Current state with resume_text and optional resume_sections
+        section_types: Section types to include (None for the whole resume)
+
+    Returns:
+        The selected sections (title and content, in document order), or the
+        whole resume text if no sections are selected or none matched
+    """
+    sections = state.get("resume_sections")
+    if not section_types or not sections:
+        return state["resume_text"]
+
+    parts = []
+    for section in sections:
+        if section["section_type"] not in section_types:
+            continue
+        title = section.get("section_title")
+        parts.append(f"{title}\n{section['content']}" if title else section["content"])
+
+    if not parts:
+        return state["resume_text"]
+    return "\n\n".join(parts)
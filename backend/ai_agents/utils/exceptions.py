@@ -24,3 +24,8 @@ class APIRateLimitError(RetryableError):
 class InvalidInputError(FatalError):
     """Invalid input provided to agent."""
     pass
+
+
+class AnalysisCancelledError(FatalError):
+    """Analysis was cancelled by the user."""
+    pass
@@ -0,0 +1,137 @@
+"""Precompiled prompt templates.
+
+Prompt YAML files are parsed and compiled once per process: each prompt is
+split into literal text and ``{variable}`` slots, so rendering is a single
+``"".join`` over the segments instead of one ``str.replace`` pass (and full
+copy of the prompt, resume included) per variable.
+
+Only variables declared in the template's ``variables`` section are slots;
+any other braces (e.g. the JSON examples in the prompts) stay literal.
+Substituted values are never scanned again, so placeholder-like text inside
+a resume is sent as-is.
+"""
+
+import logging
+import re
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER_PATTERN = re.compile(r"\{([a-z_][a-z0-9_]*)\}")
+
+
+class CompiledPrompt:
+    """A prompt split into literal segments and variable slots."""
+
+    __slots__ = ("_pieces", "_slots", "_partials")
+
+    def __init__(self, pieces: List[str], slots: List[Tuple[int, str]]):
+        """Create from precomputed segments (use compile_prompt)."""
+        self._pieces = pieces
+        self._slots = slots
+        self._partials: Dict[Hashable, "CompiledPrompt"] = {}
+
+    @property
+    def variables(self) -> Tuple[str, ...]:
+        """Variable names in order of appearance (with repeats)."""
+        return tuple(name for _, name in self._slots)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """Render the prompt in one pass.
+
+        Args:
+            values: Value for every remaining variable
+
+        Returns:
+            Rendered prompt
+
+        Raises:
+            KeyError: If a variable has no value
+        """
+        pieces = list(self._pieces)
+        for index, name in self._slots:
+            pieces[index] = values[name]
+        return "".join(pieces)
+
+    def partial(self, values: Mapping[str, str], key: Optional[Hashable] = None) -> "CompiledPrompt":
+        """Pre-render some variables, keeping the rest as slots.
+
+        Args:
+            values: Values for the variables to fill now
+            key: Memoization key; the same key returns the same result
+                (e.g. the industry code for per-industry fragments)
+
+        Returns:
+            Compiled prompt with the given variables rendered into literals
+        """
+        if key is not None and key in self._partials:
+            return self._partials[key]
+
+        pieces: List[str] = []
+        slots: List[Tuple[int, str]] = []
+        literal: List[str] = []
+        slot_names = dict(self._slots)
+
+        for index, piece in enumerate(self._pieces):
+            name = slot_names.get(index)
+            if name is None:
+                literal.append(piece)
+            elif name in values:
+                literal.append(values[name])
+            else:
+                pieces.append("".join(literal))
+                literal = []
+                slots.append((len(pieces), name))
+                pieces.append("")
+        pieces.append("".join(literal))
+
+        compiled = CompiledPrompt(pieces, slots)
+        if key is not None:
+            self._partials[key] = compiled
+        return compiled
+
+
+def compile_prompt(template: str, variables: Optional[Iterable[str]] = None) -> CompiledPrompt:
+    """Compile a prompt string.
+
+    Args:
+        template: Prompt text with ``{variable}`` placeholders
+        variables: Names to treat as slots (defaults to every placeholder)
+
+    Returns:
+        CompiledPrompt
+    """
+    known = set(variables) if variables is not None else None
+    pieces: List[str] = []
+    slots: List[Tuple[int, str]] = []
+    position = 0
+
+    for match in _PLACEHOLDER_PATTERN.finditer(template):
+        name = match.group(1)
+        if known is not None and name not in known:
+            continue
+        pieces.append(template[position:match.start()])
+        slots.append((len(pieces), name))
+        pieces.append("")
+        position = match.end()
+    pieces.append(template[position:])
+
+    return CompiledPrompt(pieces, slots)
+
+
+def compile_template(template: Dict[str, Any]) -> Dict[str, Any]:
+    """Compile the prompts of a parsed prompt YAML file in place.
+
+    Args:
+        template: Parsed template with ``prompts`` and ``variables`` sections
+
+    Returns:
+        The same template with an added ``compiled`` entry mapping each
+        prompt name (system, user) to its CompiledPrompt
+    """
+    declared = [variable["name"] for variable in template.get("variables") or [] if "name" in variable]
+    template["compiled"] = {
+        name: compile_prompt(text, declared or None)
+        for name, text in (template.get("prompts") or {}).items()
+    }
+    return template
@@ -13,6 +13,8 @@ class ResumeAnalysisState(TypedDict):
     # Input fields
     resume_text: str
     industry: str
+    resume_sections: Optional[List[Dict[str, Any]]]
+    resume_metrics: Optional[Dict[str, Any]]
     
     # Structure Agent output
     structure_scores: Optional[Dict[str, float]]
@@ -1,15 +1,35 @@
 """LangGraph workflow for resume analysis."""
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict
 
 from .state import ResumeAnalysisState
+from ..utils.exceptions import AnalysisCancelledError
 
 if TYPE_CHECKING:
     from ..agents.structure import StructureAgent
     from ..agents.appeal import AppealAgent
 
 
+def _cancellable(
+    node_name: str,
+    node: Callable[[ResumeAnalysisState], Awaitable[Dict[str, Any]]]
+) -> Callable[[ResumeAnalysisState, RunnableConfig], Awaitable[Dict[str, Any]]]:
+    """Wrap a node so it checks for cancellation before making its LLM call.
+
+    The check is read from ``config["configurable"]["should_cancel"]`` (an
+    async callable returning True once the analysis was cancelled).
+    """
+    async def run(state: ResumeAnalysisState, config: RunnableConfig) -> Dict[str, Any]:
+        should_cancel = (config or {}).get("configurable", {}).get("should_cancel")
+        if should_cancel is not None and await should_cancel():
+            raise AnalysisCancelledError(f"Analysis cancelled before {node_name} step")
+        return await node(state)
+
+    return run
+
+
 def create_workflow(
     structure_agent: "StructureAgent",
     appeal_agent: "AppealAgent"
@@ -27,9 +47,9 @@ def create_workflow(
     # Create workflow with our state schema
     workflow = StateGraph(ResumeAnalysisState)
     
-    # Add nodes (just 2 agents!)
-    workflow.add_node("structure", structure_agent.analyze)
-    workflow.add_node("appeal", appeal_agent.analyze)
+    # Add nodes (just 2 agents!), each checking for cancellation first
+    workflow.add_node("structure", _cancellable("structure", structure_agent.analyze))
+    workflow.add_node("appeal", _cancellable("appeal", appeal_agent.analyze))
     
     # Define the flow: structure → appeal → end
     workflow.set_entry_point("structure")
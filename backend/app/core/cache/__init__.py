@@ -1,20 +1,36 @@
 """Redis connection and cache service management."""
 
 from .connection import (
+    RedisClientFactory,
+    get_redis_factory,
     RedisConnection,
     get_redis_connection,
     init_redis,
     close_redis,
-    get_redis_client
+    get_redis_client,
+    get_binary_redis_client
 )
 from .service import CacheService, create_cache_service
+from .local import LocalCache
+from .codecs import Codec, CodecError, CacheSerializer, get_codec
+from .invalidation import start_invalidation_listener, stop_invalidation_listener
 
 __all__ = [
+    "RedisClientFactory",
+    "get_redis_factory",
     "RedisConnection",
     "get_redis_connection",
     "init_redis",
     "close_redis",
     "get_redis_client",
+    "get_binary_redis_client",
     "CacheService",
     "create_cache_service",
+    "LocalCache",
+    "Codec",
+    "CodecError",
+    "CacheSerializer",
+    "get_codec",
+    "start_invalidation_listener",
+    "stop_invalidation_listener",
 ]
\ No newline at end of file
@@ -0,0 +1,261 @@
+"""
+Pluggable serialization codecs for the cache layer.
+
+Every payload is framed with a single header byte: the low 7 bits identify the
+codec and the high bit marks zstd compression. Readers pick the codec from the
+frame, so the default codec can change without invalidating existing entries.
+"""
+
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Optional
+import json
+import logging
+import uuid
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Falls back to the stdlib json codec
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # Compression is skipped when not installed
+
+logger = logging.getLogger(__name__)
+
+_COMPRESSED_FLAG = 0x80
+_CODEC_MASK = 0x7F
+
+# msgpack extension type codes
+_EXT_UUID = 1
+_EXT_DATETIME = 2
+_EXT_DATE = 3
+
+
+class CodecError(Exception):
+    """Raised when a payload cannot be encoded or decoded."""
+    pass
+
+
+def _to_builtin(obj: Any) -> Any:
+    """
+    Type hook converting common non-JSON types to JSON-compatible values.
+
+    Handles Pydantic models, dataclasses, UUID, datetime/date, Decimal,
+    Enum and sets.
+    """
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+class Codec:
+    """Base class for cache codecs."""
+
+    codec_id: int = 0
+    name: str = ""
+
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value to bytes."""
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Any:
+        """Deserialize bytes to a value."""
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    """Standard library JSON codec (always available)."""
+
+    codec_id = 1
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, default=_to_builtin, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """orjson codec; serializes UUID/datetime/dataclasses natively."""
+
+    codec_id = 2
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise CodecError("orjson is not installed")
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(value, default=_to_builtin, option=orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec(Codec):
+    """
+    msgpack codec.
+
+    Round-trips UUID, datetime and date through extension types instead of
+    converting them to strings.
+    """
+
+    codec_id = 3
+    name = "msgpack"
+
+    def __init__(self):
+        if msgpack is None:
+            raise CodecError("msgpack is not installed")
+
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, uuid.UUID):
+            return msgpack.ExtType(_EXT_UUID, obj.bytes)
+        if isinstance(obj, datetime):
+            return msgpack.ExtType(_EXT_DATETIME, obj.isoformat().encode("utf-8"))
+        if isinstance(obj, date):
+            return msgpack.ExtType(_EXT_DATE, obj.isoformat().encode("utf-8"))
+        if hasattr(obj, "model_dump"):
+            return obj.model_dump()
+        return _to_builtin(obj)
+
+    @staticmethod
+    def _ext_hook(code: int, data: bytes) -> Any:
+        if code == _EXT_UUID:
+            return uuid.UUID(bytes=data)
+        if code == _EXT_DATETIME:
+            return datetime.fromisoformat(data.decode("utf-8"))
+        if code == _EXT_DATE:
+            return date.fromisoformat(data.decode("utf-8"))
+        return msgpack.ExtType(code, data)
+
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=self._default, use_bin_type=True, datetime=False)
+
+    def decode(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, ext_hook=self._ext_hook, raw=False, strict_map_key=False)
+
+
+_CODEC_CLASSES = {
+    JsonCodec.codec_id: JsonCodec,
+    OrjsonCodec.codec_id: OrjsonCodec,
+    MsgpackCodec.codec_id: MsgpackCodec,
+}
+_CODECS_BY_NAME = {cls.name: cls for cls in _CODEC_CLASSES.values()}
+_codec_instances: Dict[int, Codec] = {}
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """
+    Get a codec by name.
+
+    Args:
+        name: "json", "orjson" or "msgpack"; None picks the fastest installed
+            JSON-compatible codec (orjson, else json)
+
+    Raises:
+        CodecError: If the codec is unknown or its library is not installed
+    """
+    if name is None:
+        name = "orjson" if orjson is not None else "json"
+
+    codec_cls = _CODECS_BY_NAME.get(name)
+    if codec_cls is None:
+        raise CodecError(f"Unknown cache codec: {name}")
+
+    codec = _codec_instances.get(codec_cls.codec_id)
+    if codec is None:
+        codec = codec_cls()
+        _codec_instances[codec_cls.codec_id] = codec
+    return codec
+
+
+class CacheSerializer:
+    """
+    Frames, optionally compresses and decodes cache payloads.
+
+    Args:
+        codec: Codec used for writing (any registered codec can be read)
+        compress_threshold: Payloads at least this many bytes are zstd
+            compressed; None disables compression
+        compression_level: zstd compression level
+    """
+
+    def __init__(
+        self,
+        codec: Optional[Codec] = None,
+        compress_threshold: Optional[int] = 1024,
+        compression_level: int = 3
+    ):
+        self.codec = codec or get_codec()
+        self.compress_threshold = compress_threshold if zstandard is not None else None
+        self._compressor = zstandard.ZstdCompressor(level=compression_level) if zstandard is not None else None
+        self._decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+
+        if compress_threshold is not None and zstandard is None:
+            logger.info("zstandard not installed; cache compression disabled")
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode and frame a value."""
+        try:
+            body = self.codec.encode(value)
+        except TypeError as e:
+            raise CodecError(str(e)) from e
+
+        header = self.codec.codec_id
+        if self.compress_threshold is not None and len(body) >= self.compress_threshold:
+            body = self._compressor.compress(body)
+            header |= _COMPRESSED_FLAG
+
+        return bytes((header,)) + body
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a framed payload written by any serializer."""
+        if not self.is_framed(data):
+            raise CodecError("Payload is not a framed cache value")
+
+        header = data[0]
+        body = data[1:]
+
+        if header & _COMPRESSED_FLAG:
+            if self._decompressor is None:
+                raise CodecError("Compressed payload but zstandard is not installed")
+            body = self._decompressor.decompress(body)
+
+        codec_id = header & _CODEC_MASK
+        codec = _codec_instances.get(codec_id)
+        if codec is None:
+            codec = get_codec(_CODEC_CLASSES[codec_id].name)
+        return codec.decode(body)
+
+    @staticmethod
+    def is_framed(data: Any) -> bool:
+        """Check whether raw Redis data carries a codec frame header."""
+        return (
+            isinstance(data, (bytes, bytearray))
+            and len(data) > 1
+            and (data[0] & _CODEC_MASK) in _CODEC_CLASSES
+        )
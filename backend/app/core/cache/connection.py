@@ -1,112 +1,385 @@
 """
 Redis connection management for the new infrastructure layer.
-Provides connection pooling and basic Redis operations.
+Provides a single client factory with shared connection pools per logical
+database, optional Sentinel/Cluster support, pipelining helpers and pool
+saturation metrics.
 """
 
-from typing import Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, urlunparse
+import asyncio
 import logging
-import json
 
 import redis.asyncio as redis
 from redis.asyncio.connection import ConnectionPool
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from app.core.config import get_settings
+from app.core.metrics import (
+    REDIS_POOL_EXHAUSTED_TOTAL,
+    REDIS_POOL_IDLE_CONNECTIONS,
+    REDIS_POOL_IN_USE_CONNECTIONS,
+    REDIS_POOL_MAX_CONNECTIONS,
+)
 
 settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+# (logical db, decode_responses)
+PoolKey = Tuple[int, bool]
+
+# Connection options shared by every pool
+_SOCKET_OPTIONS = {
+    "socket_connect_timeout": 5,
+    "socket_timeout": 5,
+    "retry_on_timeout": True,
+    "health_check_interval": 30,
+}
+
+
+class _InstrumentedBlockingPool(redis.BlockingConnectionPool):
+    """
+    Blocking pool that counts checkouts which time out.
+
+    Only the wait for a free slot is bounded by ``timeout`` and counted as
+    exhaustion; connecting happens after the slot is reserved and outside
+    the pool lock, so an unreachable Redis fails fast with its own error
+    (redis-py's version connects under the lock and reports connect
+    failures as "No connection available." once the timeout expires).
+    """
+
+    pool_label: str = ""
+
+    async def get_connection(self, command_name, *keys, **options):
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with self._condition:
+                    await self._condition.wait_for(self.can_get_connection)
+                    try:
+                        connection = self._available_connections.pop()
+                    except IndexError:
+                        connection = self.make_connection()
+                    self._in_use_connections.add(connection)
+        except TimeoutError as err:
+            REDIS_POOL_EXHAUSTED_TOTAL.labels(pool=self.pool_label).inc()
+            raise RedisConnectionError("No connection available.") from err
+
+        try:
+            await self.ensure_connection(connection)
+        except BaseException:
+            await self.release(connection)
+            raise
+        return connection
+
+
+def _pool_label(key: PoolKey) -> str:
+    db, decode_responses = key
+    return f"db{db}:{'text' if decode_responses else 'binary'}"
+
+
+class RedisClientFactory:
+    """
+    Creates and shares Redis clients.
+
+    One connection pool is kept per (logical database, decode_responses)
+    pair and shared by every caller, so the cache, rate limiter and token
+    blacklist no longer size and open their own pools. Standalone pools
+    block (up to ``pool_timeout``) instead of failing when saturated.
+
+    Modes:
+    - standalone: plain Redis at ``redis_url``
+    - sentinel: master discovered via ``REDIS_SENTINELS``
+    - cluster: Redis Cluster (logical databases are not supported; db is ignored)
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        mode: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        pool_timeout: Optional[float] = None
+    ):
+        """
+        Initialize the factory.
+
+        Args:
+            redis_url: Redis URL, defaults to settings.REDIS_URL
+            mode: "standalone", "sentinel" or "cluster", defaults to settings.REDIS_MODE
+            pool_size: Max connections per pool, defaults to settings.REDIS_POOL_SIZE
+            pool_timeout: Seconds to wait for a free connection, defaults to settings.REDIS_POOL_TIMEOUT
+        """
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.mode = (mode or settings.REDIS_MODE).lower()
+        self.pool_size = pool_size or settings.REDIS_POOL_SIZE
+        self.pool_timeout = pool_timeout if pool_timeout is not None else settings.REDIS_POOL_TIMEOUT
+        self._clients: Dict[PoolKey, redis.Redis] = {}
+        self._sentinel = None
+
+        if self.mode not in ("standalone", "sentinel", "cluster"):
+            raise ValueError(f"Unsupported REDIS_MODE: {self.mode}")
+
+    def _url_for_db(self, db: int) -> str:
+        """Return the configured URL pointing at a logical database."""
+        parsed = urlparse(self.redis_url)
+        return urlunparse(parsed._replace(path=f"/{db}"))
+
+    def _create_client(self, key: PoolKey) -> redis.Redis:
+        """Create a client (and its pool) for a pool key."""
+        db, decode_responses = key
+
+        if self.mode == "cluster":
+            from redis.asyncio.cluster import RedisCluster
+            # RedisCluster retries timeouts itself and rejects retry_on_timeout
+            cluster_options = {k: v for k, v in _SOCKET_OPTIONS.items() if k != "retry_on_timeout"}
+            return RedisCluster.from_url(
+                self.redis_url,
+                decode_responses=decode_responses,
+                max_connections=self.pool_size,
+                **cluster_options,
+            )
+
+        if self.mode == "sentinel":
+            if self._sentinel is None:
+                from redis.asyncio.sentinel import Sentinel
+                sentinels = [
+                    (host.strip(), int(port))
+                    for host, _, port in (
+                        item.partition(":") for item in settings.REDIS_SENTINELS.split(",") if item.strip()
+                    )
+                ]
+                if not sentinels:
+                    raise ValueError("REDIS_SENTINELS must be set when REDIS_MODE=sentinel")
+                self._sentinel = Sentinel(
+                    sentinels,
+                    password=settings.REDIS_PASSWORD,
+                    sentinel_kwargs={"password": settings.REDIS_PASSWORD},
+                    socket_timeout=_SOCKET_OPTIONS["socket_timeout"],
+                )
+            client = self._sentinel.master_for(
+                settings.REDIS_SENTINEL_SERVICE,
+                db=db,
+                decode_responses=decode_responses,
+                max_connections=self.pool_size,
+                **_SOCKET_OPTIONS,
+            )
+            self._register_pool_metrics(key, client.connection_pool)
+            return client
+
+        pool = _InstrumentedBlockingPool.from_url(
+            self._url_for_db(db),
+            max_connections=self.pool_size,
+            timeout=self.pool_timeout,
+            decode_responses=decode_responses,
+            **_SOCKET_OPTIONS,
+        )
+        pool.pool_label = _pool_label(key)
+        self._register_pool_metrics(key, pool)
+        return redis.Redis(connection_pool=pool)
+
+    def _register_pool_metrics(self, key: PoolKey, pool: ConnectionPool) -> None:
+        """Expose pool saturation as gauges evaluated at scrape time."""
+        label = _pool_label(key)
+        REDIS_POOL_MAX_CONNECTIONS.labels(pool=label).set(pool.max_connections)
+        REDIS_POOL_IN_USE_CONNECTIONS.labels(pool=label).set_function(
+            lambda: len(getattr(pool, "_in_use_connections", ()))
+        )
+        REDIS_POOL_IDLE_CONNECTIONS.labels(pool=label).set_function(
+            lambda: len(getattr(pool, "_available_connections", ()))
+        )
+
+    def get_client(self, db: int = 0, decode_responses: bool = True) -> redis.Redis:
+        """
+        Get the shared client for a logical database.
+
+        Args:
+            db: Logical database number (ignored in cluster mode)
+            decode_responses: Return str (True) or raw bytes (False)
+
+        Returns:
+            A Redis client backed by the shared pool for (db, decode_responses)
+        """
+        key: PoolKey = (0 if self.mode == "cluster" else db, decode_responses)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._create_client(key)
+            self._clients[key] = client
+            logger.info(f"Redis pool created ({self.mode}, {_pool_label(key)}, max={self.pool_size})")
+        return client
+
+    async def execute_pipeline(
+        self,
+        build: Callable[[Any], None],
+        db: int = 0,
+        transaction: bool = False,
+        decode_responses: bool = True
+    ) -> List[Any]:
+        """
+        Queue commands on a pipeline and execute them in one round trip.
+
+        Args:
+            build: Callable receiving the pipeline and queuing commands on it
+            db: Logical database number
+            transaction: Wrap the commands in MULTI/EXEC
+            decode_responses: Use the text (True) or binary (False) client
+
+        Returns:
+            Results of the queued commands, in order
+
+        Example:
+            results = await factory.execute_pipeline(
+                lambda pipe: [pipe.get(k) for k in keys]
+            )
+        """
+        client = self.get_client(db, decode_responses)
+        async with client.pipeline(transaction=transaction) as pipe:
+            build(pipe)
+            return await pipe.execute()
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get saturation figures for every pool.
+
+        Returns:
+            Mapping of pool label to max/in_use/idle connection counts
+        """
+        stats = {}
+        for key, client in self._clients.items():
+            pool = getattr(client, "connection_pool", None)
+            if pool is None:
+                continue
+            stats[_pool_label(key)] = {
+                "max": pool.max_connections,
+                "in_use": len(getattr(pool, "_in_use_connections", ())),
+                "idle": len(getattr(pool, "_available_connections", ())),
+            }
+        return stats
+
+    async def health_check(self, db: int = 0) -> bool:
+        """
+        Check if Redis is reachable.
+
+        Returns:
+            True if the connection is healthy, False otherwise
+        """
+        try:
+            await self.get_client(db).ping()
+            return True
+        except Exception as e:
+            logger.error(f"Redis health check failed: {e}")
+            return False
+
+    async def close(self):
+        """Close every client and its pool."""
+        for key, client in list(self._clients.items()):
+            try:
+                await client.aclose() if hasattr(client, "aclose") else await client.close()
+                pool = getattr(client, "connection_pool", None)
+                if pool is not None:
+                    await pool.disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing Redis pool {_pool_label(key)}: {e}")
+        self._clients.clear()
+        self._sentinel = None
+        logger.info("Redis pools closed")
+
+
+# Global Redis client factory
+_redis_factory: Optional[RedisClientFactory] = None
+
+
+def get_redis_factory() -> RedisClientFactory:
+    """
+    Get the global Redis client factory.
+
+    Returns:
+        The global RedisClientFactory instance
+    """
+    global _redis_factory
+    if _redis_factory is None:
+        _redis_factory = RedisClientFactory()
+    return _redis_factory
+
 
 class RedisConnection:
     """
-    Manages Redis connections with async support.
-    
+    Manages the cache's Redis clients.
+
     This class provides:
-    - Connection pooling
+    - Shared connection pooling (via RedisClientFactory)
     - Health checks
     - Graceful shutdown
     """
-    
+
     def __init__(self, redis_url: Optional[str] = None):
         """
         Initialize the Redis connection manager.
-        
+
         Args:
-            redis_url: Optional Redis URL, defaults to settings.REDIS_URL
+            redis_url: Optional Redis URL; uses the global factory when omitted
         """
-        self.redis_url = redis_url or settings.REDIS_URL
-        self._pool: Optional[ConnectionPool] = None
+        self._factory = RedisClientFactory(redis_url) if redis_url else get_redis_factory()
+        self._db = settings.REDIS_CACHE_DB
         self._client: Optional[redis.Redis] = None
-    
+        self._binary_client: Optional[redis.Redis] = None
+
     async def initialize(self):
         """
-        Initialize the Redis connection pool and client.
+        Initialize the Redis clients and verify connectivity.
         """
         if self._client is not None:
             logger.warning("Redis client already initialized")
             return
-        
+
         try:
-            # Create connection pool
-            self._pool = redis.ConnectionPool.from_url(
-                self.redis_url,
-                max_connections=settings.REDIS_POOL_SIZE,
-                decode_responses=True,  # Automatically decode responses to strings
-                socket_connect_timeout=5,
-                socket_timeout=5,
-                retry_on_timeout=True,
-                health_check_interval=30
-            )
-            
-            # Create Redis client
-            self._client = redis.Redis(connection_pool=self._pool)
-            
-            # Test the connection
-            await self._client.ping()
-            
+            client = self._factory.get_client(self._db)
+            await client.ping()
+            self._client = client
+            # Binary client for codec-encoded cache payloads (no response decoding)
+            self._binary_client = self._factory.get_client(self._db, decode_responses=False)
+
             logger.info("Redis connection initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Redis connection: {e}")
             raise
-    
+
     async def close(self):
         """
         Close the Redis connection and clean up resources.
-        
+
         This should be called during application shutdown.
         """
-        if self._client is not None:
-            await self._client.close()
-            self._client = None
-        
-        if self._pool is not None:
-            await self._pool.disconnect()
-            self._pool = None
-        
+        self._client = None
+        self._binary_client = None
+        await self._factory.close()
         logger.info("Redis connection closed")
-    
+
     async def health_check(self) -> bool:
         """
         Check if the Redis connection is healthy.
-        
+
         Returns:
             True if the connection is healthy, False otherwise
         """
         if self._client is None:
             return False
-        
-        try:
-            await self._client.ping()
-            return True
-        except Exception as e:
-            logger.error(f"Redis health check failed: {e}")
-            return False
-    
+        return await self._factory.health_check(self._db)
+
+    @property
+    def factory(self) -> RedisClientFactory:
+        """Get the client factory backing this connection."""
+        return self._factory
+
     @property
     def client(self) -> Optional[redis.Redis]:
         """Get the Redis client instance."""
         return self._client
-    
+
+    @property
+    def binary_client(self) -> Optional[redis.Redis]:
+        """Get the Redis client that returns raw bytes."""
+        return self._binary_client
+
     @property
     def is_initialized(self) -> bool:
         """Check if the connection is initialized."""
@@ -120,7 +393,7 @@ _redis_connection: Optional[RedisConnection] = None
 def get_redis_connection() -> RedisConnection:
     """
     Get the global Redis connection instance.
-    
+
     Returns:
         The global RedisConnection instance
     """
@@ -145,14 +418,30 @@ async def close_redis():
 async def get_redis_client() -> redis.Redis:
     """
     Get the Redis client for dependency injection.
-    
+
     Returns:
         The Redis client instance
-        
+
+    Raises:
+        RuntimeError: If the Redis connection is not initialized
+    """
+    connection = get_redis_connection()
+    if not connection.is_initialized:
+        raise RuntimeError("Redis connection not initialized")
+    return connection.client
+
+
+async def get_binary_redis_client() -> redis.Redis:
+    """
+    Get the Redis client that returns raw bytes (for binary cache codecs).
+
+    Returns:
+        The binary Redis client instance
+
     Raises:
         RuntimeError: If the Redis connection is not initialized
     """
     connection = get_redis_connection()
     if not connection.is_initialized:
         raise RuntimeError("Redis connection not initialized")
-    return connection.client
\ No newline at end of file
+    return connection.binary_client
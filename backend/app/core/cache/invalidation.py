@@ -0,0 +1,121 @@
+"""
+Cross-instance L1 invalidation over Redis pub/sub.
+
+Every CacheService registers itself here. Writes and invalidations publish a
+small message so other application instances drop their in-process copies.
+"""
+
+from typing import Dict, Iterable, Optional, TYPE_CHECKING
+import asyncio
+import json
+import logging
+import uuid
+import weakref
+
+import redis.asyncio as redis
+
+if TYPE_CHECKING:
+    from app.core.cache.service import CacheService
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Identifies this process so it can ignore its own messages
+INSTANCE_ID = uuid.uuid4().hex
+
+_services: Dict[str, "weakref.WeakSet[CacheService]"] = {}
+_listener_task: Optional[asyncio.Task] = None
+
+
+def register_service(service: "CacheService") -> None:
+    """Register a cache service to receive invalidation messages."""
+    _services.setdefault(service.namespace, weakref.WeakSet()).add(service)
+
+
+def build_message(
+    namespace: str,
+    keys: Optional[Iterable[str]] = None,
+    version: Optional[int] = None
+) -> str:
+    """
+    Build an invalidation message.
+
+    Args:
+        namespace: Cache namespace
+        keys: Logical keys whose L1 copies should be dropped
+        version: New namespace version (drops the whole namespace)
+    """
+    message = {"origin": INSTANCE_ID, "ns": namespace}
+    if keys is not None:
+        message["keys"] = list(keys)
+    if version is not None:
+        message["version"] = version
+    return json.dumps(message)
+
+
+def handle_message(data: str) -> None:
+    """Apply an invalidation message to the local services."""
+    try:
+        message = json.loads(data)
+    except (json.JSONDecodeError, TypeError):
+        logger.warning("Ignoring malformed cache invalidation message")
+        return
+
+    if message.get("origin") == INSTANCE_ID:
+        return
+
+    for service in list(_services.get(message.get("ns"), ())):
+        if "version" in message:
+            service._apply_version(int(message["version"]))
+        if "keys" in message:
+            service._evict_local(message["keys"])
+
+
+async def _listen(client: redis.Redis) -> None:
+    """Subscribe to the invalidation channel until cancelled."""
+    while True:
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            logger.info("Cache invalidation listener subscribed")
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    handle_message(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Local copies may now be stale; drop them and resubscribe
+            logger.error(f"Cache invalidation listener error: {e}")
+            for services in _services.values():
+                for service in list(services):
+                    service._evict_local_all()
+            await asyncio.sleep(1)
+        finally:
+            try:
+                await pubsub.close()
+            except Exception:
+                pass
+
+
+async def start_invalidation_listener(client: redis.Redis) -> None:
+    """Start the background pub/sub listener (idempotent)."""
+    global _listener_task
+    if _listener_task is not None and not _listener_task.done():
+        return
+    _listener_task = asyncio.create_task(_listen(client))
+
+
+async def stop_invalidation_listener() -> None:
+    """Stop the background pub/sub listener."""
+    global _listener_task
+    if _listener_task is None:
+        return
+
+    _listener_task.cancel()
+    try:
+        await _listener_task
+    except (asyncio.CancelledError, Exception):
+        pass
+    _listener_task = None
+    logger.info("Cache invalidation listener stopped")
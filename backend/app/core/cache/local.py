@@ -0,0 +1,120 @@
+"""
+In-process L1 cache tier.
+Bounded LRU with per-entry TTL, used in front of Redis by CacheService.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Tuple
+import time
+
+
+@dataclass
+class LocalEntry:
+    """A cached value plus the metadata needed for early refresh."""
+    value: Any
+    local_expires_at: float             # When this L1 copy must be dropped
+    expires_at: Optional[float] = None  # Logical expiry of the cached value
+    delta: float = 0.0                  # Time it took to compute the value
+
+
+class LocalCache:
+    """
+    Bounded LRU cache with TTL.
+
+    Not thread-safe; intended to be used from a single event loop.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 30.0):
+        """
+        Initialize the local cache.
+
+        Args:
+            max_size: Maximum number of entries before LRU eviction
+            ttl: Maximum lifetime of an entry in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, LocalEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[LocalEntry]:
+        """Return the entry for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.local_expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        expires_at: Optional[float] = None,
+        delta: float = 0.0
+    ) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime in seconds, capped at the cache's own TTL
+            expires_at: Logical (wall clock) expiry of the value
+            delta: Recompute cost in seconds
+        """
+        if self.max_size <= 0:
+            return
+
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if lifetime <= 0:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = LocalEntry(
+            value=value,
+            local_expires_at=time.monotonic() + lifetime,
+            expires_at=expires_at,
+            delta=delta,
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        """Remove a key. Returns True if it was present."""
+        return self._entries.pop(key, None) is not None
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Remove several keys. Returns the number removed."""
+        return sum(1 for key in keys if self._entries.pop(key, None) is not None)
+
+    def clear(self, prefix: Optional[str] = None) -> int:
+        """Remove all entries, or only those starting with prefix."""
+        if prefix is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+        stale = [key for key in self._entries if key.startswith(prefix)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def stats(self) -> Tuple[int, int, int]:
+        """Return (size, hits, misses)."""
+        return len(self._entries), self.hits, self.misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
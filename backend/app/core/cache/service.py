@@ -1,59 +1,235 @@
 """
 Cache service for the new infrastructure layer.
-Provides caching functionality with TTL support and JSON serialization.
+Provides two-tier (in-process + Redis) caching with TTL support and pluggable codecs.
 """
 
-from typing import Optional, Any, Union
+from typing import Optional, Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Tuple, Union
+import asyncio
 import json
 import logging
+import math
+import random
+import time
+import weakref
 from datetime import timedelta
 
 import redis.asyncio as redis
 
-from app.core.cache.connection import get_redis_client
+from app.core.cache.codecs import CacheSerializer, CodecError
+from app.core.cache.connection import get_binary_redis_client
+from app.core.cache.invalidation import (
+    INVALIDATION_CHANNEL,
+    build_message,
+    register_service,
+)
+from app.core.cache.local import LocalCache
 
 logger = logging.getLogger(__name__)
 
+# Marker key identifying values written by CacheService (value + refresh metadata)
+_ENVELOPE_MARKER = "__cache__"
+
+# (value, expires_at, delta) as read from either tier
+CacheEntry = Tuple[Any, Optional[float], float]
+
 
 class CacheService:
     """
-    Service for caching data in Redis.
+    Two-tier cache: in-process LRU (L1) in front of Redis (L2).
     
     This service provides:
     - Key-value caching with TTL
-    - JSON serialization for complex objects
-    - Cache invalidation
-    - Namespace support for cache keys
+    - Pluggable codecs (orjson/msgpack/json) with optional zstd compression
+    - Batched reads/writes (get_many/set_many) in a single round trip
+    - get_or_compute with per-key single-flight and early probabilistic refresh
+    - Namespace-versioned invalidation (O(1), no SCAN)
+    - Cross-instance L1 eviction via Redis pub/sub
     """
     
-    def __init__(self, namespace: str = "cache", client: Optional[redis.Redis] = None):
+    VERSION_KEY = "__version__"
+    
+    # Applied when no TTL is given so entries orphaned by a namespace
+    # version bump are eventually reclaimed by Redis
+    DEFAULT_TTL = 86400
+    
+    def __init__(
+        self,
+        namespace: str = "cache",
+        client: Optional[redis.Redis] = None,
+        local_max_size: int = 1024,
+        local_ttl: float = 30.0,
+        version_ttl: float = 5.0,
+        default_ttl: Optional[int] = None,
+        serializer: Optional[CacheSerializer] = None
+    ):
         """
         Initialize the cache service.
         
         Args:
             namespace: Namespace prefix for all cache keys
-            client: Optional Redis client, will use global client if not provided
+            client: Optional Redis client, will use the global binary client if
+                not provided (must not use decode_responses)
+            local_max_size: Maximum L1 entries (0 disables the L1 tier)
+            local_ttl: Maximum lifetime of an L1 entry in seconds
+            version_ttl: How long the namespace version is trusted locally
+                before re-reading it from Redis (pub/sub normally updates it)
+            default_ttl: TTL used when set() is called without one
+            serializer: Payload serializer (defaults to the fastest installed
+                codec, zstd-compressed above 1KB when available)
         """
         self.namespace = namespace
         self._client = client
+        self._local = LocalCache(local_max_size, local_ttl) if local_max_size > 0 else None
+        self.version_ttl = version_ttl
+        self.default_ttl = default_ttl or self.DEFAULT_TTL
+        self.serializer = serializer or CacheSerializer()
+        self._version: Optional[int] = None
+        self._version_checked_at = 0.0
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        register_service(self)
     
     async def _get_client(self) -> redis.Redis:
         """Get the Redis client, using the provided one or the global one."""
         if self._client is None:
-            self._client = await get_redis_client()
+            self._client = await get_binary_redis_client()
         return self._client
     
-    def _make_key(self, key: str) -> str:
+    def _version_key(self) -> str:
+        """Redis key holding the namespace version."""
+        return f"{self.namespace}:{self.VERSION_KEY}"
+    
+    def _make_key(self, key: str, version: int) -> str:
         """
-        Create a namespaced cache key.
+        Create a namespaced, versioned cache key.
         
         Args:
             key: The cache key
+            version: Current namespace version
             
         Returns:
             The namespaced key
         """
-        return f"{self.namespace}:{key}"
+        return f"{self.namespace}:v{version}:{key}"
+    
+    async def _get_version(self, client: redis.Redis) -> int:
+        """Return the current namespace version, refreshing it if stale."""
+        now = time.monotonic()
+        if self._version is not None and now - self._version_checked_at < self.version_ttl:
+            return self._version
+        
+        raw = await client.get(self._version_key())
+        self._apply_version(int(raw) if raw else 0)
+        return self._version
+    
+    def _apply_version(self, version: int) -> None:
+        """Adopt a namespace version, dropping L1 entries from older versions."""
+        if self._version is not None and version != self._version:
+            self._evict_local_all()
+        self._version = version
+        self._version_checked_at = time.monotonic()
+    
+    def _evict_local(self, keys: Iterable[str]) -> None:
+        """Drop L1 copies of the given keys."""
+        if self._local is not None:
+            self._local.delete_many(keys)
+    
+    def _evict_local_all(self) -> None:
+        """Drop every L1 entry."""
+        if self._local is not None:
+            self._local.clear()
+    
+    def _store_local(self, key: str, value: Any, expires_at: Optional[float], delta: float) -> None:
+        """Populate L1 with a value read from or written to Redis."""
+        if self._local is None:
+            return
+        ttl = expires_at - time.time() if expires_at is not None else None
+        self._local.set(key, value, ttl=ttl, expires_at=expires_at, delta=delta)
+    
+    @staticmethod
+    def _normalize_ttl(ttl: Optional[Union[int, timedelta]]) -> Optional[int]:
+        """Convert timedelta to seconds."""
+        if isinstance(ttl, timedelta):
+            return int(ttl.total_seconds())
+        return ttl
+    
+    def _encode(self, value: Any, ttl: Optional[int], delta: float = 0.0) -> bytes:
+        """Serialize a value with the metadata needed for early refresh."""
+        return self.serializer.dumps({
+            _ENVELOPE_MARKER: 1,
+            "v": value,
+            "e": time.time() + ttl if ttl else None,
+            "d": delta,
+        })
+    
+    def _decode(self, raw: Any) -> CacheEntry:
+        """Deserialize a stored value into (value, expires_at, delta)."""
+        if self.serializer.is_framed(raw):
+            try:
+                data = self.serializer.loads(raw)
+            except Exception as e:
+                raise CodecError(f"Failed to decode cached value: {e}") from e
+        else:
+            # Unframed value (legacy JSON or raw string written with serialize=False)
+            try:
+                data = json.loads(raw)
+            except (json.JSONDecodeError, TypeError, UnicodeDecodeError):
+                return self._raw_to_str(raw), None, 0.0
+        
+        if isinstance(data, dict) and data.get(_ENVELOPE_MARKER) == 1:
+            return data.get("v"), data.get("e"), data.get("d") or 0.0
+        return data, None, 0.0
+    
+    @staticmethod
+    def _raw_to_str(raw: Any) -> Any:
+        """Return raw bytes as text when they are valid UTF-8."""
+        if isinstance(raw, (bytes, bytearray)):
+            try:
+                return raw.decode("utf-8")
+            except UnicodeDecodeError:
+                return raw
+        return raw
+    
+    async def _get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Read a key from L1, falling back to Redis."""
+        if self._local is not None:
+            entry = self._local.get(key)
+            if entry is not None:
+                return entry.value, entry.expires_at, entry.delta
+        
+        client = await self._get_client()
+        version = await self._get_version(client)
+        raw = await client.get(self._make_key(key, version))
+        if raw is None:
+            return None
+        
+        value, expires_at, delta = self._decode(raw)
+        self._store_local(key, value, expires_at, delta)
+        return value, expires_at, delta
+    
+    async def _write(
+        self,
+        items: Mapping[str, Any],
+        ttl: Optional[int],
+        delta: float = 0.0,
+        serialize: bool = True
+    ) -> None:
+        """Write items to Redis and L1, and evict other instances' L1 copies."""
+        client = await self._get_client()
+        version = await self._get_version(client)
+        ttl = ttl or self.default_ttl
+        
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                payload = self._encode(value, ttl, delta) if serialize else value
+                pipe.set(self._make_key(key, version), payload, ex=ttl)
+            pipe.publish(INVALIDATION_CHANNEL, build_message(self.namespace, keys=items.keys()))
+            await pipe.execute()
+        
+        for key, value in items.items():
+            if serialize:
+                self._store_local(key, value, time.time() + ttl, delta)
+            else:
+                self._evict_local([key])
     
     async def get(
         self,
@@ -67,31 +243,65 @@ class CacheService:
         Args:
             key: The cache key
             default: Default value if key not found
-            deserialize: Whether to deserialize JSON values
+            deserialize: Whether to decode the stored value
             
         Returns:
             The cached value or default
         """
         try:
-            client = await self._get_client()
-            full_key = self._make_key(key)
-            value = await client.get(full_key)
-            
-            if value is None:
-                return default
+            if not deserialize:
+                client = await self._get_client()
+                version = await self._get_version(client)
+                value = await client.get(self._make_key(key, version))
+                return default if value is None else self._raw_to_str(value)
             
-            if deserialize:
-                try:
-                    return json.loads(value)
-                except (json.JSONDecodeError, TypeError):
-                    return value
-            
-            return value
+            entry = await self._get_entry(key)
+            return default if entry is None else entry[0]
             
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
             return default
     
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Get several values, serving L1 hits locally and the rest with one MGET.
+        
+        Args:
+            keys: The cache keys
+            
+        Returns:
+            Mapping of found keys to values (missing keys are omitted)
+        """
+        result: Dict[str, Any] = {}
+        missing: List[str] = []
+        
+        for key in dict.fromkeys(keys):
+            entry = self._local.get(key) if self._local is not None else None
+            if entry is None:
+                missing.append(key)
+            else:
+                result[key] = entry.value
+        
+        if not missing:
+            return result
+        
+        try:
+            client = await self._get_client()
+            version = await self._get_version(client)
+            raws = await client.mget([self._make_key(key, version) for key in missing])
+            
+            for key, raw in zip(missing, raws):
+                if raw is None:
+                    continue
+                value, expires_at, delta = self._decode(raw)
+                self._store_local(key, value, expires_at, delta)
+                result[key] = value
+                
+        except Exception as e:
+            logger.error(f"Cache get_many error for {len(missing)} keys: {e}")
+        
+        return result
+    
     async def set(
         self,
         key: str,
@@ -105,35 +315,133 @@ class CacheService:
         Args:
             key: The cache key
             value: The value to cache
-            ttl: Time to live (seconds or timedelta)
-            serialize: Whether to serialize the value as JSON
+            ttl: Time to live (seconds or timedelta), defaults to default_ttl
+            serialize: Whether to encode the value with the codec
+                (False stores a str/bytes value as-is)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            client = await self._get_client()
-            full_key = self._make_key(key)
+            await self._write({key: value}, self._normalize_ttl(ttl), serialize=serialize)
+            return True
             
-            # Serialize value if needed
-            if serialize and not isinstance(value, str):
-                value = json.dumps(value)
+        except Exception as e:
+            logger.error(f"Cache set error for key {key}: {e}")
+            return False
+    
+    async def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl: Optional[Union[int, timedelta]] = None
+    ) -> bool:
+        """
+        Set several values in one pipelined round trip.
+        
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Time to live applied to every item
             
-            # Convert timedelta to seconds
-            if isinstance(ttl, timedelta):
-                ttl = int(ttl.total_seconds())
+        Returns:
+            True if successful, False otherwise
+        """
+        if not items:
+            return True
+        
+        try:
+            await self._write(items, self._normalize_ttl(ttl))
+            return True
             
-            # Set the value with optional TTL
-            if ttl:
-                await client.setex(full_key, ttl, value)
-            else:
-                await client.set(full_key, value)
+        except Exception as e:
+            logger.error(f"Cache set_many error for {len(items)} keys: {e}")
+            return False
+    
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[Union[int, timedelta]] = None,
+        beta: float = 1.0
+    ) -> Any:
+        """
+        Return a cached value, computing and caching it on a miss.
+        
+        Concurrent misses for the same key in this process share a single
+        computation. Values are refreshed early with a probability that grows
+        as expiry approaches, weighted by how long the value took to compute
+        (XFetch), so hot keys are recomputed before they expire instead of
+        stampeding once they do. While one caller refreshes, others keep
+        receiving the current value.
+        
+        Args:
+            key: The cache key
+            compute: Coroutine function producing the value
+            ttl: Time to live (seconds or timedelta)
+            beta: Early refresh aggressiveness (> 1 refreshes earlier)
             
-            return True
+        Returns:
+            The cached or freshly computed value
             
+        Raises:
+            Any exception raised by compute when no cached value is available
+        """
+        ttl = self._normalize_ttl(ttl)
+        
+        try:
+            entry = await self._get_entry(key)
         except Exception as e:
-            logger.error(f"Cache set error for key {key}: {e}")
+            logger.error(f"Cache get error for key {key}: {e}")
+            entry = None
+        
+        if entry is not None and not self._should_refresh(entry, beta):
+            return entry[0]
+        
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+        
+        if entry is not None and lock.locked():
+            # Someone else is already refreshing; serve the current value
+            return entry[0]
+        
+        async with lock:
+            if entry is None:
+                # Another coroutine (or another instance, via Redis) may have
+                # filled the key while we waited
+                try:
+                    filled = await self._get_entry(key)
+                except Exception as e:
+                    logger.error(f"Cache get error for key {key}: {e}")
+                    filled = None
+                if filled is not None:
+                    return filled[0]
+
+            started = time.monotonic()
+            try:
+                value = await compute()
+            except Exception as e:
+                if entry is None:
+                    raise
+                logger.warning(f"Cache refresh failed for key {key}, serving cached value: {e}")
+                return entry[0]
+            delta = time.monotonic() - started
+            
+            try:
+                await self._write({key: value}, ttl, delta=delta)
+            except Exception as e:
+                logger.error(f"Cache set error for key {key}: {e}")
+            
+            return value
+    
+    @staticmethod
+    def _should_refresh(entry: CacheEntry, beta: float) -> bool:
+        """XFetch early expiration check."""
+        _, expires_at, delta = entry
+        if expires_at is None:
             return False
+        # -log(u) for u in (0, 1] is an exponential sample >= 0
+        return time.time() - delta * beta * math.log(1.0 - random.random()) >= expires_at
     
     async def delete(self, key: str) -> bool:
         """
@@ -146,9 +454,14 @@ class CacheService:
             True if the key was deleted, False otherwise
         """
         try:
+            self._evict_local([key])
             client = await self._get_client()
-            full_key = self._make_key(key)
-            result = await client.delete(full_key)
+            version = await self._get_version(client)
+            
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.delete(self._make_key(key, version))
+                pipe.publish(INVALIDATION_CHANNEL, build_message(self.namespace, keys=[key]))
+                result, _ = await pipe.execute()
             return result > 0
             
         except Exception as e:
@@ -166,9 +479,11 @@ class CacheService:
             True if the key exists, False otherwise
         """
         try:
+            if self._local is not None and self._local.get(key) is not None:
+                return True
             client = await self._get_client()
-            full_key = self._make_key(key)
-            return await client.exists(full_key) > 0
+            version = await self._get_version(client)
+            return await client.exists(self._make_key(key, version)) > 0
             
         except Exception as e:
             logger.error(f"Cache exists error for key {key}: {e}")
@@ -176,25 +491,24 @@ class CacheService:
     
     async def clear_namespace(self) -> int:
         """
-        Clear all keys in this cache's namespace.
+        Invalidate all keys in this cache's namespace.
+        
+        Bumps the namespace version instead of scanning and deleting keys, so
+        the cost is constant regardless of namespace size. Entries written
+        under older versions become unreachable and expire through their TTL.
+        Other instances drop their L1 copies via pub/sub.
         
         Returns:
-            The number of keys deleted
+            The new namespace version, or 0 on error
         """
         try:
+            self._evict_local_all()
             client = await self._get_client()
-            pattern = f"{self.namespace}:*"
             
-            # Find all keys matching the pattern
-            keys = []
-            async for key in client.scan_iter(match=pattern):
-                keys.append(key)
-            
-            # Delete all found keys
-            if keys:
-                return await client.delete(*keys)
-            
-            return 0
+            version = int(await client.incr(self._version_key()))
+            await client.publish(INVALIDATION_CHANNEL, build_message(self.namespace, version=version))
+            self._apply_version(version)
+            return version
             
         except Exception as e:
             logger.error(f"Cache clear namespace error: {e}")
@@ -212,8 +526,8 @@ class CacheService:
         """
         try:
             client = await self._get_client()
-            full_key = self._make_key(key)
-            ttl = await client.ttl(full_key)
+            version = await self._get_version(client)
+            ttl = await client.ttl(self._make_key(key, version))
             
             if ttl == -2:  # Key doesn't exist
                 return None
@@ -238,29 +552,33 @@ class CacheService:
             True if successful, False otherwise
         """
         try:
+            self._evict_local([key])
             client = await self._get_client()
-            full_key = self._make_key(key)
-            
-            # Convert timedelta to seconds
-            if isinstance(ttl, timedelta):
-                ttl = int(ttl.total_seconds())
-            
-            return await client.expire(full_key, ttl)
+            version = await self._get_version(client)
+            return await client.expire(self._make_key(key, version), self._normalize_ttl(ttl))
             
         except Exception as e:
             logger.error(f"Cache extend TTL error for key {key}: {e}")
             return False
+    
+    def local_stats(self) -> Dict[str, int]:
+        """Return L1 size and hit/miss counters."""
+        if self._local is None:
+            return {"size": 0, "hits": 0, "misses": 0}
+        size, hits, misses = self._local.stats()
+        return {"size": size, "hits": hits, "misses": misses}
 
 
 # Convenience function for creating cache services
-def create_cache_service(namespace: str) -> CacheService:
+def create_cache_service(namespace: str, **kwargs: Any) -> CacheService:
     """
     Create a cache service with a specific namespace.
     
     Args:
         namespace: The cache namespace
+        **kwargs: Additional CacheService options (L1 size/TTL, default TTL)
         
     Returns:
         A configured CacheService instance
     """
-    return CacheService(namespace=namespace)
\ No newline at end of file
+    return CacheService(namespace=namespace, **kwargs)
\ No newline at end of file
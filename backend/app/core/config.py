@@ -4,14 +4,9 @@ Handles environment variables and provides secure defaults.
 """
 
 import os
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from pathlib import Path
 
-try:
-    from google.cloud import secretmanager
-except ImportError:
-    secretmanager = None  # Will be None in local dev if not installed yet
-
 # Load environment variables from .env file if it exists
 def load_env_file():
     """Load environment variables from .env file if it exists."""
@@ -30,35 +25,79 @@ def load_env_file():
 load_env_file()
 
 
-def get_secret_from_gcp(secret_name: str) -> Optional[str]:
+# Secrets read from Secret Manager in production
+GCP_SECRET_NAMES = ("db-password-prod", "jwt-secret-key-prod", "openai-api-key-prod")
+
+_gcp_secrets: Dict[str, Optional[str]] = {}
+
+
+def fetch_secrets_from_gcp(secret_names: Iterable[str]) -> Dict[str, Optional[str]]:
     """
-    Get secret from Google Secret Manager (production only).
+    Fetch several secrets from Google Secret Manager concurrently (production only).
+
+    One client is shared and the requests run in parallel, so startup waits
+    for the slowest secret instead of the sum of all of them.
 
     Args:
-        secret_name: Name of the secret in Secret Manager
+        secret_names: Names of the secrets in Secret Manager
 
     Returns:
-        Secret value or None if not in production/error
+        Secret values by name (None if not in production/error)
     """
+    secret_names = list(secret_names)
+
     # Only use Secret Manager in production
-    if os.getenv("ENVIRONMENT") != "production":
-        return None
+    if os.getenv("ENVIRONMENT") != "production" or not secret_names:
+        return {name: None for name in secret_names}
 
-    # Check if Secret Manager client is available
-    if secretmanager is None:
-        print(f"Warning: google-cloud-secret-manager not installed, cannot fetch {secret_name}")
-        return None
+    # Imported here: these are slow to import and only used in production
+    from concurrent.futures import ThreadPoolExecutor
+    try:
+        from google.cloud import secretmanager
+    except ImportError:
+        print(f"Warning: google-cloud-secret-manager not installed, cannot fetch {', '.join(secret_names)}")
+        return {name: None for name in secret_names}
 
     try:
         client = secretmanager.SecretManagerServiceClient()
-        project_id = os.getenv("PROJECT_ID", "ytgrs-464303")
-        name = f"projects/{project_id}/secrets/{secret_name}/versions/latest"
-        response = client.access_secret_version(request={"name": name})
-        return response.payload.data.decode("UTF-8")
     except Exception as e:
-        # Log but don't crash - will fall back to env vars
-        print(f"Warning: Could not fetch secret {secret_name} from Secret Manager: {e}")
-        return None
+        print(f"Warning: Could not create Secret Manager client: {e}")
+        return {name: None for name in secret_names}
+
+    project_id = os.getenv("PROJECT_ID", "ytgrs-464303")
+
+    def access(secret_name: str) -> Optional[str]:
+        try:
+            name = f"projects/{project_id}/secrets/{secret_name}/versions/latest"
+            response = client.access_secret_version(request={"name": name})
+            return response.payload.data.decode("UTF-8")
+        except Exception as e:
+            # Log but don't crash - will fall back to env vars
+            print(f"Warning: Could not fetch secret {secret_name} from Secret Manager: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=len(secret_names)) as executor:
+        return dict(zip(secret_names, executor.map(access, secret_names)))
+
+
+def get_secret_from_gcp(secret_name: str) -> Optional[str]:
+    """
+    Get secret from Google Secret Manager (production only).
+
+    Secrets in GCP_SECRET_NAMES are fetched together on first use.
+
+    Args:
+        secret_name: Name of the secret in Secret Manager
+
+    Returns:
+        Secret value or None if not in production/error
+    """
+    if secret_name not in _gcp_secrets:
+        names = [name for name in GCP_SECRET_NAMES if name not in _gcp_secrets]
+        if secret_name not in names:
+            names.append(secret_name)
+        _gcp_secrets.update(fetch_secrets_from_gcp(names))
+    return _gcp_secrets[secret_name]
 
 
 class DatabaseConfig:
@@ -73,6 +112,32 @@ class DatabaseConfig:
         or os.getenv("DB_PASSWORD", "dev_password_123")
     )
     
+    # Async engine tuning
+    POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "True").lower() in ("true", "1", "yes", "on")
+    ECHO: bool = os.getenv("DB_ECHO", "False").lower() in ("true", "1", "yes", "on")
+    # asyncpg prepared statement cache (set to 0 behind PgBouncer transaction pooling)
+    STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+    SLOW_CHECKOUT_MS: int = int(os.getenv("DB_SLOW_CHECKOUT_MS", "100"))
+    # PostgreSQL JIT compilation; off because compiling costs tens of milliseconds
+    # per query and our short OLTP queries never run long enough to win it back
+    JIT: bool = os.getenv("DB_JIT", "False").lower() in ("true", "1", "yes", "on")
+    
+    # Server-side statement_timeout per workload role (milliseconds, 0 = unlimited)
+    STATEMENT_TIMEOUTS_MS: dict = {
+        "api": int(os.getenv("DB_STATEMENT_TIMEOUT_API_MS", "30000")),
+        "worker": int(os.getenv("DB_STATEMENT_TIMEOUT_WORKER_MS", "120000")),
+        "replica": int(os.getenv("DB_STATEMENT_TIMEOUT_REPLICA_MS", "30000")),
+    }
+    
+    # Read replica (optional - reads use the primary when unset)
+    REPLICA_HOST: str = os.getenv("DB_REPLICA_HOST", "")
+    REPLICA_PORT: int = int(os.getenv("DB_REPLICA_PORT", os.getenv("DB_PORT", "5432")))
+    # Extra attempts for idempotent reads after connection loss or replica conflicts
+    READ_RETRIES: int = int(os.getenv("DB_READ_RETRIES", "2"))
+    READ_RETRY_BACKOFF_MS: int = int(os.getenv("DB_READ_RETRY_BACKOFF_MS", "50"))
+    
     @classmethod
     def get_url(cls, database_name: Optional[str] = None) -> str:
         """
@@ -115,6 +180,21 @@ class DatabaseConfig:
         else:
             # Standard TCP connection (local development)
             return f"postgresql+asyncpg://{cls.USER}:{cls.PASSWORD}@{cls.HOST}:{cls.PORT}/{db_name}"
+    
+    @classmethod
+    def get_replica_async_url(cls) -> Optional[str]:
+        """
+        Get async database URL for the read replica.
+
+        Returns:
+            Replica connection URL, or None when no replica is configured
+        """
+        if not cls.REPLICA_HOST:
+            return None
+
+        if cls.REPLICA_HOST.startswith("/cloudsql/"):
+            return f"postgresql+asyncpg://{cls.USER}:{cls.PASSWORD}@/{cls.NAME}?host={cls.REPLICA_HOST}"
+        return f"postgresql+asyncpg://{cls.USER}:{cls.PASSWORD}@{cls.REPLICA_HOST}:{cls.REPLICA_PORT}/{cls.NAME}"
 
 
 class RedisConfig:
@@ -124,6 +204,19 @@ class RedisConfig:
     PORT: int = int(os.getenv("REDIS_PORT", "6379"))
     PASSWORD: Optional[str] = os.getenv("REDIS_PASSWORD") or None
     
+    # Deployment mode: "standalone", "sentinel" or "cluster"
+    MODE: str = os.getenv("REDIS_MODE", "standalone").lower()
+    SENTINELS: str = os.getenv("REDIS_SENTINELS", "")  # "host1:26379,host2:26379"
+    SENTINEL_SERVICE: str = os.getenv("REDIS_SENTINEL_SERVICE", "mymaster")
+    
+    # Logical databases per use (ignored in cluster mode)
+    CACHE_DB: int = int(os.getenv("REDIS_CACHE_DB", "0"))
+    RATE_LIMIT_DB: int = int(os.getenv("REDIS_RATE_LIMIT_DB", "0"))
+    TOKEN_DB: int = int(os.getenv("REDIS_TOKEN_DB", "0"))
+    
+    # Seconds to wait for a free pooled connection before failing
+    POOL_TIMEOUT: float = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+    
     @classmethod
     def get_url(cls) -> str:
         """
@@ -227,6 +320,7 @@ def get_settings():
         # Database
         DATABASE_URL = get_database_url()
         ASYNC_DATABASE_URL = get_async_database_url()
+        ASYNC_DATABASE_REPLICA_URL = DatabaseConfig.get_replica_async_url()
         TEST_DATABASE_URL = get_test_database_url()
         REDIS_URL = get_redis_url()
         
@@ -260,8 +354,46 @@ def get_settings():
         # Infrastructure settings
         DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "10"))
         DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "20"))
+        DATABASE_WORKER_POOL_SIZE = int(os.getenv("DATABASE_WORKER_POOL_SIZE", "5"))
+        DATABASE_POOL_TIMEOUT = db_config.POOL_TIMEOUT
+        DATABASE_POOL_RECYCLE = db_config.POOL_RECYCLE
+        DATABASE_POOL_PRE_PING = db_config.POOL_PRE_PING
+        DATABASE_ECHO = db_config.ECHO
+        DATABASE_STATEMENT_CACHE_SIZE = db_config.STATEMENT_CACHE_SIZE
+        DATABASE_SLOW_CHECKOUT_MS = db_config.SLOW_CHECKOUT_MS
+        DATABASE_JIT = db_config.JIT
+        DATABASE_STATEMENT_TIMEOUTS_MS = db_config.STATEMENT_TIMEOUTS_MS
+        DATABASE_READ_RETRIES = db_config.READ_RETRIES
+        DATABASE_READ_RETRY_BACKOFF_MS = db_config.READ_RETRY_BACKOFF_MS
+        HEALTH_CACHE_SECONDS = float(os.getenv("HEALTH_CACHE_SECONDS", "5"))
+        HEALTH_CHECK_TIMEOUT_SECONDS = float(os.getenv("HEALTH_CHECK_TIMEOUT_SECONDS", "2"))
+        WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+        WARMUP_DB_CONNECTIONS = int(os.getenv("WARMUP_DB_CONNECTIONS", "2"))
+        WARMUP_REDIS_CONNECTIONS = int(os.getenv("WARMUP_REDIS_CONNECTIONS", "2"))
+        WARMUP_LLM_KEEPALIVE = os.getenv("WARMUP_LLM_KEEPALIVE", "false").lower() in ("true", "1", "yes", "on")
+        # Per-step limit; well inside the 120s startup probe budget (deploy.sh)
+        WARMUP_STEP_TIMEOUT_SECONDS = float(os.getenv("WARMUP_STEP_TIMEOUT_SECONDS", "30"))
         REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL_SIZE", "10"))
+        REDIS_POOL_TIMEOUT = redis_config.POOL_TIMEOUT
+        REDIS_MODE = redis_config.MODE
+        REDIS_SENTINELS = redis_config.SENTINELS
+        REDIS_SENTINEL_SERVICE = redis_config.SENTINEL_SERVICE
+        REDIS_PASSWORD = redis_config.PASSWORD
+        REDIS_CACHE_DB = redis_config.CACHE_DB
+        REDIS_RATE_LIMIT_DB = redis_config.RATE_LIMIT_DB
+        REDIS_TOKEN_DB = redis_config.TOKEN_DB
+        SEARCH_EMBEDDINGS_ENABLED = os.getenv("SEARCH_EMBEDDINGS_ENABLED", "false").lower() in ("true", "1", "yes", "on")
+        SEARCH_EMBEDDING_DIM = int(os.getenv("SEARCH_EMBEDDING_DIM", "256"))
         LOCAL_STORAGE_PATH = os.getenv("LOCAL_STORAGE_PATH", "/tmp/ai_resume_storage")
+        # local, gcs or none; local disk only by default in development (Cloud Run's /tmp is per-instance memory)
+        BLOB_STORE_BACKEND = os.getenv(
+            "BLOB_STORE_BACKEND", "local" if app_config.ENVIRONMENT == "development" else "none"
+        ).lower()
+        BLOB_STORE_GCS_BUCKET = os.getenv("BLOB_STORE_GCS_BUCKET")
+        BLOB_STORE_CHUNK_SIZE = int(os.getenv("BLOB_STORE_CHUNK_SIZE", str(1024 * 1024)))
+        BATCH_UPLOAD_MAX_FILES = int(os.getenv("BATCH_UPLOAD_MAX_FILES", "500"))
+        BATCH_UPLOAD_CONCURRENCY = int(os.getenv("BATCH_UPLOAD_CONCURRENCY", "4"))
+        METRICS_TOKEN = os.getenv("METRICS_TOKEN")  # Bearer token for /metrics (disabled when unset)
         TESTING = os.getenv("TESTING", "false").lower() == "true"
         API_URL = os.getenv("API_URL", "http://localhost:8000")
     
@@ -2,20 +2,46 @@
 
 from .connection import (
     PostgresConnection,
+    ROLE_API,
+    ROLE_WORKER,
+    ROLE_REPLICA,
     get_postgres_connection,
     init_postgres,
     close_postgres,
     get_async_session,
+    get_read_session,
+    run_read,
     validate_database_environment
 )
 from .repository import BaseRepository
+from .search import TextSearch, build_text_search, normalize_search_term
+from .pagination import (
+    InvalidCursorError,
+    KeysetCursor,
+    encode_cursor,
+    decode_cursor,
+    keyset_after
+)
 
 __all__ = [
     "PostgresConnection",
+    "ROLE_API",
+    "ROLE_WORKER",
+    "ROLE_REPLICA",
     "get_postgres_connection",
     "init_postgres",
     "close_postgres",
     "get_async_session",
+    "get_read_session",
+    "run_read",
     "validate_database_environment",
     "BaseRepository",
+    "TextSearch",
+    "build_text_search",
+    "normalize_search_term",
+    "InvalidCursorError",
+    "KeysetCursor",
+    "encode_cursor",
+    "decode_cursor",
+    "keyset_after",
 ]
\ No newline at end of file
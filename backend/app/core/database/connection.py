@@ -3,10 +3,14 @@ PostgreSQL connection management for the new infrastructure layer.
 This module provides connection pooling and session management.
 """
 
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Awaitable, Callable, Dict, Optional, TypeVar
 from contextlib import asynccontextmanager
+import asyncio
 import logging
+import time
 
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError, TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     AsyncEngine,
@@ -16,11 +20,86 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
 
 from app.core.config import get_settings
+from app.core.metrics import (
+    DB_POOL_CHECKED_OUT_CONNECTIONS,
+    DB_POOL_CHECKOUT_WAIT_SECONDS,
+    DB_POOL_CONNECT_SECONDS,
+    DB_POOL_EXHAUSTED_TOTAL,
+    DB_POOL_OVERFLOW_CONNECTIONS,
+    DB_POOL_SIZE,
+    DB_POOL_SLOW_CHECKOUTS_TOTAL,
+)
 
 settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Workload roles with their own engine, pool and statement_timeout
+ROLE_API = "api"
+ROLE_WORKER = "worker"
+ROLE_REPLICA = "replica"
+
+
+# Record.info key holding the (start, end) perf_counter times of the connect
+_CONNECT_TIMES_KEY = "instrumented_pool_connect_times"
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records checkout wait time, slow checkouts and exhaustion.
+    
+    Checkout wait covers only the wait for a free slot: opening a new
+    connection (TCP, TLS, auth) on checkout is recorded separately so
+    connect latency is not mistaken for pool contention.
+    
+    The metrics label is a class attribute so it survives pool recreation
+    on engine.dispose(); use ``for_role`` to get a labelled subclass.
+    """
+    
+    metrics_role: str = ROLE_API
+    
+    @classmethod
+    def for_role(cls, role: str) -> type:
+        """Create a pool class labelled with a workload role."""
+        return type(f"InstrumentedAsyncQueuePool_{role}", (cls,), {"metrics_role": role})
+    
+    def _create_connection(self):
+        started = time.perf_counter()
+        record = super()._create_connection()
+        connected = time.perf_counter()
+        DB_POOL_CONNECT_SECONDS.labels(role=self.metrics_role).observe(connected - started)
+        record.info[_CONNECT_TIMES_KEY] = (started, connected)
+        return record
+    
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            self._observe_wait(time.perf_counter() - started)
+            DB_POOL_EXHAUSTED_TOTAL.labels(role=self.metrics_role).inc()
+            logger.error(
+                f"Database pool exhausted ({self.metrics_role}): "
+                f"size={self.size()} checked_out={self.checkedout()} overflow={self.overflow()}"
+            )
+            raise
+        
+        waited = time.perf_counter() - started
+        # Connect times stay on the record; only a connect made by this checkout counts
+        connect_started, connected = record.info.get(_CONNECT_TIMES_KEY, (0.0, 0.0))
+        if connect_started >= started:
+            waited -= connected - connect_started
+        self._observe_wait(waited)
+        return record
+    
+    def _observe_wait(self, waited: float) -> None:
+        DB_POOL_CHECKOUT_WAIT_SECONDS.labels(role=self.metrics_role).observe(waited)
+        if waited * 1000 >= settings.DATABASE_SLOW_CHECKOUT_MS:
+            DB_POOL_SLOW_CHECKOUTS_TOTAL.labels(role=self.metrics_role).inc()
+            logger.warning(f"Slow database checkout ({self.metrics_role}): {waited * 1000:.0f}ms")
+
 
 class PostgresConnection:
     """
@@ -31,19 +110,51 @@ class PostgresConnection:
     - Session factory
     - Health checks
     - Graceful shutdown
+    
+    Each workload role (request handling, background workers) gets its own
+    engine so long-running jobs cannot starve the API pool, and each role
+    carries its own server-side statement_timeout and application_name.
     """
     
-    def __init__(self, database_url: Optional[str] = None):
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        role: str = ROLE_API,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        read_only: bool = False
+    ):
         """
         Initialize the PostgreSQL connection manager.
         
         Args:
             database_url: Optional database URL, defaults to settings.DATABASE_URL
+            role: Workload role ("api", "worker" or "replica")
+            pool_size: Pool size override (defaults to settings.DATABASE_POOL_SIZE)
+            max_overflow: Overflow override (defaults to settings.DATABASE_MAX_OVERFLOW)
+            read_only: Open every transaction READ ONLY (replica routing)
         """
         self.database_url = database_url or settings.ASYNC_DATABASE_URL
+        self.role = role
+        self.read_only = read_only
+        self.pool_size = pool_size or settings.DATABASE_POOL_SIZE
+        self.max_overflow = max_overflow if max_overflow is not None else settings.DATABASE_MAX_OVERFLOW
         self._engine: Optional[AsyncEngine] = None
         self._sessionmaker: Optional[async_sessionmaker] = None
     
+    def _server_settings(self) -> Dict[str, str]:
+        """Per-connection PostgreSQL settings for this role."""
+        server_settings = {
+            "application_name": f"ai_resume_review_backend:{self.role}",
+            "jit": "on" if settings.DATABASE_JIT else "off"
+        }
+        statement_timeout = settings.DATABASE_STATEMENT_TIMEOUTS_MS.get(self.role)
+        if statement_timeout is not None:
+            server_settings["statement_timeout"] = str(statement_timeout)
+        if self.read_only:
+            server_settings["default_transaction_read_only"] = "on"
+        return server_settings
+    
     async def initialize(self):
         """
         Initialize the database engine and session factory.
@@ -55,28 +166,36 @@ class PostgresConnection:
             logger.warning("Database engine already initialized")
             return
         
-        # Use NullPool for testing to avoid connection issues
-        # Use AsyncAdaptedQueuePool for production for better performance
-        poolclass = NullPool if settings.TESTING else AsyncAdaptedQueuePool
+        connect_args = {
+            "server_settings": self._server_settings(),
+            "command_timeout": 60,
+            "timeout": 30,
+            # asyncpg-level and SQLAlchemy adapter-level prepared statement caches
+            "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        }
         
-        # Create the async engine
-        self._engine = create_async_engine(
-            self.database_url,
-            poolclass=poolclass,
-            echo=settings.DEBUG,  # Log SQL statements in debug mode
-            pool_size=settings.DATABASE_POOL_SIZE if not settings.TESTING else 1,
-            max_overflow=settings.DATABASE_MAX_OVERFLOW if not settings.TESTING else 0,
-            pool_timeout=30,
-            pool_recycle=1800,  # Recycle connections after 30 minutes
-            connect_args={
-                "server_settings": {
-                    "application_name": "ai_resume_review_backend",
-                    "jit": "off"
-                },
-                "command_timeout": 60,
-                "timeout": 30
-            }
-        )
+        if settings.TESTING:
+            # Use NullPool for testing to avoid connection issues
+            self._engine = create_async_engine(
+                self.database_url,
+                poolclass=NullPool,
+                echo=settings.DATABASE_ECHO,
+                connect_args=connect_args
+            )
+        else:
+            self._engine = create_async_engine(
+                self.database_url,
+                poolclass=InstrumentedAsyncQueuePool.for_role(self.role),
+                echo=settings.DATABASE_ECHO,  # Log SQL statements (DB_ECHO)
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+                pool_recycle=settings.DATABASE_POOL_RECYCLE,
+                pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+                connect_args=connect_args
+            )
+            self._register_pool_metrics()
         
         # Create session factory
         self._sessionmaker = async_sessionmaker(
@@ -87,7 +206,36 @@ class PostgresConnection:
             autocommit=False  # Use transactions
         )
         
-        logger.info("PostgreSQL connection initialized successfully")
+        logger.info(
+            f"PostgreSQL connection initialized successfully "
+            f"(role={self.role}, pool_size={self.pool_size}, max_overflow={self.max_overflow})"
+        )
+    
+    def _register_pool_metrics(self) -> None:
+        """Expose pool occupancy as gauges evaluated at scrape time."""
+        DB_POOL_SIZE.labels(role=self.role).set(self.pool_size)
+        DB_POOL_CHECKED_OUT_CONNECTIONS.labels(role=self.role).set_function(
+            lambda: self._engine.pool.checkedout() if self._engine is not None else 0
+        )
+        DB_POOL_OVERFLOW_CONNECTIONS.labels(role=self.role).set_function(
+            lambda: max(0, self._engine.pool.overflow()) if self._engine is not None else 0
+        )
+    
+    def pool_status(self) -> Dict[str, int]:
+        """
+        Get current pool occupancy.
+        
+        Returns:
+            Pool size, checked-out and overflow connection counts
+        """
+        if self._engine is None or isinstance(self._engine.pool, NullPool):
+            return {}
+        pool = self._engine.pool
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(0, pool.overflow()),
+        }
     
     async def close(self):
         """
@@ -158,7 +306,7 @@ class PostgresConnection:
         
         try:
             async with self._engine.connect() as conn:
-                await conn.execute("SELECT 1")
+                await conn.execute(text("SELECT 1"))
             return True
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
@@ -175,27 +323,51 @@ class PostgresConnection:
         return self._engine is not None
 
 
-# Global connection instance
-_postgres_connection: Optional[PostgresConnection] = None
+# Global connection instances, one per workload role
+_postgres_connections: Dict[str, PostgresConnection] = {}
 
 
-def get_postgres_connection() -> PostgresConnection:
+def get_postgres_connection(role: str = ROLE_API) -> PostgresConnection:
     """
-    Get the global PostgreSQL connection instance.
+    Get the global PostgreSQL connection instance for a workload role.
+    
+    Args:
+        role: "api" for request handling, "worker" for background jobs,
+            "replica" for read-only queries (the API connection when no
+            replica is configured)
     
     Returns:
         The global PostgresConnection instance
     """
-    global _postgres_connection
-    if _postgres_connection is None:
-        _postgres_connection = PostgresConnection()
-    return _postgres_connection
+    if role == ROLE_REPLICA and not settings.ASYNC_DATABASE_REPLICA_URL:
+        return get_postgres_connection(ROLE_API)
+
+    connection = _postgres_connections.get(role)
+    if connection is None:
+        if role == ROLE_WORKER:
+            connection = PostgresConnection(
+                role=ROLE_WORKER,
+                pool_size=settings.DATABASE_WORKER_POOL_SIZE,
+                max_overflow=0
+            )
+        elif role == ROLE_REPLICA:
+            connection = PostgresConnection(
+                database_url=settings.ASYNC_DATABASE_REPLICA_URL,
+                role=ROLE_REPLICA,
+                read_only=True
+            )
+        else:
+            connection = PostgresConnection(role=role)
+        _postgres_connections[role] = connection
+    return connection
 
 
 async def init_postgres():
-    """Initialize the global PostgreSQL connection."""
-    connection = get_postgres_connection()
-    await connection.initialize()
+    """Initialize the global PostgreSQL connections (API, worker and replica if configured)."""
+    for role in (ROLE_API, ROLE_WORKER, ROLE_REPLICA):
+        connection = get_postgres_connection(role)
+        if not connection.is_initialized:
+            await connection.initialize()
 
 
 async def validate_database_environment():
@@ -217,7 +389,6 @@ async def validate_database_environment():
         RuntimeError: If environment doesn't match database
     """
     import os
-    from sqlalchemy import text
 
     expected_env = os.getenv("ENVIRONMENT", "unknown")
 
@@ -303,9 +474,9 @@ async def validate_database_environment():
 
 
 async def close_postgres():
-    """Close the global PostgreSQL connection."""
-    connection = get_postgres_connection()
-    await connection.close()
+    """Close the global PostgreSQL connections."""
+    for connection in _postgres_connections.values():
+        await connection.close()
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
@@ -319,4 +490,85 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """
     connection = get_postgres_connection()
     async for session in connection.get_session():
-        yield session
\ No newline at end of file
+        yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only endpoints, routed to the replica when configured.
+    
+    Writes through this session fail (transactions are READ ONLY on the
+    replica). Data may lag the primary slightly; use run_read with
+    ``fallback_when`` for reads that must see a just-committed write.
+    
+    Yields:
+        An async SQLAlchemy session
+    """
+    connection = get_postgres_connection(ROLE_REPLICA)
+    async for session in connection.get_session():
+        yield session
+
+
+# SQLSTATEs worth retrying for an idempotent read: serialization failure,
+# replica recovery conflict, admin/crash shutdown, cannot connect now
+_RETRYABLE_SQLSTATES = frozenset({"40001", "57P01", "57P02", "57P03"})
+
+
+def _is_retryable_read_error(error: DBAPIError) -> bool:
+    """Check whether a failed read can safely be retried on a new connection."""
+    if error.connection_invalidated or isinstance(error, (OperationalError, InterfaceError)):
+        return True
+    sqlstate = getattr(error.orig, "sqlstate", None) or getattr(error.orig, "pgcode", None)
+    return sqlstate in _RETRYABLE_SQLSTATES
+
+
+async def run_read(
+    operation: Callable[[AsyncSession], Awaitable[T]],
+    retries: Optional[int] = None,
+    fallback_when: Optional[Callable[[T], bool]] = None
+) -> T:
+    """
+    Run an idempotent read in a short replica transaction, retrying on failover.
+    
+    Each attempt gets a fresh session, so the connection is returned to the
+    pool as soon as the read finishes. Retryable errors (lost connection,
+    replica recovery conflicts) back off and try again; the final retry
+    goes to the primary.
+    
+    Args:
+        operation: Coroutine function performing the read; must load
+            everything it returns (sessions close before returning)
+        retries: Extra attempts (defaults to settings.DATABASE_READ_RETRIES)
+        fallback_when: Predicate on the replica result that triggers a re-read
+            on the primary, e.g. ``lambda r: r is None`` for replica lag right
+            after a write
+    
+    Returns:
+        The operation result
+    """
+    replica = get_postgres_connection(ROLE_REPLICA)
+    primary = get_postgres_connection(ROLE_API)
+    retries = settings.DATABASE_READ_RETRIES if retries is None else retries
+    
+    for attempt in range(retries + 1):
+        is_last = attempt == retries
+        connection = primary if is_last and attempt > 0 else replica
+        
+        try:
+            async with connection.session_context() as session:
+                result = await operation(session)
+        except DBAPIError as e:
+            if is_last or not _is_retryable_read_error(e):
+                raise
+            backoff = settings.DATABASE_READ_RETRY_BACKOFF_MS * (2 ** attempt) / 1000
+            logger.warning(
+                f"Retrying read on {connection.role} after {type(e).__name__} "
+                f"(attempt {attempt + 1}/{retries + 1}, backoff {backoff * 1000:.0f}ms)"
+            )
+            await asyncio.sleep(backoff)
+            continue
+        
+        if fallback_when is not None and connection is not primary and fallback_when(result):
+            async with primary.session_context() as session:
+                return await operation(session)
+        return result
@@ -0,0 +1,73 @@
+"""
+Keyset (cursor) pagination on ``(created_at, id)``.
+
+Cursors are opaque to clients: URL-safe base64 of the last row's sort key.
+Seeking past a cursor is an index range scan, so every page costs the same
+regardless of depth, unlike OFFSET which reads and discards earlier rows.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+    pass
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    """Sort key of the last row on a page."""
+    created_at: datetime
+    id: uuid.UUID
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """Encode a row's sort key as an opaque cursor string."""
+    payload = json.dumps({"c": created_at.isoformat(), "i": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[KeysetCursor]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page (None/empty for the first page)
+
+    Returns:
+        KeysetCursor, or None for the first page
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return KeysetCursor(
+            created_at=datetime.fromisoformat(payload["c"]),
+            id=uuid.UUID(payload["i"])
+        )
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+def keyset_after(created_at_column: ColumnElement, id_column: ColumnElement, cursor: KeysetCursor) -> ColumnElement:
+    """
+    Condition selecting rows after the cursor in ``(created_at DESC, id DESC)`` order.
+
+    Uses a row-value comparison so PostgreSQL can seek a
+    ``(created_at DESC, id DESC)`` index directly.
+    """
+    return tuple_(created_at_column, id_column) < tuple_(cursor.created_at, cursor.id)
@@ -3,7 +3,8 @@ Base repository class with common CRUD operations.
 Provides a foundation for all repository classes in the new architecture.
 """
 
-from typing import Generic, TypeVar, Optional, List, Dict, Any, Type
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Generic, TypeVar, Optional, List, Dict, Any, Type
 from uuid import UUID
 from datetime import datetime
 
@@ -23,18 +24,25 @@ class BaseRepository(Generic[T]):
     This class provides standard database operations that can be inherited
     by all feature-specific repositories. It follows the repository pattern
     to abstract data access logic from business logic.
+
+    Write methods that finish with ``save()`` commit on their own by
+    default. Inside ``unit_of_work()`` (or with ``autocommit=False``) they
+    only flush, so a service can compose several writes into one
+    transaction and commit once.
     """
     
-    def __init__(self, session: AsyncSession, model_class: Type[T]):
+    def __init__(self, session: AsyncSession, model_class: Type[T], autocommit: bool = True):
         """
         Initialize the repository with a database session and model class.
         
         Args:
             session: The async SQLAlchemy session
             model_class: The SQLAlchemy model class this repository manages
+            autocommit: Whether write methods commit (False: caller commits)
         """
         self.session = session
         self.model_class = model_class
+        self.autocommit = autocommit
     
     async def get_by_id(self, id: UUID) -> Optional[T]:
         """
@@ -187,6 +195,50 @@ class BaseRepository(Generic[T]):
         result = await self.session.execute(query)
         return result.scalar() or 0
     
+    async def save(self, *entities: T) -> None:
+        """
+        Persist pending changes according to the commit mode.
+
+        Commits and refreshes ``entities`` in autocommit mode; otherwise
+        only flushes (server-generated values come back with the INSERT
+        where the model uses eager defaults) and leaves the commit to the
+        unit of work.
+
+        Args:
+            entities: Entities to refresh after the commit
+        """
+        if not self.autocommit:
+            await self.session.flush()
+            return
+
+        await self.session.commit()
+        for entity in entities:
+            await self.session.refresh(entity)
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator["BaseRepository[T]"]:
+        """
+        Run several writes as one transaction with a single commit.
+
+        Write methods do not commit inside the block; the transaction is
+        committed when the block exits and rolled back if it raises.
+
+        Example:
+            async with repository.unit_of_work():
+                await repository.create_resume(...)
+                await repository.insert_sections(...)
+        """
+        previous = self.autocommit
+        self.autocommit = False
+        try:
+            yield self
+            await self.session.commit()
+        except BaseException:
+            await self.session.rollback()
+            raise
+        finally:
+            self.autocommit = previous
+
     async def commit(self):
         """Commit the current transaction."""
         await self.session.commit()
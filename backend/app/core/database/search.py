@@ -0,0 +1,74 @@
+"""
+Shared prefix/fuzzy text search over trigram-indexed columns.
+
+Works with the generated ``search_text`` columns added in migration 009
+(lower-cased, GIN ``gin_trgm_ops`` indexed). Substring matches and
+word-similarity matches both use the index, and results are ranked so that
+whole-field and word prefixes come first.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+import re
+
+from sqlalchemy import case, func, literal, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+# pg_trgm cannot extract trigrams from shorter terms, so fuzzy matching is skipped
+MIN_FUZZY_LENGTH = 3
+MAX_TERM_LENGTH = 100
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class TextSearch:
+    """A search filter and the relevance expression to order by."""
+    term: str
+    condition: ColumnElement
+    rank: ColumnElement
+
+
+def normalize_search_term(term: Optional[str]) -> str:
+    """Lower-case, collapse whitespace and bound the length of a search term."""
+    if not term:
+        return ""
+    return _WHITESPACE.sub(" ", term.strip().lower())[:MAX_TERM_LENGTH]
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE wildcards so user input matches literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def build_text_search(column: ColumnElement, term: Optional[str], fuzzy: bool = True) -> Optional[TextSearch]:
+    """
+    Build an index-backed search over a lower-cased trigram column.
+
+    Args:
+        column: Lower-cased text column with a gin_trgm_ops index
+        term: Raw user search input
+        fuzzy: Also match typos via word similarity (pg_trgm ``<%``)
+
+    Returns:
+        TextSearch, or None when the term is empty
+    """
+    term = normalize_search_term(term)
+    if not term:
+        return None
+
+    escaped = escape_like(term)
+    substring = column.like(f"%{escaped}%", escape="\\")
+
+    if fuzzy and len(term) >= MIN_FUZZY_LENGTH:
+        condition = or_(substring, literal(term).op("<%")(column))
+    else:
+        condition = substring
+
+    rank = (
+        case((column.like(f"{escaped}%", escape="\\"), 2.0), else_=0.0)
+        + case((column.like(f"% {escaped}%", escape="\\"), 1.0), else_=0.0)
+        + func.word_similarity(term, column)
+    )
+
+    return TextSearch(term=term, condition=condition, rank=rank)
@@ -11,6 +11,7 @@ Architecture Pattern:
 - Feature-specific business logic → features/*/api.py or service.py
 """
 
+import secrets
 from typing import Any
 from uuid import UUID
 
@@ -18,6 +19,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
 from app.core.security import verify_token, SecurityError
 from app.core.database import get_async_session
 from app.features.auth.repository import UserRepository
@@ -166,4 +168,32 @@ async def require_senior_or_admin(
             detail="Senior recruiter or admin access required"
         )
 
-    return current_user
\ No newline at end of file
+    return current_user
+
+
+async def require_metrics_token(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> None:
+    """
+    Require the METRICS_TOKEN bearer token (Prometheus scrapes, not users).
+
+    The metrics endpoint is disabled (404) unless METRICS_TOKEN is set.
+
+    Args:
+        credentials: Bearer token from Authorization header
+
+    Raises:
+        HTTPException: 404 if METRICS_TOKEN is not set, 401 if the token does not match
+    """
+    metrics_token = get_settings().METRICS_TOKEN
+    if not metrics_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(), metrics_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
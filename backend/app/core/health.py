@@ -0,0 +1,83 @@
+"""
+Health probes for the API process.
+
+- Liveness only reports that the process serves requests; it never touches
+  a dependency, so a slow database cannot get healthy instances restarted.
+- Readiness checks the database through the async API engine. The result is
+  cached for a few seconds and concurrent probes share one check, so
+  frequent health checks cost at most one ``SELECT 1`` per interval and
+  never block the event loop.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from app.core.config import get_settings
+from app.core.database import get_postgres_connection
+from app.core.datetime_utils import utc_now
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+_cached: Optional[Dict[str, Any]] = None
+_cached_at: float = 0.0
+_lock: Optional[asyncio.Lock] = None
+
+
+async def _check_database() -> Dict[str, Any]:
+    """Run one database probe."""
+    connection = get_postgres_connection()
+    if not connection.is_initialized:
+        return {"status": "unhealthy", "error": "not initialized"}
+
+    start = time.perf_counter()
+    try:
+        healthy = await asyncio.wait_for(
+            connection.health_check(),
+            timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        logger.error(f"Database health check timed out after {settings.HEALTH_CHECK_TIMEOUT_SECONDS}s")
+        return {"status": "unhealthy", "error": "timeout", "pool": connection.pool_status()}
+
+    return {
+        "status": "healthy" if healthy else "unhealthy",
+        "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+        "pool": connection.pool_status()
+    }
+
+
+async def get_database_health(max_age: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Get the database health, probing at most once per ``max_age`` seconds.
+
+    Args:
+        max_age: Seconds a result is reused (defaults to HEALTH_CACHE_SECONDS)
+
+    Returns:
+        Status ("healthy" or "unhealthy"), probe latency, pool occupancy and
+        when the probe ran
+    """
+    global _cached, _cached_at, _lock
+    if max_age is None:
+        max_age = settings.HEALTH_CACHE_SECONDS
+
+    if _cached is not None and time.monotonic() - _cached_at < max_age:
+        return _cached
+
+    if _lock is None:
+        _lock = asyncio.Lock()
+
+    async with _lock:
+        # Another probe may have refreshed the result while we waited
+        if _cached is not None and time.monotonic() - _cached_at < max_age:
+            return _cached
+
+        result = await _check_database()
+        result["checked_at"] = utc_now().isoformat()
+        _cached, _cached_at = result, time.monotonic()
+        return result
+
@@ -0,0 +1,155 @@
+"""
+Prometheus metrics for infrastructure components.
+
+Metrics are no-ops when prometheus-client is not installed, so callers can
+record unconditionally.
+"""
+
+import logging
+from typing import Callable, Tuple
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+    )
+except ImportError:
+    Counter = Gauge = Histogram = None  # Metrics disabled
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+    generate_latest = None
+
+logger = logging.getLogger(__name__)
+
+
+class _NoopMetric:
+    """Stand-in used when prometheus-client is unavailable."""
+
+    def labels(self, *args, **kwargs) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def dec(self, amount: float = 1) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+    def set_function(self, f: Callable[[], float]) -> None:
+        pass
+
+    def observe(self, amount: float) -> None:
+        pass
+
+
+def _gauge(name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+    return Gauge(name, documentation, labelnames) if Gauge is not None else _NoopMetric()
+
+
+def _counter(name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+    return Counter(name, documentation, labelnames) if Counter is not None else _NoopMetric()
+
+
+def _histogram(name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets=None):
+    if Histogram is None:
+        return _NoopMetric()
+    if buckets is None:
+        return Histogram(name, documentation, labelnames)
+    return Histogram(name, documentation, labelnames, buckets=buckets)
+
+
+# ============================================================================
+# Redis connection pools
+# ============================================================================
+
+REDIS_POOL_MAX_CONNECTIONS = _gauge(
+    "redis_pool_max_connections",
+    "Maximum connections allowed by the Redis connection pool",
+    ("pool",),
+)
+REDIS_POOL_IN_USE_CONNECTIONS = _gauge(
+    "redis_pool_in_use_connections",
+    "Connections currently checked out from the Redis connection pool",
+    ("pool",),
+)
+REDIS_POOL_IDLE_CONNECTIONS = _gauge(
+    "redis_pool_idle_connections",
+    "Idle connections held by the Redis connection pool",
+    ("pool",),
+)
+REDIS_POOL_EXHAUSTED_TOTAL = _counter(
+    "redis_pool_exhausted_total",
+    "Times a caller timed out waiting for a free Redis connection",
+    ("pool",),
+)
+
+
+# ============================================================================
+# Database connection pools
+# ============================================================================
+
+DB_POOL_CHECKOUT_WAIT_SECONDS = _histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a free database connection in the pool",
+    ("role",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+DB_POOL_CONNECT_SECONDS = _histogram(
+    "db_pool_connect_seconds",
+    "Time spent opening a new database connection (TCP, TLS, auth) on checkout",
+    ("role",),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+DB_POOL_SLOW_CHECKOUTS_TOTAL = _counter(
+    "db_pool_slow_checkouts_total",
+    "Database connection checkouts slower than the configured threshold",
+    ("role",),
+)
+DB_POOL_EXHAUSTED_TOTAL = _counter(
+    "db_pool_exhausted_total",
+    "Database connection checkouts that timed out because the pool was exhausted",
+    ("role",),
+)
+DB_POOL_SIZE = _gauge(
+    "db_pool_size",
+    "Configured size of the database connection pool",
+    ("role",),
+)
+DB_POOL_CHECKED_OUT_CONNECTIONS = _gauge(
+    "db_pool_checked_out_connections",
+    "Database connections currently checked out",
+    ("role",),
+)
+DB_POOL_OVERFLOW_CONNECTIONS = _gauge(
+    "db_pool_overflow_connections",
+    "Database connections open beyond the pool size",
+    ("role",),
+)
+
+
+
+# ============================================================================
+# Process startup
+# ============================================================================
+
+STARTUP_PHASE_SECONDS = _gauge(
+    "app_startup_phase_seconds",
+    "Duration of each startup phase of this process (import, init, total)",
+    ("phase",),
+)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Render all registered metrics in Prometheus text format.
+
+    Returns:
+        Tuple of (body, content_type)
+    """
+    if generate_latest is None:
+        return b"# prometheus-client not installed\n", CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,210 @@
+"""
+ASGI rate limiting middleware.
+
+Resolves a rate limit policy for each request from a route table compiled once
+at startup, then checks it against the Redis rate limiter before the request
+reaches FastAPI. Rejected requests never have their body parsed or their
+dependencies (database sessions, user lookups) resolved.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.rate_limiter import (
+    RateLimitType,
+    build_rate_limit_headers,
+    rate_limiter,
+)
+from app.core.security import verify_token
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitKey:
+    """How a policy identifies the caller."""
+    CLIENT = "client"  # Client IP (proxy aware)
+    USER = "user"      # Authenticated user ID, falling back to client IP
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """Rate limit policy attached to a route."""
+    limit_type: RateLimitType
+    key: str = RateLimitKey.USER
+
+
+# Route policies keyed by (HTTP method, full route path template).
+DEFAULT_RATE_LIMIT_POLICIES: Dict[Tuple[str, str], RateLimitPolicy] = {
+    ("POST", "/api/v1/auth/login"): RateLimitPolicy(RateLimitType.LOGIN, RateLimitKey.CLIENT),
+    ("POST", "/api/v1/auth/register"): RateLimitPolicy(RateLimitType.REGISTRATION, RateLimitKey.CLIENT),
+    ("POST", "/api/v1/analysis/resumes/{resume_id}/analyze"): RateLimitPolicy(RateLimitType.ANALYSIS),
+    ("POST", "/api/v1/resume_upload/candidates/{candidate_id}/resumes"): RateLimitPolicy(RateLimitType.FILE_UPLOAD),
+    ("POST", "/api/v1/resume_upload/batch"): RateLimitPolicy(RateLimitType.FILE_UPLOAD),
+}
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI middleware enforcing per-route rate limits.
+
+    The route table is compiled from the application's routes on lifespan
+    startup (or lazily on the first request when no lifespan is run), so the
+    per-request cost is a method lookup plus a handful of regex matches.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: Iterable[BaseRoute],
+        policies: Optional[Dict[Tuple[str, str], RateLimitPolicy]] = None
+    ):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Next ASGI application
+            routes: Application routes (``app.routes``), read at compile time
+            policies: Route policies (defaults to DEFAULT_RATE_LIMIT_POLICIES)
+        """
+        self.app = app
+        self.routes = routes
+        self.policies = policies if policies is not None else DEFAULT_RATE_LIMIT_POLICIES
+        self._table: Optional[Dict[str, List[Tuple[Pattern, RateLimitPolicy]]]] = None
+
+    def compile(self) -> None:
+        """Build the method -> [(path regex, policy)] lookup table."""
+        table: Dict[str, List[Tuple[Pattern, RateLimitPolicy]]] = {}
+        matched = set()
+
+        for route in self.routes:
+            path = getattr(route, "path", None)
+            path_regex = getattr(route, "path_regex", None)
+            if path is None or path_regex is None:
+                continue
+
+            for method in getattr(route, "methods", None) or ():
+                policy = self.policies.get((method, path))
+                if policy is None:
+                    continue
+                table.setdefault(method, []).append((path_regex, policy))
+                matched.add((method, path))
+
+        for method, path in set(self.policies) - matched:
+            logger.warning(f"Rate limit policy for {method} {path} does not match any route")
+
+        self._table = table
+        logger.info(f"Rate limit route table compiled with {len(matched)} policies")
+
+    def resolve(self, method: str, path: str) -> Optional[RateLimitPolicy]:
+        """Return the policy for a request, if any."""
+        if self._table is None:
+            self.compile()
+
+        for path_regex, policy in self._table.get(method, ()):
+            if path_regex.match(path):
+                return policy
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self.app(scope, self._compile_on_startup(receive), send)
+            return
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        policy = self.resolve(scope["method"], scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        identifier = self._get_identifier(scope, policy)
+        is_allowed, info = await rate_limiter.check_rate_limit(policy.limit_type, identifier)
+        headers = build_rate_limit_headers(policy.limit_type, info)
+
+        if not is_allowed:
+            await self._reject(send, policy.limit_type, info, headers)
+            return
+
+        scope.setdefault("state", {}).setdefault("rate_limit_info", {})[policy.limit_type.value] = info
+
+        if not headers:
+            await self.app(scope, receive, send)
+            return
+
+        raw_headers = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()]
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + raw_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def _compile_on_startup(self, receive: Receive) -> Receive:
+        """Wrap lifespan receive so the table is compiled once routes are final."""
+        async def wrapped() -> Message:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.compile()
+            return message
+        return wrapped
+
+    def _get_identifier(self, scope: Scope, policy: RateLimitPolicy) -> str:
+        """Identify the caller without touching the database."""
+        headers = _decode_headers(scope)
+
+        if policy.key == RateLimitKey.USER:
+            authorization = headers.get("authorization", "")
+            scheme, _, token = authorization.partition(" ")
+            if scheme.lower() == "bearer" and token:
+                payload = verify_token(token.strip())
+                if payload and payload.get("sub"):
+                    return str(payload["sub"])
+
+        # Same precedence as get_client_identifier()
+        forwarded_for = headers.get("x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.split(",")[0].strip()
+        real_ip = headers.get("x-real-ip")
+        if real_ip:
+            return real_ip.strip()
+        client = scope.get("client")
+        return client[0] if client else "127.0.0.1"
+
+    async def _reject(
+        self,
+        send: Send,
+        limit_type: RateLimitType,
+        info: Dict,
+        headers: Dict[str, str]
+    ) -> None:
+        """Send a 429 response without invoking the application."""
+        body = json.dumps({
+            "error": "Rate limit exceeded",
+            "message": f"Too many requests for {limit_type.value}",
+            **info
+        }).encode("utf-8")
+
+        raw_headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ] + [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()]
+
+        await send({"type": "http.response.start", "status": 429, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+def _decode_headers(scope: Scope) -> Dict[str, str]:
+    """Decode raw ASGI headers into a lowercase dict."""
+    return {
+        key.decode("latin-1").lower(): value.decode("latin-1")
+        for key, value in scope.get("headers", ())
+    }
@@ -16,7 +16,10 @@ from fastapi import HTTPException, Request
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
-from app.core.config import get_redis_url
+from app.core.cache.connection import RedisClientFactory, get_redis_factory
+from app.core.config import get_settings
+
+settings = get_settings()
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -92,10 +95,11 @@ class RedisRateLimiter:
         Initialize rate limiter with Redis connection.
         
         Args:
-            redis_url: Redis connection URL (optional, defaults to config)
+            redis_url: Redis connection URL (optional, defaults to the shared factory)
         """
-        self.redis_url = redis_url or get_redis_url()
+        self.redis_url = redis_url
         self.redis_client: Optional[aioredis.Redis] = None
+        self._factory: Optional[RedisClientFactory] = None
         self.configs = {
             RateLimitType.LOGIN: RateLimitConfigs.LOGIN,
             RateLimitType.REGISTRATION: RateLimitConfigs.REGISTRATION,
@@ -106,16 +110,11 @@ class RedisRateLimiter:
         }
     
     async def connect(self):
-        """Establish Redis connection."""
+        """Acquire a client from the shared Redis client factory."""
         try:
-            self.redis_client = aioredis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-                socket_timeout=5.0,
-                socket_connect_timeout=5.0,
-                retry_on_timeout=True
-            )
+            # A custom URL gets its own factory; otherwise share the global pools
+            self._factory = RedisClientFactory(self.redis_url) if self.redis_url else get_redis_factory()
+            self.redis_client = self._factory.get_client(db=settings.REDIS_RATE_LIMIT_DB)
             
             # Test connection
             await self.redis_client.ping()
@@ -126,10 +125,13 @@ class RedisRateLimiter:
             self.redis_client = None
     
     async def disconnect(self):
-        """Close Redis connection."""
+        """Release the Redis client (shared pools are closed by close_redis)."""
+        if self._factory is not None and self._factory is not get_redis_factory():
+            await self._factory.close()
         if self.redis_client:
-            await self.redis_client.close()
+            self.redis_client = None
             logger.info("Redis rate limiter disconnected")
+        self._factory = None
     
     def _get_key(self, limit_type: RateLimitType, identifier: str) -> str:
         """Generate Redis key for rate limiting."""
@@ -360,13 +362,48 @@ def get_client_identifier(request: Request) -> str:
     return get_remote_address(request)
 
 
+def build_rate_limit_headers(limit_type: RateLimitType, info: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Build standard ``RateLimit-*`` response headers from rate limit info.
+
+    Args:
+        limit_type: Type of rate limit
+        info: Info dict returned by ``RedisRateLimiter.check_rate_limit``
+
+    Returns:
+        Header dict (empty when Redis is unavailable)
+    """
+    headers: Dict[str, str] = {}
+
+    if "requests_allowed" in info:
+        headers["RateLimit-Limit"] = str(info["requests_allowed"])
+        headers["RateLimit-Remaining"] = str(max(0, info["requests_allowed"] - info.get("requests_made", 0)))
+    if "window_seconds" in info:
+        headers["RateLimit-Policy"] = f"{info.get('requests_allowed', 0)};w={info['window_seconds']}"
+    if "reset_time" in info:
+        headers["RateLimit-Reset"] = str(max(0, int(info["reset_time"] - time.time())))
+
+    if info.get("blocked"):
+        retry_after = info.get("block_time_remaining", info.get("block_duration"))
+        if retry_after is not None:
+            headers["Retry-After"] = str(retry_after)
+            headers.setdefault("RateLimit-Limit", str(rate_limiter.configs[limit_type].requests))
+            headers["RateLimit-Remaining"] = "0"
+            headers["RateLimit-Reset"] = str(retry_after)
+
+    return headers
+
+
 async def check_rate_limit_middleware(
     request: Request, 
     limit_type: RateLimitType,
     identifier: Optional[str] = None
 ) -> None:
     """
-    Middleware function to check rate limits.
+    Check rate limits from inside an endpoint.
+
+    Prefer registering a route policy with ``RateLimitMiddleware``, which
+    rejects requests before body parsing and dependency resolution.
     
     Args:
         request: FastAPI request object
@@ -383,9 +420,7 @@ async def check_rate_limit_middleware(
     
     if not is_allowed:
         # Add rate limit headers
-        headers = {}
-        if "block_time_remaining" in info:
-            headers["Retry-After"] = str(info["block_time_remaining"])
+        headers = build_rate_limit_headers(limit_type, info)
         if "requests_allowed" in info:
             headers["X-RateLimit-Limit"] = str(info["requests_allowed"])
         if "window_seconds" in info:
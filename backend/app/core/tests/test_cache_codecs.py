@@ -0,0 +1,121 @@
+"""Tests for cache payload framing, codecs and compression."""
+
+import uuid
+from datetime import date, datetime, timezone
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from pydantic import BaseModel
+
+from app.core.cache.codecs import CacheSerializer, CodecError, get_codec
+from app.core.cache.service import CacheService
+
+CODECS = ["json", "orjson", "msgpack"]
+
+VALUE = {"name": "Jane", "count": 3, "ratio": 0.5, "tags": ["a", "b"], "nested": {"ok": True, "none": None}}
+USER_ID = uuid.UUID("12345678-1234-5678-1234-567812345678")
+CREATED_AT = datetime(2025, 10, 21, 9, 30, tzinfo=timezone.utc)
+
+
+class Candidate(BaseModel):
+    id: uuid.UUID
+    created_at: datetime
+
+
+@pytest.mark.parametrize("name", CODECS)
+@pytest.mark.parametrize("compress_threshold", [None, 0])
+def test_round_trip_and_header(name, compress_threshold):
+    codec = get_codec(name)
+    serializer = CacheSerializer(codec, compress_threshold=compress_threshold)
+
+    payload = serializer.dumps(VALUE)
+
+    compressed = compress_threshold is not None
+    assert payload[0] == codec.codec_id | (0x80 if compressed else 0)
+    assert serializer.is_framed(payload)
+    assert serializer.loads(payload) == VALUE
+
+
+def test_compression_threshold():
+    serializer = CacheSerializer(get_codec("json"), compress_threshold=1024)
+    small = {"text": "x" * 100}
+    large = {"text": "x" * 5000}
+
+    assert serializer.dumps(small)[0] & 0x80 == 0
+    payload = serializer.dumps(large)
+    assert payload[0] & 0x80
+    assert len(payload) < 1024
+    assert serializer.loads(payload) == large
+
+
+@pytest.mark.parametrize("writer", CODECS)
+@pytest.mark.parametrize("reader", CODECS)
+def test_frame_selects_the_codec(writer, reader):
+    payload = CacheSerializer(get_codec(writer), compress_threshold=0).dumps(VALUE)
+
+    assert CacheSerializer(get_codec(reader)).loads(payload) == VALUE
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_json_codecs_convert_types_to_json(name):
+    serializer = CacheSerializer(get_codec(name), compress_threshold=None)
+    value = {
+        "id": USER_ID,
+        "at": CREATED_AT,
+        "day": date(2025, 10, 21),
+        "model": Candidate(id=USER_ID, created_at=CREATED_AT),
+    }
+
+    decoded = serializer.loads(serializer.dumps(value))
+
+    assert decoded["id"] == str(USER_ID)
+    assert datetime.fromisoformat(decoded["at"]) == CREATED_AT
+    assert decoded["day"] == "2025-10-21"
+    assert decoded["model"]["id"] == str(USER_ID)
+    assert datetime.fromisoformat(decoded["model"]["created_at"].replace("Z", "+00:00")) == CREATED_AT
+
+
+def test_msgpack_round_trips_uuid_and_datetime():
+    serializer = CacheSerializer(get_codec("msgpack"), compress_threshold=None)
+    value = {
+        "id": USER_ID,
+        "at": CREATED_AT,
+        "day": date(2025, 10, 21),
+        "model": Candidate(id=USER_ID, created_at=CREATED_AT),
+    }
+
+    decoded = serializer.loads(serializer.dumps(value))
+
+    assert decoded["id"] == USER_ID
+    assert decoded["at"] == CREATED_AT
+    assert decoded["day"] == date(2025, 10, 21)
+    assert Candidate(**decoded["model"]) == value["model"]
+
+
+def test_codec_errors():
+    serializer = CacheSerializer(get_codec("json"))
+
+    with pytest.raises(CodecError):
+        serializer.dumps({"value": object()})
+    with pytest.raises(CodecError):
+        serializer.loads(b'{"a": 1}')
+    with pytest.raises(CodecError):
+        get_codec("pickle")
+
+
+@pytest.mark.parametrize("legacy", [b'{"a": 1}', b'[1, 2]', b'"text"', b'42', b'true', b'null'])
+def test_plain_json_is_not_framed(legacy):
+    assert not CacheSerializer.is_framed(legacy)
+
+
+@pytest.mark.asyncio
+async def test_legacy_plain_json_values_are_read():
+    client = FakeRedis(server=FakeServer())
+    cache = CacheService(namespace=f"legacy-{uuid.uuid4().hex[:8]}", client=client)
+    # Written before framing: plain JSON, and a raw string
+    await client.set(f"{cache.namespace}:v0:user", b'{"id": 1, "roles": ["admin"]}')
+    await client.set(f"{cache.namespace}:v0:token", b"plain text")
+
+    assert await cache.get("user") == {"id": 1, "roles": ["admin"]}
+    assert await cache.get("token") == "plain text"
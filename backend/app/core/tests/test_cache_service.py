@@ -0,0 +1,260 @@
+"""Tests for the two-tier cache service against an in-memory Redis."""
+
+import asyncio
+import json
+import time
+import uuid
+from unittest.mock import patch
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from app.core.cache.invalidation import INSTANCE_ID, build_message, handle_message
+from app.core.cache.local import LocalCache
+from app.core.cache.service import CacheService
+
+
+@pytest.fixture
+def server():
+    """One fake Redis shared by every "instance" of a test."""
+    return FakeServer()
+
+
+@pytest.fixture
+def namespace():
+    return f"test-{uuid.uuid4().hex[:8]}"
+
+
+def _cache(server, namespace, **kwargs) -> CacheService:
+    return CacheService(namespace=namespace, client=FakeRedis(server=server), **kwargs)
+
+
+def _from_other_instance(message: str) -> str:
+    return json.dumps({**json.loads(message), "origin": "other-instance"})
+
+
+@pytest.mark.asyncio
+async def test_l1_serves_repeated_reads(server, namespace):
+    cache = _cache(server, namespace)
+    await cache.set("user", {"id": 1}, ttl=60)
+
+    # Gone from Redis, still in L1
+    await cache._client.flushall()
+    assert await cache.get("user") == {"id": 1}
+    assert cache.local_stats()["hits"] == 1
+
+    # Another instance has no L1 copy and misses
+    assert await _cache(server, namespace).get("user", default="missing") == "missing"
+
+
+@pytest.mark.asyncio
+async def test_l1_miss_reads_through_redis(server, namespace):
+    writer = _cache(server, namespace)
+    reader = _cache(server, namespace)
+    await writer.set("user", {"id": 1}, ttl=60)
+
+    assert await reader.get("user") == {"id": 1}
+    assert reader.local_stats() == {"size": 1, "hits": 0, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_l1_lifetime_is_capped_by_value_ttl(server, namespace):
+    cache = _cache(server, namespace, local_ttl=30)
+
+    await cache.set("short", "v", ttl=2)
+    await cache.set("long", "v", ttl=3600)
+
+    now = time.monotonic()
+    assert cache._local.get("short").local_expires_at - now <= 2
+    assert 29 < cache._local.get("long").local_expires_at - now <= 30
+
+
+def test_local_cache_ttl_and_lru():
+    local = LocalCache(max_size=2, ttl=30)
+
+    local.set("expired", 1, ttl=0)
+    assert local.get("expired") is None
+
+    local.set("a", 1)
+    local.set("b", 2)
+    local.get("a")
+    local.set("c", 3)
+    # b was least recently used
+    assert local.get("b") is None
+    assert local.get("a").value == 1
+
+    with patch("app.core.cache.local.time.monotonic", return_value=time.monotonic() + 31):
+        assert local.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_get_many_and_set_many(server, namespace):
+    await _cache(server, namespace).set_many({"a": 1, "b": [2], "c": {"x": 3}}, ttl=60)
+    cache = _cache(server, namespace)
+    await cache.get("a")
+
+    round_trips = []
+    mget = cache._client.mget
+
+    async def counting_mget(keys):
+        round_trips.append(keys)
+        return await mget(keys)
+
+    with patch.object(cache._client, "mget", counting_mget):
+        values = await cache.get_many(["a", "b", "c", "missing", "b"])
+
+    assert values == {"a": 1, "b": [2], "c": {"x": 3}}
+    # "a" came from L1; the rest in one round trip
+    assert [len(keys) for keys in round_trips] == [3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("local_max_size", [1024, 0])
+async def test_concurrent_misses_compute_once(server, namespace, local_max_size):
+    cache = _cache(server, namespace, local_max_size=local_max_size)
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"answer": 42}
+
+    results = await asyncio.gather(*[cache.get_or_compute("key", compute, ttl=60) for _ in range(10)])
+
+    assert results == [{"answer": 42}] * 10
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_waiters_pick_up_a_value_written_by_another_instance(server, namespace):
+    cache = _cache(server, namespace, local_max_size=0)
+    other = _cache(server, namespace)
+    lock = asyncio.Lock()
+    cache._locks["key"] = lock
+
+    async def compute():
+        raise AssertionError("value was already cached")
+
+    async with lock:
+        waiter = asyncio.create_task(cache.get_or_compute("key", compute, ttl=60))
+        await asyncio.sleep(0)
+        await other.set("key", "from elsewhere", ttl=60)
+
+    assert await waiter == "from elsewhere"
+
+
+@pytest.mark.asyncio
+async def test_early_refresh_near_expiry(server, namespace):
+    cache = _cache(server, namespace)
+
+    async def compute():
+        return "fresh"
+
+    await cache._write({"key": "stale"}, ttl=60, delta=10.0)
+
+    # u close to 0: -log(1 - u) ~ 0, no early refresh 60s before expiry
+    with patch("app.core.cache.service.random.random", return_value=0.0):
+        assert await cache.get_or_compute("key", compute, ttl=60) == "stale"
+
+    # u close to 1: delta * -log(1 - u) ~ 161s exceeds the remaining 60s
+    with patch("app.core.cache.service.random.random", return_value=1 - 1e-7):
+        assert await cache.get_or_compute("key", compute, ttl=60) == "fresh"
+
+    assert await _cache(server, namespace).get("key") == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_refresh_in_progress_serves_current_value(server, namespace):
+    cache = _cache(server, namespace)
+    await cache._write({"key": "current"}, ttl=60, delta=10.0)
+    lock = asyncio.Lock()
+    cache._locks["key"] = lock
+
+    async def compute():
+        raise AssertionError("another caller is refreshing")
+
+    async with lock:
+        with patch("app.core.cache.service.random.random", return_value=1 - 1e-7):
+            assert await cache.get_or_compute("key", compute, ttl=60) == "current"
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_serves_cached_value(server, namespace):
+    cache = _cache(server, namespace)
+    await cache._write({"key": "current"}, ttl=60, delta=10.0)
+
+    async def compute():
+        raise RuntimeError("backend down")
+
+    with patch("app.core.cache.service.random.random", return_value=1 - 1e-7):
+        assert await cache.get_or_compute("key", compute, ttl=60) == "current"
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute("other", compute, ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_clear_namespace_bumps_version(server, namespace):
+    cache = _cache(server, namespace)
+    # Without L1 (whose copies pub/sub evicts), only the version makes it miss
+    other = _cache(server, namespace, local_max_size=0, version_ttl=0)
+    await cache.set("key", "old", ttl=60)
+    assert await other.get("key") == "old"
+
+    assert await cache.clear_namespace() == 1
+
+    assert await cache.get("key") is None
+    assert await other.get("key") is None
+    # Old entries are left to expire, not scanned
+    assert await cache._client.exists(f"{namespace}:v0:key") == 1
+
+    await cache.set("key", "new", ttl=60)
+    assert await cache._client.get(f"{namespace}:v1:key") is not None
+    assert await other.get("key") == "new"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_messages_evict_l1(server, namespace):
+    cache = _cache(server, namespace)
+    await cache.set_many({"a": 1, "b": 2}, ttl=60)
+
+    # Own messages are ignored
+    handle_message(build_message(namespace, keys=["a"]))
+    assert cache._local.get("a") is not None
+
+    handle_message(_from_other_instance(build_message(namespace, keys=["a"])))
+    assert cache._local.get("a") is None
+    assert cache._local.get("b") is not None
+
+    handle_message(_from_other_instance(build_message("other-namespace", keys=["b"])))
+    assert cache._local.get("b") is not None
+
+    handle_message(_from_other_instance(build_message(namespace, version=7)))
+    assert len(cache._local) == 0
+    assert cache._version == 7
+
+    handle_message("not json")
+
+
+@pytest.mark.asyncio
+async def test_writes_publish_invalidations(server, namespace):
+    cache = _cache(server, namespace)
+    pubsub = cache._client.pubsub(ignore_subscribe_messages=True)
+    await pubsub.subscribe("cache:invalidate")
+
+    await cache.set("key", "v", ttl=60)
+    await cache.delete("key")
+    await cache.clear_namespace()
+
+    messages = []
+    while len(messages) < 3:
+        message = await pubsub.get_message(timeout=1)
+        if message is not None:
+            messages.append(json.loads(message["data"]))
+    await pubsub.aclose()
+
+    assert all(m["origin"] == INSTANCE_ID and m["ns"] == namespace for m in messages)
+    assert [m.get("keys") for m in messages[:2]] == [["key"], ["key"]]
+    assert messages[2]["version"] == 1
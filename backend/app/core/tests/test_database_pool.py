@@ -0,0 +1,180 @@
+"""Tests for the instrumented database pool and per-role engine settings."""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from app.core.database import connection
+from app.core.database.connection import (
+    ROLE_API,
+    ROLE_REPLICA,
+    ROLE_WORKER,
+    InstrumentedAsyncQueuePool,
+    PostgresConnection,
+    get_postgres_connection,
+)
+
+CONNECT_SECONDS = 0.05
+
+
+@pytest.fixture
+def metrics():
+    with patch.object(connection, "DB_POOL_CHECKOUT_WAIT_SECONDS") as wait, \
+            patch.object(connection, "DB_POOL_CONNECT_SECONDS") as connect, \
+            patch.object(connection, "DB_POOL_EXHAUSTED_TOTAL") as exhausted, \
+            patch.object(connection, "DB_POOL_SLOW_CHECKOUTS_TOTAL") as slow, \
+            patch.object(connection.settings, "DATABASE_SLOW_CHECKOUT_MS", 1000):
+        yield Mock(wait=wait, connect=connect, exhausted=exhausted, slow=slow)
+
+
+def _slow_connect():
+    """DBAPI connection that takes CONNECT_SECONDS to open."""
+    time.sleep(CONNECT_SECONDS)
+    return Mock()
+
+
+def _pool(**kwargs):
+    return InstrumentedAsyncQueuePool.for_role("test")(_slow_connect, pool_size=1, max_overflow=0, **kwargs)
+
+
+def _observed(histogram):
+    return [c.args[0] for c in histogram.labels.return_value.observe.call_args_list]
+
+
+def test_for_role_labels_the_pool_class():
+    pool_class = InstrumentedAsyncQueuePool.for_role(ROLE_WORKER)
+
+    assert issubclass(pool_class, InstrumentedAsyncQueuePool)
+    assert pool_class.metrics_role == ROLE_WORKER
+    assert InstrumentedAsyncQueuePool.metrics_role == ROLE_API
+
+
+@pytest.mark.asyncio
+async def test_new_connection_time_is_not_checkout_wait(metrics):
+    pool = _pool()
+
+    fairy = await greenlet_spawn(pool.connect)
+    fairy.close()
+    # Reused: no connect
+    fairy = await greenlet_spawn(pool.connect)
+    fairy.close()
+
+    connects = _observed(metrics.connect)
+    assert len(connects) == 1 and connects[0] >= CONNECT_SECONDS
+    waits = _observed(metrics.wait)
+    assert len(waits) == 2 and all(w < CONNECT_SECONDS for w in waits)
+    metrics.wait.labels.assert_called_with(role="test")
+    metrics.slow.labels.return_value.inc.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_exhausted_pool_is_counted(metrics):
+    pool = _pool(timeout=0.1)
+    held = await greenlet_spawn(pool.connect)
+
+    with patch.object(connection.settings, "DATABASE_SLOW_CHECKOUT_MS", 50):
+        with pytest.raises(PoolTimeoutError):
+            await greenlet_spawn(pool.connect)
+
+    metrics.exhausted.labels.assert_called_once_with(role="test")
+    metrics.exhausted.labels.return_value.inc.assert_called_once()
+    # The timed-out wait is recorded, and is slow
+    assert _observed(metrics.wait)[-1] >= 0.1
+    metrics.slow.labels.return_value.inc.assert_called_once()
+    held.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_connect_is_not_exhaustion(metrics):
+    pool = InstrumentedAsyncQueuePool(Mock(side_effect=OSError("connection refused")), pool_size=1, max_overflow=0)
+
+    with pytest.raises(OSError):
+        await greenlet_spawn(pool.connect)
+
+    metrics.exhausted.labels.return_value.inc.assert_not_called()
+    assert _observed(metrics.wait) == []
+    # The slot is released for the next attempt
+    assert pool.overflow() == -1
+
+
+@pytest.fixture
+def timeouts():
+    with patch.object(connection.settings, "DATABASE_STATEMENT_TIMEOUTS_MS", {ROLE_API: 30000, ROLE_WORKER: 120000}):
+        yield
+
+
+@pytest.mark.parametrize("role, statement_timeout", [(ROLE_API, "30000"), (ROLE_WORKER, "120000")])
+def test_statement_timeout_per_role(timeouts, role, statement_timeout):
+    server_settings = PostgresConnection("postgresql+asyncpg://db/app", role=role)._server_settings()
+
+    assert server_settings["statement_timeout"] == statement_timeout
+    assert server_settings["application_name"] == f"ai_resume_review_backend:{role}"
+    assert "default_transaction_read_only" not in server_settings
+
+
+def test_replica_is_read_only(timeouts):
+    server_settings = PostgresConnection("postgresql+asyncpg://db/app", role=ROLE_REPLICA, read_only=True)._server_settings()
+
+    assert server_settings["default_transaction_read_only"] == "on"
+    # No configured timeout: the server default applies
+    assert "statement_timeout" not in server_settings
+
+
+@pytest.mark.parametrize("enabled, jit", [(True, "on"), (False, "off")])
+def test_jit_setting(enabled, jit):
+    with patch.object(connection.settings, "DATABASE_JIT", enabled):
+        assert PostgresConnection("postgresql+asyncpg://db/app")._server_settings()["jit"] == jit
+
+
+def test_roles_get_their_own_connections():
+    with patch.object(connection, "_postgres_connections", {}), \
+            patch.object(connection.settings, "ASYNC_DATABASE_REPLICA_URL", "postgresql+asyncpg://replica/app"), \
+            patch.object(connection.settings, "DATABASE_WORKER_POOL_SIZE", 3):
+        api = get_postgres_connection(ROLE_API)
+        worker = get_postgres_connection(ROLE_WORKER)
+        replica = get_postgres_connection(ROLE_REPLICA)
+
+        assert get_postgres_connection() is api
+        assert (worker.pool_size, worker.max_overflow) == (3, 0)
+        assert replica.read_only and replica.database_url == "postgresql+asyncpg://replica/app"
+
+    with patch.object(connection, "_postgres_connections", {}), \
+            patch.object(connection.settings, "ASYNC_DATABASE_REPLICA_URL", None):
+        assert get_postgres_connection(ROLE_REPLICA) is get_postgres_connection(ROLE_API)
+
+
+@pytest.mark.asyncio
+async def test_engine_kwargs(timeouts):
+    database = PostgresConnection("postgresql+asyncpg://db/app", role=ROLE_WORKER, pool_size=3, max_overflow=0)
+
+    with patch.object(connection.settings, "TESTING", False), \
+            patch.object(connection.settings, "DATABASE_STATEMENT_CACHE_SIZE", 200), \
+            patch.object(connection.settings, "DATABASE_POOL_TIMEOUT", 10), \
+            patch.object(connection.settings, "DATABASE_POOL_RECYCLE", 1800), \
+            patch.object(connection.settings, "DATABASE_POOL_PRE_PING", True), \
+            patch.object(connection, "create_async_engine") as create_engine:
+        await database.initialize()
+
+    (url,), kwargs = create_engine.call_args
+    assert url == "postgresql+asyncpg://db/app"
+    assert issubclass(kwargs["poolclass"], InstrumentedAsyncQueuePool)
+    assert kwargs["poolclass"].metrics_role == ROLE_WORKER
+    assert (kwargs["pool_size"], kwargs["max_overflow"]) == (3, 0)
+    assert (kwargs["pool_timeout"], kwargs["pool_recycle"], kwargs["pool_pre_ping"]) == (10, 1800, True)
+    connect_args = kwargs["connect_args"]
+    assert connect_args["server_settings"]["statement_timeout"] == "120000"
+    assert connect_args["statement_cache_size"] == connect_args["prepared_statement_cache_size"] == 200
+
+
+@pytest.mark.asyncio
+async def test_testing_engine_uses_null_pool():
+    with patch.object(connection.settings, "TESTING", True), \
+            patch.object(connection, "create_async_engine") as create_engine:
+        await PostgresConnection("postgresql+asyncpg://db/app").initialize()
+
+    kwargs = create_engine.call_args.kwargs
+    assert kwargs["poolclass"] is connection.NullPool
+    assert "pool_size" not in kwargs
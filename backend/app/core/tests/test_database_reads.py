@@ -0,0 +1,124 @@
+"""Tests for replica reads with retry and primary fallback."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+from app.core.database import connection
+from app.core.database.connection import ROLE_API, ROLE_REPLICA, run_read
+
+
+class FakeConnection:
+    """Stands in for PostgreSQLConnection; the "session" is the role name."""
+
+    def __init__(self, role):
+        self.role = role
+
+    @asynccontextmanager
+    async def session_context(self):
+        yield self.role
+
+
+class DriverError(Exception):
+    def __init__(self, sqlstate):
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+def _db_error(sqlstate) -> DBAPIError:
+    return DBAPIError("SELECT 1", {}, DriverError(sqlstate))
+
+
+@pytest.fixture
+def sleep():
+    connections = {role: FakeConnection(role) for role in (ROLE_REPLICA, ROLE_API)}
+    with patch.object(connection, "get_postgres_connection", side_effect=lambda role=ROLE_API: connections[role]), \
+            patch.object(connection.settings, "DATABASE_READ_RETRY_BACKOFF_MS", 50), \
+            patch.object(connection.asyncio, "sleep", new_callable=AsyncMock) as sleep:
+        yield sleep
+
+
+def _operation(*outcomes):
+    """Read that returns or raises the given outcomes in turn, recording the role used."""
+    calls = []
+    outcomes = list(outcomes)
+
+    async def operation(session):
+        calls.append(session)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return operation, calls
+
+
+@pytest.mark.asyncio
+async def test_retryable_sqlstate_is_retried_on_the_replica(sleep):
+    operation, calls = _operation(_db_error("40001"), _db_error("57P01"), "rows")
+
+    assert await run_read(operation, retries=3) == "rows"
+
+    assert calls == [ROLE_REPLICA] * 3
+    assert [c.args[0] for c in sleep.await_args_list] == [0.05, 0.1]
+
+
+@pytest.mark.asyncio
+async def test_last_attempt_goes_to_the_primary(sleep):
+    operation, calls = _operation(_db_error("57P03"), OperationalError("SELECT 1", {}, Exception()), "rows")
+
+    assert await run_read(operation, retries=2) == "rows"
+
+    assert calls == [ROLE_REPLICA, ROLE_REPLICA, ROLE_API]
+
+
+@pytest.mark.asyncio
+async def test_error_on_the_last_attempt_is_raised(sleep):
+    operation, calls = _operation(_db_error("40001"), _db_error("40001"))
+
+    with pytest.raises(DBAPIError):
+        await run_read(operation, retries=1)
+
+    assert calls == [ROLE_REPLICA, ROLE_API]
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_is_raised_immediately(sleep):
+    operation, calls = _operation(_db_error("42P01"), "rows")
+
+    with pytest.raises(DBAPIError):
+        await run_read(operation, retries=3)
+
+    assert calls == [ROLE_REPLICA]
+    sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_without_retries_the_replica_is_used(sleep):
+    operation, calls = _operation("rows")
+
+    assert await run_read(operation, retries=0) == "rows"
+    assert calls == [ROLE_REPLICA]
+
+
+@pytest.mark.asyncio
+async def test_fallback_when_rereads_on_the_primary(sleep):
+    operation, calls = _operation(None, "row")
+
+    assert await run_read(operation, retries=0, fallback_when=lambda r: r is None) == "row"
+    assert calls == [ROLE_REPLICA, ROLE_API]
+
+    # Not triggered by a replica result the predicate accepts
+    operation, calls = _operation("row")
+    assert await run_read(operation, retries=0, fallback_when=lambda r: r is None) == "row"
+    assert calls == [ROLE_REPLICA]
+
+
+@pytest.mark.asyncio
+async def test_fallback_when_skipped_for_a_primary_result(sleep):
+    operation, calls = _operation(_db_error("40001"), None)
+
+    assert await run_read(operation, retries=1, fallback_when=lambda r: r is None) is None
+    assert calls == [ROLE_REPLICA, ROLE_API]
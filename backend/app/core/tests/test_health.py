@@ -0,0 +1,122 @@
+"""Tests for the cached database health probe and the readiness endpoint."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import health
+from app.core.health import get_database_health
+
+
+class FakeConnection:
+    """Database connection whose health check takes ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0.01, healthy: bool = True):
+        self.delay = delay
+        self.healthy = healthy
+        self.is_initialized = True
+        self.probes = 0
+
+    async def health_check(self) -> bool:
+        self.probes += 1
+        await asyncio.sleep(self.delay)
+        return self.healthy
+
+    def pool_status(self):
+        return {"size": 5, "checked_out": 1, "overflow": 0}
+
+
+@pytest.fixture
+def database():
+    database = FakeConnection()
+    with patch.object(health, "_cached", None), patch.object(health, "_cached_at", 0.0), \
+            patch.object(health, "_lock", None), \
+            patch.object(health, "get_postgres_connection", return_value=database):
+        yield database
+
+
+@pytest.mark.asyncio
+async def test_concurrent_probes_share_one_check(database):
+    results = await asyncio.gather(*(get_database_health() for _ in range(10)))
+
+    assert database.probes == 1
+    assert all(r is results[0] for r in results)
+    assert results[0]["status"] == "healthy"
+    assert results[0]["pool"] == {"size": 5, "checked_out": 1, "overflow": 0}
+    assert "latency_ms" in results[0] and "checked_at" in results[0]
+
+
+@pytest.mark.asyncio
+async def test_result_is_cached_for_max_age(database):
+    first = await get_database_health(max_age=60)
+    assert await get_database_health(max_age=60) is first
+    assert database.probes == 1
+
+    # Older than max_age: probed again
+    assert await get_database_health(max_age=0) is not first
+    assert database.probes == 2
+
+
+@pytest.mark.asyncio
+async def test_default_max_age_is_health_cache_seconds(database):
+    # Only the health module's clock: the event loop keeps the real one
+    with patch.object(health.settings, "HEALTH_CACHE_SECONDS", 5), \
+            patch.object(health, "time", perf_counter=time.perf_counter) as clock:
+        monotonic = clock.monotonic
+        monotonic.return_value = 1000.0
+        await get_database_health()
+        monotonic.return_value = 1004.9
+        await get_database_health()
+        assert database.probes == 1
+
+        monotonic.return_value = 1005.0
+        await get_database_health()
+        assert database.probes == 2
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_unhealthy(database):
+    database.delay = 1
+
+    with patch.object(health.settings, "HEALTH_CHECK_TIMEOUT_SECONDS", 0.05):
+        result = await get_database_health()
+
+    assert result["status"] == "unhealthy"
+    assert result["error"] == "timeout"
+    assert result["pool"] == database.pool_status()
+
+
+@pytest.mark.asyncio
+async def test_failed_and_uninitialized_databases_are_unhealthy(database):
+    database.healthy = False
+    assert (await get_database_health(max_age=0))["status"] == "unhealthy"
+
+    database.is_initialized = False
+    result = await get_database_health(max_age=0)
+    assert result == {"status": "unhealthy", "error": "not initialized", "checked_at": result["checked_at"]}
+
+
+def test_readiness_is_503_when_the_probe_times_out(database):
+    from app.main import app
+
+    database.delay = 1
+    client = TestClient(app)
+
+    with patch("app.main.is_warm", return_value=True), \
+            patch.object(health.settings, "HEALTH_CHECK_TIMEOUT_SECONDS", 0.05):
+        response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "not_ready"
+    assert response.json()["database"]["error"] == "timeout"
+
+    # Healthy again once the cached result expires
+    database.delay = 0
+    with patch("app.main.is_warm", return_value=True), patch.object(health, "_cached_at", 0.0):
+        response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    assert response.json()["database"]["status"] == "healthy"
@@ -0,0 +1,169 @@
+"""Tests for the ASGI rate limiting middleware."""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core.rate_limit_middleware import RateLimitMiddleware
+from app.core.rate_limiter import RateLimitType
+
+ANALYZE_PATH = "/api/v1/analysis/resumes/3f2b8c1e-0000-4000-8000-000000000001/analyze"
+
+ALLOWED = {"requests_allowed": 10, "requests_made": 3, "window_seconds": 3600, "reset_time": time.time() + 600}
+BLOCKED = {
+    "requests_allowed": 5,
+    "requests_made": 5,
+    "window_seconds": 900,
+    "blocked": True,
+    "block_time_remaining": 120,
+}
+
+
+@pytest.fixture
+def api():
+    """App with rate limited and unlimited routes; records which endpoints ran."""
+    app = FastAPI()
+    app.state.calls = []
+
+    @app.post("/api/v1/auth/login")
+    async def login():
+        app.state.calls.append("login")
+        return {"ok": True}
+
+    @app.post("/api/v1/analysis/resumes/{resume_id}/analyze")
+    async def analyze(resume_id: str, request: Request):
+        app.state.calls.append("analyze")
+        return {"rate_limit_info": request.state.rate_limit_info}
+
+    @app.get("/api/v1/analysis/resumes/{resume_id}/analyze")
+    async def analyze_status(resume_id: str):
+        app.state.calls.append("status")
+        return {"ok": True}
+
+    return app
+
+
+@pytest.fixture
+def check_rate_limit():
+    with patch("app.core.rate_limit_middleware.rate_limiter.check_rate_limit", new_callable=AsyncMock) as check:
+        check.return_value = (True, ALLOWED)
+        yield check
+
+
+def test_route_table_compiled_on_lifespan_startup(api):
+    middleware = RateLimitMiddleware(api, routes=api.routes)
+    assert middleware._table is None
+
+    with TestClient(middleware):
+        assert set(middleware._table) == {"POST"}
+        assert len(middleware._table["POST"]) == 2
+
+
+def test_route_table_compiled_lazily_without_lifespan(api, check_rate_limit):
+    middleware = RateLimitMiddleware(api, routes=api.routes)
+    client = TestClient(middleware)
+
+    with patch.object(middleware, "compile", wraps=middleware.compile) as compile_table:
+        client.post(ANALYZE_PATH)
+        client.post(ANALYZE_PATH)
+
+    compile_table.assert_called_once()
+
+
+def test_resolve_matches_templated_paths(api):
+    middleware = RateLimitMiddleware(api, routes=api.routes)
+
+    assert middleware.resolve("POST", ANALYZE_PATH).limit_type == RateLimitType.ANALYSIS
+    assert middleware.resolve("POST", "/api/v1/auth/login").limit_type == RateLimitType.LOGIN
+    # Other methods, longer paths and unlisted routes are not limited
+    assert middleware.resolve("GET", ANALYZE_PATH) is None
+    assert middleware.resolve("POST", ANALYZE_PATH + "/extra") is None
+    assert middleware.resolve("POST", "/api/v1/auth/logout") is None
+
+
+def test_user_policies_are_keyed_by_token_subject(api, check_rate_limit):
+    client = TestClient(RateLimitMiddleware(api, routes=api.routes))
+
+    with patch("app.core.rate_limit_middleware.verify_token", return_value={"sub": "user-42"}):
+        client.post(ANALYZE_PATH, headers={"Authorization": "Bearer token"})
+
+    check_rate_limit.assert_awaited_once_with(RateLimitType.ANALYSIS, "user-42")
+
+
+@pytest.mark.parametrize("headers, identifier", [
+    ({"Authorization": "Bearer invalid"}, "testclient"),
+    ({"X-Forwarded-For": "203.0.113.7, 10.0.0.1"}, "203.0.113.7"),
+    ({"X-Real-IP": "198.51.100.2"}, "198.51.100.2"),
+])
+def test_user_policies_fall_back_to_client_ip(api, check_rate_limit, headers, identifier):
+    client = TestClient(RateLimitMiddleware(api, routes=api.routes))
+
+    with patch("app.core.rate_limit_middleware.verify_token", return_value=None):
+        client.post(ANALYZE_PATH, headers=headers)
+
+    check_rate_limit.assert_awaited_once_with(RateLimitType.ANALYSIS, identifier)
+
+
+def test_client_policies_ignore_the_token(api, check_rate_limit):
+    client = TestClient(RateLimitMiddleware(api, routes=api.routes))
+
+    with patch("app.core.rate_limit_middleware.verify_token") as verify:
+        client.post("/api/v1/auth/login", headers={"Authorization": "Bearer token", "X-Real-IP": "198.51.100.2"})
+
+    verify.assert_not_called()
+    check_rate_limit.assert_awaited_once_with(RateLimitType.LOGIN, "198.51.100.2")
+
+
+def test_rejected_request_gets_429_without_running_the_app(api, check_rate_limit):
+    check_rate_limit.return_value = (False, BLOCKED)
+    client = TestClient(RateLimitMiddleware(api, routes=api.routes))
+
+    response = client.post("/api/v1/auth/login", json={"email": "a@example.com"})
+
+    assert response.status_code == 429
+    assert response.json()["error"] == "Rate limit exceeded"
+    assert response.json()["message"] == "Too many requests for login"
+    assert response.json()["block_time_remaining"] == 120
+    assert response.headers["RateLimit-Limit"] == "5"
+    assert response.headers["RateLimit-Remaining"] == "0"
+    assert response.headers["RateLimit-Policy"] == "5;w=900"
+    assert response.headers["Retry-After"] == "120"
+    assert api.state.calls == []
+
+
+def test_allowed_request_gets_rate_limit_headers(api, check_rate_limit):
+    client = TestClient(RateLimitMiddleware(api, routes=api.routes))
+
+    response = client.post(ANALYZE_PATH)
+
+    assert response.status_code == 200
+    assert api.state.calls == ["analyze"]
+    assert response.headers["RateLimit-Limit"] == "10"
+    assert response.headers["RateLimit-Remaining"] == "7"
+    assert response.headers["RateLimit-Policy"] == "10;w=3600"
+    assert 0 < int(response.headers["RateLimit-Reset"]) <= 600
+    # The endpoint sees the rate limit info
+    assert response.json()["rate_limit_info"]["analysis"]["requests_made"] == 3
+
+
+def test_unlimited_routes_pass_through(api, check_rate_limit):
+    client = TestClient(RateLimitMiddleware(api, routes=api.routes))
+
+    response = client.get(ANALYZE_PATH)
+
+    assert response.status_code == 200
+    assert "RateLimit-Limit" not in response.headers
+    check_rate_limit.assert_not_awaited()
+
+
+def test_no_headers_when_redis_is_unavailable(api, check_rate_limit):
+    check_rate_limit.return_value = (True, {})
+    client = TestClient(RateLimitMiddleware(api, routes=api.routes))
+
+    response = client.post(ANALYZE_PATH)
+
+    assert response.status_code == 200
+    assert "RateLimit-Limit" not in response.headers
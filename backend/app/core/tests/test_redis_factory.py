@@ -0,0 +1,88 @@
+"""Tests for the shared Redis client factory and its pool metrics."""
+
+import socket
+from unittest.mock import patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.cache import connection
+from app.core.cache.connection import RedisClientFactory
+
+
+def _closed_port() -> int:
+    """A local port nothing listens on."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def factory():
+    return RedisClientFactory(f"redis://127.0.0.1:{_closed_port()}/0", mode="standalone", pool_size=1, pool_timeout=0.05)
+
+
+def test_pools_are_shared_per_db_and_decoding(factory):
+    text = factory.get_client(db=1)
+
+    assert factory.get_client(db=1) is text
+    assert factory.get_client(db=1, decode_responses=False) is not text
+    assert factory.get_client(db=2) is not text
+    assert text.connection_pool.connection_kwargs["db"] == 1
+    assert text.connection_pool.max_connections == 1
+    assert set(factory.pool_stats()) == {"db1:text", "db1:binary", "db2:text"}
+
+
+def test_cluster_mode_shares_one_client_across_dbs():
+    factory = RedisClientFactory(f"redis://127.0.0.1:{_closed_port()}/0", mode="cluster")
+
+    assert factory.get_client(db=3) is factory.get_client(db=0)
+    assert factory.get_client(decode_responses=False) is not factory.get_client()
+
+
+def test_sentinel_mode_discovers_the_master_per_db():
+    factory = RedisClientFactory("redis://unused:6379/0", mode="sentinel", pool_size=4)
+
+    with patch.object(connection.settings, "REDIS_SENTINELS", "s1:26379, s2:26380"):
+        client = factory.get_client(db=2)
+
+    assert factory.get_client(db=2) is client
+    assert [(c.connection_pool.connection_kwargs["host"], c.connection_pool.connection_kwargs["port"])
+            for c in factory._sentinel.sentinels] == [("s1", 26379), ("s2", 26380)]
+    assert client.connection_pool.connection_kwargs["db"] == 2
+    assert client.connection_pool.max_connections == 4
+
+    with patch.object(connection.settings, "REDIS_SENTINELS", ""):
+        with pytest.raises(ValueError):
+            RedisClientFactory("redis://unused:6379/0", mode="sentinel").get_client()
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        RedisClientFactory("redis://localhost:6379/0", mode="proxy")
+
+
+@pytest.mark.asyncio
+async def test_exhausted_pool_is_counted(factory):
+    pool = factory.get_client(db=0).connection_pool
+    # The only connection is checked out
+    pool._in_use_connections.add(object())
+
+    with patch("app.core.cache.connection.REDIS_POOL_EXHAUSTED_TOTAL") as exhausted:
+        with pytest.raises(RedisConnectionError, match="No connection available"):
+            await pool.get_connection("GET")
+
+    exhausted.labels.assert_called_once_with(pool="db0:text")
+    exhausted.labels.return_value.inc.assert_called_once()
+    assert factory.pool_stats()["db0:text"] == {"max": 1, "in_use": 1, "idle": 0}
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_is_not_counted_as_exhaustion(factory):
+    pool = factory.get_client(db=0).connection_pool
+
+    with patch("app.core.cache.connection.REDIS_POOL_EXHAUSTED_TOTAL") as exhausted:
+        with pytest.raises(RedisConnectionError):
+            await pool.get_connection("GET")
+
+    exhausted.labels.return_value.inc.assert_not_called()
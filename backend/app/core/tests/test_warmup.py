@@ -0,0 +1,95 @@
+"""Tests for the startup warm-up and the probes it gates."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.core import warmup
+
+
+async def _ok(*args):
+    return {"opened": 2}
+
+
+async def _fail(*args):
+    raise ConnectionError("connection refused")
+
+
+async def _hang(*args):
+    await asyncio.sleep(3600)
+
+
+@pytest.fixture
+def status():
+    status = {"status": "pending", "steps": {}}
+    with patch.object(warmup, "_status", status), patch.object(warmup, "_task", None), \
+            patch.object(warmup.settings, "WARMUP_ENABLED", True), \
+            patch.object(warmup.settings, "WARMUP_STEP_TIMEOUT_SECONDS", 0.1):
+        yield status
+
+
+def _steps(database=_ok, redis=_ok, ai=_ok):
+    return patch.multiple(warmup, _warm_database=database, _warm_redis=redis, _warm_ai=ai)
+
+
+@pytest.fixture
+async def client():
+    from app.main import app
+
+    # Probes only; the lifespan is not run
+    with patch("app.main.get_database_health", AsyncMock(return_value={"status": "healthy"})):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+
+
+@pytest.mark.asyncio
+async def test_failing_step_is_recorded_and_warmup_finishes(status):
+    with _steps(redis=_fail):
+        await warmup.run_warmup()
+
+    assert warmup.is_warm()
+    assert status["steps"]["database"]["status"] == "ok"
+    assert status["steps"]["redis"] == {"status": "failed", "error": "connection refused", "ms": status["steps"]["redis"]["ms"]}
+    assert status["steps"]["ai"]["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_hanging_step_times_out(status):
+    with _steps(ai=_hang):
+        await asyncio.wait_for(warmup.run_warmup(), timeout=5)
+
+    assert warmup.is_warm()
+    assert status["steps"]["ai"]["status"] == "timeout"
+    assert status["steps"]["ai"]["ms"] >= 100
+    assert status["steps"]["database"]["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_probes_report_ready_after_a_failed_and_a_hung_step(status, client):
+    with _steps(database=_fail, ai=_hang):
+        assert warmup.start_warmup()
+        # Only one warm-up per process
+        assert not warmup.start_warmup()
+
+        response = await client.get("/health/startup")
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+        assert (await client.get("/health/ready")).status_code == 503
+
+        await asyncio.wait_for(warmup._task, timeout=5)
+
+    response = await client.get("/health/startup")
+    assert response.status_code == 200
+    assert response.json()["warmup"]["steps"]["database"]["status"] == "failed"
+    assert response.json()["warmup"]["steps"]["ai"]["status"] == "timeout"
+    assert (await client.get("/health/ready")).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_disabled_warmup_is_warm_immediately(status):
+    with patch.object(warmup.settings, "WARMUP_ENABLED", False):
+        assert not warmup.start_warmup()
+
+    assert warmup.is_warm()
@@ -0,0 +1,161 @@
+"""
+Row-level visibility rules for candidates and analyses.
+
+Single place that decides what a user may read:
+
+- Admin/Senior recruiters: every active candidate and every analysis
+- Junior recruiters: candidates with an active assignment, and analyses
+  they requested themselves
+
+Each role maps to one SQL predicate that repositories add to their queries
+(assignments are checked with a semi-join, so no join rows are multiplied
+and no extra join is needed in the caller). Point lookups use a cached set
+of the user's assigned candidate IDs instead of querying assignments on
+every request. The cache must be invalidated whenever assignments change
+(see invalidate_user_visibility).
+"""
+
+import logging
+import uuid
+from typing import Callable, Dict, FrozenSet, Optional
+
+from sqlalchemy import exists, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.cache import CacheService, create_cache_service
+from database.models.assignment import UserCandidateAssignment
+from database.models.candidate import Candidate
+from database.models.review import ReviewRequest
+
+logger = logging.getLogger(__name__)
+
+# Roles that see every candidate and analysis
+FULL_ACCESS_ROLES = frozenset({"admin", "senior_recruiter"})
+
+# Safety net only; assignment changes invalidate explicitly
+VISIBILITY_CACHE_TTL = 300
+
+_visibility_cache: Optional[CacheService] = None
+
+
+def has_full_access(user_role: str) -> bool:
+    """Check whether a role sees all candidates and analyses."""
+    return user_role in FULL_ACCESS_ROLES
+
+
+def _assigned_to(user_id: uuid.UUID) -> ColumnElement:
+    """Semi-join: candidate has an active assignment to the user."""
+    return exists().where(
+        UserCandidateAssignment.candidate_id == Candidate.id,
+        UserCandidateAssignment.user_id == user_id,
+        UserCandidateAssignment.is_active == True
+    )
+
+
+_CANDIDATE_PREDICATES: Dict[str, Callable[[uuid.UUID], ColumnElement]] = {
+    "admin": lambda user_id: Candidate.status == 'active',
+    "senior_recruiter": lambda user_id: Candidate.status == 'active',
+    "junior_recruiter": lambda user_id: (Candidate.status == 'active') & _assigned_to(user_id),
+}
+
+_ANALYSIS_PREDICATES: Dict[str, Callable[[uuid.UUID], ColumnElement]] = {
+    "admin": lambda user_id: true(),
+    "senior_recruiter": lambda user_id: true(),
+    "junior_recruiter": lambda user_id: ReviewRequest.requested_by_user_id == user_id,
+}
+
+
+def candidate_visibility(user_id: uuid.UUID, user_role: str) -> ColumnElement:
+    """
+    Predicate selecting candidates visible to a user.
+
+    Unknown roles get the most restrictive (junior) rule.
+
+    Args:
+        user_id: User ID
+        user_role: User role ('admin', 'senior_recruiter', 'junior_recruiter')
+
+    Returns:
+        Boolean SQL expression over Candidate
+    """
+    builder = _CANDIDATE_PREDICATES.get(user_role, _CANDIDATE_PREDICATES["junior_recruiter"])
+    return builder(user_id)
+
+
+def analysis_visibility(user_id: uuid.UUID, user_role: str) -> ColumnElement:
+    """
+    Predicate selecting analyses (review requests) visible to a user.
+
+    Args:
+        user_id: User ID
+        user_role: User role ('admin', 'senior_recruiter', 'junior_recruiter')
+
+    Returns:
+        Boolean SQL expression over ReviewRequest
+    """
+    builder = _ANALYSIS_PREDICATES.get(user_role, _ANALYSIS_PREDICATES["junior_recruiter"])
+    return builder(user_id)
+
+
+def can_view_analysis(request: ReviewRequest, user_id: uuid.UUID, user_role: str) -> bool:
+    """In-memory equivalent of analysis_visibility for an already loaded request."""
+    return has_full_access(user_role) or request.requested_by_user_id == user_id
+
+
+def _get_visibility_cache() -> CacheService:
+    """Get the shared visibility cache."""
+    global _visibility_cache
+    if _visibility_cache is None:
+        _visibility_cache = create_cache_service(
+            "visibility",
+            default_ttl=VISIBILITY_CACHE_TTL,
+            local_ttl=30.0
+        )
+    return _visibility_cache
+
+
+async def get_assigned_candidate_ids(session: AsyncSession, user_id: uuid.UUID) -> FrozenSet[uuid.UUID]:
+    """
+    IDs of candidates with an active assignment to the user (cached).
+
+    Args:
+        session: Database session used on a cache miss
+        user_id: User ID
+
+    Returns:
+        Frozen set of candidate IDs
+    """
+    async def load() -> list:
+        result = await session.execute(
+            select(UserCandidateAssignment.candidate_id).where(
+                UserCandidateAssignment.user_id == user_id,
+                UserCandidateAssignment.is_active == True
+            )
+        )
+        # Stored as strings so every cache codec can encode it
+        return [str(candidate_id) for candidate_id in result.scalars().all()]
+
+    ids = await _get_visibility_cache().get_or_compute(f"assigned:{user_id}", load)
+    return frozenset(uuid.UUID(candidate_id) for candidate_id in ids)
+
+
+async def get_visible_candidate_ids(
+    session: AsyncSession,
+    user_id: uuid.UUID,
+    user_role: str
+) -> Optional[FrozenSet[uuid.UUID]]:
+    """
+    Candidate IDs a user is restricted to.
+
+    Returns:
+        Assigned candidate IDs, or None when the role sees every candidate
+    """
+    if has_full_access(user_role):
+        return None
+    return await get_assigned_candidate_ids(session, user_id)
+
+
+async def invalidate_user_visibility(user_id: uuid.UUID) -> None:
+    """Drop the cached visibility of a user (call after assignment changes)."""
+    await _get_visibility_cache().delete(f"assigned:{user_id}")
@@ -0,0 +1,153 @@
+"""
+Startup warm-up.
+
+Runs once per instance, in the background after the lifespan startup, and
+pays up front for everything the first request would otherwise wait on:
+
+- Opens WARMUP_DB_CONNECTIONS pooled connections per database engine
+- Opens WARMUP_REDIS_CONNECTIONS pooled connections per Redis client
+- Parses the AI config/prompt YAML and compiles the analysis workflow
+- Connects to the LLM endpoint (WARMUP_LLM_KEEPALIVE, off locally)
+
+Steps run concurrently and a failing step is recorded, not fatal; a step
+still running after WARMUP_STEP_TIMEOUT_SECONDS is cancelled and recorded
+as timed out, so a hung dependency cannot hold the instance back. The
+startup and readiness probes report ready only once warm-up finished, so
+Cloud Run routes traffic to warm instances only.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Dict, Optional
+
+from sqlalchemy import text
+
+from app.core.cache import get_redis_connection
+from app.core.config import get_settings
+from app.core.database import ROLE_API, ROLE_WORKER, get_postgres_connection
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+_status: Dict[str, Any] = {"status": "pending", "steps": {}}
+_task: Optional[asyncio.Task] = None
+
+
+async def _warm_database(count: int) -> Dict[str, int]:
+    """Open pooled connections on the API and worker engines."""
+    opened = {}
+    for role in (ROLE_API, ROLE_WORKER):
+        connection = get_postgres_connection(role)
+        if not connection.is_initialized:
+            continue
+        # Beyond pool_size connections would be closed again on release
+        role_count = min(count, connection.pool_size)
+
+        # Held together so the pool has to open distinct connections
+        async with AsyncExitStack() as stack:
+            connections = await asyncio.gather(*(
+                stack.enter_async_context(connection.engine.connect())
+                for _ in range(role_count)
+            ))
+            await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in connections))
+        opened[role] = role_count
+    return opened
+
+
+async def _warm_redis(count: int) -> Dict[str, int]:
+    """Open pooled connections on the cache clients (no-op without Redis)."""
+    redis_connection = get_redis_connection()
+    if not redis_connection.is_initialized:
+        return {}
+
+    # Concurrent pings check out (and so open) one connection each
+    clients = {"text": redis_connection.client, "binary": redis_connection.binary_client}
+    for client in clients.values():
+        await asyncio.gather(*(client.ping() for _ in range(count)))
+    return {name: count for name in clients}
+
+
+async def _warm_ai() -> Dict[str, Any]:
+    """Pre-load AI config and prompts, compile the workflow, reach the LLM."""
+    from ai_agents.orchestrator import warm_up
+    return await warm_up(llm_keepalive=settings.WARMUP_LLM_KEEPALIVE)
+
+
+async def _run_step(name: str, step: Awaitable[Any]) -> None:
+    """Run one warm-up step and record its outcome."""
+    started = time.perf_counter()
+    try:
+        detail = await asyncio.wait_for(step, timeout=settings.WARMUP_STEP_TIMEOUT_SECONDS)
+        _status["steps"][name] = {"status": "ok", "detail": detail}
+    except asyncio.TimeoutError:
+        logger.warning(f"Warm-up step {name} timed out after {settings.WARMUP_STEP_TIMEOUT_SECONDS}s")
+        _status["steps"][name] = {"status": "timeout"}
+    except Exception as e:
+        logger.warning(f"Warm-up step {name} failed: {e}")
+        _status["steps"][name] = {"status": "failed", "error": str(e)}
+    _status["steps"][name]["ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+
+async def run_warmup() -> Dict[str, Any]:
+    """
+    Run every warm-up step concurrently.
+
+    Returns:
+        Warm-up status with per-step outcome and timing
+    """
+    started = time.perf_counter()
+    _status["status"] = "running"
+
+    await asyncio.gather(
+        _run_step("database", _warm_database(settings.WARMUP_DB_CONNECTIONS)),
+        _run_step("redis", _warm_redis(settings.WARMUP_REDIS_CONNECTIONS)),
+        _run_step("ai", _warm_ai())
+    )
+
+    _status["status"] = "done"
+    _status["seconds"] = round(time.perf_counter() - started, 2)
+    logger.info(f"Warm-up completed in {_status['seconds']}s: {_status['steps']}")
+    return _status
+
+
+def start_warmup() -> bool:
+    """
+    Start the warm-up in the background (once per process).
+
+    Returns:
+        True if the warm-up was started; when WARMUP_ENABLED is off the
+        instance counts as warm immediately
+    """
+    global _task
+    if not settings.WARMUP_ENABLED:
+        _status["status"] = "done"
+        return False
+    if _task is not None:
+        return False
+    _task = asyncio.create_task(run_warmup())
+    return True
+
+
+async def stop_warmup() -> None:
+    """Cancel the warm-up if it is still running."""
+    global _task
+    if _task is None or _task.done():
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+
+
+def is_warm() -> bool:
+    """Check whether the warm-up finished (successful or not)."""
+    return _status["status"] == "done"
+
+
+def get_warmup_status() -> Dict[str, Any]:
+    """Get the warm-up status with per-step outcome and timing."""
+    return _status
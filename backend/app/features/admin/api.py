@@ -9,6 +9,7 @@ Architecture:
 
 from typing import Optional
 from uuid import UUID
+import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
@@ -17,6 +18,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_async_session
 from app.core.security import SecurityError
 from app.core.dependencies import require_admin, require_senior_or_admin
+from ai_agents.config.registry import ConfigSnapshot, get_config_registry
+from ai_agents.settings import get_settings as get_ai_settings
 from .service import AdminService
 from .repository import AdminUserRepository
 from .schemas import (
@@ -29,7 +32,9 @@ from .schemas import (
     MessageResponse,
     UserRole,
     UserListItem,
-    UserDirectoryItem
+    UserDirectoryItem,
+    AIConfigResponse,
+    AIConfigReloadResponse
 )
 from database.models.auth import User
 from .schemas import UserListItem as AdminUserResponse
@@ -342,4 +347,64 @@ async def get_user_directory(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve user directory"
-        )
\ No newline at end of file
+        )
+
+
+def _ai_config_info(snapshot: ConfigSnapshot) -> dict:
+    """Describe a config snapshot for the AI config endpoints."""
+    ai_settings = get_ai_settings()
+    return {
+        "version": snapshot.version,
+        "fingerprint": snapshot.fingerprint_for(ai_settings.prompt_version, ai_settings.prompt_language),
+        "prompt_version": ai_settings.prompt_version,
+        "prompt_language": ai_settings.prompt_language,
+        "loaded_at": snapshot.loaded_at,
+        "files": snapshot.fingerprints
+    }
+
+
+@router.get("/ai-config", response_model=AIConfigResponse)
+async def get_ai_config(
+    current_user: User = Depends(require_admin)
+):
+    """
+    Get the loaded AI agent configuration version (admin only).
+
+    Returns the fingerprint of every config and prompt file, and the
+    fingerprint stamped on results produced now.
+
+    Required role: Admin
+    """
+    return AIConfigResponse(**_ai_config_info(get_config_registry().snapshot))
+
+
+@router.post("/ai-config/reload", response_model=AIConfigReloadResponse)
+async def reload_ai_config(
+    current_user: User = Depends(require_admin)
+):
+    """
+    Reload AI agent configuration and prompts from disk (admin only).
+
+    The new version is swapped in atomically; running analyses finish with
+    the version they started with. If a file fails to load, the current
+    version stays active. Only the instance that receives the request
+    reloads; the others pick changes up through the config watcher.
+
+    Required role: Admin
+    """
+    registry = get_config_registry()
+    try:
+        # Reads and parses every file; kept off the event loop
+        reloaded = await asyncio.to_thread(registry.reload, True)
+    except Exception as e:
+        logger.error(f"Error reloading AI config: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to reload AI configuration, version {registry.snapshot.version} still active: {e}"
+        )
+
+    logger.info(
+        f"AI config reload by admin {current_user.id}: "
+        f"version {registry.snapshot.version} (changed={reloaded})"
+    )
+    return AIConfigReloadResponse(reloaded=reloaded, **_ai_config_info(registry.snapshot))
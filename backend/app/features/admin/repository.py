@@ -6,12 +6,13 @@ Extends UserRepository with admin-specific queries.
 from typing import Optional, List, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func, or_, and_
+from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import build_text_search
 from app.features.auth.repository import UserRepository
 from database.models.auth import User
-from database.models.assignment import UserCandidateAssignment
+from database.models.assignment import UserAssignmentStats
 from database.models.resume import Resume
 from database.models.review import ReviewRequest
 
@@ -40,53 +41,48 @@ class AdminUserRepository(UserRepository):
         Args:
             page: Page number (1-based)
             page_size: Items per page
-            search: Search term for email/name
+            search: Prefix/fuzzy search term for email/name (ranked by relevance)
             role: Filter by role
             is_active: Filter by active status
 
         Returns:
             Tuple of (list of (User, assignment_count) tuples, total_count)
         """
-        # Build query with LEFT JOIN to get assignment counts in single query
+        # Assignment counts come from the trigger-maintained counter table
+        # (PK join, no aggregate)
         query = (
             select(
                 User,
-                func.count(UserCandidateAssignment.id).label('assigned_count')
+                func.coalesce(UserAssignmentStats.active_assignment_count, 0).label('assigned_count')
             )
-            .outerjoin(
-                UserCandidateAssignment,
-                and_(
-                    UserCandidateAssignment.user_id == User.id,
-                    UserCandidateAssignment.is_active == True
-                )
-            )
-            .group_by(User.id)
+            .outerjoin(UserAssignmentStats, UserAssignmentStats.user_id == User.id)
         )
 
         # Apply filters
-        if search:
-            search_pattern = f"%{search.lower()}%"
-            query = query.where(
-                or_(
-                    User.email.ilike(search_pattern),
-                    User.first_name.ilike(search_pattern),
-                    User.last_name.ilike(search_pattern)
-                )
-            )
+        filters = []
+        text_search = build_text_search(User.search_text, search)
+        if text_search:
+            filters.append(text_search.condition)
 
         if role:
-            query = query.where(User.role == role)
+            filters.append(User.role == role)
 
         if is_active is not None:
-            query = query.where(User.is_active == is_active)
+            filters.append(User.is_active == is_active)
+
+        if filters:
+            query = query.where(and_(*filters))
 
-        # Get total count before pagination
-        count_query = select(func.count()).select_from(query.subquery())
+        # Get total count before pagination (filters only touch users)
+        count_query = select(func.count(User.id)).where(and_(*filters)) if filters else select(func.count(User.id))
         total_result = await self.session.execute(count_query)
         total = total_result.scalar() or 0
 
-        # Apply pagination and ordering
-        query = query.order_by(User.created_at.desc())
+        # Apply pagination and ordering (most relevant first when searching)
+        if text_search:
+            query = query.order_by(text_search.rank.desc(), User.created_at.desc())
+        else:
+            query = query.order_by(User.created_at.desc())
         query = query.offset((page - 1) * page_size).limit(page_size)
 
         # Execute single query that gets users + assignment counts
@@ -115,13 +111,13 @@ class AdminUserRepository(UserRepository):
         query = (
             select(
                 User,
-                # Count assigned candidates (only active assignments)
-                select(func.count(UserCandidateAssignment.id))
-                .where(
-                    UserCandidateAssignment.user_id == user_id,
-                    UserCandidateAssignment.is_active == True
+                # Active assignment count (denormalized counter)
+                func.coalesce(
+                    select(UserAssignmentStats.active_assignment_count)
+                    .where(UserAssignmentStats.user_id == user_id)
+                    .scalar_subquery(),
+                    0
                 )
-                .scalar_subquery()
                 .label('assigned_count'),
                 # Count resumes uploaded
                 select(func.count(Resume.id))
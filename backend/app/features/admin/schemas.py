@@ -4,7 +4,7 @@ Defines request and response models for admin operations.
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict, computed_field
@@ -144,4 +144,18 @@ class UserDirectoryResponse(BaseModel):
 class MessageResponse(BaseModel):
     """Simple message response."""
     message: str
-    success: bool = True
\ No newline at end of file
+    success: bool = True
+
+class AIConfigResponse(BaseModel):
+    """Loaded AI agent configuration and prompt fingerprints."""
+    version: str = Field(..., description="Fingerprint of all config and prompt files")
+    fingerprint: str = Field(..., description="Fingerprint stamped on new results (active prompt version and language)")
+    prompt_version: str
+    prompt_language: str
+    loaded_at: datetime
+    files: Dict[str, str] = Field(..., description="Fingerprint per file")
+
+
+class AIConfigReloadResponse(AIConfigResponse):
+    """Result of an AI configuration reload."""
+    reloaded: bool = Field(..., description="Whether a new version was installed")
@@ -14,7 +14,6 @@ from app.core.security import (
     verify_token,
     SecurityError
 )
-from app.core.rate_limiter import check_rate_limit_middleware, RateLimitType
 from app.core.database import get_async_session
 from .repository import UserRepository, RefreshTokenRepository
 from .service import AuthService
@@ -97,14 +96,13 @@ async def login(
 
     This endpoint:
     - Validates user credentials
-    - Applies rate limiting
+    - Is rate limited per client IP (RateLimitMiddleware)
     - Creates new session
     - Returns JWT tokens
     """
     try:
-        # Rate limiting by IP (prevents brute force attacks)
+        # Rate limiting by IP (prevents brute force attacks) is enforced by RateLimitMiddleware
         client_ip = get_client_ip(request)
-        await check_rate_limit_middleware(request, RateLimitType.LOGIN, client_ip)
 
         # Extract request metadata
         user_agent = request.headers.get("User-Agent")
@@ -115,7 +113,6 @@ async def login(
         return response
 
     except HTTPException:
-        # Re-raise HTTPException (from rate limiter, etc.) without modification
         raise
     except SecurityError as e:
         logger.warning(f"Login failed from {get_client_ip(request)}: {e}")
@@ -143,14 +140,12 @@ async def register(
 
     This endpoint:
     - Validates registration data
-    - Applies rate limiting
+    - Is rate limited per client IP (RateLimitMiddleware)
     - Creates new user account
     - Returns user information
     """
     try:
-        # Rate limiting by IP (prevents abuse)
-        client_ip = get_client_ip(request)
-        await check_rate_limit_middleware(request, RateLimitType.REGISTRATION, client_ip)
+        # Rate limiting by IP (prevents abuse) is enforced by RateLimitMiddleware
 
         # Call service layer (business logic)
         response = await auth_service.register_user(user_data)
@@ -159,7 +154,6 @@ async def register(
         return response
 
     except HTTPException:
-        # Re-raise HTTPException (from rate limiter, etc.) without modification
         raise
     except SecurityError as e:
         logger.warning(f"Registration failed from {get_client_ip(request)}: {e}")
@@ -175,22 +175,25 @@ class TestAuthAPILogin:
         # Assert
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     
-    @patch('app.features.auth.api.check_rate_limit_middleware')
-    @patch('app.features.auth.api.AuthService')
-    def test_login_rate_limiting(self, MockAuthService, mock_rate_limit, client):
+    @patch('app.core.rate_limit_middleware.rate_limiter.check_rate_limit', new_callable=AsyncMock)
+    def test_login_rate_limiting(self, mock_rate_limit, client):
         """Test that rate limiting is applied to login attempts."""
         # Arrange
-        from app.core.rate_limiter import RateLimitExceeded
-        mock_rate_limit.side_effect = RateLimitExceeded("Rate limit exceeded")
+        mock_rate_limit.return_value = (False, {
+            "blocked": True,
+            "block_time_remaining": 1800
+        })
         
         # Act
         response = client.post("/api/v1/auth/login", json=MockAuthData.VALID_LOGIN_REQUEST)
         
         # Assert
         assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.headers["Retry-After"] == "1800"
+        assert response.headers["RateLimit-Remaining"] == "0"
         mock_rate_limit.assert_called_once()
-        # AuthService should not be called if rate limited
-        MockAuthService.assert_not_called()
+        # Rejected before the endpoint (and its dependencies) run
+        self.mock_auth_service.login.assert_not_called()
 
 
 class TestAuthAPILogout:
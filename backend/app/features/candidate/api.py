@@ -8,12 +8,12 @@ Architecture:
 
 import uuid
 import logging
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_async_session
+from app.core.database import InvalidCursorError, decode_cursor, encode_cursor, get_async_session
 from app.core.dependencies import get_current_user
 from .service import CandidateService
 from .repository import CandidateRepository
@@ -93,8 +93,9 @@ async def create_candidate(
     summary="Get candidates for current user"
 )
 async def get_candidates(
-    limit: int = 10,
-    offset: int = 0,
+    limit: int = Query(10, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
     current_user: User = Depends(get_current_user),
     repo: CandidateRepository = Depends(get_candidate_repository)
 ):
@@ -104,17 +105,32 @@ async def get_candidates(
     - Junior recruiters: Only assigned candidates
     - Senior recruiters/Admin: All candidates
 
+    Pagination: follow ``next_cursor`` (keyset, constant cost per page).
+    ``offset`` is still accepted for the first pages but gets slower with depth.
+
     Architecture: Simple read with role-based filtering → Repository
     """
     try:
-        # Get candidates from repository (role-based filtering)
+        after = decode_cursor(cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        # Fetch one extra row to know whether another page exists
         candidates = await repo.list_for_user(
             user_id=current_user.id,
             user_role=current_user.role,
-            limit=limit,
-            offset=offset
+            limit=limit + 1,
+            offset=offset,
+            after=after
         )
 
+        next_cursor = None
+        if len(candidates) > limit:
+            candidates = candidates[:limit]
+            last = candidates[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
         # Convert to response format with basic stats
         candidate_list = []
         for candidate in candidates:
@@ -128,7 +144,8 @@ async def get_candidates(
             candidates=candidate_list,
             total_count=len(candidates),  # TODO: Get actual count
             limit=limit,
-            offset=offset
+            offset=offset,
+            next_cursor=next_cursor
         )
 
     except HTTPException:
@@ -138,6 +155,42 @@ async def get_candidates(
         raise HTTPException(status_code=500, detail="Failed to retrieve candidates")
 
 
+@router.get(
+    "/search",
+    response_model=List[CandidateInfo],
+    summary="Search candidates"
+)
+async def search_candidates(
+    q: str = Query(..., min_length=1, max_length=100, description="Name, email or company (prefix/fuzzy)"),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    repo: CandidateRepository = Depends(get_candidate_repository)
+):
+    """
+    Search candidates by name, email or company, ranked by relevance.
+
+    Same visibility rules as the candidate list:
+    - Junior recruiters: Only assigned candidates
+    - Senior recruiters/Admin: All candidates
+
+    Architecture: Simple read with role-based filtering → Repository
+    """
+    try:
+        candidates = await repo.search_for_user(
+            user_id=current_user.id,
+            user_role=current_user.role,
+            search=q,
+            limit=limit
+        )
+        return [CandidateInfo.from_orm(candidate) for candidate in candidates]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to search candidates: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to search candidates")
+
+
 @router.get(
     "/{candidate_id}",
     response_model=CandidateInfo,
@@ -6,10 +6,11 @@ Handles role-based access control at the query level.
 from typing import Optional, List
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import BaseRepository
+from app.core.database import BaseRepository, KeysetCursor, build_text_search, keyset_after
+from app.core.visibility import candidate_visibility, get_assigned_candidate_ids, has_full_access
 from database.models.candidate import Candidate
 from database.models.assignment import UserCandidateAssignment
 
@@ -25,57 +26,98 @@ class CandidateRepository(BaseRepository[Candidate]):
         """Initialize repository with database session."""
         super().__init__(session, Candidate)
 
+    @staticmethod
+    def restrict_to_visible(query: Select, user_id: UUID, user_role: str) -> Select:
+        """
+        Restrict a query that selects from candidates to candidates visible to a user.
+
+        Business rules (app.core.visibility):
+        - Admin/Senior recruiters: See all active candidates
+        - Junior recruiters: See only assigned active candidates
+
+        Args:
+            query: Select statement with Candidate in its FROM clause
+            user_id: User ID
+            user_role: User role ('admin', 'senior_recruiter', 'junior_recruiter')
+
+        Returns:
+            Filtered select statement
+        """
+        return query.where(candidate_visibility(user_id, user_role))
+
     async def list_for_user(
         self,
         user_id: UUID,
         user_role: str,
         limit: int = 10,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[KeysetCursor] = None
     ) -> List[Candidate]:
         """
-        Get candidates visible to user based on role.
+        Get candidates visible to user based on role, newest first.
 
         Business rules:
         - Admin/Senior recruiters: See all active candidates
         - Junior recruiters: See only assigned candidates
 
+        Pass ``after`` (keyset cursor) instead of ``offset`` for deep pages:
+        rows are ordered by ``(created_at, id)`` so the seek is an index range
+        scan (idx_candidates_active_created_id) and each page costs the same.
+
         Args:
             user_id: User ID
             user_role: User role ('admin', 'senior_recruiter', 'junior_recruiter')
             limit: Maximum number of results
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when ``after`` is given)
+            after: Return candidates after this cursor
 
         Returns:
             List of candidates visible to the user
         """
-        if user_role in ['admin', 'senior_recruiter']:
-            # Admin and senior recruiters see all active candidates
-            query = (
-                select(Candidate)
-                .where(Candidate.status == 'active')
-                .order_by(Candidate.created_at.desc())
-                .limit(limit)
-                .offset(offset)
-            )
-        else:
-            # Junior recruiters see only assigned candidates
-            query = (
-                select(Candidate)
-                .join(
-                    UserCandidateAssignment,
-                    Candidate.id == UserCandidateAssignment.candidate_id
-                )
-                .where(
-                    and_(
-                        UserCandidateAssignment.user_id == user_id,
-                        UserCandidateAssignment.is_active == True,
-                        Candidate.status == 'active'
-                    )
-                )
-                .order_by(Candidate.created_at.desc())
-                .limit(limit)
-                .offset(offset)
-            )
+        query = self.restrict_to_visible(select(Candidate), user_id, user_role)
+
+        if after is not None:
+            query = query.where(keyset_after(Candidate.created_at, Candidate.id, after))
+        elif offset:
+            query = query.offset(offset)
+
+        query = query.order_by(Candidate.created_at.desc(), Candidate.id.desc()).limit(limit)
+
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def search_for_user(
+        self,
+        user_id: UUID,
+        user_role: str,
+        search: str,
+        limit: int = 20
+    ) -> List[Candidate]:
+        """
+        Prefix/fuzzy search over candidate name, email and company.
+
+        Same visibility rules as list_for_user. Results are ordered by
+        relevance (prefix matches first, then similarity).
+
+        Args:
+            user_id: User ID
+            user_role: User role ('admin', 'senior_recruiter', 'junior_recruiter')
+            search: Search term
+            limit: Maximum number of results
+
+        Returns:
+            Matching candidates visible to the user
+        """
+        text_search = build_text_search(Candidate.search_text, search)
+        if text_search is None:
+            return []
+
+        query = self.restrict_to_visible(
+            select(Candidate).where(text_search.condition),
+            user_id,
+            user_role
+        )
+        query = query.order_by(text_search.rank.desc(), Candidate.created_at.desc()).limit(limit)
 
         result = await self.session.execute(query)
         return list(result.scalars().all())
@@ -93,6 +135,9 @@ class CandidateRepository(BaseRepository[Candidate]):
         - Admin/Senior recruiters: Access all candidates
         - Junior recruiters: Access only assigned candidates
 
+        The assignment check uses the cached per-user candidate set, so this
+        is a primary key lookup for every role.
+
         Args:
             candidate_id: Candidate ID
             user_id: User ID
@@ -101,29 +146,12 @@ class CandidateRepository(BaseRepository[Candidate]):
         Returns:
             Candidate if user has access, None otherwise
         """
-        if user_role in ['admin', 'senior_recruiter']:
-            # Admin and senior recruiters have access to all candidates
-            query = select(Candidate).where(Candidate.id == candidate_id)
-            result = await self.session.execute(query)
-            return result.scalar_one_or_none()
-        else:
-            # Junior recruiters need active assignment
-            query = (
-                select(Candidate)
-                .join(
-                    UserCandidateAssignment,
-                    Candidate.id == UserCandidateAssignment.candidate_id
-                )
-                .where(
-                    and_(
-                        Candidate.id == candidate_id,
-                        UserCandidateAssignment.user_id == user_id,
-                        UserCandidateAssignment.is_active == True
-                    )
-                )
-            )
-            result = await self.session.execute(query)
-            return result.scalar_one_or_none()
+        if not has_full_access(user_role):
+            assigned = await get_assigned_candidate_ids(self.session, user_id)
+            if candidate_id not in assigned:
+                return None
+
+        return await self.get_by_id(candidate_id)
 
     async def create_with_assignment(
         self,
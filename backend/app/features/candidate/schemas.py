@@ -53,6 +53,7 @@ class CandidateListResponse(BaseModel):
     total_count: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page; None on the last page
 
 
 class CandidateCreateResponse(BaseModel):
@@ -16,6 +16,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 
+from app.core.visibility import invalidate_user_visibility
 from database.models.candidate import Candidate
 from database.models.assignment import UserCandidateAssignment
 from database.models.auth import User
@@ -101,6 +102,7 @@ class CandidateService:
             self.session.add(assignment)
             await self.session.commit()
             await self.session.refresh(candidate)
+            await invalidate_user_visibility(created_by_user_id)
 
             logger.info(f"Created candidate {candidate.id} and assigned to user {created_by_user_id}")
             return candidate
@@ -168,6 +170,7 @@ class CandidateService:
 
             self.session.add(assignment)
             await self.session.commit()
+            await invalidate_user_visibility(user_id)
 
             logger.info(f"Assigned candidate {candidate_id} to user {user_id}")
             return True
@@ -390,4 +390,117 @@ class TestCandidateAPIValidation:
                 first_name="John",
                 last_name="Doe",
                 years_experience=-1
-            )
\ No newline at end of file
+            )
+
+class TestCandidateSearchAPI:
+    """Test candidate search endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_search_candidates_uses_role_scoped_repository(self, mock_current_user, sample_candidate):
+        """Search delegates to the repository with the caller's role."""
+        from app.features.candidate.api import search_candidates
+
+        mock_repo = Mock()
+        mock_repo.search_for_user = AsyncMock(return_value=[sample_candidate])
+
+        response = await search_candidates(
+            q="joh",
+            limit=10,
+            current_user=mock_current_user,
+            repo=mock_repo
+        )
+
+        assert len(response) == 1
+        assert response[0].first_name == "John"
+        mock_repo.search_for_user.assert_called_once_with(
+            user_id=mock_current_user.id,
+            user_role="junior_recruiter",
+            search="joh",
+            limit=10
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_candidates_repository_error(self, mock_current_user):
+        """Repository failures surface as 500."""
+        from app.features.candidate.api import search_candidates
+
+        mock_repo = Mock()
+        mock_repo.search_for_user = AsyncMock(side_effect=Exception("db down"))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await search_candidates(q="doe", limit=10, current_user=mock_current_user, repo=mock_repo)
+
+        assert exc_info.value.status_code == 500
+
+
+class TestCandidateListPagination:
+    """Test keyset pagination of the candidate list."""
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_resumes_after_last_row(self, mock_current_user, sample_candidate):
+        """An extra row yields a cursor that the next request decodes to the last row's key."""
+        from app.features.candidate.api import get_candidates
+        from app.core.database import decode_cursor
+
+        mock_repo = Mock()
+        mock_repo.list_for_user = AsyncMock(return_value=[sample_candidate, sample_candidate])
+
+        response = await get_candidates(
+            limit=1,
+            offset=0,
+            cursor=None,
+            current_user=mock_current_user,
+            repo=mock_repo
+        )
+
+        assert len(response.candidates) == 1
+        assert response.next_cursor is not None
+        mock_repo.list_for_user.assert_called_once_with(
+            user_id=mock_current_user.id,
+            user_role="junior_recruiter",
+            limit=2,
+            offset=0,
+            after=None
+        )
+
+        after = decode_cursor(response.next_cursor)
+        assert after.id == sample_candidate.id
+        assert after.created_at == sample_candidate.created_at
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_cursor(self, mock_current_user, sample_candidate):
+        """A short page has no next cursor."""
+        from app.features.candidate.api import get_candidates
+
+        mock_repo = Mock()
+        mock_repo.list_for_user = AsyncMock(return_value=[sample_candidate])
+
+        response = await get_candidates(
+            limit=10,
+            offset=0,
+            cursor=None,
+            current_user=mock_current_user,
+            repo=mock_repo
+        )
+
+        assert response.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_rejected(self, mock_current_user):
+        """A malformed cursor is a 400, not a server error."""
+        from app.features.candidate.api import get_candidates
+
+        mock_repo = Mock()
+        mock_repo.list_for_user = AsyncMock()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_candidates(
+                limit=10,
+                offset=0,
+                cursor="not-a-cursor",
+                current_user=mock_current_user,
+                repo=mock_repo
+            )
+
+        assert exc_info.value.status_code == 400
+        mock_repo.list_for_user.assert_not_called()
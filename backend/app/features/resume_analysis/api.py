@@ -2,18 +2,22 @@
 
 import uuid
 import logging
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, BackgroundTasks
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_async_session
+from app.core.database import get_async_session, run_read
 from app.core.dependencies import get_current_user
 from database.models.auth import User
-from app.core.rate_limiter import rate_limiter, RateLimitExceeded, RateLimitType
 
-from .service import AnalysisService, AnalysisValidationException, AnalysisException
+from .service import (
+    AnalysisService,
+    AnalysisValidationException,
+    AnalysisConflictException,
+    AnalysisException
+)
 from .schemas import (
     AnalysisRequest,
     AnalysisResponse,
@@ -21,7 +25,8 @@ from .schemas import (
     AnalysisResult,
     AnalysisListResponse,
     AnalysisSummary,
-    AnalysisStats
+    AnalysisStats,
+    FeedbackInsightsResponse
 )
 from database.models.analysis import AnalysisStatus, Industry
 
@@ -47,6 +52,13 @@ async def request_resume_analysis(
     resume_id: uuid.UUID,
     background_tasks: BackgroundTasks,
     request: AnalysisRequest,
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=255,
+        description="Client key; retries with the same key return the original request"
+    ),
     current_user: User = Depends(get_current_user),
     service: AnalysisService = Depends(get_analysis_service)
 ) -> AnalysisResponse:
@@ -58,18 +70,12 @@ async def request_resume_analysis(
     - Queues analysis job for background processing
     - Returns analysis job ID for polling results
     - Supports different analysis depths and focus areas
+    - Returns the existing request for a reused Idempotency-Key or while the
+      same analysis is still pending/processing
     """
     
+    # Rate limiting is enforced by RateLimitMiddleware before this handler runs
     try:
-        # Apply rate limiting
-        is_allowed, rate_info = await rate_limiter.check_rate_limit(
-            limit_type=RateLimitType.ANALYSIS,
-            identifier=str(current_user.id)
-        )
-
-        if not is_allowed:
-            raise RateLimitExceeded("Too many analysis requests. Please wait before analyzing more resumes.")
-        
         logger.info(f"User {current_user.id} requesting analysis for resume {resume_id}, industry: {request.industry}")
 
         # Request analysis (async processing with background tasks)
@@ -77,20 +83,19 @@ async def request_resume_analysis(
             resume_id=resume_id,
             user_id=current_user.id,
             industry=request.industry,
-            background_tasks=background_tasks
+            background_tasks=background_tasks,
+            idempotency_key=idempotency_key
         )
 
         logger.info(f"Analysis queued: {result.analysis_id}")
         return result
         
-    except RateLimitExceeded:
-        raise HTTPException(
-            status_code=429,
-            detail="Too many analysis requests. Please wait before analyzing more resumes."
-        )
     except AnalysisValidationException as e:
         logger.warning(f"Analysis validation error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
+    except AnalysisConflictException as e:
+        logger.warning(f"Analysis idempotency conflict: {str(e)}")
+        raise HTTPException(status_code=409, detail=str(e))
     except AnalysisException as e:
         logger.error(f"Analysis error: {str(e)}")
         raise HTTPException(status_code=500, detail="Resume analysis failed. Please try again.")
@@ -107,24 +112,29 @@ async def request_resume_analysis(
 )
 async def get_analysis_status(
     analysis_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    service: AnalysisService = Depends(get_analysis_service)
+    current_user: User = Depends(get_current_user)
 ) -> AnalysisStatusResponse:
     """
     Poll analysis status and get results when complete.
 
     Use this endpoint to check if analysis is done and retrieve results.
     Frontend should poll this every 2-3 seconds until status is 'completed'.
+
+    Served from the read replica; an analysis not yet replicated (just
+    requested) is re-read from the primary.
     """
 
-    try:
-        status_result = await service.get_analysis_status(
-            request_id=analysis_id,
-            user_id=current_user.id,
-            user_role=current_user.role
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    async def read_status(session: AsyncSession) -> Optional[AnalysisStatusResponse]:
+        try:
+            return await AnalysisService(session).get_analysis_status(
+                request_id=analysis_id,
+                user_id=current_user.id,
+                user_role=current_user.role
+            )
+        except ValueError:
+            return None
+
+    status_result = await run_read(read_status, fallback_when=lambda result: result is None)
 
     if not status_result:
         raise HTTPException(status_code=404, detail="Analysis not found or not accessible")
@@ -169,22 +179,29 @@ async def get_analysis_status(
 )
 async def get_analysis_result(
     analysis_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
-    service: AnalysisService = Depends(get_analysis_service)
+    current_user: User = Depends(get_current_user)
 ) -> AnalysisResult:
-    """Get detailed analysis results by ID (only for completed analyses)."""
+    """
+    Get detailed analysis results by ID (only for completed analyses).
 
-    try:
-        result = await service.get_analysis_result(
-            request_id=analysis_id,
-            user_id=current_user.id,
-            user_role=current_user.role
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    Served from the read replica; results not yet replicated are re-read
+    from the primary.
+    """
+
+    async def read_result(session: AsyncSession) -> Optional[AnalysisResult]:
+        try:
+            return await AnalysisService(session).get_analysis_result(
+                request_id=analysis_id,
+                user_id=current_user.id,
+                user_role=current_user.role
+            )
+        except ValueError:
+            return None
+
+    result = await run_read(read_result, fallback_when=lambda value: value is None)
 
     if not result:
-        raise HTTPException(status_code=404, detail="Analysis not found or not accessible")
+        raise HTTPException(status_code=404, detail="Analysis not found, not accessible or not completed yet")
 
     # === DATA SIZE CHECKPOINT 11: API RESPONSE TO FRONTEND (GET RESULT) ===
     logger.debug(f"=== CHECKPOINT 11: API RESPONSE TO FRONTEND (GET RESULT) ===")
@@ -249,21 +266,22 @@ async def list_analyses(
     candidate_id: Optional[uuid.UUID] = Query(None, description="Filter by candidate"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=50, description="Items per page"),
-    current_user: User = Depends(get_current_user),
-    service: AnalysisService = Depends(get_analysis_service)
+    current_user: User = Depends(get_current_user)
 ) -> AnalysisListResponse:
-    """List user's analyses with role-based filtering and pagination."""
+    """List user's analyses with role-based filtering and pagination (read replica)."""
 
     offset = (page - 1) * page_size
 
-    result = await service.list_user_analyses(
-        user_id=current_user.id,
-        user_role=current_user.role,
-        limit=page_size,
-        offset=offset,
-        status=status,
-        industry=industry,
-        candidate_id=candidate_id
+    result = await run_read(
+        lambda session: AnalysisService(session).list_user_analyses(
+            user_id=current_user.id,
+            user_role=current_user.role,
+            limit=page_size,
+            offset=offset,
+            status=status,
+            industry=industry,
+            candidate_id=candidate_id
+        )
     )
 
     return AnalysisListResponse(
@@ -286,7 +304,7 @@ async def cancel_analysis(
 ) -> JSONResponse:
     """Cancel an ongoing analysis."""
     
-    success = await service.cancel_analysis(analysis_id, current_user.id)
+    success = await service.cancel_analysis(analysis_id, current_user.id, current_user.role)
     
     if not success:
         raise HTTPException(
@@ -315,6 +333,31 @@ async def get_analysis_stats(
     return await service.get_user_stats(current_user.id)
 
 
+@router.get(
+    "/stats/feedback",
+    response_model=FeedbackInsightsResponse,
+    summary="Get feedback insights",
+    description="Most common feedback categories per industry across visible analyses"
+)
+async def get_feedback_insights(
+    industry: Optional[Industry] = Query(None, description="Filter by industry"),
+    feedback_type: Optional[List[str]] = Query(None, description="Filter by feedback type (strength, weakness, suggestion, error)"),
+    limit: int = Query(20, ge=1, le=100, description="Max groups returned"),
+    current_user: User = Depends(get_current_user)
+) -> FeedbackInsightsResponse:
+    """Aggregate stored feedback items by category (read replica)."""
+
+    return await run_read(
+        lambda session: AnalysisService(session).get_feedback_insights(
+            user_id=current_user.id,
+            user_role=current_user.role,
+            industry=industry,
+            feedback_types=feedback_type,
+            limit=limit
+        )
+    )
+
+
 @router.get(
     "/config/limits",
     summary="Get analysis limits",
@@ -0,0 +1,124 @@
+"""
+Cooperative cancellation of running analyses.
+
+Cancelling a request sets its status to 'cancelled' in the database (the
+source of truth) and raises a cancellation flag in the shared cache:
+
+- The process running the analysis aborts its AI task immediately, which
+  also aborts the in-flight OpenAI HTTP request.
+- Other processes see the flag before the next workflow node, or at the
+  latest on the next poll while an LLM call is running.
+
+Queued jobs never start: the background job only runs after moving the
+request from 'pending' to 'processing'.
+"""
+
+import asyncio
+import logging
+import uuid
+from typing import Awaitable, Callable, Dict, Iterable, Optional, TypeVar
+
+from ai_agents.utils import AnalysisCancelledError
+from app.core.cache import CacheService, create_cache_service
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Flags outlive any analysis (two LLM calls with retries)
+CANCEL_FLAG_TTL = 3600
+
+# How often a running analysis checks for a cancellation from another process
+CANCEL_POLL_SECONDS = 2.0
+
+_cancel_cache: Optional[CacheService] = None
+_running: Dict[uuid.UUID, asyncio.Task] = {}
+
+
+def _get_cancel_cache() -> CacheService:
+    """Get the shared cancellation flag cache."""
+    global _cancel_cache
+    if _cancel_cache is None:
+        # No L1: flags are set by other processes and must be read from Redis
+        _cancel_cache = create_cache_service(
+            "analysis_cancel",
+            default_ttl=CANCEL_FLAG_TTL,
+            local_max_size=0
+        )
+    return _cancel_cache
+
+
+async def request_cancellation(request_id: uuid.UUID) -> bool:
+    """
+    Signal a running analysis to stop.
+
+    Call after the request's status was set to 'cancelled'.
+
+    Args:
+        request_id: Review request ID
+
+    Returns:
+        True if the analysis was running in this process and was aborted
+    """
+    await _get_cancel_cache().set(str(request_id), True)
+
+    task = _running.get(request_id)
+    if task is not None and not task.done():
+        task.cancel()
+        return True
+    return False
+
+
+async def is_cancel_requested(request_id: uuid.UUID) -> bool:
+    """Check whether cancellation was requested for an analysis."""
+    return await _get_cancel_cache().exists(str(request_id))
+
+
+async def all_cancel_requested(request_ids: Iterable[uuid.UUID]) -> bool:
+    """Check whether every given analysis was cancelled (True for none)."""
+    for request_id in request_ids:
+        if not await is_cancel_requested(request_id):
+            return False
+    return True
+
+
+async def run_cancellable(
+    request_id: uuid.UUID,
+    operation: Callable[[], Awaitable[T]],
+    poll_interval: float = CANCEL_POLL_SECONDS
+) -> T:
+    """
+    Run an analysis step that is aborted when the request is cancelled.
+
+    Args:
+        request_id: Review request ID
+        operation: Starts the step (e.g. the AI orchestrator run)
+        poll_interval: Seconds between checks for a cancellation flag
+
+    Returns:
+        The operation's result
+
+    Raises:
+        AnalysisCancelledError: If the request was cancelled
+    """
+    task = asyncio.ensure_future(operation())
+    _running[request_id] = task
+
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await is_cancel_requested(request_id):
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                raise AnalysisCancelledError(f"Analysis {request_id} cancelled")
+    except asyncio.CancelledError:
+        if task.cancelled():
+            # Aborted locally by request_cancellation
+            raise AnalysisCancelledError(f"Analysis {request_id} cancelled")
+        task.cancel()
+        raise
+    finally:
+        if _running.get(request_id) is task:
+            del _running[request_id]
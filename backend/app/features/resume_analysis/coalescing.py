@@ -0,0 +1,102 @@
+"""
+In-flight coalescing of identical AI analyses.
+
+Analyses with the same key (resume, industry, prompt version) that run at
+the same time share one orchestrator run: the first caller starts it and
+later callers await the same task, so duplicate requests cost one set of
+LLM calls. Every caller receives the same result and stores it for its own
+review request.
+
+Waiters are tracked per run. A cancelled waiter leaves the run to the
+others; when the last waiter is cancelled the run itself is cancelled, so
+nobody pays for an analysis no request will store.
+
+Coalescing is per process; BackgroundTasks run in the API process that
+accepted the request.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Hashable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisCoalescer:
+    """Registry of running analyses keyed by their inputs."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    def is_running(self, key: Hashable) -> bool:
+        """Check whether an analysis for the key is in flight."""
+        return key in self._in_flight
+
+    def waiters(self, key: Hashable) -> FrozenSet[Hashable]:
+        """Waiter IDs currently sharing the run for a key."""
+        return frozenset(self._waiters.get(key, ()))
+
+    async def run(
+        self,
+        key: Hashable,
+        operation: Callable[[], Awaitable[Dict[str, Any]]],
+        waiter: Optional[Hashable] = None
+    ) -> Dict[str, Any]:
+        """
+        Run an analysis, or join the one already running for the key.
+
+        The shared task is shielded, so a cancelled caller does not cancel the
+        run other callers are waiting on; the last caller to leave cancels it.
+
+        Args:
+            key: Analysis inputs identifying duplicates
+            operation: Starts the analysis when no run is in flight
+            waiter: ID of the caller (e.g. review request ID)
+
+        Returns:
+            The (shared) analysis result
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(operation())
+            self._in_flight[key] = task
+            self._waiters[key] = set()
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            logger.info(f"Joining in-flight analysis for {key}")
+
+        waiters = self._waiters[key]
+        token = waiter if waiter is not None else object()
+        waiters.add(token)
+
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            waiters.discard(token)
+            if not waiters and not task.done():
+                logger.info(f"Last waiter left, cancelling analysis for {key}")
+                # Unregister first so a new caller starts a fresh run
+                self._forget(key, task)
+                task.cancel()
+            raise
+        finally:
+            waiters.discard(token)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """Drop a finished or abandoned run (only if it is still the registered one)."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            del self._waiters[key]
+
+
+_coalescer = AnalysisCoalescer()
+
+
+def get_analysis_coalescer() -> AnalysisCoalescer:
+    """Get the process-wide analysis coalescer."""
+    return _coalescer
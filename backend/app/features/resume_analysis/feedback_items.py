@@ -0,0 +1,125 @@
+"""
+Flatten AI feedback into ``review_feedback_items`` rows.
+
+The agents return feedback as lists of strings keyed by kind (strengths,
+improvement_areas, ...) plus v1.1 ``specific_feedback`` objects. Storing one
+row per item lets analytics group by ``(category, feedback_type)`` with an
+index instead of parsing every ``detailed_scores`` JSON document.
+"""
+
+from typing import Any, Dict, List, Optional
+
+# Upper bound on rows stored per analysis (the JSON copy stays complete)
+MAX_FEEDBACK_ITEMS = 500
+
+# Feedback list key -> feedback_type
+_FEEDBACK_TYPES: Dict[str, str] = {
+    # Strengths
+    "strengths": "strength",
+    "relevant_achievements": "strength",
+    "competitive_advantages": "strength",
+    "transferable_experience": "strength",
+    # Weaknesses (v1.0)
+    "issues": "weakness",
+    "missing_sections": "weakness",
+    "tone_problems": "weakness",
+    "completeness_gaps": "weakness",
+    "missing_skills": "weakness",
+    # Suggestions
+    "improvement_areas": "suggestion",
+    "recommendations": "suggestion",
+}
+
+# Overrides of the agent's default category for specific list keys
+_KEY_CATEGORIES: Dict[str, str] = {
+    "tone_problems": "grammar",
+    "issues": "formatting",
+    "missing_skills": "keywords",
+}
+
+# Default category per agent (detailed_scores section)
+_AGENT_CATEGORIES: Dict[str, str] = {
+    "structure_analysis": "structure",
+    "appeal_analysis": "appeal_point",
+}
+
+# Categories accepted by chk_feedback_category (migration 012)
+FEEDBACK_CATEGORIES = frozenset({
+    "content", "formatting", "keywords", "grammar",
+    "structure", "scr_framework", "quantitative_impact", "appeal_point",
+})
+
+
+def _clean(value: Any) -> Optional[str]:
+    """Strip a text value, returning None for non-strings and blanks."""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    return value or None
+
+
+def _specific_items(items: List[Any], default_category: str) -> List[Dict[str, Any]]:
+    """Rows for v1.1 ``specific_feedback`` objects (issue + suggestion)."""
+    rows = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        issue = _clean(item.get("issue"))
+        if issue is None:
+            continue
+        category = item.get("category")
+        rows.append({
+            "feedback_type": "weakness",
+            "category": category if category in FEEDBACK_CATEGORIES else default_category,
+            "feedback_text": issue,
+            "original_text": _clean(item.get("target_text")),
+            "suggested_text": _clean(item.get("suggestion")),
+        })
+    return rows
+
+
+def explode_feedback(detailed_scores: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Build feedback item rows from a result's ``detailed_scores``.
+
+    Unknown feedback keys and empty entries are skipped; rows do not carry
+    ``review_result_id`` (the repository sets it at insert time).
+
+    Args:
+        detailed_scores: Detailed scores as stored on ReviewResult
+
+    Returns:
+        Row dicts for ReviewFeedbackItem, at most MAX_FEEDBACK_ITEMS
+    """
+    rows: List[Dict[str, Any]] = []
+
+    for section, default_category in _AGENT_CATEGORIES.items():
+        feedback = (detailed_scores.get(section) or {}).get("feedback") or {}
+        if not isinstance(feedback, dict):
+            continue
+
+        for key, items in feedback.items():
+            if not isinstance(items, list):
+                continue
+
+            if key == "specific_feedback":
+                rows.extend(_specific_items(items, default_category))
+                continue
+
+            feedback_type = _FEEDBACK_TYPES.get(key)
+            if feedback_type is None:
+                continue
+
+            category = _KEY_CATEGORIES.get(key, default_category)
+            for item in items:
+                text = _clean(item)
+                if text is not None:
+                    rows.append({
+                        "feedback_type": feedback_type,
+                        "category": category,
+                        "feedback_text": text,
+                        "original_text": None,
+                        "suggested_text": None,
+                    })
+
+    return rows[:MAX_FEEDBACK_ITEMS]
@@ -2,19 +2,25 @@
 
 import uuid
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
-from sqlalchemy import desc, and_, func, select
+from sqlalchemy import desc, and_, func, insert, select, update
 
 from app.core.database import BaseRepository
 from app.core.datetime_utils import utc_now
+from app.core.visibility import analysis_visibility, can_view_analysis
 from database.models import ReviewRequest, ReviewResult, ReviewFeedbackItem
 
 logger = logging.getLogger(__name__)
 
+# Request statuses an analysis job may still move out of
+ACTIVE_STATUSES = ("pending", "processing")
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
 
 class ReviewRequestRepository(BaseRepository[ReviewRequest]):
     """Repository for review requests (Schema v1.1)"""
@@ -27,7 +33,9 @@ class ReviewRequestRepository(BaseRepository[ReviewRequest]):
         user_id: uuid.UUID,
         resume_id: uuid.UUID,
         target_industry: str,
-        review_type: str = "comprehensive"
+        review_type: str = "comprehensive",
+        prompt_version: Optional[str] = None,
+        idempotency_key: Optional[str] = None
     ) -> ReviewRequest:
         """Create a new review request"""
         request = ReviewRequest(
@@ -36,12 +44,13 @@ class ReviewRequestRepository(BaseRepository[ReviewRequest]):
             target_industry=target_industry,
             review_type=review_type,
             status="pending",
-            requested_at=utc_now()
+            requested_at=utc_now(),
+            prompt_version=prompt_version,
+            idempotency_key=idempotency_key
         )
 
         self.session.add(request)
-        await self.session.commit()
-        await self.session.refresh(request)
+        await self.save(request)
         return request
 
     async def update_status(
@@ -61,10 +70,39 @@ class ReviewRequestRepository(BaseRepository[ReviewRequest]):
         elif status == "completed":
             request.completed_at = utc_now()
 
-        await self.session.commit()
-        await self.session.refresh(request)
+        await self.save(request)
         return request
 
+    async def transition_status(
+        self,
+        request_id: uuid.UUID,
+        status: str,
+        from_statuses: Tuple[str, ...]
+    ) -> bool:
+        """
+        Change a request's status only if it is currently in from_statuses.
+
+        A single conditional UPDATE, so concurrent transitions (e.g. cancel vs.
+        complete) cannot overwrite each other. Does not commit.
+
+        Returns:
+            True if the request was updated
+        """
+        values: Dict[str, Any] = {"status": status}
+        if status in TERMINAL_STATUSES:
+            values["completed_at"] = utc_now()
+
+        result = await self.session.execute(
+            update(ReviewRequest)
+            .where(
+                ReviewRequest.id == request_id,
+                ReviewRequest.status.in_(from_statuses)
+            )
+            .values(**values)
+            .returning(ReviewRequest.id)
+        )
+        return result.scalar_one_or_none() is not None
+
     async def get_by_resume_and_user(
         self,
         resume_id: uuid.UUID,
@@ -81,6 +119,43 @@ class ReviewRequestRepository(BaseRepository[ReviewRequest]):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_by_idempotency_key(
+        self,
+        user_id: uuid.UUID,
+        idempotency_key: str
+    ) -> Optional[ReviewRequest]:
+        """Get the request a user created with an idempotency key"""
+        query = select(ReviewRequest).where(
+            and_(
+                ReviewRequest.requested_by_user_id == user_id,
+                ReviewRequest.idempotency_key == idempotency_key
+            )
+        )
+
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_in_flight(
+        self,
+        user_id: uuid.UUID,
+        resume_id: uuid.UUID,
+        target_industry: str,
+        prompt_version: Optional[str]
+    ) -> Optional[ReviewRequest]:
+        """Get the user's newest pending/processing request with the same inputs"""
+        query = select(ReviewRequest).where(
+            and_(
+                ReviewRequest.resume_id == resume_id,
+                ReviewRequest.target_industry == target_industry,
+                ReviewRequest.prompt_version == prompt_version,
+                ReviewRequest.requested_by_user_id == user_id,
+                ReviewRequest.status.in_(ACTIVE_STATUSES)
+            )
+        ).order_by(desc(ReviewRequest.requested_at)).limit(1)
+
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
     async def get_by_user(
         self,
         user_id: uuid.UUID,
@@ -115,7 +190,7 @@ class ReviewRequestRepository(BaseRepository[ReviewRequest]):
         query = select(ReviewRequest).where(
             and_(
                 ReviewRequest.requested_by_user_id == user_id,
-                ReviewRequest.status.in_(["pending", "processing"])
+                ReviewRequest.status.in_(ACTIVE_STATUSES)
             )
         )
 
@@ -164,9 +239,11 @@ class ReviewResultRepository(BaseRepository[ReviewResult]):
         executive_summary: str,
         detailed_scores: dict,
         ai_model_used: str,
-        processing_time_ms: int
+        processing_time_ms: int,
+        feedback_items: Optional[List[Dict[str, Any]]] = None,
+        config_fingerprint: Optional[str] = None
     ) -> ReviewResult:
-        """Save analysis results with granular scoring"""
+        """Save analysis results with granular scoring and their feedback items"""
         # === DATA SIZE CHECKPOINT 8: REPOSITORY BEFORE SAVE ===
         logger.debug(f"=== CHECKPOINT 8: REPOSITORY BEFORE SAVE ===")
         logger.debug(f"Request ID: {request_id}")
@@ -201,12 +278,16 @@ class ReviewResultRepository(BaseRepository[ReviewResult]):
             detailed_scores=detailed_scores,
             ai_model_used=ai_model_used,
             processing_time_ms=processing_time_ms,
+            config_fingerprint=config_fingerprint,
             created_at=utc_now()
         )
 
         self.session.add(result)
-        await self.session.commit()
-        await self.session.refresh(result)
+        if feedback_items:
+            # Flush for result.id, then write every item in one multi-row INSERT
+            await self.session.flush()
+            await self.insert_feedback_items(result.id, feedback_items)
+        await self.save(result)
 
         # === DATA SIZE CHECKPOINT 9: REPOSITORY AFTER SAVE ===
         logger.debug(f"=== CHECKPOINT 9: REPOSITORY AFTER SAVE (DB READ-BACK) ===")
@@ -233,6 +314,44 @@ class ReviewResultRepository(BaseRepository[ReviewResult]):
 
         return result
 
+    async def insert_feedback_items(
+        self,
+        result_id: uuid.UUID,
+        feedback_items: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Insert feedback items for a result with a single multi-row INSERT.
+
+        Does not commit; the caller's transaction covers the result and its items.
+
+        Args:
+            result_id: Review result ID
+            feedback_items: Rows from explode_feedback
+
+        Returns:
+            Number of inserted rows
+        """
+        if not feedback_items:
+            return 0
+
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "review_result_id": result_id,
+                "resume_section_id": item.get("resume_section_id"),
+                "feedback_type": item["feedback_type"],
+                "category": item["category"],
+                "feedback_text": item["feedback_text"],
+                "severity_level": item.get("severity_level", 3),
+                "original_text": item.get("original_text"),
+                "suggested_text": item.get("suggested_text"),
+                "confidence_score": item.get("confidence_score"),
+            }
+            for item in feedback_items
+        ]
+        await self.session.execute(insert(ReviewFeedbackItem).values(rows))
+        return len(rows)
+
     async def get_by_request_id(self, request_id: uuid.UUID) -> Optional[ReviewResult]:
         """Get result by request ID"""
         query = select(ReviewResult).where(ReviewResult.review_request_id == request_id)
@@ -248,6 +367,15 @@ class ReviewResultRepository(BaseRepository[ReviewResult]):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_many_by_request_ids(self, request_ids: List[uuid.UUID]) -> Dict[uuid.UUID, ReviewResult]:
+        """Get results for several requests in one query, keyed by request ID."""
+        if not request_ids:
+            return {}
+
+        query = select(ReviewResult).where(ReviewResult.review_request_id.in_(request_ids))
+        result = await self.session.execute(query)
+        return {r.review_request_id: r for r in result.scalars().all()}
+
 
 class AnalysisRepository:
     """Updated repository using two-table architecture"""
@@ -257,19 +385,68 @@ class AnalysisRepository:
         self.request_repo = ReviewRequestRepository(session)
         self.result_repo = ReviewResultRepository(session)
 
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator["AnalysisRepository"]:
+        """Run request and result writes as one transaction with a single commit (see BaseRepository.unit_of_work)."""
+        previous = self.result_repo.autocommit
+        self.result_repo.autocommit = False
+        try:
+            async with self.request_repo.unit_of_work():
+                yield self
+        finally:
+            self.result_repo.autocommit = previous
+
     async def create_analysis(
         self,
         user_id: uuid.UUID,
         resume_id: uuid.UUID,
         target_industry: str,
-        review_type: str = "comprehensive"
+        review_type: str = "comprehensive",
+        prompt_version: Optional[str] = None,
+        idempotency_key: Optional[str] = None
     ) -> ReviewRequest:
         """Create analysis request (Step 1 of 2)"""
         return await self.request_repo.create_review_request(
             user_id=user_id,
             resume_id=resume_id,
             target_industry=target_industry,
-            review_type=review_type
+            review_type=review_type,
+            prompt_version=prompt_version,
+            idempotency_key=idempotency_key
+        )
+
+    async def find_existing_request(
+        self,
+        user_id: uuid.UUID,
+        resume_id: uuid.UUID,
+        target_industry: str,
+        prompt_version: Optional[str],
+        idempotency_key: Optional[str] = None
+    ) -> Optional[ReviewRequest]:
+        """
+        Find a request that a new submission should reuse.
+
+        Args:
+            user_id: Requesting user ID
+            resume_id: Resume ID
+            target_industry: Target industry
+            prompt_version: AI prompt version
+            idempotency_key: Client idempotency key, if any
+
+        Returns:
+            The request created with the same idempotency key (any status), else
+            a pending/processing request with the same inputs, else None
+        """
+        if idempotency_key:
+            request = await self.request_repo.get_by_idempotency_key(user_id, idempotency_key)
+            if request:
+                return request
+
+        return await self.request_repo.get_in_flight(
+            user_id=user_id,
+            resume_id=resume_id,
+            target_industry=target_industry,
+            prompt_version=prompt_version
         )
 
     async def save_results(
@@ -282,11 +459,17 @@ class AnalysisRepository:
         executive_summary: str,
         detailed_scores: dict,
         ai_model_used: str,
-        processing_time_ms: int
+        processing_time_ms: int,
+        feedback_items: Optional[List[Dict[str, Any]]] = None,
+        config_fingerprint: Optional[str] = None
     ) -> ReviewResult:
-        """Save analysis results with granular scoring (Step 2 of 2)"""
-        # Save results
-        result = await self.result_repo.save_analysis_results(
+        """
+        Save analysis results with granular scoring (Step 2 of 2).
+
+        Does not change the request status: the worker moves it to completed
+        with transition_request_status in the same unit_of_work().
+        """
+        return await self.result_repo.save_analysis_results(
             request_id=request_id,
             overall_score=overall_score,
             ats_score=ats_score,
@@ -295,18 +478,11 @@ class AnalysisRepository:
             executive_summary=executive_summary,
             detailed_scores=detailed_scores,
             ai_model_used=ai_model_used,
-            processing_time_ms=processing_time_ms
-        )
-
-        # Update request status
-        await self.request_repo.update_status(
-            request_id=request_id,
-            status="completed",
-            completed_at=utc_now()
+            processing_time_ms=processing_time_ms,
+            feedback_items=feedback_items,
+            config_fingerprint=config_fingerprint
         )
 
-        return result
-
     async def get_analysis_with_results(self, request_id: uuid.UUID) -> Optional[Tuple[ReviewRequest, Optional[ReviewResult]]]:
         """Get complete analysis data (internal use only - no access control)"""
         request = await self.request_repo.get_by_id(request_id)
@@ -316,6 +492,10 @@ class AnalysisRepository:
         result = await self.result_repo.get_by_request_id(request_id)
         return (request, result)
 
+    async def get_results_for_requests(self, request_ids: List[uuid.UUID]) -> Dict[uuid.UUID, ReviewResult]:
+        """Get results for several requests, keyed by request ID (internal use only - no access control)"""
+        return await self.result_repo.get_many_by_request_ids(request_ids)
+
     async def get_analysis_for_user(
         self,
         analysis_id: uuid.UUID,
@@ -343,17 +523,20 @@ class AnalysisRepository:
         if not analysis_data:
             return None
 
-        request, result = analysis_data
+        request, _ = analysis_data
+        if not can_view_analysis(request, user_id, user_role):
+            return None  # Access denied
 
-        # Admin and Senior see everything (MVP approach)
-        if user_role in ['admin', 'senior_recruiter']:
-            return analysis_data
+        return analysis_data
 
-        # Junior sees only own analyses
-        if request.requested_by_user_id == user_id:
-            return analysis_data
-
-        return None  # Access denied
+    async def transition_request_status(
+        self,
+        request_id: uuid.UUID,
+        status: str,
+        from_statuses: Tuple[str, ...] = ACTIVE_STATUSES
+    ) -> bool:
+        """Conditionally change a request's status (see ReviewRequestRepository.transition_status)"""
+        return await self.request_repo.transition_status(request_id, status, from_statuses)
 
     async def update_request_status(
         self,
@@ -438,15 +621,7 @@ class AnalysisRepository:
         """
         from database.models import Resume
 
-        # Build base query based on role
-        if user_role in ['admin', 'senior_recruiter']:
-            # Admin and Senior see all analyses
-            query = select(ReviewRequest)
-        else:
-            # Junior sees only own analyses
-            query = select(ReviewRequest).where(
-                ReviewRequest.requested_by_user_id == user_id
-            )
+        query = select(ReviewRequest).where(analysis_visibility(user_id, user_role))
 
         # Apply optional filters
         if status:
@@ -491,13 +666,7 @@ class AnalysisRepository:
         """
         from database.models import Resume
 
-        # Build base query based on role
-        if user_role in ['admin', 'senior_recruiter']:
-            query = select(func.count(ReviewRequest.id))
-        else:
-            query = select(func.count(ReviewRequest.id)).where(
-                ReviewRequest.requested_by_user_id == user_id
-            )
+        query = select(func.count(ReviewRequest.id)).where(analysis_visibility(user_id, user_role))
 
         # Apply optional filters
         if status:
@@ -513,6 +682,59 @@ class AnalysisRepository:
         result = await self.session.execute(query)
         return result.scalar() or 0
 
+    async def count_feedback_by_category(
+        self,
+        user_id: uuid.UUID,
+        user_role: str,
+        industry: Optional[str] = None,
+        feedback_types: Optional[List[str]] = None,
+        limit: int = 20
+    ) -> List[Tuple[str, str, str, int]]:
+        """
+        Count feedback items per industry, category and feedback type.
+
+        Reads review_feedback_items rows (indexed on ``(category, feedback_type)``
+        and ``review_result_id``) instead of parsing detailed_scores JSON.
+        Same access rules as list_analyses_for_user.
+
+        Args:
+            user_id: Current user ID
+            user_role: User role
+            industry: Optional industry filter
+            feedback_types: Optional feedback type filter (e.g. ['weakness', 'suggestion'])
+            limit: Max groups returned
+
+        Returns:
+            List of (industry, category, feedback_type, count), most common first
+        """
+        item_count = func.count(ReviewFeedbackItem.id)
+        query = (
+            select(
+                ReviewRequest.target_industry,
+                ReviewFeedbackItem.category,
+                ReviewFeedbackItem.feedback_type,
+                item_count
+            )
+            .join(ReviewResult, ReviewResult.id == ReviewFeedbackItem.review_result_id)
+            .join(ReviewRequest, ReviewRequest.id == ReviewResult.review_request_id)
+            .where(analysis_visibility(user_id, user_role))
+        )
+
+        if industry:
+            query = query.where(ReviewRequest.target_industry == industry)
+
+        if feedback_types:
+            query = query.where(ReviewFeedbackItem.feedback_type.in_(feedback_types))
+
+        query = query.group_by(
+            ReviewRequest.target_industry,
+            ReviewFeedbackItem.category,
+            ReviewFeedbackItem.feedback_type
+        ).order_by(desc(item_count)).limit(limit)
+
+        result = await self.session.execute(query)
+        return [(row[0], row[1], row[2], row[3]) for row in result.all()]
+
     async def get_recent_analyses(
         self,
         user_id: uuid.UUID,
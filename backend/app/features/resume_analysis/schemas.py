@@ -132,6 +132,19 @@ class AnalysisStats(BaseModel):
     tier_breakdown: Dict[MarketTier, int] = {}
 
 
+
+class FeedbackCategoryCount(BaseModel):
+    """Number of feedback items for one industry, category and type."""
+    industry: str
+    category: str
+    feedback_type: str
+    count: int
+
+
+class FeedbackInsightsResponse(BaseModel):
+    """Most common feedback categories, most frequent first."""
+    items: List[FeedbackCategoryCount]
+
 # Legacy compatibility schemas (for migration from old services)
 class CompleteAnalysisResult(BaseModel):
     """Legacy format for compatibility with old service."""
@@ -2,23 +2,37 @@
 
 import logging
 import uuid
-from typing import Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, BackgroundTasks
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.datetime_utils import utc_now
-from app.core.database import get_postgres_connection
-
-# Import AI orchestrator from the isolated ai_agents module
-from ai_agents.orchestrator import ResumeAnalysisOrchestrator
-
-from .repository import AnalysisRepository
+from app.core.database import get_postgres_connection, ROLE_WORKER
+
+# AI orchestrator (LangGraph, OpenAI SDK) is imported on first use,
+# see _run_ai_analysis
+from ai_agents.settings import get_settings as get_ai_settings
+from ai_agents.config.registry import get_config_snapshot
+from ai_agents.utils import AnalysisCancelledError
+
+from .repository import AnalysisRepository, ACTIVE_STATUSES
+from .feedback_items import explode_feedback
+from .coalescing import get_analysis_coalescer
+from .cancellation import (
+    all_cancel_requested,
+    is_cancel_requested,
+    request_cancellation,
+    run_cancellable
+)
 from database.models import ReviewRequest, ReviewResult, ReviewFeedbackItem
 
 # Import resume upload repository for integration (simplified)
 from app.features.resume_upload.repository import ResumeUploadRepository
+from app.features.resume_upload.segmentation import segment_resume
+from app.features.resume_upload.text_metrics import compute_text_metrics
 from database.models.analysis import Industry, AnalysisStatus
 from .schemas import (
     AnalysisRequest,
@@ -27,161 +41,246 @@ from .schemas import (
     AnalysisResult,
     AnalysisListResponse,
     AnalysisSummary,
-    AnalysisStats
+    AnalysisStats,
+    FeedbackCategoryCount,
+    FeedbackInsightsResponse
 )
 
 logger = logging.getLogger(__name__)
 
 
 # ============================================================================
-# Background Processing Function (runs with independent session)
+# Background Processing Function (short worker-pool transaction per step)
 # ============================================================================
 
 async def process_analysis_background(
     request_id: uuid.UUID,
     resume_text: str,
-    ai_agent_industry: str
+    ai_agent_industry: str,
+    resume_id: Optional[uuid.UUID] = None,
+    prompt_version: Optional[str] = None,
+    resume_sections: Optional[List[Dict[str, Any]]] = None,
+    resume_metrics: Optional[Dict[str, Any]] = None
 ):
     """
-    Process resume analysis in the background with its own database session.
+    Process resume analysis in the background.
 
-    This function runs independently after the API request completes,
-    with a fresh database session to avoid transaction conflicts.
+    This function runs independently after the API request completes. Each
+    database step runs in its own short transaction on the worker pool, and
+    no connection is held while the AI orchestrator runs (which can take
+    minutes), so the pool size bounds database concurrency rather than the
+    number of analyses in flight.
+
+    Concurrent analyses of the same resume, industry and prompt version share
+    one orchestrator run (see coalescing.py); each request stores the result.
+
+    Cancellation (see cancellation.py): a request that is no longer pending is
+    not started, the AI run is aborted when the request is cancelled, and
+    status transitions are conditional so 'cancelled' is never overwritten.
 
     Args:
         request_id: The analysis request ID
         resume_text: The resume text to analyze
         ai_agent_industry: The industry for AI agent analysis
+        resume_id: Resume ID (enables coalescing when given)
+        prompt_version: AI prompt version the request was created with
+        resume_sections: Typed resume sections, so agents can read only
+            the sections they need
+        resume_metrics: Locally computed text metrics given to the agents
     """
-    # Create a new database session for this background task
-    postgres_conn = get_postgres_connection()
+    logger.info(f"Starting background analysis for request {request_id}")
 
-    async with postgres_conn.session_context() as session:
+    try:
+        # Step 1: Claim the request: pending -> processing (short transaction)
         try:
-            logger.info(f"Starting background analysis for request {request_id}")
-
-            # Initialize repository with the new session
-            repository = AnalysisRepository(session)
+            if not await _transition_in_transaction(request_id, "processing", from_statuses=("pending",)):
+                logger.info(f"Analysis {request_id} is no longer pending (cancelled?), skipping")
+                return
+            logger.info(f"Updated analysis {request_id} status to 'processing'")
+        except Exception as e:
+            logger.error(f"Failed to update status for request {request_id}: {str(e)}")
+            # Continue with analysis anyway
 
-            # Step 1: Update status to processing
-            try:
-                await repository.update_request_status(
-                    request_id=request_id,
-                    status="processing"
+        # Step 2: Run AI analysis using orchestrator (no database connection held)
+        try:
+            ai_result = await run_cancellable(
+                request_id,
+                lambda: _run_ai_analysis_for_request(
+                    request_id, resume_text, ai_agent_industry, resume_id, prompt_version,
+                    resume_sections, resume_metrics
                 )
-                await session.commit()
-                logger.info(f"Updated analysis {request_id} status to 'processing'")
-            except Exception as e:
-                logger.error(f"Failed to update status for request {request_id}: {str(e)}")
-                # Continue with analysis anyway
+            )
+        except AnalysisCancelledError:
+            logger.info(f"Analysis {request_id} cancelled, AI run aborted")
+            await _transition_in_transaction(request_id, "cancelled")
+            return
 
-            # Step 2: Run AI analysis using orchestrator
-            logger.info(f"Calling AI orchestrator for request {request_id}")
+        # Step 3: Store results and update status (short transaction)
+        if ai_result.get("success", False):
+            logger.info(f"AI analysis successful for request {request_id}, storing results")
 
             try:
-                # Initialize the AI orchestrator
-                ai_orchestrator = ResumeAnalysisOrchestrator()
-
-                # Call the orchestrator to analyze the resume
-                ai_result = await ai_orchestrator.analyze(
-                    resume_text=resume_text,
-                    industry=ai_agent_industry,
-                    analysis_id=str(request_id)
-                )
+                async with get_postgres_connection(ROLE_WORKER).session_context() as session:
+                    repository = AnalysisRepository(session)
+                    # One commit; row lock until then: a concurrent cancel waits, then finds it completed
+                    async with repository.unit_of_work():
+                        if not await repository.transition_request_status(request_id, "completed"):
+                            logger.info(f"Analysis {request_id} was cancelled, discarding results")
+                            return
+                        await _store_analysis_results(session, repository, request_id, ai_result, ai_agent_industry)
+
+                logger.info(f"Analysis completed successfully for request {request_id}")
+
+            except Exception as store_error:
+                logger.error(f"Failed to store results for request {request_id}: {str(store_error)}", exc_info=True)
+                await _transition_in_transaction(request_id, "failed")
+        else:
+            # AI analysis failed
+            error_msg = ai_result.get("error", "AI analysis failed")
+            logger.error(f"AI analysis failed for request {request_id}: {error_msg}")
+            await _transition_in_transaction(request_id, "failed")
 
-                logger.info(f"AI orchestrator completed for request {request_id}, success={ai_result.get('success', False)}")
-
-                # === DATA SIZE CHECKPOINT 6: SERVICE RECEIVED AI RESULT ===
-                logger.debug(f"=== CHECKPOINT 6: SERVICE RECEIVED AI RESULT ===")
-                logger.debug(f"Request ID: {request_id}")
-                logger.debug(f"Success: {ai_result.get('success')}")
-                if ai_result.get('success'):
-                    structure_feedback = ai_result.get('structure', {}).get('feedback', {})
-                    structure_total = sum(len(v) if isinstance(v, list) else 0 for v in structure_feedback.values())
-                    logger.debug(f"Structure feedback items received: {structure_total}")
-                    for key, value in structure_feedback.items():
-                        if isinstance(value, list):
-                            logger.debug(f"  - structure.{key}: {len(value)} items")
-
-                    appeal_feedback = ai_result.get('appeal', {}).get('feedback', {})
-                    appeal_total = sum(len(v) if isinstance(v, list) else 0 for v in appeal_feedback.values())
-                    logger.debug(f"Appeal feedback items received: {appeal_total}")
-                    for key, value in appeal_feedback.items():
-                        if isinstance(value, list):
-                            logger.debug(f"  - appeal.{key}: {len(value)} items")
-
-                    logger.debug(f"Total feedback items received: {structure_total + appeal_total}")
-                logger.debug(f"=== END CHECKPOINT 6 ===")
-
-
-            except Exception as ai_error:
-                logger.error(f"AI orchestrator error for request {request_id}: {str(ai_error)}", exc_info=True)
-
-                # Check if we should use mock results for development/testing
-                settings = get_settings()
-                use_mock_results = getattr(settings, 'USE_MOCK_AI_RESULTS', False)
-
-                if use_mock_results:
-                    logger.info(f"Using mock AI results for request {request_id} due to AI service error")
-                    ai_result = _create_mock_ai_result(request_id, ai_agent_industry)
-                else:
-                    # Create a failure response
-                    ai_result = {
-                        "success": False,
-                        "error": f"AI analysis failed: {str(ai_error)}",
-                        "analysis_id": str(request_id)
-                    }
-
-            # Step 3: Store results and update status
-            if ai_result.get("success", False):
-                logger.info(f"AI analysis successful for request {request_id}, storing results")
-
-                try:
-                    # Store the analysis results
-                    await _store_analysis_results(session, repository, request_id, ai_result, ai_agent_industry)
-
-                    # Update status to completed
-                    await repository.update_request_status(
-                        request_id=request_id,
-                        status="completed"
-                    )
-                    await session.commit()
+    except Exception as e:
+        logger.error(f"Background analysis failed for request {request_id}: {str(e)}", exc_info=True)
 
-                    logger.info(f"Analysis completed successfully for request {request_id}")
+        # Try to update status to failed
+        try:
+            await _transition_in_transaction(request_id, "failed")
+        except Exception as update_error:
+            logger.error(f"Failed to update failed status for request {request_id}: {str(update_error)}")
 
-                except Exception as store_error:
-                    logger.error(f"Failed to store results for request {request_id}: {str(store_error)}", exc_info=True)
-                    await repository.update_request_status(
-                        request_id=request_id,
-                        status="failed",
-                        error_message=f"Failed to store results: {str(store_error)}"
-                    )
-                    await session.commit()
-            else:
-                # AI analysis failed
-                error_msg = ai_result.get("error", "AI analysis failed")
-                logger.error(f"AI analysis failed for request {request_id}: {error_msg}")
-
-                await repository.update_request_status(
-                    request_id=request_id,
-                    status="failed",
-                    error_message=error_msg
-                )
-                await session.commit()
 
-        except Exception as e:
-            logger.error(f"Background analysis failed for request {request_id}: {str(e)}", exc_info=True)
+async def _transition_in_transaction(
+    request_id: uuid.UUID,
+    status: str,
+    from_statuses: Tuple[str, ...] = ACTIVE_STATUSES
+) -> bool:
+    """Conditionally change a request's status in its own worker-pool transaction."""
+    async with get_postgres_connection(ROLE_WORKER).session_context() as session:
+        repository = AnalysisRepository(session)
+        return await repository.transition_request_status(request_id, status, from_statuses)
 
-            # Try to update status to failed
-            try:
-                await repository.update_request_status(
-                    request_id=request_id,
-                    status="failed",
-                    error_message=str(e)
-                )
-                await session.commit()
-            except Exception as update_error:
-                logger.error(f"Failed to update failed status for request {request_id}: {str(update_error)}")
+
+async def _run_ai_analysis_for_request(
+    request_id: uuid.UUID,
+    resume_text: str,
+    ai_agent_industry: str,
+    resume_id: Optional[uuid.UUID],
+    prompt_version: Optional[str],
+    resume_sections: Optional[List[Dict[str, Any]]] = None,
+    resume_metrics: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Run the AI analysis for a request, sharing the run with identical requests."""
+    if resume_id is None:
+        return await _run_ai_analysis(
+            request_id,
+            resume_text,
+            ai_agent_industry,
+            should_cancel=lambda: is_cancel_requested(request_id),
+            resume_sections=resume_sections,
+            resume_metrics=resume_metrics
+        )
+
+    # Requests join a run only if it uses the same config and prompt files
+    ai_settings = get_ai_settings()
+    config_fingerprint = get_config_snapshot().fingerprint_for(
+        prompt_version or ai_settings.prompt_version, ai_settings.prompt_language
+    )
+    key = (resume_id, ai_agent_industry, prompt_version, config_fingerprint)
+    coalescer = get_analysis_coalescer()
+    return await coalescer.run(
+        key,
+        lambda: _run_ai_analysis(
+            request_id,
+            resume_text,
+            ai_agent_industry,
+            # Shared run: stop only when every waiting request was cancelled
+            should_cancel=lambda: all_cancel_requested(coalescer.waiters(key)),
+            resume_sections=resume_sections,
+            resume_metrics=resume_metrics
+        ),
+        waiter=request_id
+    )
+
+
+async def _run_ai_analysis(
+    request_id: uuid.UUID,
+    resume_text: str,
+    ai_agent_industry: str,
+    should_cancel: Optional[Callable[[], Awaitable[bool]]] = None,
+    resume_sections: Optional[List[Dict[str, Any]]] = None,
+    resume_metrics: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run the AI orchestrator, returning a failure (or mock) result instead of raising.
+
+    Raises:
+        AnalysisCancelledError: If should_cancel reported a cancellation between agents
+    """
+    logger.info(f"Calling AI orchestrator for request {request_id}")
+
+    try:
+        # Shared AI orchestrator (imported lazily to keep startup fast; usually
+        # already built by the startup warm-up)
+        from ai_agents.orchestrator import get_orchestrator
+        ai_orchestrator = get_orchestrator()
+
+        # Call the orchestrator to analyze the resume
+        ai_result = await ai_orchestrator.analyze(
+            resume_text=resume_text,
+            industry=ai_agent_industry,
+            analysis_id=str(request_id),
+            should_cancel=should_cancel,
+            resume_sections=resume_sections,
+            resume_metrics=resume_metrics
+        )
+
+        logger.info(f"AI orchestrator completed for request {request_id}, success={ai_result.get('success', False)}")
+
+        # === DATA SIZE CHECKPOINT 6: SERVICE RECEIVED AI RESULT ===
+        logger.debug(f"=== CHECKPOINT 6: SERVICE RECEIVED AI RESULT ===")
+        logger.debug(f"Request ID: {request_id}")
+        logger.debug(f"Success: {ai_result.get('success')}")
+        if ai_result.get('success'):
+            structure_feedback = ai_result.get('structure', {}).get('feedback', {})
+            structure_total = sum(len(v) if isinstance(v, list) else 0 for v in structure_feedback.values())
+            logger.debug(f"Structure feedback items received: {structure_total}")
+            for key, value in structure_feedback.items():
+                if isinstance(value, list):
+                    logger.debug(f"  - structure.{key}: {len(value)} items")
+
+            appeal_feedback = ai_result.get('appeal', {}).get('feedback', {})
+            appeal_total = sum(len(v) if isinstance(v, list) else 0 for v in appeal_feedback.values())
+            logger.debug(f"Appeal feedback items received: {appeal_total}")
+            for key, value in appeal_feedback.items():
+                if isinstance(value, list):
+                    logger.debug(f"  - appeal.{key}: {len(value)} items")
+
+            logger.debug(f"Total feedback items received: {structure_total + appeal_total}")
+        logger.debug(f"=== END CHECKPOINT 6 ===")
+
+        return ai_result
+
+    except AnalysisCancelledError:
+        raise
+
+    except Exception as ai_error:
+        logger.error(f"AI orchestrator error for request {request_id}: {str(ai_error)}", exc_info=True)
+
+        # Check if we should use mock results for development/testing
+        settings = get_settings()
+        use_mock_results = getattr(settings, 'USE_MOCK_AI_RESULTS', False)
+
+        if use_mock_results:
+            logger.info(f"Using mock AI results for request {request_id} due to AI service error")
+            return _create_mock_ai_result(request_id, ai_agent_industry)
+
+        # Create a failure response
+        return {
+            "success": False,
+            "error": f"AI analysis failed: {str(ai_error)}",
+            "analysis_id": str(request_id)
+        }
 
 
 async def _store_analysis_results(
@@ -227,6 +326,7 @@ async def _store_analysis_results(
             },
             "market_tier": ai_result.get("market_tier", "unknown"),
             "ai_analysis_id": ai_result.get("analysis_id"),
+            "ai_config": ai_result.get("config", {}),
             "conversion_timestamp": utc_now().isoformat()
         }
 
@@ -252,6 +352,10 @@ async def _store_analysis_results(
         logger.debug(f"detailed_scores JSON length: {len(json.dumps(detailed_scores))} chars")
         logger.debug(f"=== END CHECKPOINT 7 ===")
 
+        # One row per feedback item for per-category analytics
+        feedback_items = explode_feedback(detailed_scores)
+        logger.debug(f"Feedback item rows to insert: {len(feedback_items)}")
+
         # Store results using repository
         await repository.save_results(
             request_id=request_id,
@@ -262,7 +366,9 @@ async def _store_analysis_results(
             executive_summary=executive_summary,
             detailed_scores=detailed_scores,
             ai_model_used="gpt-4",
-            processing_time_ms=30000
+            processing_time_ms=30000,
+            feedback_items=feedback_items,
+            config_fingerprint=ai_result.get("config", {}).get("fingerprint")
         )
 
         logger.info(f"Successfully stored analysis results for request {request_id}")
@@ -346,6 +452,11 @@ class AnalysisValidationException(AnalysisException):
     pass
 
 
+class AnalysisConflictException(AnalysisException):
+    """Idempotency key reused with different request parameters."""
+    pass
+
+
 class AnalysisService:
     """
     Minimal business logic service for resume analysis using two-table workflow.
@@ -370,10 +481,20 @@ class AnalysisService:
         resume_id: uuid.UUID,
         user_id: uuid.UUID,
         industry: Industry,
-        background_tasks: BackgroundTasks
+        background_tasks: BackgroundTasks,
+        idempotency_key: Optional[str] = None
     ) -> AnalysisResponse:
         """
         Request analysis for an uploaded resume using two-table workflow.
+
+        Submissions are deduplicated: a request created with the same
+        idempotency key, or a pending/processing request for the same resume,
+        industry and prompt version, is returned instead of queueing another
+        AI run.
+
+        Raises:
+            AnalysisConflictException: If the idempotency key was used for a
+                different resume or industry
         """
 
         try:
@@ -396,23 +517,68 @@ class AnalysisService:
             if not resume.extracted_text:
                 raise ValueError("Resume text not available")
 
-            # Step 3: Create review request
-            review_request = await self.repository.create_analysis(
+            # Step 3: Reuse an existing request (retry or duplicate submission)
+            prompt_version = get_ai_settings().prompt_version
+            existing = await self.repository.find_existing_request(
                 user_id=user_id,
                 resume_id=resume_id,
                 target_industry=industry.value,
-                review_type="comprehensive"
+                prompt_version=prompt_version,
+                idempotency_key=idempotency_key
             )
+            if existing:
+                return self._existing_request_response(existing, resume_id, industry)
+
+            # Step 4: Create review request
+            try:
+                review_request = await self.repository.create_analysis(
+                    user_id=user_id,
+                    resume_id=resume_id,
+                    target_industry=industry.value,
+                    review_type="comprehensive",
+                    prompt_version=prompt_version,
+                    idempotency_key=idempotency_key
+                )
+            except IntegrityError:
+                # A concurrent retry with the same idempotency key won the insert
+                await self.db.rollback()
+                existing = await self.repository.find_existing_request(
+                    user_id=user_id,
+                    resume_id=resume_id,
+                    target_industry=industry.value,
+                    prompt_version=prompt_version,
+                    idempotency_key=idempotency_key
+                )
+                if not existing:
+                    raise
+                return self._existing_request_response(existing, resume_id, industry)
 
-            # Step 4: Map industry for AI agent compatibility
+            # Step 5: Map industry for AI agent compatibility
             ai_agent_industry = self._map_database_industry_to_ai_agent(industry)
 
-            # Step 5: Queue background analysis job with proper session management
+            # Step 6: Load the resume sections and text metrics (computed now
+            # for resumes uploaded before they were stored)
+            sections = [
+                {
+                    "section_type": section.section_type,
+                    "section_title": section.section_title,
+                    "content": section.content,
+                    "section_metadata": section.section_metadata
+                }
+                for section in await self.resume_repository.get_sections(resume_id)
+            ] or segment_resume(resume.extracted_text)
+            text_metrics = resume.text_metrics or compute_text_metrics(resume.extracted_text, sections)
+
+            # Step 7: Queue background analysis job with proper session management
             background_tasks.add_task(
                 process_analysis_background,
                 request_id=review_request.id,
                 resume_text=resume.extracted_text,
-                ai_agent_industry=ai_agent_industry
+                ai_agent_industry=ai_agent_industry,
+                resume_id=resume_id,
+                prompt_version=prompt_version,
+                resume_sections=sections,
+                resume_metrics=text_metrics
             )
 
             return AnalysisResponse(
@@ -421,12 +587,31 @@ class AnalysisService:
                 message="Analysis request created successfully"
             )
 
-        except HTTPException:
+        except (HTTPException, AnalysisConflictException):
             raise
         except Exception as e:
             logger.error(f"Error requesting analysis: {str(e)}")
             raise AnalysisException(f"Failed to request analysis: {str(e)}")
 
+    def _existing_request_response(
+        self,
+        request: ReviewRequest,
+        resume_id: uuid.UUID,
+        industry: Industry
+    ) -> AnalysisResponse:
+        """Response for a submission answered by an existing request."""
+        if request.resume_id != resume_id or request.target_industry != industry.value:
+            raise AnalysisConflictException(
+                "Idempotency key was already used for a different analysis request"
+            )
+
+        logger.info(f"Reusing analysis request {request.id} (status: {request.status})")
+        return AnalysisResponse(
+            analysis_id=str(request.id),
+            status=request.status,
+            message="Analysis request already exists"
+        )
+
     async def get_analysis_status(
         self,
         request_id: uuid.UUID,
@@ -510,7 +695,8 @@ class AnalysisService:
                 completed_at=request.completed_at
             )
 
-        except ValueError:
+        except (ValueError, DBAPIError):
+            # DBAPIError propagates so run_read can retry on another connection
             raise
         except Exception as e:
             logger.error(f"Error getting analysis result: {str(e)}")
@@ -554,21 +740,23 @@ class AnalysisService:
                 candidate_id=candidate_id
             )
 
+            # Load resumes (with candidates) and completed results for the page in one query each
+            resumes = await self.resume_repository.get_many_with_candidate({r.resume_id for r in requests})
+            results = await self.repository.get_results_for_requests(
+                [r.id for r in requests if r.status == "completed"]
+            )
+
             # Convert to summary format with candidate info
             analyses = []
             for request in requests:
-                # Get resume with candidate relationship loaded
-                resume = await self.resume_repository.get_by_id_with_candidate(request.resume_id)
+                resume = resumes.get(request.resume_id)
 
                 # Skip if resume not found
                 if not resume:
                     logger.warning(f"Resume {request.resume_id} not found for analysis {request.id}")
                     continue
 
-                # Get result if completed
-                result = None
-                if request.status == "completed":
-                    _, result = await self.repository.get_analysis_with_results(request.id)
+                result = results.get(request.id)
 
                 analyses.append(AnalysisSummary(
                     id=str(request.id),
@@ -587,10 +775,50 @@ class AnalysisService:
                 "total_count": total_count
             }
 
+        except DBAPIError:
+            raise
         except Exception as e:
             logger.error(f"Error listing user analyses: {str(e)}")
             raise AnalysisException(f"Failed to list analyses: {str(e)}")
 
+    async def get_feedback_insights(
+        self,
+        user_id: uuid.UUID,
+        user_role: str,
+        industry: Optional[Industry] = None,
+        feedback_types: Optional[list[str]] = None,
+        limit: int = 20
+    ) -> FeedbackInsightsResponse:
+        """Most common feedback categories per industry across visible analyses."""
+        logger.info(f"Getting feedback insights for user {user_id}, industry {industry}")
+
+        try:
+            rows = await self.repository.count_feedback_by_category(
+                user_id=user_id,
+                user_role=user_role,
+                industry=industry.value if industry else None,
+                feedback_types=feedback_types,
+                limit=limit
+            )
+
+            return FeedbackInsightsResponse(
+                items=[
+                    FeedbackCategoryCount(
+                        industry=row_industry,
+                        category=category,
+                        feedback_type=feedback_type,
+                        count=count
+                    )
+                    for row_industry, category, feedback_type, count in rows
+                ]
+            )
+
+        except DBAPIError:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting feedback insights: {str(e)}")
+            raise AnalysisException(f"Failed to get feedback insights: {str(e)}")
+
     async def get_resume_analyses(self, resume_id: uuid.UUID, user_id: uuid.UUID) -> list[AnalysisSummary]:
         """Get analysis history for a specific resume."""
         logger.info(f"Getting resume analyses for resume {resume_id}, user {user_id}")
@@ -604,15 +832,37 @@ class AnalysisService:
             logger.error(f"Error getting resume analyses: {str(e)}")
             raise AnalysisException(f"Failed to get resume analyses: {str(e)}")
 
-    async def cancel_analysis(self, request_id: uuid.UUID, user_id: uuid.UUID) -> bool:
-        """Cancel an ongoing analysis."""
+    async def cancel_analysis(
+        self,
+        request_id: uuid.UUID,
+        user_id: uuid.UUID,
+        user_role: Optional[str] = None
+    ) -> bool:
+        """
+        Cancel a pending or processing analysis.
+
+        Only the requester (or an admin) may cancel. The status change is
+        committed first; the running job then stops at its next cancellation
+        check, or immediately when it runs in this process.
+
+        Returns:
+            False if the analysis was not found, not permitted, or already finished
+        """
         logger.info(f"Cancelling analysis {request_id} for user {user_id}")
 
         try:
-            # TODO: Implement proper cancellation logic
-            # For now, return False to indicate cancellation not available
-            logger.warning(f"Analysis cancellation not yet implemented for {request_id}")
-            return False
+            request = await self.repository.request_repo.get_by_id(request_id)
+            if not request or (request.requested_by_user_id != user_id and user_role != "admin"):
+                return False
+
+            if not await self.repository.transition_request_status(request_id, "cancelled"):
+                logger.info(f"Analysis {request_id} already finished with status '{request.status}'")
+                return False
+            await self.db.commit()
+
+            aborted_locally = await request_cancellation(request_id)
+            logger.info(f"Analysis {request_id} cancelled (aborted in this process: {aborted_locally})")
+            return True
 
         except Exception as e:
             logger.error(f"Error cancelling analysis: {str(e)}")
@@ -193,7 +193,7 @@ class TestAnalysisAccessControl:
         mock_repository.list_analyses_for_user.return_value = [mock_request]
         mock_repository.count_analyses_for_user.return_value = 1
         service.resume_repository = AsyncMock()
-        service.resume_repository.get_by_id_with_candidate.return_value = None
+        service.resume_repository.get_many_with_candidate.return_value = {}
 
         # Execute
         result = await service.list_user_analyses(
@@ -221,7 +221,7 @@ class TestAnalysisAccessControl:
         mock_repository.list_analyses_for_user.return_value = [mock_request]
         mock_repository.count_analyses_for_user.return_value = 1
         service.resume_repository = AsyncMock()
-        service.resume_repository.get_by_id_with_candidate.return_value = None
+        service.resume_repository.get_many_with_candidate.return_value = {}
 
         # Execute
         result = await service.list_user_analyses(
@@ -250,7 +250,7 @@ class TestAnalysisAccessControl:
         mock_repository.list_analyses_for_user.return_value = [mock_request]
         mock_repository.count_analyses_for_user.return_value = 1
         service.resume_repository = AsyncMock()
-        service.resume_repository.get_by_id_with_candidate.return_value = None
+        service.resume_repository.get_many_with_candidate.return_value = {}
 
         # Execute
         result = await service.list_user_analyses(
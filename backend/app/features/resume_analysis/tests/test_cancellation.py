@@ -0,0 +1,88 @@
+"""Unit tests for cooperative analysis cancellation."""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ai_agents.utils import AnalysisCancelledError
+from app.features.resume_analysis import cancellation
+
+
+@pytest.fixture
+def cancel_flags():
+    """In-memory stand-in for the shared cancellation flag cache."""
+    flags = set()
+    cache = AsyncMock()
+    cache.set.side_effect = lambda key, value: flags.add(key)
+    cache.exists.side_effect = lambda key: key in flags
+    with patch.object(cancellation, "_get_cancel_cache", return_value=cache):
+        yield flags
+
+
+class TestRunCancellable:
+    """Test aborting a running analysis step."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result_when_not_cancelled(self, cancel_flags):
+        async def analyze():
+            return {"success": True}
+
+        result = await cancellation.run_cancellable(uuid.uuid4(), analyze, poll_interval=0.01)
+
+        assert result == {"success": True}
+        assert cancellation._running == {}
+
+    @pytest.mark.asyncio
+    async def test_local_cancellation_aborts_running_task(self, cancel_flags):
+        request_id = uuid.uuid4()
+        started = asyncio.Event()
+        aborted = asyncio.Event()
+
+        async def analyze():
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                aborted.set()
+                raise
+
+        runner = asyncio.ensure_future(cancellation.run_cancellable(request_id, analyze, poll_interval=30))
+        await started.wait()
+
+        assert await cancellation.request_cancellation(request_id) is True
+        with pytest.raises(AnalysisCancelledError):
+            await runner
+        assert aborted.is_set()
+
+    @pytest.mark.asyncio
+    async def test_flag_from_another_process_is_polled(self, cancel_flags):
+        request_id = uuid.uuid4()
+        started = asyncio.Event()
+
+        async def analyze():
+            started.set()
+            await asyncio.sleep(60)
+
+        runner = asyncio.ensure_future(cancellation.run_cancellable(request_id, analyze, poll_interval=0.01))
+        await started.wait()
+        cancel_flags.add(str(request_id))
+
+        with pytest.raises(AnalysisCancelledError):
+            await runner
+
+    @pytest.mark.asyncio
+    async def test_cancel_without_running_task_only_sets_flag(self, cancel_flags):
+        request_id = uuid.uuid4()
+
+        assert await cancellation.request_cancellation(request_id) is False
+        assert await cancellation.is_cancel_requested(request_id) is True
+
+    @pytest.mark.asyncio
+    async def test_all_cancel_requested(self, cancel_flags):
+        a, b = uuid.uuid4(), uuid.uuid4()
+        cancel_flags.add(str(a))
+
+        assert await cancellation.all_cancel_requested([a]) is True
+        assert await cancellation.all_cancel_requested([a, b]) is False
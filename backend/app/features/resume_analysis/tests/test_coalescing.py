@@ -0,0 +1,133 @@
+"""Unit tests for in-flight analysis coalescing."""
+
+import asyncio
+
+import pytest
+
+from app.features.resume_analysis.coalescing import AnalysisCoalescer
+
+
+class TestAnalysisCoalescer:
+    """Test that concurrent identical analyses share one run."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_run(self):
+        coalescer = AnalysisCoalescer()
+        release = asyncio.Event()
+        calls = []
+
+        async def analyze():
+            calls.append(1)
+            await release.wait()
+            return {"success": True}
+
+        waiters = [asyncio.ensure_future(coalescer.run("key", analyze)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert coalescer.is_running("key")
+
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert len(calls) == 1
+        assert results == [{"success": True}] * 3
+        assert len(coalescer) == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        coalescer = AnalysisCoalescer()
+        calls = []
+
+        async def analyze(key):
+            calls.append(key)
+            return {"key": key}
+
+        results = await asyncio.gather(
+            coalescer.run("a", lambda: analyze("a")),
+            coalescer.run("b", lambda: analyze("b"))
+        )
+
+        assert sorted(calls) == ["a", "b"]
+        assert results == [{"key": "a"}, {"key": "b"}]
+
+    @pytest.mark.asyncio
+    async def test_finished_run_is_not_reused(self):
+        coalescer = AnalysisCoalescer()
+        calls = []
+
+        async def analyze():
+            calls.append(1)
+            return {"success": True}
+
+        await coalescer.run("key", analyze)
+        await coalescer.run("key", analyze)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_run(self):
+        coalescer = AnalysisCoalescer()
+        release = asyncio.Event()
+
+        async def analyze():
+            await release.wait()
+            return {"success": True}
+
+        first = asyncio.ensure_future(coalescer.run("key", analyze))
+        second = asyncio.ensure_future(coalescer.run("key", analyze))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await second == {"success": True}
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter(self):
+        coalescer = AnalysisCoalescer()
+
+        async def analyze():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            coalescer.run("key", analyze),
+            coalescer.run("key", analyze),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert len(coalescer) == 0
+
+    @pytest.mark.asyncio
+    async def test_last_cancelled_waiter_cancels_shared_run(self):
+        coalescer = AnalysisCoalescer()
+        started = asyncio.Event()
+        calls = []
+
+        async def analyze():
+            calls.append(1)
+            started.set()
+            await asyncio.sleep(60)
+            return {"success": True}
+
+        first = asyncio.ensure_future(coalescer.run("key", analyze, waiter="a"))
+        second = asyncio.ensure_future(coalescer.run("key", analyze, waiter="b"))
+        await started.wait()
+        assert coalescer.waiters("key") == frozenset({"a", "b"})
+
+        first.cancel()
+        second.cancel()
+        await asyncio.gather(first, second, return_exceptions=True)
+
+        assert not coalescer.is_running("key")
+        assert coalescer.waiters("key") == frozenset()
+
+        # A new request starts a fresh run instead of joining the cancelled one
+        async def quick():
+            calls.append(1)
+            return {"success": True}
+
+        assert await coalescer.run("key", quick) == {"success": True}
+        assert len(calls) == 2
@@ -0,0 +1,93 @@
+"""Unit tests for flattening AI feedback into review_feedback_items rows."""
+
+from app.features.resume_analysis.feedback_items import (
+    FEEDBACK_CATEGORIES,
+    MAX_FEEDBACK_ITEMS,
+    explode_feedback,
+)
+
+
+def _detailed_scores(structure_feedback=None, appeal_feedback=None):
+    return {
+        "structure_analysis": {"scores": {}, "feedback": structure_feedback or {}},
+        "appeal_analysis": {"scores": {}, "feedback": appeal_feedback or {}},
+    }
+
+
+class TestExplodeFeedback:
+    """Test mapping of feedback lists to feedback item rows."""
+
+    def test_v11_lists_map_to_types_and_agent_categories(self):
+        rows = explode_feedback(_detailed_scores(
+            structure_feedback={"strengths": ["Clear layout"], "improvement_areas": ["Add summary"]},
+            appeal_feedback={"improvement_areas": ["Weak SCR structure"]},
+        ))
+
+        assert [(r["feedback_type"], r["category"], r["feedback_text"]) for r in rows] == [
+            ("strength", "structure", "Clear layout"),
+            ("suggestion", "structure", "Add summary"),
+            ("suggestion", "appeal_point", "Weak SCR structure"),
+        ]
+
+    def test_specific_feedback_keeps_target_and_suggestion(self):
+        rows = explode_feedback(_detailed_scores(appeal_feedback={"specific_feedback": [{
+            "category": "quantitative_impact",
+            "target_text": "Improved efficiency",
+            "issue": "No numbers",
+            "suggestion": "State the saving in yen",
+        }]}))
+
+        assert rows == [{
+            "feedback_type": "weakness",
+            "category": "quantitative_impact",
+            "feedback_text": "No numbers",
+            "original_text": "Improved efficiency",
+            "suggested_text": "State the saving in yen",
+        }]
+
+    def test_unknown_specific_category_falls_back_to_agent_default(self):
+        rows = explode_feedback(_detailed_scores(structure_feedback={"specific_feedback": [
+            {"category": "something_new", "issue": "Dates inconsistent", "suggestion": "Use YYYY/MM"},
+        ]}))
+
+        assert rows[0]["category"] == "structure"
+
+    def test_v10_keys_use_category_overrides(self):
+        rows = explode_feedback(_detailed_scores(
+            structure_feedback={"tone_problems": ["Casual wording"], "issues": ["Mixed fonts"]},
+            appeal_feedback={"missing_skills": ["Financial modeling"]},
+        ))
+
+        assert {(r["feedback_text"], r["category"], r["feedback_type"]) for r in rows} == {
+            ("Casual wording", "grammar", "weakness"),
+            ("Mixed fonts", "formatting", "weakness"),
+            ("Financial modeling", "keywords", "weakness"),
+        }
+
+    def test_skips_blank_non_string_and_unknown_entries(self):
+        rows = explode_feedback(_detailed_scores(structure_feedback={
+            "strengths": ["  ", None, 3, " Concise "],
+            "unrelated_key": ["ignored"],
+            "specific_feedback": [{"category": "grammar", "issue": ""}, "not a dict"],
+        }))
+
+        assert [r["feedback_text"] for r in rows] == ["Concise"]
+
+    def test_missing_sections_produce_no_rows(self):
+        assert explode_feedback({}) == []
+        assert explode_feedback({"structure_analysis": {"feedback": None}}) == []
+
+    def test_row_count_is_bounded(self):
+        rows = explode_feedback(_detailed_scores(
+            structure_feedback={"strengths": [f"item {i}" for i in range(MAX_FEEDBACK_ITEMS + 10)]}
+        ))
+
+        assert len(rows) == MAX_FEEDBACK_ITEMS
+
+    def test_categories_are_allowed_by_constraint(self):
+        rows = explode_feedback(_detailed_scores(
+            structure_feedback={"strengths": ["a"], "tone_problems": ["b"], "issues": ["c"]},
+            appeal_feedback={"strengths": ["d"], "missing_skills": ["e"]},
+        ))
+
+        assert {r["category"] for r in rows} <= FEEDBACK_CATEGORIES
@@ -0,0 +1,59 @@
+"""Unit tests for listing analyses without per-row lookups."""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.features.resume_analysis.repository import AnalysisRepository
+from app.features.resume_analysis.service import AnalysisService
+from app.features.resume_upload.repository import ResumeUploadRepository
+from database.models import ReviewRequest
+
+
+def _request(status: str) -> ReviewRequest:
+    return ReviewRequest(
+        id=uuid.uuid4(),
+        resume_id=uuid.uuid4(),
+        requested_by_user_id=uuid.uuid4(),
+        target_industry="tech_consulting",
+        status=status,
+        requested_at=datetime.now(timezone.utc),
+    )
+
+
+def _resume(resume_id: uuid.UUID) -> MagicMock:
+    resume = MagicMock(id=resume_id, candidate_id=uuid.uuid4(), original_filename="cv.pdf")
+    resume.candidate.first_name, resume.candidate.last_name = "Jane", "Doe"
+    return resume
+
+
+@pytest.mark.asyncio
+async def test_page_is_loaded_with_one_query_per_table():
+    completed, pending, orphan = _request("completed"), _request("pending"), _request("completed")
+    service = AnalysisService(AsyncMock())
+    service.repository = AsyncMock(spec=AnalysisRepository)
+    service.repository.list_analyses_for_user.return_value = [completed, pending, orphan]
+    service.repository.count_analyses_for_user.return_value = 3
+    service.repository.get_results_for_requests.return_value = {completed.id: MagicMock(overall_score=82)}
+    service.resume_repository = AsyncMock(spec=ResumeUploadRepository)
+    service.resume_repository.get_many_with_candidate.return_value = {
+        r.resume_id: _resume(r.resume_id) for r in (completed, pending)
+    }
+
+    listing = await service.list_user_analyses(user_id=uuid.uuid4(), user_role="admin")
+
+    service.resume_repository.get_many_with_candidate.assert_awaited_once_with(
+        {completed.resume_id, pending.resume_id, orphan.resume_id}
+    )
+    # Only completed analyses have results
+    service.repository.get_results_for_requests.assert_awaited_once_with([completed.id, orphan.id])
+    service.repository.get_analysis_with_results.assert_not_awaited()
+
+    # The analysis whose resume is gone is skipped
+    analyses = listing["analyses"]
+    assert [a.id for a in analyses] == [str(completed.id), str(pending.id)]
+    assert [a.overall_score for a in analyses] == [82, None]
+    assert analyses[0].candidate_name == "Jane Doe"
+    assert listing["total_count"] == 3
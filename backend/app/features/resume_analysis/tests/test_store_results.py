@@ -0,0 +1,68 @@
+"""Unit tests for storing analysis results in one transaction."""
+
+import uuid
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.features.resume_analysis.repository import AnalysisRepository
+
+
+@pytest.fixture
+def session():
+    """Async session mock; the conditional status UPDATE matches one row."""
+    session = Mock()
+    session.execute = AsyncMock(return_value=Mock(scalar_one_or_none=Mock(return_value=uuid.uuid4())))
+    session.flush = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.refresh = AsyncMock()
+    session.get = AsyncMock()
+    return session
+
+
+async def _complete(repository, request_id):
+    assert await repository.transition_request_status(request_id, "completed")
+    return await repository.save_results(
+        request_id=request_id,
+        overall_score=80,
+        ats_score=70,
+        content_score=75,
+        formatting_score=90,
+        executive_summary="Strong resume for the target industry.",
+        detailed_scores={"structure_analysis": {}, "appeal_analysis": {}},
+        ai_model_used="gpt-4",
+        processing_time_ms=1000,
+    )
+
+
+@pytest.mark.asyncio
+async def test_results_and_status_are_committed_once(session):
+    repository = AnalysisRepository(session)
+    request_id = uuid.uuid4()
+
+    async with repository.unit_of_work():
+        result = await _complete(repository, request_id)
+
+    assert result.review_request_id == request_id
+    session.add.assert_called_once_with(result)
+    # Status set by the conditional UPDATE only: no re-read, no second commit
+    assert session.execute.await_count == 1
+    session.get.assert_not_awaited()
+    session.commit.assert_awaited_once()
+    session.refresh.assert_not_awaited()
+    assert repository.request_repo.autocommit and repository.result_repo.autocommit
+
+
+@pytest.mark.asyncio
+async def test_failed_store_rolls_back_the_status_change(session):
+    repository = AnalysisRepository(session)
+    session.flush.side_effect = RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        async with repository.unit_of_work():
+            await _complete(repository, uuid.uuid4())
+
+    session.commit.assert_not_awaited()
+    session.rollback.assert_awaited_once()
+    assert repository.request_repo.autocommit and repository.result_repo.autocommit
@@ -1,19 +1,21 @@
 """Resume upload API endpoints with candidate association."""
 
+import json
 import uuid
 import logging
-from typing import Optional
+from typing import List, Optional
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, UploadFile, File, Form, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_async_session
 from app.core.dependencies import get_current_user
 from database.models.auth import User
-from app.core.rate_limiter import rate_limiter, RateLimitExceeded, RateLimitType
 
 from .service import ResumeUploadService
+from .storage import get_blob_store, original_key, parse_byte_range
 from .schemas import (
     UploadedFileV2,
     FileUploadResponse,
@@ -61,15 +63,8 @@ async def upload_resume(
     - Returns upload status with extracted text
     """
 
+    # Rate limiting is enforced by RateLimitMiddleware before this handler runs
     try:
-        # Apply rate limiting
-        is_allowed, rate_info = await rate_limiter.check_rate_limit(
-            limit_type=RateLimitType.FILE_UPLOAD,
-            identifier=str(current_user.id)
-        )
-        if not is_allowed:
-            raise RateLimitExceeded("Upload rate limit exceeded")
-
         logger.info(f"User {current_user.id} uploading resume for candidate {candidate_id}: {file.filename}")
 
         # Process upload with candidate association
@@ -82,11 +77,6 @@ async def upload_resume(
         logger.info(f"File upload successful: {result.id}")
         return result
         
-    except RateLimitExceeded:
-        raise HTTPException(
-            status_code=429,
-            detail="Too many upload requests. Please wait before uploading more files."
-        )
     except ValueError as e:
         logger.warning(f"File validation error: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -96,10 +86,42 @@ async def upload_resume(
 
 
 
-# NOTE: Batch upload endpoint removed during refactoring
-# Reason: Requires candidate_id for proper domain modeling (version management)
-# Use POST /candidates/{candidate_id}/resumes for individual uploads
-# TODO: Implement proper batch upload with candidate associations if needed
+@router.post(
+    "/batch",
+    summary="Bulk upload resumes",
+    description=(
+        "Upload many resume files and/or zip archives in one request. "
+        "Streams per-file progress as newline-delimited JSON (application/x-ndjson)."
+    )
+)
+async def upload_resumes_batch(
+    files: List[UploadFile] = File(...),
+    candidate_id: Optional[uuid.UUID] = Form(None, description="Candidate for files not in a candidate folder"),
+    current_user: User = Depends(get_current_user),
+    service: ResumeUploadService = Depends(get_resume_upload_service)
+) -> StreamingResponse:
+    """
+    Upload a batch of resumes.
+
+    - Plain files go to ``candidate_id``
+    - Zip entries in a top-level folder named after a candidate ID go to
+      that candidate, other entries to ``candidate_id``
+    - Each line of the response is an event: "extracted"/"error" per file
+      as it finishes, "completed" per stored resume (with id and
+      version_number), then a "done" summary
+    """
+    try:
+        items = await service.prepare_batch(files, candidate_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    logger.info(f"User {current_user.id} uploading a batch of {len(items)} resumes")
+
+    async def events():
+        async for event in service.upload_batch(items, current_user.id):
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -122,6 +144,56 @@ async def get_upload(
     return FileUploadResponse.model_validate(upload)
 
 
+@router.get(
+    "/{file_id}/original",
+    summary="Download original file",
+    description="Stream the original uploaded file; supports single byte ranges (Range: bytes=start-end)"
+)
+async def download_original(
+    file_id: uuid.UUID,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    current_user: User = Depends(get_current_user),
+    repository = Depends(get_resume_upload_repository)
+) -> Response:
+    """Stream the original file of an upload (206 for range requests)."""
+
+    upload = await repository.get_by_id(file_id)
+    if not upload or upload.uploaded_by_user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Upload not found")
+
+    blob_store = get_blob_store()
+    key = original_key(upload.file_hash)
+    size = await blob_store.size(key) if blob_store else None
+    if size is None:
+        # Uploaded before originals were retained, or retention is disabled
+        raise HTTPException(status_code=404, detail="Original file not available")
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": f'"{upload.file_hash}"',
+        "Content-Disposition": f"inline; filename*=UTF-8''{quote(upload.original_filename)}",
+    }
+
+    try:
+        byte_range = parse_byte_range(range_header, size)
+    except ValueError:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, 200
+    else:
+        (start, end), status_code = byte_range, 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        blob_store.read_range(key, start, end),
+        status_code=status_code,
+        media_type=upload.mime_type,
+        headers=headers
+    )
+
+
 @router.get(
     "/",
     response_model=FileUploadListResponse,
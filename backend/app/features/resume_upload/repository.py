@@ -1,16 +1,25 @@
 """Resume upload repository for database operations."""
 
 import uuid
-from typing import Optional, List
+from typing import Any, Dict, Iterable, Optional, List
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import desc, and_, select
+from sqlalchemy import desc, and_, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.core.database import BaseRepository
 from app.core.datetime_utils import utc_now
+from database.models.candidate import Candidate
+from database.models.content import ResumeContent
 from database.models.resume import Resume, ResumeStatus
+from database.models.section import ResumeSection
+
+
+# Rows per multi-row INSERT (keeps statements under the 32767 bind parameter limit)
+INSERT_BATCH_SIZE = 1000
 
 
 class ResumeUploadRepository(BaseRepository[Resume]):
@@ -28,14 +37,50 @@ class ResumeUploadRepository(BaseRepository[Resume]):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_latest_resume_for_candidate(self, candidate_id: uuid.UUID) -> Optional[Resume]:
-        """Get the most recent resume for a candidate (by version number)."""
-        query = select(Resume).where(
-            Resume.candidate_id == candidate_id
-        ).order_by(desc(Resume.version_number)).limit(1)
+    async def get_many_with_candidate(self, resume_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, Resume]:
+        """Get resumes by ID with candidate relationship loaded, keyed by ID."""
+        resume_ids = list(resume_ids)
+        if not resume_ids:
+            return {}
+        stmt = select(Resume).where(Resume.id.in_(resume_ids)).options(
+            selectinload(Resume.candidate)
+        )
+        result = await self.session.execute(stmt)
+        return {resume.id: resume for resume in result.scalars().all()}
 
+    async def get_existing_candidate_ids(self, candidate_ids: Iterable[uuid.UUID]) -> set:
+        """Get which of the given candidate IDs exist."""
+        query = select(Candidate.id).where(Candidate.id.in_(list(candidate_ids)))
         result = await self.session.execute(query)
-        return result.scalar_one_or_none()
+        return set(result.scalars().all())
+
+    async def _insert_many(self, stmt, rows: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Execute a multi-row INSERT in batches of INSERT_BATCH_SIZE rows (no commit).
+
+        Returns:
+            The RETURNING rows of all batches (empty without RETURNING)
+        """
+        returned = []
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            result = await self.session.execute(stmt.values(rows[start:start + INSERT_BATCH_SIZE]))
+            if result.returns_rows:
+                returned.extend(result.all())
+        return returned
+
+    async def insert_resumes(self, rows: List[Dict[str, Any]]) -> Dict[uuid.UUID, int]:
+        """
+        Insert resume records with multi-row INSERTs.
+
+        Does not commit. Rows are dicts of Resume columns and must include
+        the ``id``; save their content with save_contents first. Version
+        numbers are assigned by the database (migration 018).
+
+        Returns:
+            Resume ID -> assigned version number
+        """
+        returned = await self._insert_many(insert(Resume).returning(Resume.id, Resume.version_number), rows)
+        return {resume_id: version_number for resume_id, version_number in returned}
 
     async def create_resume(
         self,
@@ -46,11 +91,20 @@ class ResumeUploadRepository(BaseRepository[Resume]):
         file_hash: str,
         file_size: int,
         mime_type: str,
-        version_number: int,
         status: str = ResumeStatus.PENDING.value,
-        extracted_text: Optional[str] = None
+        search_vector: Optional[ColumnElement] = None,
+        word_count: Optional[int] = None,
+        text_metrics: Optional[Dict[str, Any]] = None,
+        processed_at: Optional[datetime] = None
     ) -> Resume:
-        """Create a new resume record. Just stores data as provided."""
+        """
+        Create a new resume record. Just stores data as provided.
+
+        The extracted text is not stored here; save it with save_content
+        (keyed by file_hash) in the same transaction first. The version
+        number is assigned by the database in the INSERT (migration 018).
+        Commits unless called inside unit_of_work().
+        """
         resume = Resume(
             candidate_id=candidate_id,
             uploaded_by_user_id=uploaded_by_user_id,
@@ -59,17 +113,132 @@ class ResumeUploadRepository(BaseRepository[Resume]):
             file_hash=file_hash,
             file_size=file_size,
             mime_type=mime_type,
-            version_number=version_number,
             status=status,
-            extracted_text=extracted_text
+            search_vector=search_vector,
+            word_count=word_count,
+            text_metrics=text_metrics,
+            processed_at=processed_at
         )
 
         self.session.add(resume)
-        await self.session.commit()
-        await self.session.refresh(resume)
+        await self.save(resume)
 
         return resume
 
+    async def get_content(self, file_hash: str) -> Optional[ResumeContent]:
+        """Get the stored extraction of a file by its SHA-256 hash."""
+        return await self.session.get(ResumeContent, file_hash)
+
+    async def save_content(
+        self,
+        file_hash: str,
+        extracted_text: str,
+        sections: Optional[List[Dict[str, Any]]] = None,
+        text_metrics: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Store the extraction of a file unless it is already stored.
+
+        Does not commit. reference_count is maintained by a trigger when
+        resumes with this file_hash are inserted or deleted (migration 017).
+        """
+        await self.save_contents([{
+            "file_hash": file_hash,
+            "extracted_text": extracted_text,
+            "sections": sections,
+            "text_metrics": text_metrics,
+        }])
+
+    async def save_contents(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Store the extractions of several files, keeping those already stored.
+
+        Does not commit. Existing rows are locked by a no-op update, so a
+        concurrent delete of their last resume (which drops the content row)
+        waits until this transaction has inserted its resumes.
+
+        Args:
+            rows: Dicts with file_hash, extracted_text, sections and text_metrics
+        """
+        created_at = utc_now()
+        unique_rows = {row["file_hash"]: {**row, "created_at": created_at} for row in rows}
+        stmt = pg_insert(ResumeContent)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ResumeContent.file_hash],
+            set_={"file_hash": stmt.excluded.file_hash}
+        )
+        # Rows in hash order so concurrent batches lock them in the same order
+        await self._insert_many(stmt, [unique_rows[file_hash] for file_hash in sorted(unique_rows)])
+
+    def existing_search_vector(self, file_hash: str) -> ColumnElement:
+        """SQL expression copying the search vector of an earlier resume with the same file."""
+        return (
+            select(Resume.search_vector)
+            .where(Resume.file_hash == file_hash, Resume.search_vector.isnot(None))
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    async def insert_sections(
+        self,
+        resume_id: uuid.UUID,
+        sections: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Insert a resume's sections with a single multi-row INSERT.
+
+        Does not commit; run it inside unit_of_work() with the resume.
+
+        Args:
+            resume_id: Resume ID
+            sections: Sections from segment_resume
+
+        Returns:
+            Number of inserted rows
+        """
+        return await self.insert_sections_many({resume_id: sections})
+
+    async def insert_sections_many(self, sections_by_resume: Dict[uuid.UUID, List[Dict[str, Any]]]) -> int:
+        """
+        Insert the sections of several resumes with multi-row INSERTs.
+
+        Does not commit.
+
+        Args:
+            sections_by_resume: Resume ID -> sections from segment_resume
+
+        Returns:
+            Number of inserted rows
+        """
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "resume_id": resume_id,
+                "section_type": section["section_type"],
+                "section_title": section.get("section_title"),
+                "content": section["content"],
+                "start_page": section.get("start_page"),
+                "end_page": section.get("end_page"),
+                "start_position": section.get("start_position"),
+                "end_position": section.get("end_position"),
+                "sequence_order": section.get("sequence_order", 0),
+                "section_metadata": section.get("section_metadata"),
+            }
+            for resume_id, sections in sections_by_resume.items()
+            for section in sections
+        ]
+        await self._insert_many(insert(ResumeSection), rows)
+        return len(rows)
+
+    async def get_sections(self, resume_id: uuid.UUID) -> List[ResumeSection]:
+        """Get a resume's sections in document order."""
+        query = select(ResumeSection).where(
+            ResumeSection.resume_id == resume_id
+        ).order_by(ResumeSection.sequence_order)
+
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def update_status(
         self,
         file_id: uuid.UUID,
@@ -77,7 +246,11 @@ class ResumeUploadRepository(BaseRepository[Resume]):
         processed_at: Optional[datetime] = None,
         error_message: Optional[str] = None
     ) -> Optional[Resume]:
-        """Update file upload status and optionally set processed_at timestamp."""
+        """
+        Update file upload status and optionally set processed_at timestamp.
+
+        Commits unless called inside unit_of_work().
+        """
         file_upload = await self.get_by_id(file_id)
         if not file_upload:
             return None
@@ -90,8 +263,7 @@ class ResumeUploadRepository(BaseRepository[Resume]):
 
         # Note: error_message field not implemented in Resume model
 
-        await self.session.commit()
-        await self.session.refresh(file_upload)
+        await self.save(file_upload)
 
         return file_upload
     
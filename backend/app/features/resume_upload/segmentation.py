@@ -0,0 +1,198 @@
+"""
+Resume section segmentation.
+
+Splits extracted resume text into typed sections (the ``resume_sections``
+table) by recognising section header lines in English and Japanese resumes,
+e.g. "Work Experience", "EDUCATION:", "■職務経歴", "【資格】" or "学　歴".
+
+Segmentation is deterministic and CPU-only (no LLM call): a header is a
+short line whose normalized text is a known section title. Text before the
+first header is the preamble (name and contact details on most resumes); a
+resume without any recognised header becomes a single ``other`` section.
+"""
+
+import re
+import unicodedata
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Sequence
+
+# Longest line still considered a header
+MAX_HEADER_LENGTH = 40
+
+# Preambles up to this many lines are treated as contact details
+MAX_CONTACT_PREAMBLE_LINES = 8
+
+SECTION_HEADERS: Dict[str, Sequence[str]] = {
+    "contact": (
+        "contact", "contact information", "contact info", "contact details",
+        "personal information", "personal details",
+        "連絡先", "基本情報", "個人情報",
+    ),
+    "summary": (
+        "summary", "professional summary", "career summary", "executive summary",
+        "profile", "professional profile", "objective", "career objective", "about me",
+        "職務要約", "職務概要", "要約", "概要", "自己PR", "自己紹介", "志望動機",
+        "キャリアサマリー", "サマリー", "プロフィール",
+    ),
+    "experience": (
+        "experience", "work experience", "professional experience", "relevant experience",
+        "employment", "employment history", "work history", "career history",
+        "projects", "project experience",
+        "職務経歴", "職務経歴詳細", "職歴", "学歴・職歴", "経歴", "職務内容",
+        "業務経歴", "業務内容", "実務経験", "プロジェクト経験", "プロジェクト実績", "実績",
+    ),
+    "education": (
+        "education", "academic background", "educational background",
+        "education and training",
+        "学歴",
+    ),
+    "skills": (
+        "skills", "technical skills", "core skills", "key skills", "skill set",
+        "skills and abilities", "core competencies", "competencies",
+        "languages", "language skills", "technologies", "tools",
+        "スキル", "技術スキル", "テクニカルスキル", "保有スキル", "PCスキル",
+        "活かせる経験・知識・技術", "開発環境", "得意分野", "語学", "語学力",
+    ),
+    "certifications": (
+        "certifications", "certification", "certificates", "licenses", "qualifications",
+        "licenses and certifications", "certifications and licenses",
+        "資格", "保有資格", "取得資格", "免許", "免許・資格", "資格・免許",
+    ),
+    "other": (
+        "awards", "honors", "publications", "interests", "hobbies", "volunteer",
+        "volunteer experience", "activities", "references", "additional information",
+        "受賞歴", "趣味", "特技", "趣味・特技", "本人希望記入欄", "備考",
+    ),
+}
+
+# Leading numbering ("1.", "2)", "IV.") and decoration around header text
+_NUMBERING = re.compile(r"^(?:\d+|[ivx]+)[.)]\s*")
+_DECORATION = "■□●○◆◇▼▽▶►★☆・*#-=_~|[]【】〔〕〈〉《》<>()「」『』:"
+_SEPARATORS = re.compile(r"\band\b|[\s・/&,、]+")
+_COLON = re.compile(r"[:：]")
+
+_CONTACT_PATTERN = re.compile(
+    r"[\w.+-]+@[\w-]+\.[\w.]+"          # email
+    r"|\+?\d[\d\s()-]{7,}\d"            # phone number
+    r"|tel|phone|mail|住所|電話|氏名",
+    re.IGNORECASE
+)
+
+
+def _header_key(text: str) -> str:
+    """Normalize a candidate header (width, case, numbering, decoration, spacing)."""
+    key = unicodedata.normalize("NFKC", text).strip().lower()
+    key = _NUMBERING.sub("", key)
+    key = key.strip(_DECORATION + " ")
+    return _SEPARATORS.sub("", key)
+
+
+_HEADER_TYPES: Dict[str, str] = {
+    _header_key(title): section_type
+    for section_type, titles in SECTION_HEADERS.items()
+    for title in titles
+}
+
+
+def _match_header(line: str) -> Optional[Dict[str, Any]]:
+    """
+    Check whether a line is a section header.
+
+    Returns:
+        Section type, title and the offset (within the line) where the
+        section content starts, or None
+    """
+    stripped = line.strip()
+    if not stripped:
+        return None
+
+    if len(stripped) <= MAX_HEADER_LENGTH:
+        section_type = _HEADER_TYPES.get(_header_key(stripped))
+        if section_type:
+            return {"section_type": section_type, "section_title": stripped, "content_offset": len(line)}
+
+    # "Skills: Python, Go" - header and content on one line
+    colon = _COLON.search(line)
+    if colon and 0 < colon.start() <= MAX_HEADER_LENGTH:
+        title = line[:colon.start()].strip()
+        section_type = _HEADER_TYPES.get(_header_key(title))
+        if section_type:
+            return {"section_type": section_type, "section_title": title, "content_offset": colon.end()}
+
+    return None
+
+
+def _page_of(position: int, page_starts: Optional[List[int]]) -> Optional[int]:
+    """1-based page containing a character position (None without page offsets)."""
+    if not page_starts:
+        return None
+    return max(bisect_right(page_starts, position), 1)
+
+
+def _preamble_type(content: str) -> str:
+    """Type of the text before the first header."""
+    lines = [line for line in content.splitlines() if line.strip()]
+    if len(lines) <= MAX_CONTACT_PREAMBLE_LINES or _CONTACT_PATTERN.search(content):
+        return "contact"
+    return "other"
+
+
+def segment_resume(text: str, page_starts: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+    """
+    Split resume text into typed sections.
+
+    Args:
+        text: Extracted resume text
+        page_starts: Character offset where each page starts (PDFs), used
+            to fill start_page/end_page
+
+    Returns:
+        Sections in document order, as dicts with section_type,
+        section_title, content, start/end position and page, sequence_order
+        and section_metadata (how the section was detected). Positions are
+        character offsets into ``text``; a section spans its header line.
+    """
+    if not text or not text.strip():
+        return []
+
+    # (section_type, section_title, start, content_start, detection)
+    boundaries = []
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        header = _match_header(line.rstrip("\r\n"))
+        if header:
+            boundaries.append((
+                header["section_type"], header["section_title"],
+                offset, offset + header["content_offset"], "header"
+            ))
+        offset += len(line)
+
+    if not boundaries:
+        boundaries.append(("other", None, 0, 0, "none"))
+    elif text[:boundaries[0][2]].strip():
+        preamble = text[:boundaries[0][2]]
+        boundaries.insert(0, (_preamble_type(preamble), None, 0, 0, "preamble"))
+
+    sections = []
+    for index, (section_type, title, start, content_start, detection) in enumerate(boundaries):
+        end = boundaries[index + 1][2] if index + 1 < len(boundaries) else len(text)
+        raw_content = text[content_start:end]
+        content = raw_content.strip()
+        if not content:
+            continue  # Header directly followed by another header
+
+        # Trim the trailing whitespace from the highlighted range
+        end = content_start + len(raw_content.rstrip())
+        sections.append({
+            "section_type": section_type,
+            "section_title": title,
+            "content": content,
+            "start_position": start,
+            "end_position": end,
+            "start_page": _page_of(start, page_starts),
+            "end_page": _page_of(max(end - 1, start), page_starts),
+            "sequence_order": len(sections),
+            "section_metadata": {"detection": detection},
+        })
+
+    return sections
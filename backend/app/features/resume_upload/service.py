@@ -2,19 +2,27 @@
 
 import io
 import uuid
+import asyncio
 import logging
 import hashlib
-from typing import Optional
+import zipfile
+import mimetypes
+from contextlib import nullcontext
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from functools import partial
 from pathlib import Path
 
-import PyPDF2
-import docx
 from fastapi import UploadFile, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.datetime_utils import utc_now
+from app.features.search.embeddings import get_embedding_index
+from app.features.search.repository import build_search_vector
 from .repository import ResumeUploadRepository
+from .segmentation import segment_resume
+from .storage import get_blob_store, original_key
+from .text_metrics import compute_text_metrics
 from database.models.resume import Resume, ResumeStatus
 from .schemas import (
     UploadedFileV2,
@@ -45,21 +53,6 @@ class ResumeUploadService:
         self.repository = ResumeUploadRepository(session)
         self.settings = get_settings()
 
-    async def _get_next_version_number(self, candidate_id: uuid.UUID) -> int:
-        """
-        Calculate the next version number for a candidate's resume.
-
-        Business Rule: Version numbers start at 1 and increment sequentially.
-
-        Args:
-            candidate_id: The candidate's ID
-
-        Returns:
-            Next version number (1 if no previous resumes exist)
-        """
-        latest_resume = await self.repository.get_latest_resume_for_candidate(candidate_id)
-        return (latest_resume.version_number + 1) if latest_resume else 1
-
     async def upload_resume(
         self,
         candidate_id: uuid.UUID,
@@ -75,67 +68,340 @@ class ResumeUploadService:
             content = await file.read()
             await self._validate_file(file, content)
 
-            # Business logic: Calculate next version number for this candidate
-            version_number = await self._get_next_version_number(candidate_id)
-
             file_extension = Path(file.filename).suffix.lower()
             unique_filename = f"{file_id}{file_extension}"
             file_hash = hashlib.sha256(content).hexdigest()
-            extracted_text = await self._extract_text(content, file_extension)
-
-            db_upload = await self.repository.create_resume(
-                candidate_id=candidate_id,
-                uploaded_by_user_id=user_id,
-                original_filename=file.filename,
-                stored_filename=unique_filename,
-                file_hash=file_hash,
-                file_size=len(content),
-                mime_type=file.content_type or 'application/octet-stream',
-                version_number=version_number,
-                extracted_text=extracted_text
+            extracted_text, sections, text_metrics, reused = await self._get_or_extract_content(
+                content, file_extension, file_hash
             )
 
-            # Business logic: Mark as completed and set processed timestamp
-            await self.repository.update_status(
-                db_upload.id,
-                ResumeStatus.COMPLETED,
-                processed_at=utc_now()
-            )
+            await self._store_original(file, file_hash)
+
+            # One transaction: the content (stored once per file), the resume
+            # row created directly in its final state, and its sections
+            async with self.repository.unit_of_work():
+                await self.repository.save_content(file_hash, extracted_text, sections, text_metrics)
+
+                db_upload = await self.repository.create_resume(
+                    candidate_id=candidate_id,
+                    uploaded_by_user_id=user_id,
+                    original_filename=file.filename,
+                    stored_filename=unique_filename,
+                    file_hash=file_hash,
+                    file_size=len(content),
+                    mime_type=file.content_type or 'application/octet-stream',
+                    status=ResumeStatus.COMPLETED.value,
+                    search_vector=(
+                        self.repository.existing_search_vector(file_hash) if reused
+                        else build_search_vector(extracted_text)
+                    ),
+                    word_count=text_metrics["word_count"],
+                    text_metrics=text_metrics,
+                    processed_at=utc_now()
+                )
+
+                await self.repository.insert_sections(db_upload.id, sections)
+
+            embedding_index = get_embedding_index()
+            if embedding_index is not None and extracted_text:
+                embedding_index.add(db_upload.id, candidate_id, extracted_text)
 
             return self._to_uploaded_file_v2(db_upload, extracted_text)
 
         except Exception as e:
+            # Nothing to clean up: a failed unit of work leaves no resume row
             logger.error(f"File upload failed for {file.filename}: {str(e)}")
 
-            # Mark as error if we have a DB record
-            if 'db_upload' in locals():
-                await self.repository.update_status(
-                    file_id=db_upload.id,
-                    status=ResumeStatus.ERROR
-                    # Note: error_message not implemented in model yet
-                )
-
             raise HTTPException(status_code=400, detail=str(e))
     
+    async def prepare_batch(
+        self,
+        files: List[UploadFile],
+        candidate_id: Optional[uuid.UUID] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List the files of a batch upload, expanding zip archives.
+
+        Zip entries inside a top-level folder named after a candidate ID
+        ("<candidate_id>/resume.pdf") go to that candidate; all other files
+        go to ``candidate_id``. Nothing is read yet besides zip directories.
+
+        Raises:
+            ValueError: If an archive is invalid or the batch has more than
+                BATCH_UPLOAD_MAX_FILES files
+        """
+        items = await asyncio.to_thread(self._expand_batch, files, candidate_id)
+        if not items:
+            raise ValueError("No files to upload")
+        if len(items) > self.settings.BATCH_UPLOAD_MAX_FILES:
+            raise ValueError(
+                f"Too many files ({len(items)}). Maximum is {self.settings.BATCH_UPLOAD_MAX_FILES} per batch"
+            )
+        return items
+
+    async def upload_batch(
+        self,
+        items: List[Dict[str, Any]],
+        user_id: uuid.UUID
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Upload the files of a batch (from prepare_batch) in one transaction.
+
+        Files are read, validated and extracted concurrently, at most
+        BATCH_UPLOAD_CONCURRENCY at a time, and identical files are
+        extracted once. The rows are then written with bulk inserts (which
+        assign the version numbers) and a single commit. A failing file
+        does not fail the rest of the batch.
+
+        Yields:
+            Progress events: "extracted" or "error" per file as it finishes,
+            "completed" per stored resume, then a "done" summary
+        """
+        candidate_ids = {item["candidate_id"] for item in items if item["candidate_id"]}
+        existing_candidate_ids = (
+            await self.repository.get_existing_candidate_ids(candidate_ids) if candidate_ids else set()
+        )
+
+        semaphore = asyncio.Semaphore(self.settings.BATCH_UPLOAD_CONCURRENCY)
+        session_lock = asyncio.Lock()
+        extractions: Dict[str, asyncio.Future] = {}
+        tasks = [
+            asyncio.ensure_future(self._process_batch_item(
+                item, existing_candidate_ids, semaphore, session_lock, extractions
+            ))
+            for item in items
+        ]
+
+        processed = []
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                event = {"index": result["index"], "filename": result["filename"], "status": result["status"]}
+                if result["status"] == "error":
+                    event["error"] = result["error"]
+                else:
+                    processed.append(result)
+                yield event
+        finally:
+            # Client went away mid-batch: stop the remaining work
+            for task in tasks:
+                task.cancel()
+
+        completed = 0
+        if processed:
+            processed.sort(key=lambda result: result["index"])
+            try:
+                await self._save_batch(processed, user_id)
+            except Exception as e:
+                logger.error(f"Saving batch upload of {len(processed)} files failed: {str(e)}")
+                for result in processed:
+                    yield {
+                        "index": result["index"], "filename": result["filename"],
+                        "status": "error", "error": "Failed to save upload"
+                    }
+            else:
+                completed = len(processed)
+                for result in processed:
+                    yield {
+                        "index": result["index"],
+                        "filename": result["filename"],
+                        "status": "completed",
+                        "id": str(result["id"]),
+                        "candidate_id": str(result["candidate_id"]),
+                        "version_number": result["version_number"],
+                    }
+
+        yield {"status": "done", "total": len(items), "completed": completed, "failed": len(items) - completed}
+
+    def _expand_batch(
+        self,
+        files: List[UploadFile],
+        candidate_id: Optional[uuid.UUID]
+    ) -> List[Dict[str, Any]]:
+        """List the files of a batch with a reader for each (blocking)."""
+        items = []
+        for file in files:
+            if Path(file.filename or "").suffix.lower() == ".zip":
+                items.extend(self._zip_items(file, candidate_id))
+            else:
+                items.append({
+                    "filename": file.filename,
+                    "content_type": file.content_type,
+                    "mime_type": file.content_type or 'application/octet-stream',
+                    "candidate_id": candidate_id,
+                    "read": partial(self._read_upload, file.file),
+                })
+
+        for index, item in enumerate(items):
+            item["index"] = index
+        return items
+
+    def _zip_items(self, file: UploadFile, candidate_id: Optional[uuid.UUID]) -> List[Dict[str, Any]]:
+        """List the files in a zip archive (directories and metadata skipped)."""
+        try:
+            archive = zipfile.ZipFile(file.file)
+        except zipfile.BadZipFile:
+            raise ValueError(f"{file.filename} is not a valid zip archive")
+
+        items = []
+        for info in archive.infolist():
+            path = Path(info.filename)
+            if info.is_dir() or path.name.startswith(".") or "__MACOSX" in path.parts:
+                continue
+
+            entry_candidate_id = candidate_id
+            if len(path.parts) > 1:
+                try:
+                    entry_candidate_id = uuid.UUID(path.parts[0])
+                except ValueError:
+                    pass
+
+            items.append({
+                "filename": path.name,
+                "content_type": None,
+                "mime_type": mimetypes.guess_type(path.name)[0] or 'application/octet-stream',
+                "candidate_id": entry_candidate_id,
+                "read": partial(self._read_zip_entry, archive, info),
+            })
+        return items
+
+    @staticmethod
+    def _read_upload(fileobj) -> bytes:
+        """Read a spooled upload from the start (blocking)."""
+        fileobj.seek(0)
+        return fileobj.read()
+
+    def _read_zip_entry(self, archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
+        """Read a zip entry, never decompressing more than MAX_FILE_SIZE + 1 bytes (blocking)."""
+        if info.file_size > self.MAX_FILE_SIZE:
+            raise ValueError(f"File too large. Maximum size is {self.MAX_FILE_SIZE / (1024*1024)}MB")
+        with archive.open(info) as entry:
+            return entry.read(self.MAX_FILE_SIZE + 1)
+
+    async def _process_batch_item(
+        self,
+        item: Dict[str, Any],
+        candidate_ids: set,
+        semaphore: asyncio.Semaphore,
+        session_lock: asyncio.Lock,
+        extractions: Dict[str, asyncio.Future]
+    ) -> Dict[str, Any]:
+        """Read, validate, extract and store the original of one batch file."""
+        result = {"index": item["index"], "filename": item["filename"], "candidate_id": item["candidate_id"]}
+
+        async with semaphore:
+            try:
+                if item["candidate_id"] is None:
+                    raise ValueError("No candidate_id given for this file")
+                if item["candidate_id"] not in candidate_ids:
+                    raise ValueError("Candidate not found")
+
+                content = await asyncio.to_thread(item["read"])
+                self._validate_content(item["filename"], item["content_type"], content)
+                file_hash = hashlib.sha256(content).hexdigest()
+
+                # Identical files in the batch share one extraction
+                if file_hash not in extractions:
+                    extractions[file_hash] = asyncio.ensure_future(self._get_or_extract_content(
+                        content, Path(item["filename"]).suffix.lower(), file_hash, session_lock
+                    ))
+                extracted_text, sections, text_metrics, reused = await extractions[file_hash]
+
+                await self._store_original(content, file_hash)
+
+            except Exception as e:
+                logger.warning(f"Batch upload of {item['filename']} failed: {str(e)}")
+                return {**result, "status": "error", "error": str(e)}
+
+        return {
+            **result,
+            "status": "extracted",
+            "file_hash": file_hash,
+            "file_size": len(content),
+            "mime_type": item["mime_type"],
+            "extracted_text": extracted_text,
+            "sections": sections,
+            "text_metrics": text_metrics,
+            "reused": reused,
+        }
+
+    async def _save_batch(self, processed: List[Dict[str, Any]], user_id: uuid.UUID) -> None:
+        """Write all rows of a batch in one unit of work (version numbers come from the INSERT)."""
+        now = utc_now()
+        resume_rows = []
+        sections_by_resume = {}
+        for result in processed:
+            result["id"] = uuid.uuid4()
+            resume_rows.append({
+                "id": result["id"],
+                "candidate_id": result["candidate_id"],
+                "uploaded_by_user_id": user_id,
+                "original_filename": result["filename"],
+                "stored_filename": f"{result['id']}{Path(result['filename']).suffix.lower()}",
+                "file_hash": result["file_hash"],
+                "file_size": result["file_size"],
+                "mime_type": result["mime_type"],
+                "status": ResumeStatus.COMPLETED.value,
+                "search_vector": (
+                    self.repository.existing_search_vector(result["file_hash"]) if result["reused"]
+                    else build_search_vector(result["extracted_text"])
+                ),
+                "word_count": result["text_metrics"]["word_count"],
+                "text_metrics": result["text_metrics"],
+                "uploaded_at": now,
+                "processed_at": now,
+            })
+            sections_by_resume[result["id"]] = result["sections"]
+
+        # Counter rows are locked in insert order; a fixed candidate order
+        # keeps concurrent batches from deadlocking (stable within a candidate)
+        resume_rows.sort(key=lambda row: str(row["candidate_id"]))
+
+        async with self.repository.unit_of_work():
+            await self.repository.save_contents([
+                {
+                    "file_hash": result["file_hash"],
+                    "extracted_text": result["extracted_text"],
+                    "sections": result["sections"],
+                    "text_metrics": result["text_metrics"],
+                }
+                for result in processed
+            ])
+            versions = await self.repository.insert_resumes(resume_rows)
+            await self.repository.insert_sections_many(sections_by_resume)
+
+        for result in processed:
+            result["version_number"] = versions.get(result["id"])
+
+        embedding_index = get_embedding_index()
+        if embedding_index is not None:
+            for result in processed:
+                if result["extracted_text"]:
+                    embedding_index.add(result["id"], result["candidate_id"], result["extracted_text"])
+
     async def _validate_file(self, file: UploadFile, content: bytes) -> None:
         """
         Validate file metadata and content.
         Consolidated validation to avoid duplicate checks.
         """
+        self._validate_content(file.filename, file.content_type, content)
+
+    def _validate_content(self, filename: Optional[str], content_type: Optional[str], content: bytes) -> None:
+        """Validate a file's name, MIME type, size and content."""
         # Check filename exists
-        if not file.filename:
+        if not filename:
             raise ValueError("File must have a filename")
 
         # Check file extension
-        file_extension = Path(file.filename).suffix.lower()
+        file_extension = Path(filename).suffix.lower()
         if file_extension not in self.ALLOWED_EXTENSIONS:
             raise ValueError(
                 f"File type not supported. Allowed types: {', '.join(self.ALLOWED_EXTENSIONS)}"
             )
 
         # Check MIME type
-        if file.content_type and file.content_type not in self.ALLOWED_MIME_TYPES:
-            raise ValueError(f"MIME type {file.content_type} not supported")
+        if content_type and content_type not in self.ALLOWED_MIME_TYPES:
+            raise ValueError(f"MIME type {content_type} not supported")
 
         # Check file size (single check using actual content)
         content_size = len(content)
@@ -153,16 +419,104 @@ class ResumeUploadService:
                 logger.warning(f"Suspicious pattern detected: {pattern}")
                 # In production, might want to reject the file
     
-    async def _extract_text(self, content: bytes, file_extension: str) -> str:
-        """Extract text from file content based on file type."""
+    async def _store_original(self, source: Union[UploadFile, bytes], file_hash: str) -> None:
+        """
+        Keep the original file in the blob store (once per file_hash).
+
+        Streams the spooled upload (or the bytes) in chunks rather than
+        handing the backend one large buffer.
+        """
+        blob_store = get_blob_store()
+        if blob_store is None:
+            return
+
+        key = original_key(file_hash)
+        if await blob_store.exists(key):
+            return
+
+        async def chunks():
+            if isinstance(source, bytes):
+                for offset in range(0, len(source), blob_store.chunk_size):
+                    yield source[offset:offset + blob_store.chunk_size]
+                return
+            await source.seek(0)
+            while chunk := await source.read(blob_store.chunk_size):
+                yield chunk
+
+        size = await blob_store.write_stream(key, chunks())
+        logger.info(f"Stored original file {file_hash[:12]} ({size} bytes)")
+
+    async def _get_or_extract_content(
+        self,
+        content: bytes,
+        file_extension: str,
+        file_hash: str,
+        session_lock: Optional[asyncio.Lock] = None
+    ) -> Tuple[str, List[Dict[str, Any]], Dict[str, Any], bool]:
+        """
+        Get the text, sections and metrics of a file, parsing each file only once.
+
+        Args:
+            session_lock: Held around the lookup when several uploads share
+                the session concurrently (batch uploads)
+
+        Returns:
+            (extracted_text, sections, text_metrics, reused) where reused is
+            True if an earlier upload of the same file was reused
+        """
+        async with session_lock or nullcontext():
+            stored = await self.repository.get_content(file_hash)
+        if stored is not None:
+            logger.info(f"Reusing extracted text of file {file_hash[:12]} ({stored.reference_count} resumes)")
+            # Rows backfilled from before segmentation have no sections/metrics
+            sections = stored.sections or segment_resume(stored.extracted_text)
+            text_metrics = stored.text_metrics or compute_text_metrics(stored.extracted_text, sections)
+            return stored.extracted_text, sections, text_metrics, True
+
+        page_starts: List[int] = []
+        extracted_text = await self._extract_text(content, file_extension, page_starts)
+        sections = segment_resume(extracted_text, page_starts)
+        text_metrics = compute_text_metrics(extracted_text, sections)
+        return extracted_text, sections, text_metrics, False
+
+    async def _extract_text(
+        self,
+        content: bytes,
+        file_extension: str,
+        page_starts: Optional[List[int]] = None
+    ) -> str:
+        """
+        Extract text from file content based on file type.
+
+        For PDFs, the character offset where each page starts is appended to
+        ``page_starts`` when a list is given (used for section page numbers).
+        Parsing is CPU-bound and runs in a worker thread.
+        """
+        return await asyncio.to_thread(self._parse_text, content, file_extension, page_starts)
+
+    @staticmethod
+    def _parse_text(
+        content: bytes,
+        file_extension: str,
+        page_starts: Optional[List[int]] = None
+    ) -> str:
+        """Parse the text of a PDF, Word or text file (blocking)."""
         try:
             if file_extension == '.pdf':
-                # Extract from PDF
+                # Extract from PDF (parsers are imported on first use)
+                import PyPDF2
                 pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
-                return '\n'.join(page.extract_text() for page in pdf_reader.pages)
+                pages = [page.extract_text() for page in pdf_reader.pages]
+                if page_starts is not None:
+                    offset = 0
+                    for page_text in pages:
+                        page_starts.append(offset)
+                        offset += len(page_text) + 1  # Joined with '\n'
+                return '\n'.join(pages)
 
             elif file_extension in ['.doc', '.docx']:
                 # Extract from Word document
+                import docx
                 doc = docx.Document(io.BytesIO(content))
                 text_parts = [p.text for p in doc.paragraphs if p.text.strip()]
 
@@ -221,7 +575,8 @@ class ResumeUploadService:
                 retryCount=0,
                 maxRetries=3
             ),
-            extracted_text=extracted_text or db_upload.extracted_text,
+            # The row is not refreshed after the insert; the text is passed in
+            extracted_text=extracted_text if extracted_text is not None else db_upload.extracted_text,
             error=None,
             startTime=int(db_upload.uploaded_at.timestamp() * 1000),
             endTime=int(db_upload.processed_at.timestamp() * 1000) if db_upload.processed_at else None
@@ -0,0 +1,265 @@
+"""
+Blob storage for original resume files.
+
+Originals are stored content-addressed by their SHA-256 (``file_hash``), so
+an identical file uploaded again is stored once and its key never changes.
+Writes stream chunk by chunk and reads return byte ranges as async chunk
+iterators, so neither side holds a whole file in API memory.
+
+Backends (``BLOB_STORE_BACKEND``):
+
+- ``local``: files under LOCAL_STORAGE_PATH (development and tests)
+- ``gcs``: Google Cloud Storage bucket BLOB_STORE_GCS_BUCKET
+  (google-cloud-storage is imported on first use)
+- ``none``: originals are not retained
+"""
+
+import asyncio
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import AsyncIterator, Optional, Tuple
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+ORIGINALS_PREFIX = "originals"
+
+
+def original_key(file_hash: str) -> str:
+    """Content-addressed key of an original file (fanned out by hash prefix)."""
+    return f"{ORIGINALS_PREFIX}/{file_hash[:2]}/{file_hash[2:4]}/{file_hash}"
+
+
+_BYTE_RANGE = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$", re.IGNORECASE)
+
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse an HTTP Range header against a blob of ``size`` bytes.
+
+    Only single ranges are served partially; a missing, malformed or
+    multi-range header means the whole blob (which RFC 9110 allows).
+
+    Returns:
+        (start, end) with end inclusive, or None for the whole blob
+
+    Raises:
+        ValueError: If the range is not satisfiable (416)
+    """
+    match = _BYTE_RANGE.match(header or "")
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        # "bytes=-500": the last 500 bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("Range not satisfiable")
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = size - 1 if last == "" else min(int(last), size - 1)
+    if start >= size:
+        raise ValueError("Range not satisfiable")
+    if start > end:
+        return None  # Invalid range, ignored
+    return start, end
+
+
+class BlobStore:
+    """Interface of the original file storage backends."""
+
+    def __init__(self, chunk_size: int):
+        """
+        Args:
+            chunk_size: Bytes per chunk for streamed reads
+        """
+        self.chunk_size = chunk_size
+
+    async def exists(self, key: str) -> bool:
+        """Check whether a blob exists."""
+        raise NotImplementedError
+
+    async def size(self, key: str) -> Optional[int]:
+        """Get the size of a blob in bytes (None if it does not exist)."""
+        raise NotImplementedError
+
+    async def write_stream(self, key: str, chunks: AsyncIterator[bytes]) -> int:
+        """
+        Write a blob from a stream of chunks.
+
+        The blob becomes visible only once completely written; a failed
+        write leaves no partial blob behind.
+
+        Returns:
+            Number of bytes written
+        """
+        raise NotImplementedError
+
+    def read_range(self, key: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Stream a byte range of a blob.
+
+        Args:
+            key: Blob key
+            start: First byte (inclusive)
+            end: Last byte (inclusive, None for the end of the blob)
+
+        Returns:
+            Async iterator over chunks of at most chunk_size bytes
+        """
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        """Delete a blob (no-op if it does not exist)."""
+        raise NotImplementedError
+
+
+class LocalBlobStore(BlobStore):
+    """Blobs as files under a root directory."""
+
+    def __init__(self, root: str, chunk_size: int):
+        super().__init__(chunk_size)
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(self._path(key).is_file)
+
+    async def size(self, key: str) -> Optional[int]:
+        try:
+            stat = await asyncio.to_thread(self._path(key).stat)
+        except FileNotFoundError:
+            return None
+        return stat.st_size
+
+    async def write_stream(self, key: str, chunks: AsyncIterator[bytes]) -> int:
+        path = self._path(key)
+        await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+
+        # Written next to the target and renamed into place when complete
+        fd, temp_path = await asyncio.to_thread(tempfile.mkstemp, dir=path.parent, prefix=".upload-")
+        written = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async for chunk in chunks:
+                    await asyncio.to_thread(f.write, chunk)
+                    written += len(chunk)
+            await asyncio.to_thread(os.replace, temp_path, path)
+        except BaseException:
+            await asyncio.to_thread(Path(temp_path).unlink, missing_ok=True)
+            raise
+        return written
+
+    async def read_range(self, key: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        f = await asyncio.to_thread(open, self._path(key), "rb")
+        try:
+            await asyncio.to_thread(f.seek, start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                size = self.chunk_size if remaining is None else min(self.chunk_size, remaining)
+                chunk = await asyncio.to_thread(f.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            await asyncio.to_thread(f.close)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+
+class GCSBlobStore(BlobStore):
+    """Blobs in a Google Cloud Storage bucket (blocking client calls run in threads)."""
+
+    def __init__(self, bucket_name: str, chunk_size: int):
+        super().__init__(chunk_size)
+        # Imported on first use to keep cold starts fast (see fetch_secrets_from_gcp)
+        from google.cloud import storage
+
+        self.bucket = storage.Client().bucket(bucket_name)
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(self.bucket.blob(key).exists)
+
+    async def size(self, key: str) -> Optional[int]:
+        blob = await asyncio.to_thread(self.bucket.get_blob, key)
+        return None if blob is None else blob.size
+
+    async def write_stream(self, key: str, chunks: AsyncIterator[bytes]) -> int:
+        # Resumable upload: GCS makes the object visible only when the
+        # writer is closed, so a failed upload leaves nothing behind
+        blob = self.bucket.blob(key, chunk_size=max(self.chunk_size, 256 * 1024))
+        writer = await asyncio.to_thread(blob.open, "wb")
+        written = 0
+        # On failure the writer is dropped without close(), which abandons the upload
+        async for chunk in chunks:
+            await asyncio.to_thread(writer.write, chunk)
+            written += len(chunk)
+        await asyncio.to_thread(writer.close)
+        return written
+
+    async def read_range(self, key: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        blob = self.bucket.blob(key)
+        if end is None:
+            size = await self.size(key)
+            if size is None:
+                raise FileNotFoundError(key)
+            end = size - 1
+
+        # One ranged GET per chunk keeps memory bounded by chunk_size
+        position = start
+        while position <= end:
+            chunk_end = min(position + self.chunk_size - 1, end)
+            chunk = await asyncio.to_thread(blob.download_as_bytes, start=position, end=chunk_end)
+            if not chunk:
+                break
+            position += len(chunk)
+            yield chunk
+
+    async def delete(self, key: str) -> None:
+        from google.api_core.exceptions import NotFound
+
+        try:
+            await asyncio.to_thread(self.bucket.blob(key).delete)
+        except NotFound:
+            pass
+
+
+_blob_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> Optional[BlobStore]:
+    """
+    Get the process-wide blob store.
+
+    Returns:
+        The configured backend, or None when BLOB_STORE_BACKEND is "none"
+    """
+    global _blob_store
+
+    if _blob_store is None:
+        settings = get_settings()
+        backend = settings.BLOB_STORE_BACKEND
+        if backend == "none":
+            return None
+        if backend == "gcs":
+            if not settings.BLOB_STORE_GCS_BUCKET:
+                raise ValueError("BLOB_STORE_GCS_BUCKET must be set for the gcs blob store")
+            _blob_store = GCSBlobStore(settings.BLOB_STORE_GCS_BUCKET, settings.BLOB_STORE_CHUNK_SIZE)
+        elif backend == "local":
+            _blob_store = LocalBlobStore(settings.LOCAL_STORAGE_PATH, settings.BLOB_STORE_CHUNK_SIZE)
+        else:
+            raise ValueError(f"Unknown BLOB_STORE_BACKEND: {backend}")
+        logger.info(f"Original files are stored in the {backend} blob store")
+
+    return _blob_store
@@ -0,0 +1,148 @@
+"""Tests for bulk resume uploads."""
+
+import io
+import uuid
+import zipfile
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.features.resume_upload.service import ResumeUploadService
+
+RESUME_TEXT = b"John Doe\nExperience\nAcme Corp (2019-2024)\nSkills\nPython, Go, PostgreSQL" * 3
+
+
+def _upload(filename: str, content: bytes, content_type: str = "text/plain") -> Mock:
+    file = Mock()
+    file.filename = filename
+    file.content_type = content_type
+    file.file = io.BytesIO(content)
+    return file
+
+
+def _zip(entries: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in entries.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def resume_service():
+    """Resume upload service with a mocked repository and no blob store."""
+    service = ResumeUploadService(Mock())
+    service.session = Mock(commit=AsyncMock(), rollback=AsyncMock())
+    service.repository = Mock()
+    service.repository.get_content = AsyncMock(return_value=None)
+    service.repository.save_contents = AsyncMock()
+    service.repository.insert_resumes = AsyncMock(
+        side_effect=lambda rows: {row["id"]: version for version, row in enumerate(rows, start=1)}
+    )
+    service.repository.insert_sections_many = AsyncMock()
+
+    @asynccontextmanager
+    async def unit_of_work():
+        yield service.repository
+        await service.session.commit()
+
+    service.repository.unit_of_work = unit_of_work
+    return service
+
+
+async def _run(service, items, candidate_ids):
+    service.repository.get_existing_candidate_ids = AsyncMock(return_value=set(candidate_ids))
+    with patch("app.features.resume_upload.service.get_blob_store", return_value=None), \
+            patch("app.features.resume_upload.service.get_embedding_index", return_value=None):
+        return [event async for event in service.upload_batch(items, uuid.uuid4())]
+
+
+@pytest.mark.asyncio
+async def test_zip_entries_are_routed_to_candidate_folders(resume_service):
+    default_candidate, folder_candidate = uuid.uuid4(), uuid.uuid4()
+    archive = _zip({
+        "a.txt": RESUME_TEXT,
+        f"{folder_candidate}/b.txt": RESUME_TEXT + b" v2",
+        "__MACOSX/._a.txt": b"metadata",
+        "notes/": b"",
+    })
+
+    items = await resume_service.prepare_batch(
+        [_upload("c.txt", RESUME_TEXT + b" v3"), _upload("pool.zip", archive, "application/zip")],
+        candidate_id=default_candidate
+    )
+
+    assert [(item["filename"], item["candidate_id"]) for item in items] == [
+        ("c.txt", default_candidate),
+        ("a.txt", default_candidate),
+        ("b.txt", folder_candidate),
+    ]
+    assert [item["index"] for item in items] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_batch_is_written_with_bulk_inserts_and_one_commit(resume_service):
+    candidate_id = uuid.uuid4()
+    items = await resume_service.prepare_batch(
+        [_upload("a.txt", RESUME_TEXT), _upload("b.txt", RESUME_TEXT + b" v2")],
+        candidate_id=candidate_id
+    )
+
+    events = await _run(resume_service, items, [candidate_id])
+
+    completed = [event for event in events if event["status"] == "completed"]
+    # Versions assigned by the INSERT are reported per file
+    assert [event["version_number"] for event in completed] == [1, 2]
+    assert events[-1] == {"status": "done", "total": 2, "completed": 2, "failed": 0}
+
+    resume_service.repository.insert_resumes.assert_awaited_once()
+    rows = resume_service.repository.insert_resumes.await_args.args[0]
+    assert [row["original_filename"] for row in rows] == ["a.txt", "b.txt"]
+    assert all(row["status"] == "completed" and "version_number" not in row for row in rows)
+    resume_service.session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failing_files_do_not_fail_the_batch(resume_service):
+    candidate_id = uuid.uuid4()
+    items = await resume_service.prepare_batch(
+        [
+            _upload("a.txt", RESUME_TEXT),
+            _upload("b.exe", RESUME_TEXT, "application/octet-stream"),
+            _upload("c.txt", RESUME_TEXT),
+        ],
+        candidate_id=candidate_id
+    )
+
+    with patch.object(resume_service, "_extract_text", AsyncMock(return_value=RESUME_TEXT.decode())) as extract:
+        events = await _run(resume_service, items, [candidate_id])
+
+    errors = [event for event in events if event["status"] == "error"]
+    assert [event["filename"] for event in errors] == ["b.exe"]
+    assert events[-1] == {"status": "done", "total": 3, "completed": 2, "failed": 1}
+    # a.txt and c.txt are the same file: extracted once
+    extract.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unknown_candidate_is_reported_per_file(resume_service):
+    items = await resume_service.prepare_batch([_upload("a.txt", RESUME_TEXT)], candidate_id=uuid.uuid4())
+
+    events = await _run(resume_service, items, [])
+
+    assert events[0]["status"] == "error"
+    assert events[0]["error"] == "Candidate not found"
+    resume_service.repository.insert_resumes.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batch_limits(resume_service):
+    resume_service.settings = Mock(BATCH_UPLOAD_MAX_FILES=1)
+
+    with pytest.raises(ValueError, match="Too many files"):
+        await resume_service.prepare_batch(
+            [_upload("a.txt", RESUME_TEXT), _upload("b.txt", RESUME_TEXT)], candidate_id=uuid.uuid4()
+        )
+    with pytest.raises(ValueError, match="not a valid zip"):
+        await resume_service.prepare_batch([_upload("pool.zip", b"not a zip")], candidate_id=uuid.uuid4())
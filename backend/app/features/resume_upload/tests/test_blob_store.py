@@ -0,0 +1,75 @@
+"""Tests for original file retention in the local blob store."""
+
+import hashlib
+
+import pytest
+
+from app.features.resume_upload.storage import LocalBlobStore, original_key, parse_byte_range
+
+FILE_CONTENT = bytes(range(256)) * 40
+FILE_HASH = hashlib.sha256(FILE_CONTENT).hexdigest()
+
+
+async def _chunks(data: bytes, size: int = 1000):
+    for offset in range(0, len(data), size):
+        yield data[offset:offset + size]
+
+
+async def _read(blob_store, key, start=0, end=None) -> bytes:
+    return b"".join([chunk async for chunk in blob_store.read_range(key, start, end)])
+
+
+@pytest.fixture
+def blob_store(tmp_path):
+    """Local blob store with a small chunk size."""
+    return LocalBlobStore(str(tmp_path), chunk_size=1024)
+
+
+def test_keys_are_content_addressed():
+    assert original_key(FILE_HASH) == f"originals/{FILE_HASH[:2]}/{FILE_HASH[2:4]}/{FILE_HASH}"
+
+
+@pytest.mark.asyncio
+async def test_streamed_write_and_range_reads(blob_store):
+    key = original_key(FILE_HASH)
+    assert not await blob_store.exists(key)
+    assert await blob_store.size(key) is None
+
+    assert await blob_store.write_stream(key, _chunks(FILE_CONTENT)) == len(FILE_CONTENT)
+
+    assert await blob_store.exists(key)
+    assert await blob_store.size(key) == len(FILE_CONTENT)
+    assert await _read(blob_store, key) == FILE_CONTENT
+    assert await _read(blob_store, key, 1000, 4999) == FILE_CONTENT[1000:5000]
+    # Reads are chunked
+    assert [len(c) async for c in blob_store.read_range(key, 0, 2999)] == [1024, 1024, 952]
+
+
+@pytest.mark.asyncio
+async def test_failed_write_leaves_no_blob(blob_store, tmp_path):
+    async def failing_chunks():
+        yield FILE_CONTENT[:100]
+        raise ConnectionError("client disconnected")
+
+    key = original_key(FILE_HASH)
+    with pytest.raises(ConnectionError):
+        await blob_store.write_stream(key, failing_chunks())
+
+    assert not await blob_store.exists(key)
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == []
+
+
+def test_parse_byte_range():
+    assert parse_byte_range(None, 1000) is None
+    assert parse_byte_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_byte_range("bytes=900-", 1000) == (900, 999)
+    assert parse_byte_range("bytes=-100", 1000) == (900, 999)
+    assert parse_byte_range("bytes=500-5000", 1000) == (500, 999)
+    # Malformed and multi-range headers get the whole file
+    assert parse_byte_range("bytes=0-1,5-9", 1000) is None
+    assert parse_byte_range("items=0-9", 1000) is None
+
+    with pytest.raises(ValueError):
+        parse_byte_range("bytes=1000-", 1000)
+    with pytest.raises(ValueError):
+        parse_byte_range("bytes=-0", 1000)
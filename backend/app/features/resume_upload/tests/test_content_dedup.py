@@ -0,0 +1,73 @@
+"""Tests for reusing the extraction of identical files across uploads."""
+
+import hashlib
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from app.features.resume_upload.service import ResumeUploadService
+from database.models.content import ResumeContent
+
+RESUME_TEXT = "John Doe\nExperience\nAcme Corp (2019-2024)\nSkills\nPython"
+FILE_CONTENT = b"%PDF-1.4 resume bytes"
+FILE_HASH = hashlib.sha256(FILE_CONTENT).hexdigest()
+
+
+@pytest.fixture
+def resume_service():
+    """Resume upload service with a mocked repository."""
+    service = ResumeUploadService(Mock())
+    service.repository = Mock()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_new_file_is_extracted(resume_service):
+    resume_service.repository.get_content = AsyncMock(return_value=None)
+
+    with patch.object(resume_service, "_extract_text", AsyncMock(return_value=RESUME_TEXT)) as extract:
+        text, sections, metrics, reused = await resume_service._get_or_extract_content(
+            FILE_CONTENT, ".pdf", FILE_HASH
+        )
+
+    extract.assert_awaited_once()
+    assert reused is False
+    assert text == RESUME_TEXT
+    assert [section["section_type"] for section in sections] == ["contact", "experience", "skills"]
+    assert metrics["total_sections"] == 2
+
+
+@pytest.mark.asyncio
+async def test_known_file_reuses_stored_extraction(resume_service):
+    stored = ResumeContent(
+        file_hash=FILE_HASH,
+        extracted_text=RESUME_TEXT,
+        sections=[{"section_type": "other", "content": RESUME_TEXT}],
+        text_metrics={"word_count": 9},
+        reference_count=2
+    )
+    resume_service.repository.get_content = AsyncMock(return_value=stored)
+
+    with patch.object(resume_service, "_extract_text", AsyncMock()) as extract:
+        text, sections, metrics, reused = await resume_service._get_or_extract_content(
+            FILE_CONTENT, ".pdf", FILE_HASH
+        )
+
+    extract.assert_not_awaited()
+    assert reused is True
+    assert text == RESUME_TEXT
+    assert sections == stored.sections
+    assert metrics == {"word_count": 9}
+
+
+@pytest.mark.asyncio
+async def test_backfilled_content_gets_sections_and_metrics(resume_service):
+    stored = ResumeContent(file_hash=FILE_HASH, extracted_text=RESUME_TEXT, reference_count=1)
+    resume_service.repository.get_content = AsyncMock(return_value=stored)
+
+    _, sections, metrics, reused = await resume_service._get_or_extract_content(
+        FILE_CONTENT, ".pdf", FILE_HASH
+    )
+
+    assert reused is True
+    assert sections and metrics["word_count"] > 0
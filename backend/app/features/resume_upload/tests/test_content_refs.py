@@ -0,0 +1,117 @@
+"""
+Tests for resume content reference counting (migrations 017, 019 and 020).
+
+Runs the migrations in a scratch schema of the test database, on a minimal
+resumes table; skipped when the database is not reachable.
+"""
+
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+
+from app.core.config import get_test_database_url
+
+asyncpg = pytest.importorskip("asyncpg")
+
+pytestmark = pytest.mark.integration
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[5] / "database" / "migrations"
+MIGRATIONS = [
+    "017_add_resume_contents.sql",
+    "019_require_resume_content.sql",
+    "020_recount_resume_content_refs.sql",
+]
+
+# Same statement as ResumeUploadRepository.save_contents
+SAVE_CONTENT = """
+    INSERT INTO resume_contents (file_hash, extracted_text) VALUES ($1, 'text')
+    ON CONFLICT (file_hash) DO UPDATE SET file_hash = EXCLUDED.file_hash
+"""
+
+
+@pytest.fixture
+async def db():
+    """Connection with search_path set to a scratch schema holding the migrated tables."""
+    schema = f"test_content_refs_{uuid.uuid4().hex[:8]}"
+    url = os.getenv("TEST_DATABASE_URL", get_test_database_url())
+    try:
+        admin = await asyncpg.connect(url, timeout=5)
+    except (OSError, asyncpg.PostgresError) as e:
+        pytest.skip(f"Test database not available: {e}")
+
+    await admin.execute(f"CREATE SCHEMA {schema}")
+    conn = await asyncpg.connect(url, server_settings={"search_path": schema})
+    try:
+        await conn.execute("""
+            CREATE TABLE schema_migrations (version VARCHAR(255) PRIMARY KEY);
+            CREATE TABLE resumes (
+                id UUID PRIMARY KEY,
+                file_hash VARCHAR(64) NOT NULL,
+                extracted_text TEXT,
+                text_metrics JSON,
+                uploaded_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+            );
+        """)
+        yield conn
+    finally:
+        await conn.close()
+        await admin.execute(f"DROP SCHEMA {schema} CASCADE")
+        await admin.close()
+
+
+async def _migrate(conn):
+    for name in MIGRATIONS:
+        await conn.execute((MIGRATIONS_DIR / name).read_text())
+
+
+async def _upload(conn, file_hash: str) -> uuid.UUID:
+    resume_id = uuid.uuid4()
+    async with conn.transaction():
+        await conn.execute(SAVE_CONTENT, file_hash)
+        await conn.execute("INSERT INTO resumes (id, file_hash) VALUES ($1, $2)", resume_id, file_hash)
+    return resume_id
+
+
+async def _references(conn, file_hash: str):
+    return await conn.fetchval("SELECT reference_count FROM resume_contents WHERE file_hash = $1", file_hash)
+
+
+async def test_delete_then_reupload(db):
+    await _migrate(db)
+
+    first = await _upload(db, "a" * 64)
+    await db.execute("DELETE FROM resumes WHERE id = $1", first)
+    assert await _references(db, "a" * 64) is None
+
+    await _upload(db, "a" * 64)
+    await _upload(db, "a" * 64)
+    assert await _references(db, "a" * 64) == 2
+
+
+async def test_uncounted_resume_does_not_drop_reuploaded_content(db):
+    # A pending resume from before 017: no extracted text, so no content row
+    pending = uuid.uuid4()
+    await db.execute("INSERT INTO resumes (id, file_hash) VALUES ($1, $2)", pending, "b" * 64)
+    await _migrate(db)
+
+    live = await _upload(db, "b" * 64)
+    assert await _references(db, "b" * 64) == 2
+
+    await db.execute("DELETE FROM resumes WHERE id = $1", pending)
+    assert await _references(db, "b" * 64) == 1
+
+    # Rewriting the same hash is not a reference change
+    await db.execute("UPDATE resumes SET file_hash = file_hash WHERE id = $1", live)
+    assert await _references(db, "b" * 64) == 1
+
+    await db.execute("DELETE FROM resumes WHERE id = $1", live)
+    assert await _references(db, "b" * 64) is None
+
+
+async def test_resume_without_content_is_rejected(db):
+    await _migrate(db)
+
+    with pytest.raises(asyncpg.ForeignKeyViolationError):
+        await db.execute("INSERT INTO resumes (id, file_hash) VALUES ($1, $2)", uuid.uuid4(), "c" * 64)
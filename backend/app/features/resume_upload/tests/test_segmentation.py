@@ -0,0 +1,88 @@
+"""Unit tests for resume section segmentation."""
+
+from app.features.resume_upload.segmentation import segment_resume
+
+
+ENGLISH_RESUME = """John Doe
+john.doe@example.com | +1 555 123 4567
+
+PROFESSIONAL SUMMARY
+Backend engineer with 8 years of experience.
+
+Work Experience:
+Acme Corp, Senior Engineer (2019-2024)
+- Led the payments team
+
+Education
+BSc Computer Science
+Skills: Python, Go, PostgreSQL
+"""
+
+JAPANESE_RESUME = """職務経歴書
+2025年10月1日現在
+氏名　山田 太郎
+
+■職務要約
+SIerにて10年間、金融系システムの開発に従事。
+【職務経歴】
+2015年4月～現在　株式会社サンプル
+学　歴
+東京大学 工学部
+1. 資格・免許
+基本情報技術者
+"""
+
+
+def _types(sections):
+    return [section["section_type"] for section in sections]
+
+
+def test_english_headers():
+    sections = segment_resume(ENGLISH_RESUME)
+
+    assert _types(sections) == ["contact", "summary", "experience", "education", "skills"]
+    assert sections[2]["section_title"] == "Work Experience:"
+    assert sections[2]["content"] == "Acme Corp, Senior Engineer (2019-2024)\n- Led the payments team"
+    # Header and content on one line
+    assert sections[4]["section_title"] == "Skills"
+    assert sections[4]["content"] == "Python, Go, PostgreSQL"
+    assert [section["sequence_order"] for section in sections] == [0, 1, 2, 3, 4]
+
+
+def test_japanese_headers():
+    sections = segment_resume(JAPANESE_RESUME)
+
+    assert _types(sections) == ["contact", "summary", "experience", "education", "certifications"]
+    assert sections[0]["section_metadata"] == {"detection": "preamble"}
+    assert sections[3]["section_title"] == "学　歴"
+    assert sections[4]["content"] == "基本情報技術者"
+
+
+def test_positions_cover_header_and_content():
+    for section in segment_resume(ENGLISH_RESUME):
+        covered = ENGLISH_RESUME[section["start_position"]:section["end_position"]]
+        assert covered.endswith(section["content"])
+        if section["section_title"]:
+            assert covered.startswith(section["section_title"])
+
+
+def test_pages_from_page_offsets():
+    page_two = ENGLISH_RESUME.index("Education")
+    sections = segment_resume(ENGLISH_RESUME, page_starts=[0, page_two])
+
+    assert [(s["start_page"], s["end_page"]) for s in sections] == [
+        (1, 1), (1, 1), (1, 1), (2, 2), (2, 2)
+    ]
+    assert all(s["start_page"] is None for s in segment_resume(ENGLISH_RESUME))
+
+
+def test_text_without_headers_is_one_section():
+    sections = segment_resume("Experienced engineer.\nLikes distributed systems.")
+
+    assert _types(sections) == ["other"]
+    assert sections[0]["section_metadata"] == {"detection": "none"}
+
+
+def test_empty_text():
+    assert segment_resume("") == []
+    assert segment_resume("  \n ") == []
@@ -0,0 +1,67 @@
+"""Unit tests for the local resume text metrics."""
+
+from app.features.resume_upload.segmentation import segment_resume
+from app.features.resume_upload.text_metrics import compute_text_metrics
+
+
+ENGLISH_RESUME = """John Doe
+john.doe@example.com
+
+Summary
+Backend engineer.
+
+Experience
+Acme Corp, Jan 2019 - Present
+- Cut API latency by 30%
+- Led a team of 5 engineers
+- Wrote the onboarding guide
+Beta Inc, 2015-2018
+
+Education
+BSc Computer Science, 2014/09
+"""
+
+JAPANESE_RESUME = """職務経歴書
+■職務要約
+SIerにて開発に従事。
+■職務経歴
+2015年4月～現在 株式会社サンプル
+・売上を前年比120%に向上
+・10名のチームを統括
+平成27年3月 大学卒業
+"""
+
+
+def test_english_metrics():
+    metrics = compute_text_metrics(ENGLISH_RESUME, segment_resume(ENGLISH_RESUME))
+
+    assert metrics["total_sections"] == 3
+    assert metrics["section_types"] == ["education", "experience", "summary"]
+    assert metrics["bullet_count"] == 3
+    assert metrics["quantified_achievement_count"] == 2
+    assert metrics["date_count"] == 4
+    assert metrics["date_formats"] == ["mon yyyy", "yyyy", "yyyy/mm"]
+    assert metrics["japanese_character_count"] == 0
+    assert metrics["word_count"] == metrics["latin_word_count"]
+    assert metrics["reading_time"] == 1
+
+
+def test_japanese_counts_characters():
+    metrics = compute_text_metrics(JAPANESE_RESUME, segment_resume(JAPANESE_RESUME))
+
+    # Japanese has no spaces, so whitespace splitting would see a handful of "words"
+    assert metrics["japanese_character_count"] > 40
+    assert metrics["word_count"] == metrics["japanese_character_count"] + metrics["latin_word_count"]
+    # Decorated headers ("■職務経歴") are sections, not bullets
+    assert metrics["total_sections"] == 2
+    assert metrics["bullet_count"] == 2
+    assert metrics["quantified_achievement_count"] == 2
+    assert metrics["date_formats"] == ["era", "yyyy年m月"]
+
+
+def test_empty_text():
+    metrics = compute_text_metrics("")
+
+    assert metrics["word_count"] == 0
+    assert metrics["reading_time"] == 0
+    assert metrics["total_sections"] == 0
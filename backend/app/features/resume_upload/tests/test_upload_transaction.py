@@ -0,0 +1,77 @@
+"""Tests for the single-transaction resume upload write path."""
+
+import uuid
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.datetime_utils import utc_now
+from app.features.resume_upload.service import ResumeUploadService
+
+RESUME_TEXT = b"John Doe\nExperience\nAcme Corp (2019-2024)\nSkills\nPython, Go, PostgreSQL" * 3
+
+
+@pytest.fixture
+def session():
+    """Async session mock; flush fills the Python-side defaults like SQLAlchemy does."""
+    session = Mock()
+    # Multi-row INSERTs without RETURNING
+    session.execute = AsyncMock(return_value=Mock(returns_rows=False))
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.refresh = AsyncMock()
+
+    async def flush():
+        resume = session.add.call_args.args[0]
+        resume.id = resume.id or uuid.uuid4()
+        resume.uploaded_at = resume.uploaded_at or utc_now()
+
+    session.flush = AsyncMock(side_effect=flush)
+    return session
+
+
+@pytest.fixture
+def upload_file():
+    file = Mock()
+    file.filename = "resume.txt"
+    file.content_type = "text/plain"
+    file.read = AsyncMock(return_value=RESUME_TEXT)
+    file.seek = AsyncMock()
+    return file
+
+
+async def _upload(service, upload_file):
+    with patch.object(service.repository, "get_content", AsyncMock(return_value=None)), \
+            patch("app.features.resume_upload.service.get_blob_store", return_value=None), \
+            patch("app.features.resume_upload.service.get_embedding_index", return_value=None):
+        return await service.upload_resume(uuid.uuid4(), upload_file, uuid.uuid4())
+
+
+@pytest.mark.asyncio
+async def test_upload_creates_completed_resume_with_one_commit(session, upload_file):
+    service = ResumeUploadService(session)
+
+    result = await _upload(service, upload_file)
+
+    resume = session.add.call_args.args[0]
+    assert resume.status == "completed"
+    assert resume.processed_at is not None
+    assert result.status == "completed"
+    # No status update, no refresh: one commit for content, resume and sections
+    session.commit.assert_awaited_once()
+    session.refresh.assert_not_awaited()
+    assert service.repository.autocommit is True
+
+
+@pytest.mark.asyncio
+async def test_failed_upload_rolls_back_everything(session, upload_file):
+    service = ResumeUploadService(session)
+
+    with patch.object(service.repository, "insert_sections", AsyncMock(side_effect=RuntimeError("db down"))):
+        with pytest.raises(HTTPException):
+            await _upload(service, upload_file)
+
+    session.commit.assert_not_awaited()
+    session.rollback.assert_awaited_once()
+    assert service.repository.autocommit is True
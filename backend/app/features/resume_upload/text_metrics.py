@@ -0,0 +1,109 @@
+"""
+Deterministic resume text metrics.
+
+Computed locally at upload time (microseconds, no LLM call) and stored on
+the resume, then handed to the agents as facts so the LLM only does the
+judgment work:
+
+- Japanese-aware counts: Japanese text has no spaces between words, so
+  kanji/kana are counted per character (文字数) and Latin text per word
+- Sections (from segmentation), bullet points and numbered items
+- Quantified achievements: bullets or lines with numbers and units
+  ("30%", "$2M", "5 engineers", "売上120%", "10名")
+- Dates and the date formats in use (mixing formats is a structure issue)
+"""
+
+import math
+import re
+from typing import Any, Dict, List, Optional
+
+# Reading speeds for the reading_time estimate
+ENGLISH_WORDS_PER_MINUTE = 200
+JAPANESE_CHARACTERS_PER_MINUTE = 500
+
+_CJK_CHARACTER = re.compile(r"[぀-ヿ㐀-䶿一-鿿豈-﫿ｦ-ﾟ]")
+_LATIN_WORD = re.compile(r"[A-Za-z0-9０-９Ａ-Ｚａ-ｚ]+(?:['’.\-][A-Za-z0-9]+)*")
+
+_BULLET = re.compile(r"^\s*(?:[-–—•●○◦▪▫■□◆◇・*+>]|\(?\d{1,2}[.)）]|[①-⑳])\s*\S")
+
+_QUANTIFIED = re.compile(
+    r"\d[\d,.]*\s*(?:%|％|percent|x\b|倍|k\b|m\b|mm\b|million|billion|万|億|千|円|件|名|人|社|"
+    r"users|customers|clients|people|engineers|members|projects|countries|hours|days)"
+    r"|[$¥€£]\s*\d",
+    re.IGNORECASE
+)
+
+# Date formats, most specific first; each date is counted once
+_DATE_FORMATS = (
+    ("yyyy年m月", re.compile(r"(?:19|20)\d{2}\s*年(?:\s*\d{1,2}\s*月)?")),
+    ("era", re.compile(r"(?:令和|平成|昭和)\s*(?:\d{1,2}|元)\s*年(?:\s*\d{1,2}\s*月)?")),
+    ("yyyy/mm", re.compile(r"\b(?:19|20)\d{2}\s*[/.\-]\s*\d{1,2}\b(?![/.\-]\d)")),
+    ("mm/yyyy", re.compile(r"\b\d{1,2}\s*/\s*(?:19|20)\d{2}\b")),
+    ("mon yyyy", re.compile(
+        r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?\s+(?:19|20)\d{2}\b",
+        re.IGNORECASE
+    )),
+    ("yyyy", re.compile(r"(?<![\d/.])(?:19|20)\d{2}(?!\d|[/.]\d)")),
+)
+
+
+def _count_dates(text: str) -> Dict[str, int]:
+    """Count dates per format (a span is matched by one format only)."""
+    counts: Dict[str, int] = {}
+    remaining = text
+    for name, pattern in _DATE_FORMATS:
+        found = len(pattern.findall(remaining))
+        if found:
+            counts[name] = found
+            # Blank out matches so less specific formats do not count them again
+            remaining = pattern.sub(lambda m: " " * len(m.group()), remaining)
+    return counts
+
+
+def compute_text_metrics(text: str, sections: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Compute deterministic metrics for a resume.
+
+    Args:
+        text: Extracted resume text
+        sections: Sections from segment_resume (for the section metrics)
+
+    Returns:
+        word_count (Latin words plus Japanese characters), character_count
+        (non-whitespace), japanese_character_count, latin_word_count,
+        reading_time (minutes), line_count, total_sections, section_types,
+        bullet_count, quantified_achievement_count, date_count and
+        date_formats
+    """
+    text = text or ""
+    lines = [line for line in text.splitlines() if line.strip()]
+
+    japanese_characters = len(_CJK_CHARACTER.findall(text))
+    latin_words = len(_LATIN_WORD.findall(text))
+    reading_minutes = latin_words / ENGLISH_WORDS_PER_MINUTE + japanese_characters / JAPANESE_CHARACTERS_PER_MINUTE
+
+    headed_sections = [
+        section for section in sections or []
+        if (section.get("section_metadata") or {}).get("detection") == "header"
+    ]
+    date_counts = _count_dates(text)
+
+    # Section contents exclude the header lines ("■職務経歴" is no bullet)
+    content_lines = [
+        line for section in sections for line in section["content"].splitlines() if line.strip()
+    ] if sections else lines
+
+    return {
+        "word_count": latin_words + japanese_characters,
+        "character_count": sum(1 for char in text if not char.isspace()),
+        "japanese_character_count": japanese_characters,
+        "latin_word_count": latin_words,
+        "reading_time": max(math.ceil(reading_minutes), 1) if lines else 0,
+        "line_count": len(lines),
+        "total_sections": len(headed_sections),
+        "section_types": sorted({section["section_type"] for section in headed_sections}),
+        "bullet_count": sum(1 for line in content_lines if _BULLET.match(line)),
+        "quantified_achievement_count": sum(1 for line in content_lines if _QUANTIFIED.search(line)),
+        "date_count": sum(date_counts.values()),
+        "date_formats": sorted(date_counts),
+    }
@@ -0,0 +1 @@
+"""Resume full-text and similarity search feature module."""
@@ -0,0 +1,130 @@
+"""
+Resume search API endpoints.
+
+Architecture:
+- Full-text search: API → Service → Repository (tsvector index)
+- Similar resumes: API → Service → in-process embedding index
+"""
+
+import uuid
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_session, get_read_session
+from app.core.dependencies import get_current_user, require_admin
+from .service import ResumeSearchService, SearchUnavailableError
+from .schemas import ResumeSearchResponse, SimilarResumesResponse, ReindexResponse
+from database.models.auth import User
+
+logger = logging.getLogger(__name__)
+router = APIRouter(tags=["search"])
+
+
+# Dependency injection
+async def get_search_service(
+    session: AsyncSession = Depends(get_async_session)
+) -> ResumeSearchService:
+    """Dependency to get resume search service (primary, for writes)."""
+    return ResumeSearchService(session)
+
+
+async def get_search_read_service(
+    session: AsyncSession = Depends(get_read_session)
+) -> ResumeSearchService:
+    """Dependency to get resume search service on the read replica."""
+    return ResumeSearchService(session)
+
+
+@router.get(
+    "/resumes",
+    response_model=ResumeSearchResponse,
+    summary="Search resume contents"
+)
+async def search_resumes(
+    q: str = Query(..., min_length=1, max_length=200, description="Terms that must all appear in the resume"),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    service: ResumeSearchService = Depends(get_search_read_service)
+):
+    """
+    Find candidates whose resumes mention every search term.
+
+    Japanese and English terms can be mixed, e.g. "Salesforce M&A デューデリジェンス".
+    One result per candidate (best-matching resume version), ranked by relevance.
+
+    - Junior recruiters: Only assigned candidates
+    - Senior recruiters/Admin: All candidates
+    """
+    try:
+        results = await service.search(
+            user_id=current_user.id,
+            user_role=current_user.role,
+            query_text=q,
+            limit=limit
+        )
+        return ResumeSearchResponse(query=q, results=results, total_count=len(results))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to search resumes: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to search resumes")
+
+
+@router.get(
+    "/resumes/{resume_id}/similar",
+    response_model=SimilarResumesResponse,
+    summary="Find similar resumes"
+)
+async def get_similar_resumes(
+    resume_id: uuid.UUID,
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_user),
+    service: ResumeSearchService = Depends(get_search_read_service)
+):
+    """
+    Find other candidates' resumes most similar to the given resume.
+
+    Requires the embedding index (SEARCH_EMBEDDINGS_ENABLED). Same visibility
+    rules as full-text search.
+    """
+    try:
+        results = await service.find_similar(
+            resume_id=resume_id,
+            user_id=current_user.id,
+            user_role=current_user.role,
+            limit=limit
+        )
+        if results is None:
+            raise HTTPException(status_code=404, detail="Resume not found")
+
+        return SimilarResumesResponse(resume_id=resume_id, results=results, total_count=len(results))
+
+    except SearchUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to find similar resumes: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to find similar resumes")
+
+
+@router.post(
+    "/reindex",
+    response_model=ReindexResponse,
+    summary="Index resumes missing a search vector"
+)
+async def reindex_resumes(
+    admin: User = Depends(require_admin),
+    service: ResumeSearchService = Depends(get_search_service)
+):
+    """Backfill full-text search vectors for resumes uploaded before indexing existed (admin only)."""
+    try:
+        indexed = await service.reindex()
+        return ReindexResponse(indexed=indexed)
+
+    except Exception as e:
+        logger.error(f"Failed to reindex resumes: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to reindex resumes")
@@ -0,0 +1,273 @@
+"""
+In-process similar-resume index.
+
+CPU-only bag-of-words embeddings: tokens from the search tokenizer are hashed
+into a fixed number of signed buckets (feature hashing), weighted with
+sublinear term frequency and L2-normalized, so cosine similarity is a single
+matrix-vector product over all indexed resumes. No model download or GPU is
+needed and a query over tens of thousands of resumes takes milliseconds.
+
+Disabled unless SEARCH_EMBEDDINGS_ENABLED is set and numpy is installed.
+"""
+
+import asyncio
+import logging
+import math
+import uuid
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+
+from app.core.config import get_settings
+from app.core.database import get_postgres_connection, ROLE_WORKER
+from database.models.resume import Resume
+from .tokenizer import tokenize
+
+# numpy is imported on first use (see _import_numpy) to keep cold starts fast
+np = None
+
+logger = logging.getLogger(__name__)
+
+BUILD_BATCH_SIZE = 500
+_INITIAL_CAPACITY = 1024
+
+
+def _import_numpy() -> bool:
+    """Import numpy on first use; False if it is not installed (similar-resume search disabled)."""
+    global np
+
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return False
+        np = numpy
+    return True
+
+
+class ResumeEmbeddingIndex:
+    """Dense matrix of normalized resume vectors with top-k cosine lookup."""
+
+    def __init__(self, dim: int = 256):
+        """
+        Initialize an empty index.
+
+        Args:
+            dim: Number of hashed feature buckets per vector
+        """
+        if not _import_numpy():
+            raise RuntimeError("numpy is required for the resume embedding index")
+
+        self.dim = dim
+        self.ready = False
+        self._matrix = np.zeros((_INITIAL_CAPACITY, dim), dtype=np.float32)
+        self._resume_ids: List[uuid.UUID] = []
+        self._candidate_ids: List[uuid.UUID] = []
+        self._positions: Dict[uuid.UUID, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._resume_ids)
+
+    def __contains__(self, resume_id: uuid.UUID) -> bool:
+        return resume_id in self._positions
+
+    def embed(self, text: str) -> "np.ndarray":
+        """
+        Embed text as a normalized hashed term-frequency vector.
+
+        Args:
+            text: Resume or query text
+
+        Returns:
+            float32 vector of length ``dim`` (all zeros for empty text)
+        """
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for token, count in Counter(tokenize(text)).items():
+            digest = zlib.crc32(token.encode("utf-8"))
+            sign = 1.0 if digest & 0x80000000 else -1.0
+            vector[digest % self.dim] += sign * (1.0 + math.log(count))
+
+        norm = float(np.linalg.norm(vector))
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def add(self, resume_id: uuid.UUID, candidate_id: uuid.UUID, text: str) -> None:
+        """Add or replace a resume in the index."""
+        vector = self.embed(text)
+
+        position = self._positions.get(resume_id)
+        if position is None:
+            position = len(self._resume_ids)
+            if position == self._matrix.shape[0]:
+                grown = np.zeros((position * 2, self.dim), dtype=np.float32)
+                grown[:position] = self._matrix
+                self._matrix = grown
+            self._resume_ids.append(resume_id)
+            self._candidate_ids.append(candidate_id)
+            self._positions[resume_id] = position
+
+        self._matrix[position] = vector
+
+    def remove(self, resume_id: uuid.UUID) -> bool:
+        """Remove a resume (swap-with-last). Returns False if it was not indexed."""
+        position = self._positions.pop(resume_id, None)
+        if position is None:
+            return False
+
+        last = len(self._resume_ids) - 1
+        if position != last:
+            self._matrix[position] = self._matrix[last]
+            self._resume_ids[position] = self._resume_ids[last]
+            self._candidate_ids[position] = self._candidate_ids[last]
+            self._positions[self._resume_ids[position]] = position
+
+        self._resume_ids.pop()
+        self._candidate_ids.pop()
+        self._matrix[last] = 0.0
+        return True
+
+    def most_similar(
+        self,
+        resume_id: uuid.UUID,
+        limit: int = 10,
+        visible_candidate_ids: Optional[Set[uuid.UUID]] = None
+    ) -> List[Tuple[uuid.UUID, uuid.UUID, float]]:
+        """
+        Find resumes most similar to an indexed resume.
+
+        Other versions of the source candidate's resume are excluded.
+
+        Args:
+            resume_id: Source resume ID
+            limit: Maximum number of results
+            visible_candidate_ids: Restrict results to these candidates (None = no restriction)
+
+        Returns:
+            List of (resume_id, candidate_id, cosine similarity), best first
+        """
+        position = self._positions.get(resume_id)
+        if position is None or limit <= 0:
+            return []
+
+        count = len(self._resume_ids)
+        scores = self._matrix[:count] @ self._matrix[position]
+        source_candidate = self._candidate_ids[position]
+
+        if visible_candidate_ids is None and count > limit * 4:
+            # Unfiltered: partial sort of a small over-fetch is enough
+            top = np.argpartition(-scores, limit * 4)[:limit * 4]
+            order = top[np.argsort(-scores[top])]
+        else:
+            order = np.argsort(-scores)
+
+        results = []
+        for index in order:
+            candidate_id = self._candidate_ids[index]
+            if candidate_id == source_candidate:
+                continue
+            if visible_candidate_ids is not None and candidate_id not in visible_candidate_ids:
+                continue
+            results.append((self._resume_ids[index], candidate_id, float(scores[index])))
+            if len(results) >= limit:
+                break
+        return results
+
+    async def build(self) -> int:
+        """
+        Load every resume with extracted text from the database.
+
+        Runs on the worker pool so a large backfill does not hold API connections.
+
+        Returns:
+            Number of indexed resumes
+        """
+        last_id: Optional[uuid.UUID] = None
+        async with get_postgres_connection(ROLE_WORKER).session_context() as session:
+            while True:
+                query = (
+                    select(Resume.id, Resume.candidate_id, Resume.extracted_text)
+                    .where(Resume.extracted_text.isnot(None))
+                    .order_by(Resume.id)
+                    .limit(BUILD_BATCH_SIZE)
+                )
+                if last_id is not None:
+                    query = query.where(Resume.id > last_id)
+
+                rows = (await session.execute(query)).all()
+                if not rows:
+                    break
+
+                for row in rows:
+                    self.add(row.id, row.candidate_id, row.extracted_text)
+                last_id = rows[-1].id
+
+                # Yield to the event loop between batches
+                await asyncio.sleep(0)
+
+        self.ready = True
+        return len(self)
+
+
+_embedding_index: Optional[ResumeEmbeddingIndex] = None
+_build_task: Optional[asyncio.Task] = None
+
+
+def get_embedding_index() -> Optional[ResumeEmbeddingIndex]:
+    """
+    Get the process-wide embedding index.
+
+    Returns:
+        The index, or None when disabled or numpy is not installed
+    """
+    global _embedding_index
+
+    if _embedding_index is None:
+        settings = get_settings()
+        if not settings.SEARCH_EMBEDDINGS_ENABLED or not _import_numpy():
+            return None
+        _embedding_index = ResumeEmbeddingIndex(dim=settings.SEARCH_EMBEDDING_DIM)
+
+    return _embedding_index
+
+
+async def _build_embedding_index(index: ResumeEmbeddingIndex) -> None:
+    """Build the index, logging instead of raising (similar search stays disabled)."""
+    try:
+        count = await index.build()
+        logger.info(f"Resume embedding index built with {count} resumes")
+    except Exception as e:
+        logger.error(f"Failed to build resume embedding index: {e}")
+
+
+def start_embedding_index_build() -> bool:
+    """
+    Build the embedding index in the background.
+
+    Returns:
+        True if a build was scheduled
+    """
+    global _build_task
+
+    index = get_embedding_index()
+    if index is None:
+        return False
+
+    if _build_task is None or _build_task.done():
+        _build_task = asyncio.create_task(_build_embedding_index(index))
+    return True
+
+
+async def stop_embedding_index_build() -> None:
+    """Cancel a running background build."""
+    global _build_task
+
+    if _build_task is not None and not _build_task.done():
+        _build_task.cancel()
+        try:
+            await _build_task
+        except asyncio.CancelledError:
+            pass
+    _build_task = None
@@ -0,0 +1,170 @@
+"""
+Resume search repository.
+
+Resumes are matched against ``resumes.search_vector`` (GIN indexed, see
+migration 010). Lexemes come from the Japanese-aware tokenizer, so vectors
+are built with ``array_to_tsvector`` and queries are cast straight to
+``tsquery`` instead of going through a PostgreSQL text search configuration.
+"""
+
+import uuid
+from typing import List, Optional, Tuple
+
+from sqlalchemy import cast, func, literal, select, update, Text
+from sqlalchemy.dialects.postgresql import ARRAY, TSQUERY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.features.candidate.repository import CandidateRepository
+from database.models.candidate import Candidate
+from database.models.resume import Resume
+from .tokenizer import build_tsquery, index_tokens
+
+
+def build_search_vector(text: Optional[str]) -> ColumnElement:
+    """
+    SQL expression producing the search vector for a document.
+
+    The lexeme list is bound as a single text[] parameter.
+
+    Args:
+        text: Extracted resume text
+
+    Returns:
+        ``array_to_tsvector(:tokens)`` expression (empty tsvector for empty text)
+    """
+    tokens = index_tokens(text or "")
+    return func.array_to_tsvector(literal(tokens, type_=ARRAY(Text)))
+
+
+class ResumeSearchRepository:
+    """Full-text resume queries with candidate visibility rules applied."""
+
+    REINDEX_BATCH_SIZE = 200
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def search_resumes(
+        self,
+        user_id: uuid.UUID,
+        user_role: str,
+        query_text: str,
+        limit: int = 20
+    ) -> List[Tuple[Resume, Candidate, float]]:
+        """
+        Find candidates whose resumes contain every term of the query.
+
+        Only the best-matching resume version per candidate is returned, and
+        junior recruiters only see their assigned candidates.
+
+        Args:
+            user_id: User ID
+            user_role: User role ('admin', 'senior_recruiter', 'junior_recruiter')
+            query_text: Search input (Japanese, English or mixed)
+            limit: Maximum number of candidates
+
+        Returns:
+            List of (resume, candidate, rank), best first
+        """
+        tsquery_text = build_tsquery(query_text)
+        if not tsquery_text:
+            return []
+
+        tsquery = cast(literal(tsquery_text), TSQUERY)
+        rank = func.ts_rank(Resume.search_vector, tsquery)
+
+        best_per_candidate = CandidateRepository.restrict_to_visible(
+            select(Resume.id.label("resume_id"), rank.label("rank"))
+            .join(Candidate, Candidate.id == Resume.candidate_id)
+            .where(Resume.search_vector.op("@@")(tsquery)),
+            user_id,
+            user_role
+        ).distinct(Resume.candidate_id).order_by(
+            Resume.candidate_id,
+            rank.desc(),
+            Resume.version_number.desc()
+        ).subquery()
+
+        query = (
+            select(Resume, Candidate, best_per_candidate.c.rank)
+            .join(best_per_candidate, Resume.id == best_per_candidate.c.resume_id)
+            .join(Candidate, Candidate.id == Resume.candidate_id)
+            .options(defer(Resume.extracted_text), defer(Resume.search_vector))
+            .order_by(best_per_candidate.c.rank.desc(), Resume.uploaded_at.desc())
+            .limit(limit)
+        )
+
+        result = await self.session.execute(query)
+        return [(row[0], row[1], float(row[2])) for row in result.all()]
+
+    async def get_resumes_with_candidates(
+        self,
+        resume_ids: List[uuid.UUID]
+    ) -> List[Tuple[Resume, Candidate]]:
+        """Load resumes and their candidates by ID (order not preserved)."""
+        if not resume_ids:
+            return []
+
+        query = (
+            select(Resume, Candidate)
+            .join(Candidate, Candidate.id == Resume.candidate_id)
+            .where(Resume.id.in_(resume_ids))
+            .options(defer(Resume.extracted_text), defer(Resume.search_vector))
+        )
+        result = await self.session.execute(query)
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def get_visible_resume(
+        self,
+        resume_id: uuid.UUID,
+        user_id: uuid.UUID,
+        user_role: str
+    ) -> Optional[Resume]:
+        """Get a resume if its candidate is visible to the user."""
+        query = CandidateRepository.restrict_to_visible(
+            select(Resume)
+            .join(Candidate, Candidate.id == Resume.candidate_id)
+            .where(Resume.id == resume_id)
+            .options(defer(Resume.search_vector)),
+            user_id,
+            user_role
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def reindex_missing(self) -> int:
+        """
+        Build search vectors for resumes that do not have one yet.
+
+        Processes batches until no unindexed resume with extracted text remains.
+
+        Returns:
+            Number of resumes indexed
+        """
+        indexed = 0
+        while True:
+            query = (
+                select(Resume.id, Resume.extracted_text)
+                .where(
+                    Resume.search_vector.is_(None),
+                    Resume.extracted_text.isnot(None)
+                )
+                .limit(self.REINDEX_BATCH_SIZE)
+            )
+            rows = (await self.session.execute(query)).all()
+            if not rows:
+                break
+
+            for row in rows:
+                await self.session.execute(
+                    update(Resume)
+                    .where(Resume.id == row.id)
+                    .values(search_vector=build_search_vector(row.extracted_text))
+                )
+            await self.session.commit()
+            indexed += len(rows)
+
+        return indexed
@@ -0,0 +1,38 @@
+"""Resume search schemas."""
+
+import uuid
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+
+from app.features.candidate.schemas import CandidateInfo
+
+
+class ResumeMatch(BaseModel):
+    """A candidate and the resume version that matched."""
+    candidate: CandidateInfo
+    resume_id: uuid.UUID
+    version_number: int
+    original_filename: str
+    uploaded_at: datetime
+    score: float
+
+
+class ResumeSearchResponse(BaseModel):
+    """Response for full-text resume search."""
+    query: str
+    results: List[ResumeMatch]
+    total_count: int
+
+
+class SimilarResumesResponse(BaseModel):
+    """Response for similar-resume lookup."""
+    resume_id: uuid.UUID
+    results: List[ResumeMatch]
+    total_count: int
+
+
+class ReindexResponse(BaseModel):
+    """Response for search reindexing."""
+    indexed: int
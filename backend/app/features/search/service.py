@@ -0,0 +1,113 @@
+"""Resume search service combining full-text and similarity lookups."""
+
+import uuid
+import logging
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.visibility import get_visible_candidate_ids
+from app.features.candidate.schemas import CandidateInfo
+from database.models.candidate import Candidate
+from database.models.resume import Resume
+from .embeddings import get_embedding_index
+from .repository import ResumeSearchRepository
+from .schemas import ResumeMatch
+
+logger = logging.getLogger(__name__)
+
+
+class SearchUnavailableError(Exception):
+    """Raised when the similar-resume index is disabled or still building."""
+    pass
+
+
+class ResumeSearchService:
+    """Service for searching resumes visible to the current user."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize service with database session."""
+        self.session = session
+        self.repository = ResumeSearchRepository(session)
+
+    async def search(
+        self,
+        user_id: uuid.UUID,
+        user_role: str,
+        query_text: str,
+        limit: int = 20
+    ) -> List[ResumeMatch]:
+        """Full-text search over resume contents."""
+        rows = await self.repository.search_resumes(
+            user_id=user_id,
+            user_role=user_role,
+            query_text=query_text,
+            limit=limit
+        )
+        return [self._to_match(resume, candidate, score) for resume, candidate, score in rows]
+
+    async def find_similar(
+        self,
+        resume_id: uuid.UUID,
+        user_id: uuid.UUID,
+        user_role: str,
+        limit: int = 10
+    ) -> Optional[List[ResumeMatch]]:
+        """
+        Find resumes of other candidates similar to a resume.
+
+        Returns:
+            Matches best first, or None if the source resume is not visible to the user
+
+        Raises:
+            SearchUnavailableError: If the embedding index is disabled or not built yet
+        """
+        index = get_embedding_index()
+        if index is None or not index.ready:
+            raise SearchUnavailableError("Similar-resume search is not available")
+
+        source = await self.repository.get_visible_resume(resume_id, user_id, user_role)
+        if source is None:
+            return None
+
+        if source.extracted_text and resume_id not in index:
+            index.add(source.id, source.candidate_id, source.extracted_text)
+
+        visible = await get_visible_candidate_ids(self.session, user_id, user_role)
+        hits = index.most_similar(resume_id, limit=limit, visible_candidate_ids=visible)
+        if not hits:
+            return []
+
+        rows = await self.repository.get_resumes_with_candidates([hit[0] for hit in hits])
+        by_id = {resume.id: (resume, candidate) for resume, candidate in rows}
+
+        matches = []
+        for hit_id, _candidate_id, score in hits:
+            row = by_id.get(hit_id)
+            if row is None:
+                # Deleted since it was indexed
+                index.remove(hit_id)
+                continue
+            resume, candidate = row
+            if candidate.status != 'active':
+                continue
+            matches.append(self._to_match(resume, candidate, score))
+        return matches
+
+    async def reindex(self) -> int:
+        """Build search vectors for resumes uploaded before full-text search existed."""
+        indexed = await self.repository.reindex_missing()
+        logger.info(f"Indexed {indexed} resumes for full-text search")
+        return indexed
+
+    @staticmethod
+    def _to_match(resume: Resume, candidate: Candidate, score: float) -> ResumeMatch:
+        """Convert a resume/candidate pair to a search result."""
+        return ResumeMatch(
+            candidate=CandidateInfo.from_orm(candidate),
+            resume_id=resume.id,
+            version_number=resume.version_number,
+            original_filename=resume.original_filename,
+            uploaded_at=resume.uploaded_at,
+            score=round(score, 4)
+        )
@@ -0,0 +1,69 @@
+"""Unit tests for the resume search tokenizer."""
+
+from app.features.search.tokenizer import build_tsquery, index_tokens, tokenize
+
+
+class TestTokenize:
+    """Test tokenization of Japanese, English and mixed text."""
+
+    def test_latin_words_are_lowercased(self):
+        """Test ASCII words become lower-case tokens."""
+        assert tokenize("Salesforce Admin") == ["salesforce", "admin"]
+
+    def test_inner_symbols_are_kept(self):
+        """Test terms like M&A, C++ and Node.js survive tokenization."""
+        assert tokenize("M&A, C++ and Node.js") == ["m&a", "c++", "and", "node.js"]
+
+    def test_fullwidth_text_is_normalized(self):
+        """Test full-width ASCII is folded by NFKC."""
+        assert tokenize("ＳＡＬＥＳＦＯＲＣＥ") == ["salesforce"]
+
+    def test_cjk_runs_become_bigrams(self):
+        """Test Japanese runs are split into overlapping bigrams."""
+        assert tokenize("財務分析") == ["財務", "務分", "分析"]
+
+    def test_single_cjk_character_is_kept(self):
+        """Test a one-character run is its own token."""
+        assert tokenize("A社") == ["a", "社"]
+
+    def test_mixed_text(self):
+        """Test Japanese and English in one string."""
+        assert tokenize("Salesforce導入") == ["salesforce", "導入"]
+
+    def test_empty_text(self):
+        """Test empty input produces no tokens."""
+        assert tokenize("") == []
+        assert tokenize("、。！") == []
+
+
+class TestIndexTokens:
+    """Test index token de-duplication."""
+
+    def test_tokens_are_deduplicated_in_order(self):
+        """Test duplicates are removed keeping first-seen order."""
+        assert index_tokens("sql python sql") == ["sql", "python"]
+
+
+class TestBuildTsquery:
+    """Test tsquery construction."""
+
+    def test_terms_are_anded(self):
+        """Test every token is required."""
+        assert build_tsquery("Salesforce M&A") == "'salesforce' & 'm&a'"
+
+    def test_japanese_query_matches_document_bigrams(self):
+        """Test a Japanese query uses the same bigrams as indexed text."""
+        query = build_tsquery("デューデリジェンス")
+        document = set(index_tokens("M&Aのデューデリジェンスを担当"))
+
+        lexemes = [part.strip("'") for part in query.split(" & ")]
+        assert lexemes
+        assert all(lexeme in document for lexeme in lexemes)
+
+    def test_quotes_are_escaped(self):
+        """Test quote characters cannot break out of a lexeme."""
+        assert build_tsquery("o'reilly") == "'o' & 'reilly'"
+
+    def test_empty_query(self):
+        """Test a query without tokens produces an empty string."""
+        assert build_tsquery("   ") == ""
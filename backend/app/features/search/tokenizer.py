@@ -0,0 +1,93 @@
+"""
+Japanese-aware tokenizer for resume full-text search.
+
+PostgreSQL ships no Japanese text search parser, so tokenization happens here
+and the resulting lexemes are stored verbatim with ``array_to_tsvector``:
+
+- Text is NFKC-normalized (full-width ASCII/katakana folded) and lower-cased.
+- Latin/number runs become word tokens, keeping inner ``& . + # / -`` so
+  terms like ``m&a``, ``c++`` and ``node.js`` survive.
+- CJK runs (kanji, hiragana, katakana) become overlapping character bigrams,
+  so any Japanese substring query of two or more characters matches.
+
+Queries go through the same tokenizer and every token is ANDed.
+"""
+
+from typing import List
+import re
+import unicodedata
+
+# Upper bound on distinct lexemes stored per document (tsvector limit is 1MB)
+MAX_INDEX_TOKENS = 20000
+MAX_QUERY_TOKENS = 64
+
+_TOKEN_PATTERN = re.compile(
+    r"(?P<latin>[a-z0-9][a-z0-9+#]*(?:[&./\-][a-z0-9+#]+)*)"
+    r"|(?P<cjk>[぀-ゟ゠-ヿ㐀-䶿一-鿿豈-﫿ー]+)"
+)
+
+
+def normalize_text(text: str) -> str:
+    """NFKC-normalize and lower-case text."""
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def _cjk_bigrams(run: str) -> List[str]:
+    """Split a CJK run into overlapping bigrams (single char runs kept as-is)."""
+    if len(run) == 1:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Tokenize text into search lexemes, in document order.
+
+    Args:
+        text: Raw text (Japanese, English or mixed)
+
+    Returns:
+        List of lexemes (may contain duplicates)
+    """
+    if not text:
+        return []
+
+    tokens: List[str] = []
+    for match in _TOKEN_PATTERN.finditer(normalize_text(text)):
+        if match.group("latin"):
+            tokens.append(match.group("latin"))
+        else:
+            tokens.extend(_cjk_bigrams(match.group("cjk")))
+    return tokens
+
+
+def index_tokens(text: str) -> List[str]:
+    """
+    Distinct lexemes for indexing a document.
+
+    Args:
+        text: Document text
+
+    Returns:
+        De-duplicated lexemes in first-seen order, bounded by MAX_INDEX_TOKENS
+    """
+    return list(dict.fromkeys(tokenize(text)))[:MAX_INDEX_TOKENS]
+
+
+def _quote_lexeme(token: str) -> str:
+    """Quote a lexeme for a tsquery literal."""
+    return "'" + token.replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+def build_tsquery(query: str) -> str:
+    """
+    Build a tsquery literal matching documents containing every query token.
+
+    Args:
+        query: User search input, e.g. "Salesforce M&A デューデリジェンス"
+
+    Returns:
+        tsquery text to cast with ``::tsquery`` (empty string if no tokens)
+    """
+    tokens = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TOKENS]
+    return " & ".join(_quote_lexeme(token) for token in tokens)
@@ -3,12 +3,17 @@ FastAPI main application for AI Resume Review Platform.
 Implements secure authentication with rate limiting and comprehensive security features.
 """
 
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, status
+# Import-time reference for the startup report (see lifespan)
+_IMPORT_STARTED = time.perf_counter()
+
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -16,10 +21,22 @@ from starlette.middleware.base import BaseHTTPMiddleware
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
-from database.connection import init_database, close_database, get_db_health
 from app.core.rate_limiter import rate_limiter
-from app.core.security import SecurityError
+from app.core.rate_limit_middleware import RateLimitMiddleware
+from app.core.security import SecurityError, set_redis_client_for_tokens
+from app.core.cache import (
+    init_redis,
+    close_redis,
+    get_redis_connection,
+    start_invalidation_listener,
+    stop_invalidation_listener,
+)
+from app.core.metrics import render_metrics, STARTUP_PHASE_SECONDS
+from app.core.health import get_database_health
+from app.core.warmup import start_warmup, stop_warmup, is_warm, get_warmup_status
+from app.core.datetime_utils import utc_now
 from app.core.config import get_settings
+from app.core.dependencies import require_metrics_token
 
 settings = get_settings()
 
@@ -31,38 +48,82 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def _init_shared_redis():
+    """Initialize shared Redis pools (optional - graceful degradation)."""
+    try:
+        await init_redis()
+        redis_factory = get_redis_connection().factory
+        set_redis_client_for_tokens(redis_factory.get_client(db=settings.REDIS_TOKEN_DB))
+        await start_invalidation_listener(get_redis_connection().binary_client)
+        logger.info("✓ Redis initialized (cache, token blacklist)")
+    except Exception as e:
+        logger.warning(f"⚠ Redis initialization failed: {e}")
+        logger.warning("  Continuing without Redis-backed cache and token blacklist")
+
+
+async def _init_rate_limiter():
+    """Initialize rate limiter (optional - graceful degradation)."""
+    try:
+        await rate_limiter.connect()
+        if rate_limiter.redis_client:
+            logger.info("✓ Rate limiter initialized with Redis")
+        else:
+            logger.warning("⚠ Rate limiter running without Redis (rate limiting disabled)")
+    except Exception as e:
+        logger.warning(f"⚠ Rate limiter initialization failed: {e}")
+        logger.warning("  Continuing without rate limiting (acceptable for MVP)")
+
+
+async def _init_database():
+    """Initialize async database engines and check the environment (required)."""
+    from app.core.database import init_postgres, validate_database_environment
+    await init_postgres()
+    logger.info("PostgreSQL async connection initialized")
+
+    # Critical safety check: validate environment matches database
+    await validate_database_environment()
+    logger.info("Database environment validation completed")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     logger.info("Starting AI Resume Review Platform Backend")
+    init_started = time.perf_counter()
     
     try:
-        # Initialize database
-        init_database()
-        logger.info("Database initialized")
-
-        # Initialize rate limiter (optional - graceful degradation)
-        try:
-            await rate_limiter.connect()
-            if rate_limiter.redis_client:
-                logger.info("✓ Rate limiter initialized with Redis")
-            else:
-                logger.warning("⚠ Rate limiter running without Redis (rate limiting disabled)")
-        except Exception as e:
-            logger.warning(f"⚠ Rate limiter initialization failed: {e}")
-            logger.warning("  Continuing without rate limiting (acceptable for MVP)")
-
-        # Initialize async infrastructure
-        from app.core.database import init_postgres, validate_database_environment
-        await init_postgres()
-        logger.info("PostgreSQL async connection initialized")
-
-        # Critical safety check: validate environment matches database
-        await validate_database_environment()
-        logger.info("Database environment validation completed")
+        # Independent connections are set up concurrently; only the
+        # database is required, so its failure aborts startup
+        await asyncio.gather(
+            _init_shared_redis(),
+            _init_rate_limiter(),
+            _init_database()
+        )
 
-        logger.info("Application startup completed successfully")
+        # Similar-resume index (optional - built in the background)
+        from app.features.search.embeddings import start_embedding_index_build
+        if start_embedding_index_build():
+            logger.info("Resume embedding index build started")
+
+        # AI config/prompt hot reload (optional - polls the files)
+        from ai_agents.config.registry import start_config_watcher
+        if start_config_watcher():
+            logger.info("AI config watcher started")
+
+        # Warm pools and AI assets in the background; the startup and
+        # readiness probes report ready once it finished
+        if start_warmup():
+            logger.info("Warm-up started")
+
+        ready = time.perf_counter()
+        STARTUP_PHASE_SECONDS.labels(phase="import").set(_IMPORTS_SECONDS)
+        STARTUP_PHASE_SECONDS.labels(phase="init").set(ready - init_started)
+        STARTUP_PHASE_SECONDS.labels(phase="total").set(ready - _IMPORT_STARTED)
+        logger.info(
+            f"Application startup completed successfully in {ready - _IMPORT_STARTED:.2f}s "
+            f"(imports {_IMPORTS_SECONDS:.2f}s, init {ready - init_started:.2f}s)"
+        )
         
     except Exception as e:
         logger.error(f"Application startup failed: {e}")
@@ -74,6 +135,14 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down AI Resume Review Platform Backend")
 
     try:
+        await stop_warmup()
+
+        from app.features.search.embeddings import stop_embedding_index_build
+        await stop_embedding_index_build()
+
+        from ai_agents.config.registry import stop_config_watcher
+        await stop_config_watcher()
+
         # Close rate limiter (if connected)
         try:
             await rate_limiter.disconnect()
@@ -81,8 +150,16 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Error disconnecting rate limiter: {e}")
 
+        # Close shared Redis pools
+        try:
+            await stop_invalidation_listener()
+            await close_redis()
+        except Exception as e:
+            logger.warning(f"Error closing Redis: {e}")
+
         # Close database
-        close_database()
+        from app.core.database import close_postgres
+        await close_postgres()
         logger.info("Database connections closed")
 
     except Exception as e:
@@ -155,6 +232,11 @@ allowed_origins = [origin.strip() for origin in allowed_origins_str.split(",") i
 logger.info(f"CORS enabled for {len(allowed_origins)} origins")
 logger.debug(f"Allowed CORS origins: {allowed_origins}")
 
+# Rate limiting runs inside CORS so 429 responses still carry CORS headers.
+# Policies are resolved from a route table compiled at startup, and rejected
+# requests never reach body parsing or dependency resolution.
+app.add_middleware(RateLimitMiddleware, routes=app.routes)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -207,6 +289,7 @@ from app.features.resume_upload.api import router as resume_upload_router
 from app.features.resume_analysis.api import router as analysis_router
 from app.features.admin.api import router as admin_router
 from app.features.profile.api import router as profile_router
+from app.features.search.api import router as search_router
 
 app.include_router(auth_router, prefix="/api/v1/auth", tags=["auth"])
 app.include_router(profile_router, prefix="/api/v1/profile", tags=["profile"])
@@ -214,9 +297,14 @@ app.include_router(candidate_router, prefix="/api/v1/candidates", tags=["candida
 app.include_router(resume_upload_router, prefix="/api/v1/resume_upload", tags=["resumes"])
 app.include_router(analysis_router, prefix="/api/v1/analysis", tags=["analysis"])
 app.include_router(admin_router, prefix="/api/v1/admin", tags=["admin"])
+app.include_router(search_router, prefix="/api/v1/search", tags=["search"])
 
 logger.info("All API routes registered successfully")
 
+# Module import including every feature router (see
+# scripts/gcp/utils/profile_startup.py for a per-module breakdown)
+_IMPORTS_SECONDS = time.perf_counter() - _IMPORT_STARTED
+
 # Global exception handlers
 @app.exception_handler(Exception)
 async def handle_exceptions(request: Request, exc: Exception):
@@ -256,6 +344,58 @@ async def handle_exceptions(request: Request, exc: Exception):
 
 
 # Health check endpoints
+@app.get("/health/live", tags=["Health"])
+async def liveness():
+    """
+    Liveness probe.
+
+    Only reports that the process serves requests; dependencies are not
+    checked, so a database outage does not get instances restarted.
+    """
+    return {"status": "alive"}
+
+
+@app.get("/health/startup", tags=["Health"])
+async def startup_probe():
+    """
+    Startup probe (Cloud Run).
+
+    Returns 503 until the warm-up finished, so the first request an
+    instance receives sees warm pools, prompts and LLM connection.
+    """
+    warmup = get_warmup_status()
+    if not is_warm():
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "warming_up", "warmup": warmup}
+        )
+    return {"status": "started", "warmup": warmup}
+
+
+@app.get("/health/ready", tags=["Health"])
+async def readiness():
+    """
+    Readiness probe.
+
+    Returns 503 until the warm-up finished and while the database is
+    unreachable. The database probe is cached for a few seconds
+    (HEALTH_CACHE_SECONDS).
+    """
+    if not is_warm():
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "warming_up", "warmup": get_warmup_status()}
+        )
+
+    db_health = await get_database_health()
+    if db_health["status"] != "healthy":
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "not_ready", "database": db_health}
+        )
+    return {"status": "ready", "database": db_health}
+
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """
@@ -264,13 +404,14 @@ async def health_check():
     Returns the current status of the application and its dependencies.
     """
     try:
-        # Check database health
-        db_health = get_db_health()
+        # Check database health (cached async probe)
+        db_health = await get_database_health()
         
         # Check rate limiter health
         rate_limiter_health = {
             "status": "healthy" if rate_limiter.redis_client else "unavailable",
-            "redis_connected": rate_limiter.redis_client is not None
+            "redis_connected": rate_limiter.redis_client is not None,
+            "pools": get_redis_connection().factory.pool_stats()
         }
         
         overall_status = "healthy"
@@ -279,7 +420,7 @@ async def health_check():
         
         return {
             "status": overall_status,
-            "timestamp": "2024-11-30T12:00:00Z",  # Would use datetime.utcnow().isoformat()
+            "timestamp": utc_now().isoformat(),
             "version": "1.0.0",
             "services": {
                 "database": db_health,
@@ -299,6 +440,13 @@ async def health_check():
         )
 
 
+@app.get("/metrics", tags=["Health"], include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+async def metrics():
+    """Prometheus metrics (connection pool saturation, etc.), behind METRICS_TOKEN."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """
@@ -0,0 +1,119 @@
+-- Migration: 009_add_search_indexes_and_assignment_stats
+-- Description: Indexed prefix/fuzzy search for users and candidates, denormalized assignment counts
+-- Date: 2025-10-20
+-- Related: Admin user list and candidate search
+-- Purpose: Replace ilike('%term%') sequential scans and per-query GROUP BY over assignments
+
+BEGIN;
+
+-- ============================================================================
+-- SECTION 1: Trigram search columns and indexes
+-- ============================================================================
+
+-- 1.1: pg_trgm provides similarity operators and GIN operator classes
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 1.2: Normalized search text for users (email + name)
+-- Generated column keeps the index expression in one place and is maintained by PostgreSQL
+ALTER TABLE users ADD COLUMN IF NOT EXISTS search_text TEXT
+    GENERATED ALWAYS AS (lower(email || ' ' || first_name || ' ' || last_name)) STORED;
+
+-- 1.3: Normalized search text for candidates (email + name + company)
+ALTER TABLE candidates ADD COLUMN IF NOT EXISTS search_text TEXT
+    GENERATED ALWAYS AS (
+        lower(coalesce(email, '') || ' ' || first_name || ' ' || last_name || ' ' || coalesce(current_company, ''))
+    ) STORED;
+
+-- 1.4: GIN trigram indexes serve ILIKE '%term%', prefix and word-similarity (<%) lookups
+CREATE INDEX IF NOT EXISTS idx_users_search_trgm ON users USING GIN (search_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_candidates_search_trgm ON candidates USING GIN (search_text gin_trgm_ops);
+
+COMMENT ON COLUMN users.search_text IS 'Lower-cased email and name for trigram search (generated)';
+COMMENT ON COLUMN candidates.search_text IS 'Lower-cased email, name and company for trigram search (generated)';
+
+-- ============================================================================
+-- SECTION 2: Denormalized active assignment counts
+-- ============================================================================
+
+-- 2.1: One row per user holding the number of active candidate assignments
+-- Kept out of the users table so counter updates do not touch users.updated_at
+CREATE TABLE IF NOT EXISTS user_assignment_stats (
+    user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    active_assignment_count INTEGER NOT NULL DEFAULT 0 CHECK (active_assignment_count >= 0),
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE user_assignment_stats IS 'Denormalized per-user assignment counters maintained by trigger';
+COMMENT ON COLUMN user_assignment_stats.active_assignment_count IS 'Number of active rows in user_candidate_assignments for the user';
+
+-- 2.2: Trigger function keeping the counter in sync with assignment changes
+CREATE OR REPLACE FUNCTION maintain_user_assignment_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        IF OLD.is_active THEN
+            UPDATE user_assignment_stats
+            SET active_assignment_count = active_assignment_count - 1,
+                updated_at = NOW()
+            WHERE user_id = OLD.user_id;
+        END IF;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        IF NEW.is_active THEN
+            INSERT INTO user_assignment_stats (user_id, active_assignment_count)
+            VALUES (NEW.user_id, 1)
+            ON CONFLICT (user_id) DO UPDATE
+            SET active_assignment_count = user_assignment_stats.active_assignment_count + 1,
+                updated_at = NOW();
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_user_assignment_stats ON user_candidate_assignments;
+CREATE TRIGGER trg_user_assignment_stats
+    AFTER INSERT OR DELETE OR UPDATE OF is_active, user_id ON user_candidate_assignments
+    FOR EACH ROW EXECUTE FUNCTION maintain_user_assignment_stats();
+
+-- 2.3: Backfill counters from existing assignments
+INSERT INTO user_assignment_stats (user_id, active_assignment_count)
+SELECT u.id, COUNT(a.id) FILTER (WHERE a.is_active)
+FROM users u
+LEFT JOIN user_candidate_assignments a ON a.user_id = u.id
+GROUP BY u.id
+ON CONFLICT (user_id) DO UPDATE
+SET active_assignment_count = EXCLUDED.active_assignment_count,
+    updated_at = NOW();
+
+-- ============================================================================
+-- SECTION 3: Verify data integrity
+-- ============================================================================
+
+DO $$
+DECLARE
+    mismatch_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO mismatch_count
+    FROM user_assignment_stats s
+    WHERE s.active_assignment_count <> (
+        SELECT COUNT(*) FROM user_candidate_assignments a
+        WHERE a.user_id = s.user_id AND a.is_active
+    );
+
+    IF mismatch_count > 0 THEN
+        RAISE EXCEPTION 'Found % users with mismatched assignment counts after backfill.', mismatch_count;
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
+
+-- Record this migration
+INSERT INTO schema_migrations (version) VALUES ('009_add_search_indexes_and_assignment_stats')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- Rollback Migration 009: Remove search indexes and assignment stats
+-- Date: 2025-10-20
+--
+-- The pg_trgm extension is left installed; drop it manually if nothing else uses it:
+--   DROP EXTENSION IF EXISTS pg_trgm;
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS trg_user_assignment_stats ON user_candidate_assignments;
+DROP FUNCTION IF EXISTS maintain_user_assignment_stats();
+DROP TABLE IF EXISTS user_assignment_stats;
+
+DROP INDEX IF EXISTS idx_users_search_trgm;
+DROP INDEX IF EXISTS idx_candidates_search_trgm;
+
+ALTER TABLE users DROP COLUMN IF EXISTS search_text;
+ALTER TABLE candidates DROP COLUMN IF EXISTS search_text;
+
+DELETE FROM schema_migrations WHERE version = '009_add_search_indexes_and_assignment_stats';
+
+COMMIT;
@@ -0,0 +1,47 @@
+-- Migration: 010_add_resume_search_vector
+-- Description: Full-text search vector over resume extracted text
+-- Date: 2025-10-21
+-- Related: Resume search API (/api/v1/search)
+-- Purpose: Let recruiters search resume contents (Japanese and English) without opening every file
+
+BEGIN;
+
+-- ============================================================================
+-- SECTION 1: Search vector column and index
+-- ============================================================================
+
+-- 1.1: Lexemes are produced by the application tokenizer (NFKC, lower-case,
+-- CJK character bigrams) and stored with array_to_tsvector, because PostgreSQL
+-- has no built-in Japanese parser. NULL means "not indexed yet".
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS search_vector TSVECTOR;
+
+COMMENT ON COLUMN resumes.search_vector IS 'Full-text lexemes from extracted_text (application tokenizer); NULL until indexed';
+
+-- 1.2: GIN index serves @@ tsquery matches
+CREATE INDEX IF NOT EXISTS idx_resumes_search_vector ON resumes USING GIN (search_vector);
+
+-- Existing resumes are indexed by POST /api/v1/search/reindex (tokenization runs in the application)
+
+-- ============================================================================
+-- SECTION 2: Verify schema
+-- ============================================================================
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_indexes
+        WHERE tablename = 'resumes' AND indexname = 'idx_resumes_search_vector'
+    ) THEN
+        RAISE EXCEPTION 'Index idx_resumes_search_vector was not created.';
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
+
+-- Record this migration
+INSERT INTO schema_migrations (version) VALUES ('010_add_resume_search_vector')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
@@ -0,0 +1,12 @@
+-- Rollback Migration 010: Remove resume search vector
+-- Date: 2025-10-21
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_resumes_search_vector;
+
+ALTER TABLE resumes DROP COLUMN IF EXISTS search_vector;
+
+DELETE FROM schema_migrations WHERE version = '010_add_resume_search_vector';
+
+COMMIT;
@@ -0,0 +1,54 @@
+-- Migration: 011_add_candidate_keyset_indexes
+-- Description: Indexes matching candidate list filters and keyset sort order
+-- Date: 2025-10-21
+-- Related: Cursor pagination for GET /api/v1/candidates
+-- Purpose: Serve each candidate list page with an index range scan instead of sort + OFFSET
+
+BEGIN;
+
+-- ============================================================================
+-- SECTION 1: Active candidates (admin / senior recruiter path)
+-- ============================================================================
+
+-- 1.1: Partial index in exact list order; a keyset seek on (created_at, id)
+-- reads only the rows of the requested page
+CREATE INDEX IF NOT EXISTS idx_candidates_active_created_id
+    ON candidates (created_at DESC, id DESC)
+    WHERE status = 'active';
+
+-- ============================================================================
+-- SECTION 2: Active assignments (junior recruiter path)
+-- ============================================================================
+
+-- 2.1: Covering partial index: the join reads candidate IDs for a user from
+-- the index alone (index-only scan) without visiting inactive assignments
+CREATE INDEX IF NOT EXISTS idx_assignments_user_active_candidate
+    ON user_candidate_assignments (user_id, candidate_id)
+    WHERE is_active = true;
+
+-- ============================================================================
+-- SECTION 3: Verify schema
+-- ============================================================================
+
+DO $$
+DECLARE
+    missing_count INTEGER;
+BEGIN
+    SELECT 2 - COUNT(*) INTO missing_count
+    FROM pg_indexes
+    WHERE indexname IN ('idx_candidates_active_created_id', 'idx_assignments_user_active_candidate');
+
+    IF missing_count > 0 THEN
+        RAISE EXCEPTION 'Keyset pagination indexes were not created.';
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
+
+-- Record this migration
+INSERT INTO schema_migrations (version) VALUES ('011_add_candidate_keyset_indexes')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
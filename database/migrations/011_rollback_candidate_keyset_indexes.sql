@@ -0,0 +1,11 @@
+-- Rollback Migration 011: Remove candidate keyset indexes
+-- Date: 2025-10-21
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_assignments_user_active_candidate;
+DROP INDEX IF EXISTS idx_candidates_active_created_id;
+
+DELETE FROM schema_migrations WHERE version = '011_add_candidate_keyset_indexes';
+
+COMMIT;
@@ -0,0 +1,59 @@
+-- Migration: 012_add_feedback_item_analytics
+-- Description: Accept AI feedback categories and index review_feedback_items for aggregation
+-- Date: 2025-10-21
+-- Related: Per-item feedback storage (GET /api/v1/analysis/stats/feedback)
+-- Purpose: Count feedback by category/type per industry with index scans instead of parsing detailed_scores JSON
+
+BEGIN;
+
+-- ============================================================================
+-- SECTION 1: Category constraint
+-- ============================================================================
+
+-- 1.1: Keep the categories emitted by the AI agents (v1.1 specific_feedback)
+-- next to the original ones
+ALTER TABLE review_feedback_items DROP CONSTRAINT IF EXISTS chk_feedback_category;
+ALTER TABLE review_feedback_items ADD CONSTRAINT chk_feedback_category
+    CHECK (category IN (
+        'content', 'formatting', 'keywords', 'grammar',
+        'structure', 'scr_framework', 'quantitative_impact', 'appeal_point'
+    ));
+
+-- ============================================================================
+-- SECTION 2: Indexes
+-- ============================================================================
+
+-- 2.1: Group/filter by category and feedback type in one index
+CREATE INDEX IF NOT EXISTS idx_feedback_category_type
+    ON review_feedback_items (category, feedback_type);
+
+-- 2.2: Per-industry filter on the requests side of the join
+CREATE INDEX IF NOT EXISTS idx_review_requests_industry
+    ON review_requests (target_industry);
+
+-- ============================================================================
+-- SECTION 3: Verify schema
+-- ============================================================================
+
+DO $$
+DECLARE
+    missing_count INTEGER;
+BEGIN
+    SELECT 2 - COUNT(*) INTO missing_count
+    FROM pg_indexes
+    WHERE indexname IN ('idx_feedback_category_type', 'idx_review_requests_industry');
+
+    IF missing_count > 0 THEN
+        RAISE EXCEPTION 'Feedback analytics indexes were not created.';
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
+
+-- Record this migration
+INSERT INTO schema_migrations (version) VALUES ('012_add_feedback_item_analytics')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
@@ -0,0 +1,20 @@
+-- Rollback Migration 012: Remove feedback analytics indexes and AI categories
+-- Date: 2025-10-21
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_review_requests_industry;
+DROP INDEX IF EXISTS idx_feedback_category_type;
+
+-- Fold AI agent categories back into the original set before restoring the check
+UPDATE review_feedback_items SET category = 'formatting' WHERE category = 'structure';
+UPDATE review_feedback_items SET category = 'content'
+    WHERE category IN ('scr_framework', 'quantitative_impact', 'appeal_point');
+
+ALTER TABLE review_feedback_items DROP CONSTRAINT IF EXISTS chk_feedback_category;
+ALTER TABLE review_feedback_items ADD CONSTRAINT chk_feedback_category
+    CHECK (category IN ('content', 'formatting', 'keywords', 'grammar'));
+
+DELETE FROM schema_migrations WHERE version = '012_add_feedback_item_analytics';
+
+COMMIT;
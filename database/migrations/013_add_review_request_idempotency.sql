@@ -0,0 +1,61 @@
+-- Migration: 013_add_review_request_idempotency
+-- Description: Idempotency keys and in-flight lookup for review requests
+-- Date: 2025-10-21
+-- Related: POST /api/v1/analysis/resumes/{resume_id}/analyze (Idempotency-Key header)
+-- Purpose: Return the existing request for retried or duplicate analysis submissions instead of queueing another AI run
+
+BEGIN;
+
+-- ============================================================================
+-- SECTION 1: New columns
+-- ============================================================================
+
+-- 1.1: Prompt version the analysis runs with (part of the duplicate key)
+ALTER TABLE review_requests ADD COLUMN IF NOT EXISTS prompt_version VARCHAR(20);
+
+-- 1.2: Client-supplied idempotency key
+ALTER TABLE review_requests ADD COLUMN IF NOT EXISTS idempotency_key VARCHAR(255);
+
+-- ============================================================================
+-- SECTION 2: Indexes
+-- ============================================================================
+
+-- 2.1: One request per (user, key); concurrent retries fail on insert and
+-- read the winner's row
+CREATE UNIQUE INDEX IF NOT EXISTS uq_review_requests_user_idempotency_key
+    ON review_requests (requested_by_user_id, idempotency_key)
+    WHERE idempotency_key IS NOT NULL;
+
+-- 2.2: Pending/processing duplicate lookup (small partial index: only
+-- in-flight rows are indexed)
+CREATE INDEX IF NOT EXISTS idx_review_requests_in_flight
+    ON review_requests (resume_id, target_industry, prompt_version)
+    WHERE status IN ('pending', 'processing');
+
+-- ============================================================================
+-- SECTION 3: Verify schema
+-- ============================================================================
+
+DO $$
+DECLARE
+    missing_count INTEGER;
+BEGIN
+    SELECT 2 - COUNT(*) INTO missing_count
+    FROM information_schema.columns
+    WHERE table_name = 'review_requests'
+    AND column_name IN ('prompt_version', 'idempotency_key');
+
+    IF missing_count > 0 THEN
+        RAISE EXCEPTION 'review_requests idempotency columns were not created.';
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
+
+-- Record this migration
+INSERT INTO schema_migrations (version) VALUES ('013_add_review_request_idempotency')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
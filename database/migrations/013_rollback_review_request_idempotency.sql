@@ -0,0 +1,14 @@
+-- Rollback Migration 013: Remove review request idempotency keys
+-- Date: 2025-10-21
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_review_requests_in_flight;
+DROP INDEX IF EXISTS uq_review_requests_user_idempotency_key;
+
+ALTER TABLE review_requests DROP COLUMN IF EXISTS idempotency_key;
+ALTER TABLE review_requests DROP COLUMN IF EXISTS prompt_version;
+
+DELETE FROM schema_migrations WHERE version = '013_add_review_request_idempotency';
+
+COMMIT;
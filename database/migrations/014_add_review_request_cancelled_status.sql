@@ -0,0 +1,40 @@
+-- Migration: 014_add_review_request_cancelled_status
+-- Description: Allow 'cancelled' as a review request status
+-- Date: 2025-10-21
+-- Related: DELETE /api/v1/analysis/{analysis_id}/cancel
+-- Purpose: Record analyses stopped by the user so their jobs are skipped or aborted
+
+BEGIN;
+
+-- ============================================================================
+-- SECTION 1: Status constraint
+-- ============================================================================
+
+ALTER TABLE review_requests DROP CONSTRAINT IF EXISTS chk_review_requests_status;
+ALTER TABLE review_requests ADD CONSTRAINT chk_review_requests_status
+    CHECK (status IN ('pending', 'processing', 'completed', 'failed', 'cancelled'));
+
+-- ============================================================================
+-- SECTION 2: Verify schema
+-- ============================================================================
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'chk_review_requests_status'
+        AND pg_get_constraintdef(oid) LIKE '%cancelled%'
+    ) THEN
+        RAISE EXCEPTION 'chk_review_requests_status does not allow cancelled.';
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
+
+-- Record this migration
+INSERT INTO schema_migrations (version) VALUES ('014_add_review_request_cancelled_status')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- Rollback Migration 014: Remove 'cancelled' review request status
+-- Date: 2025-10-21
+
+BEGIN;
+
+-- Cancelled requests become failed so the original constraint holds
+UPDATE review_requests SET status = 'failed' WHERE status = 'cancelled';
+
+ALTER TABLE review_requests DROP CONSTRAINT IF EXISTS chk_review_requests_status;
+ALTER TABLE review_requests ADD CONSTRAINT chk_review_requests_status
+    CHECK (status IN ('pending', 'processing', 'completed', 'failed'));
+
+DELETE FROM schema_migrations WHERE version = '014_add_review_request_cancelled_status';
+
+COMMIT;
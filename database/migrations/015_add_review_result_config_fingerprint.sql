@@ -0,0 +1,48 @@
+-- Migration: 015_add_review_result_config_fingerprint
+-- Description: Record the AI config/prompt fingerprint each review result was produced with
+-- Date: 2025-10-21
+-- Related: ai_agents/config/registry.py (hot-reloadable config registry)
+-- Purpose: Compare and filter results by the exact agents.yaml, industries.yaml and prompt files used
+
+BEGIN;
+
+-- ============================================================================
+-- SECTION 1: New column
+-- ============================================================================
+
+-- 1.1: Combined fingerprint of the config and prompt files (NULL for older results)
+ALTER TABLE review_results ADD COLUMN IF NOT EXISTS config_fingerprint VARCHAR(64);
+
+-- ============================================================================
+-- SECTION 2: Indexes
+-- ============================================================================
+
+-- 2.1: Results per config version (A/B comparison of prompt changes)
+CREATE INDEX IF NOT EXISTS idx_review_results_config_fingerprint
+    ON review_results (config_fingerprint, created_at DESC)
+    WHERE config_fingerprint IS NOT NULL;
+
+-- ============================================================================
+-- SECTION 3: Verify schema
+-- ============================================================================
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'review_results'
+        AND column_name = 'config_fingerprint'
+    ) THEN
+        RAISE EXCEPTION 'review_results.config_fingerprint was not created.';
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
+
+-- Record this migration
+INSERT INTO schema_migrations (version) VALUES ('015_add_review_result_config_fingerprint')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
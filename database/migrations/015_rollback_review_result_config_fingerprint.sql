@@ -0,0 +1,12 @@
+-- Rollback Migration 015: Remove review result config fingerprints
+-- Date: 2025-10-21
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_review_results_config_fingerprint;
+
+ALTER TABLE review_results DROP COLUMN IF EXISTS config_fingerprint;
+
+DELETE FROM schema_migrations WHERE version = '015_add_review_result_config_fingerprint';
+
+COMMIT;
@@ -0,0 +1,41 @@
+-- Migration: 016_add_resume_text_metrics
+-- Description: Store deterministic text metrics on resumes at upload time
+-- Date: 2025-10-21
+-- Related: backend/app/features/resume_upload/text_metrics.py (local pre-analysis)
+-- Purpose: Word counts, sections, bullets, quantified achievements and dates are computed once
+--          locally and passed to the AI agents instead of being asked from the LLM
+
+BEGIN;
+
+-- ============================================================================
+-- SECTION 1: New column
+-- ============================================================================
+
+-- 1.1: Metrics computed from extracted_text (NULL for resumes uploaded earlier;
+--      resumes.word_count holds the Japanese-aware word count)
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS text_metrics JSON;
+
+-- ============================================================================
+-- SECTION 2: Verify schema
+-- ============================================================================
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'resumes'
+        AND column_name = 'text_metrics'
+    ) THEN
+        RAISE EXCEPTION 'resumes.text_metrics was not created.';
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
+
+-- Record this migration
+INSERT INTO schema_migrations (version) VALUES ('016_add_resume_text_metrics')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
@@ -0,0 +1,10 @@
+-- Rollback Migration 016: Remove resume text metrics
+-- Date: 2025-10-21
+
+BEGIN;
+
+ALTER TABLE resumes DROP COLUMN IF EXISTS text_metrics;
+
+DELETE FROM schema_migrations WHERE version = '016_add_resume_text_metrics';
+
+COMMIT;
@@ -0,0 +1,109 @@
+-- Migration: 017_add_resume_contents
+-- Description: Store extracted resume text once per distinct file (SHA-256) with reference counting
+-- Date: 2025-10-21
+-- Related: database/models/content.py, backend/app/features/resume_upload/service.py
+-- Purpose: Re-uploads of an identical file (new version, other candidate) reuse the stored
+--          extraction instead of parsing the file again, and the text is not stored per resume
+
+BEGIN;
+
+-- ============================================================================
+-- SECTION 1: Content table
+-- ============================================================================
+
+-- 1.1: One row per distinct uploaded file
+CREATE TABLE IF NOT EXISTS resume_contents (
+    file_hash VARCHAR(64) PRIMARY KEY,
+    extracted_text TEXT NOT NULL,
+    sections JSON,
+    text_metrics JSON,
+    reference_count INTEGER NOT NULL DEFAULT 0 CHECK (reference_count >= 0),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+COMMENT ON TABLE resume_contents IS 'Extracted text, sections and metrics per distinct file hash, shared by resumes';
+COMMENT ON COLUMN resume_contents.reference_count IS 'Number of resumes with this file_hash, maintained by trigger';
+
+-- ============================================================================
+-- SECTION 2: Backfill from existing resumes
+-- ============================================================================
+
+-- 2.1: Latest extraction per file hash (identical files extract identically)
+INSERT INTO resume_contents (file_hash, extracted_text, text_metrics)
+SELECT DISTINCT ON (file_hash) file_hash, extracted_text, text_metrics
+FROM resumes
+WHERE extracted_text IS NOT NULL
+ORDER BY file_hash, uploaded_at DESC
+ON CONFLICT (file_hash) DO NOTHING;
+
+-- 2.2: Reference counts
+UPDATE resume_contents c
+SET reference_count = (SELECT COUNT(*) FROM resumes r WHERE r.file_hash = c.file_hash);
+
+-- ============================================================================
+-- SECTION 3: Reference counting trigger
+-- ============================================================================
+
+-- 3.1: Count resumes per content row; drop content no resume references anymore
+--      (also runs for resumes deleted by the candidates cascade)
+CREATE OR REPLACE FUNCTION maintain_resume_content_refs()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE resume_contents
+        SET reference_count = reference_count - 1
+        WHERE file_hash = OLD.file_hash;
+
+        DELETE FROM resume_contents
+        WHERE file_hash = OLD.file_hash AND reference_count = 0;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE resume_contents
+        SET reference_count = reference_count + 1
+        WHERE file_hash = NEW.file_hash;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_resume_content_refs ON resumes;
+CREATE TRIGGER trg_resume_content_refs
+    AFTER INSERT OR DELETE OR UPDATE OF file_hash ON resumes
+    FOR EACH ROW EXECUTE FUNCTION maintain_resume_content_refs();
+
+-- ============================================================================
+-- SECTION 4: Verify data integrity
+-- ============================================================================
+
+DO $$
+DECLARE
+    missing_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO missing_count
+    FROM resumes r
+    WHERE r.extracted_text IS NOT NULL
+    AND NOT EXISTS (SELECT 1 FROM resume_contents c WHERE c.file_hash = r.file_hash);
+
+    IF missing_count > 0 THEN
+        RAISE EXCEPTION 'Found % resumes without stored content after backfill.', missing_count;
+    END IF;
+END $$;
+
+-- ============================================================================
+-- SECTION 5: Drop the per-resume copy of the text
+-- ============================================================================
+
+-- 5.1: resumes.extracted_text is now read from resume_contents
+ALTER TABLE resumes DROP COLUMN IF EXISTS extracted_text;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
+
+-- Record this migration
+INSERT INTO schema_migrations (version) VALUES ('017_add_resume_contents')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
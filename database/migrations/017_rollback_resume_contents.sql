@@ -0,0 +1,20 @@
+-- Rollback Migration 017: Move extracted text back onto resumes
+-- Date: 2025-10-21
+
+BEGIN;
+
+ALTER TABLE resumes ADD COLUMN IF NOT EXISTS extracted_text TEXT;
+
+UPDATE resumes r
+SET extracted_text = c.extracted_text
+FROM resume_contents c
+WHERE c.file_hash = r.file_hash;
+
+DROP TRIGGER IF EXISTS trg_resume_content_refs ON resumes;
+DROP FUNCTION IF EXISTS maintain_resume_content_refs();
+
+DROP TABLE IF EXISTS resume_contents;
+
+DELETE FROM schema_migrations WHERE version = '017_add_resume_contents';
+
+COMMIT;
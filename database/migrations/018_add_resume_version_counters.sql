@@ -0,0 +1,121 @@
+-- Migration: 018_add_resume_version_counters
+-- Description: Assign resume version numbers atomically on insert from a per-candidate counter
+-- Date: 2025-10-21
+-- Related: database/models/resume.py, backend/app/features/resume_upload/service.py
+-- Purpose: Version numbers were computed by the API (read latest version, then insert), so
+--          concurrent uploads for one candidate could get the same version. The insert now
+--          takes the next version from a counter row (row-locked upsert with RETURNING) and a
+--          unique constraint guarantees one resume per (candidate, version)
+
+BEGIN;
+
+-- ============================================================================
+-- SECTION 1: Resolve duplicate versions from earlier races
+-- ============================================================================
+
+-- 1.1: The earliest upload keeps the version; later duplicates move past the
+--      candidate's highest version, in upload order
+WITH ranked AS (
+    SELECT
+        id,
+        candidate_id,
+        uploaded_at,
+        ROW_NUMBER() OVER (PARTITION BY candidate_id, version_number ORDER BY uploaded_at, id) AS copy_number,
+        MAX(version_number) OVER (PARTITION BY candidate_id) AS max_version
+    FROM resumes
+),
+renumbered AS (
+    SELECT
+        id,
+        max_version + ROW_NUMBER() OVER (PARTITION BY candidate_id ORDER BY uploaded_at, id) AS new_version
+    FROM ranked
+    WHERE copy_number > 1
+)
+UPDATE resumes r
+SET version_number = renumbered.new_version
+FROM renumbered
+WHERE r.id = renumbered.id;
+
+-- ============================================================================
+-- SECTION 2: Unique version per candidate
+-- ============================================================================
+
+-- 2.1: Also serves "latest version of a candidate" lookups
+ALTER TABLE resumes DROP CONSTRAINT IF EXISTS uq_resumes_candidate_version;
+ALTER TABLE resumes ADD CONSTRAINT uq_resumes_candidate_version UNIQUE (candidate_id, version_number);
+
+-- ============================================================================
+-- SECTION 3: Per-candidate version counters
+-- ============================================================================
+
+-- 3.1: One counter row per candidate with resumes
+CREATE TABLE IF NOT EXISTS resume_version_counters (
+    candidate_id UUID PRIMARY KEY REFERENCES candidates(id) ON DELETE CASCADE,
+    last_version INTEGER NOT NULL CHECK (last_version >= 0)
+);
+
+COMMENT ON TABLE resume_version_counters IS 'Last resume version number assigned per candidate, maintained by trigger';
+
+-- 3.2: Start from the current highest versions
+INSERT INTO resume_version_counters (candidate_id, last_version)
+SELECT candidate_id, MAX(version_number)
+FROM resumes
+GROUP BY candidate_id
+ON CONFLICT (candidate_id) DO UPDATE SET last_version = EXCLUDED.last_version;
+
+-- ============================================================================
+-- SECTION 4: Version assignment trigger
+-- ============================================================================
+
+-- 4.1: Take the next version in the insert itself. The upsert locks the
+--      candidate's counter row until commit, so concurrent uploads for the
+--      same candidate get consecutive versions; any version given by the
+--      caller is replaced. Versions of deleted resumes are not reused.
+CREATE OR REPLACE FUNCTION assign_resume_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO resume_version_counters AS c (candidate_id, last_version)
+    VALUES (NEW.candidate_id, 1)
+    ON CONFLICT (candidate_id) DO UPDATE SET last_version = c.last_version + 1
+    RETURNING c.last_version INTO NEW.version_number;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_assign_resume_version ON resumes;
+CREATE TRIGGER trg_assign_resume_version
+    BEFORE INSERT ON resumes
+    FOR EACH ROW EXECUTE FUNCTION assign_resume_version();
+
+-- ============================================================================
+-- SECTION 5: Verify data integrity
+-- ============================================================================
+
+DO $$
+DECLARE
+    behind_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO behind_count
+    FROM (
+        SELECT candidate_id, MAX(version_number) AS max_version
+        FROM resumes
+        GROUP BY candidate_id
+    ) v
+    LEFT JOIN resume_version_counters c ON c.candidate_id = v.candidate_id
+    WHERE c.last_version IS NULL OR c.last_version < v.max_version;
+
+    IF behind_count > 0 THEN
+        RAISE EXCEPTION 'Found % candidates whose version counter is behind their resumes.', behind_count;
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
+
+-- Record this migration
+INSERT INTO schema_migrations (version) VALUES ('018_add_resume_version_counters')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
@@ -0,0 +1,16 @@
+-- Rollback Migration 018: Back to API-computed resume version numbers
+-- Date: 2025-10-21
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS trg_assign_resume_version ON resumes;
+DROP FUNCTION IF EXISTS assign_resume_version();
+
+DROP TABLE IF EXISTS resume_version_counters;
+
+-- Renumbered duplicates (section 1 of the migration) keep their new versions
+ALTER TABLE resumes DROP CONSTRAINT IF EXISTS uq_resumes_candidate_version;
+
+DELETE FROM schema_migrations WHERE version = '018_add_resume_version_counters';
+
+COMMIT;
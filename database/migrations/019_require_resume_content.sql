@@ -0,0 +1,51 @@
+-- Migration: 019_require_resume_content
+-- Description: Reject resumes whose content row does not exist instead of leaving them without text
+-- Date: 2025-10-22
+-- Related: database/migrations/017_add_resume_contents.sql, backend/app/features/resume_upload/repository.py
+-- Purpose: A content row can be deleted (its last resume removed) between the upload's content
+--          upsert and its resume INSERT; the upsert now locks the row, and the trigger fails
+--          loudly if the row is gone anyway rather than counting a reference to nothing
+
+BEGIN;
+
+-- ============================================================================
+-- SECTION 1: Reference counting trigger
+-- ============================================================================
+
+-- 1.1: Same as 017, but an INSERT or UPDATE must find the content row
+CREATE OR REPLACE FUNCTION maintain_resume_content_refs()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE resume_contents
+        SET reference_count = reference_count - 1
+        WHERE file_hash = OLD.file_hash;
+
+        DELETE FROM resume_contents
+        WHERE file_hash = OLD.file_hash AND reference_count = 0;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE resume_contents
+        SET reference_count = reference_count + 1
+        WHERE file_hash = NEW.file_hash;
+
+        IF NOT FOUND THEN
+            RAISE EXCEPTION 'No resume_contents row for file_hash %', NEW.file_hash
+                USING ERRCODE = 'foreign_key_violation';
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
+
+-- Record this migration
+INSERT INTO schema_migrations (version) VALUES ('019_require_resume_content')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
@@ -0,0 +1,31 @@
+-- Rollback Migration 019: Count content references without requiring the content row
+-- Date: 2025-10-22
+
+BEGIN;
+
+-- Function as created by 017
+CREATE OR REPLACE FUNCTION maintain_resume_content_refs()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE resume_contents
+        SET reference_count = reference_count - 1
+        WHERE file_hash = OLD.file_hash;
+
+        DELETE FROM resume_contents
+        WHERE file_hash = OLD.file_hash AND reference_count = 0;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE resume_contents
+        SET reference_count = reference_count + 1
+        WHERE file_hash = NEW.file_hash;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DELETE FROM schema_migrations WHERE version = '019_require_resume_content';
+
+COMMIT;
@@ -0,0 +1,101 @@
+-- Migration: 020_recount_resume_content_refs
+-- Description: Recount resume_contents.reference_count from resumes instead of incrementing it
+-- Date: 2025-10-23
+-- Related: database/migrations/017_add_resume_contents.sql, database/migrations/019_require_resume_content.sql
+-- Purpose: Resumes without extracted text at the 017 backfill (pending, failed) have no content
+--          row and were never counted, so deleting one after a re-upload of the same file
+--          decremented the new row to zero and dropped the live resume's text. Counts are now
+--          recomputed per hash, and an UPDATE that keeps the same hash no longer touches them
+
+BEGIN;
+
+-- ============================================================================
+-- SECTION 1: Reference counting trigger
+-- ============================================================================
+
+-- 1.1: Recount the affected hashes. The content row is locked first, so the count
+--      (a new statement, hence a new snapshot) sees every resume committed by
+--      transactions that held the lock before us
+CREATE OR REPLACE FUNCTION maintain_resume_content_refs()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM 1 FROM resume_contents WHERE file_hash = OLD.file_hash FOR UPDATE;
+
+        IF FOUND THEN
+            UPDATE resume_contents
+            SET reference_count = (SELECT COUNT(*) FROM resumes WHERE file_hash = OLD.file_hash)
+            WHERE file_hash = OLD.file_hash;
+
+            DELETE FROM resume_contents
+            WHERE file_hash = OLD.file_hash AND reference_count = 0;
+        END IF;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM 1 FROM resume_contents WHERE file_hash = NEW.file_hash FOR UPDATE;
+
+        IF NOT FOUND THEN
+            RAISE EXCEPTION 'No resume_contents row for file_hash %', NEW.file_hash
+                USING ERRCODE = 'foreign_key_violation';
+        END IF;
+
+        UPDATE resume_contents
+        SET reference_count = (SELECT COUNT(*) FROM resumes WHERE file_hash = NEW.file_hash)
+        WHERE file_hash = NEW.file_hash;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 1.2: Updates only fire when the hash actually changes
+DROP TRIGGER IF EXISTS trg_resume_content_refs ON resumes;
+CREATE TRIGGER trg_resume_content_refs
+    AFTER INSERT OR DELETE ON resumes
+    FOR EACH ROW EXECUTE FUNCTION maintain_resume_content_refs();
+
+DROP TRIGGER IF EXISTS trg_resume_content_refs_update ON resumes;
+CREATE TRIGGER trg_resume_content_refs_update
+    AFTER UPDATE OF file_hash ON resumes
+    FOR EACH ROW
+    WHEN (OLD.file_hash IS DISTINCT FROM NEW.file_hash)
+    EXECUTE FUNCTION maintain_resume_content_refs();
+
+-- ============================================================================
+-- SECTION 2: Repair existing counts
+-- ============================================================================
+
+-- 2.1: Count every resume per hash, including those never counted before
+UPDATE resume_contents c
+SET reference_count = (SELECT COUNT(*) FROM resumes r WHERE r.file_hash = c.file_hash);
+
+-- 2.2: Content no resume references anymore
+DELETE FROM resume_contents WHERE reference_count = 0;
+
+-- ============================================================================
+-- SECTION 3: Verify data integrity
+-- ============================================================================
+
+DO $$
+DECLARE
+    wrong_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO wrong_count
+    FROM resume_contents c
+    WHERE c.reference_count <> (SELECT COUNT(*) FROM resumes r WHERE r.file_hash = c.file_hash);
+
+    IF wrong_count > 0 THEN
+        RAISE EXCEPTION 'Found % resume_contents rows with a wrong reference_count.', wrong_count;
+    END IF;
+END $$;
+
+-- ============================================================================
+-- Migration Complete
+-- ============================================================================
+
+-- Record this migration
+INSERT INTO schema_migrations (version) VALUES ('020_recount_resume_content_refs')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
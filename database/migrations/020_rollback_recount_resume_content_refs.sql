@@ -0,0 +1,46 @@
+-- Rollback Migration 020: Back to incremental reference counting
+-- Date: 2025-10-23
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS trg_resume_content_refs_update ON resumes;
+DROP TRIGGER IF EXISTS trg_resume_content_refs ON resumes;
+
+-- Function as created by 019
+CREATE OR REPLACE FUNCTION maintain_resume_content_refs()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE resume_contents
+        SET reference_count = reference_count - 1
+        WHERE file_hash = OLD.file_hash;
+
+        DELETE FROM resume_contents
+        WHERE file_hash = OLD.file_hash AND reference_count = 0;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE resume_contents
+        SET reference_count = reference_count + 1
+        WHERE file_hash = NEW.file_hash;
+
+        IF NOT FOUND THEN
+            RAISE EXCEPTION 'No resume_contents row for file_hash %', NEW.file_hash
+                USING ERRCODE = 'foreign_key_violation';
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Trigger as created by 017
+CREATE TRIGGER trg_resume_content_refs
+    AFTER INSERT OR DELETE OR UPDATE OF file_hash ON resumes
+    FOR EACH ROW EXECUTE FUNCTION maintain_resume_content_refs();
+
+-- Recounted rows (section 2 of the migration) keep their corrected counts
+
+DELETE FROM schema_migrations WHERE version = '020_recount_resume_content_refs';
+
+COMMIT;
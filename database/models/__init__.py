@@ -15,7 +15,8 @@ Base = declarative_base()
 # This must be done after Base is created to avoid circular imports
 from .auth import User, RefreshToken
 from .candidate import Candidate
-from .assignment import UserCandidateAssignment
+from .assignment import UserCandidateAssignment, UserAssignmentStats
+from .content import ResumeContent
 from .resume import Resume, ResumeStatus
 from .section import ResumeSection, SectionType
 from .review import ReviewRequest, ReviewResult, ReviewFeedbackItem, ReviewStatus, FeedbackType, FeedbackCategory
@@ -32,6 +33,8 @@ __all__ = [
     # New candidate-centric models
     "Candidate",
     "UserCandidateAssignment", 
+    "UserAssignmentStats",
+    "ResumeContent",
     "Resume",
     "ResumeStatus",
     "ResumeSection",
@@ -9,7 +9,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, validates
 
@@ -77,4 +77,22 @@ class UserCandidateAssignment(Base):
     
     def __repr__(self) -> str:
         status = "Active" if self.is_currently_active else "Inactive"
-        return f"<UserCandidateAssignment(user_id={self.user_id}, candidate_id={self.candidate_id}, type='{self.assignment_type}', status='{status}')>"
\ No newline at end of file
+        return f"<UserCandidateAssignment(user_id={self.user_id}, candidate_id={self.candidate_id}, type='{self.assignment_type}', status='{status}')>"
+
+
+class UserAssignmentStats(Base):
+    """
+    Denormalized per-user assignment counters.
+    
+    Maintained by the trg_user_assignment_stats trigger on
+    user_candidate_assignments (migration 009); read-only from the application.
+    """
+    
+    __tablename__ = 'user_assignment_stats'
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    active_assignment_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+    
+    def __repr__(self) -> str:
+        return f"<UserAssignmentStats(user_id={self.user_id}, active={self.active_assignment_count})>"
@@ -11,7 +11,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 from enum import Enum
 
-from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, ForeignKey, Computed
 from sqlalchemy.dialects.postgresql import UUID as PostgreSQLUUID
 from sqlalchemy.orm import validates, relationship
 
@@ -56,6 +56,12 @@ class User(Base):
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
     
+    # Lower-cased email + name, trigram indexed for search (migration 009)
+    search_text = Column(
+        Text,
+        Computed("lower(email || ' ' || first_name || ' ' || last_name)", persisted=True)
+    )
+    
     # Account status and permissions
     role = Column(String(50), nullable=False, default=UserRole.JUNIOR_RECRUITER.value)
     is_active = Column(Boolean, nullable=False, default=True)
@@ -8,7 +8,7 @@ import uuid
 from datetime import datetime
 from typing import Optional, List
 
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, Computed
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, validates
 
@@ -40,6 +40,14 @@ class Candidate(Base):
     current_position = Column(String(255), nullable=True)  # Note: DB has 'current_position' not 'current_role'
     years_experience = Column(Integer, nullable=True)
     status = Column(String(20), default='active')  # active, placed, archived
+    # Lower-cased email + name + company, trigram indexed for search (migration 009)
+    search_text = Column(
+        Text,
+        Computed(
+            "lower(coalesce(email, '') || ' ' || first_name || ' ' || last_name || ' ' || coalesce(current_company, ''))",
+            persisted=True
+        )
+    )
     created_by_user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False)
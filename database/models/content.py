@@ -0,0 +1,37 @@
+"""
+Resume content database model.
+
+Contains the ResumeContent model: extracted text and derived data stored once
+per distinct file (SHA-256), shared by every resume uploaded with that file.
+"""
+
+from sqlalchemy import Column, String, Integer, Text, DateTime, JSON
+
+from . import Base
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from app.core.datetime_utils import utc_now
+
+
+class ResumeContent(Base):
+    """
+    Deduplicated extraction results keyed by file hash.
+
+    An upload of a file whose hash is already here reuses the stored text,
+    sections and metrics instead of parsing the file again. reference_count
+    is recounted from resumes by the trg_resume_content_refs triggers
+    (migrations 017 and 020), which also remove the row once no resume uses it.
+    """
+
+    __tablename__ = "resume_contents"
+
+    file_hash = Column(String(64), primary_key=True)  # SHA-256 of the uploaded file
+    extracted_text = Column(Text, nullable=False)
+    sections = Column(JSON, nullable=True)  # segment_resume output (with page numbers)
+    text_metrics = Column(JSON, nullable=True)  # compute_text_metrics output
+    reference_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ResumeContent(file_hash={self.file_hash[:12]}, references={self.reference_count})>"
@@ -9,11 +9,12 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, Boolean
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, JSON, FetchedValue, UniqueConstraint, select
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import column_property, relationship, validates
 
 from . import Base
+from .content import ResumeContent
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
@@ -40,6 +41,11 @@ class Resume(Base):
     """
     
     __tablename__ = "resumes"
+    __table_args__ = (
+        UniqueConstraint('candidate_id', 'version_number', name='uq_resumes_candidate_version'),
+    )
+    # Return trigger-assigned version numbers from the INSERT itself
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     candidate_id = Column(UUID(as_uuid=True), ForeignKey('candidates.id'), nullable=False)
@@ -49,11 +55,21 @@ class Resume(Base):
     file_hash = Column(String(64), nullable=False)  # SHA-256 hash - allows duplicates for resume iterations
     file_size = Column(Integer, nullable=False)
     mime_type = Column(String(100), nullable=False)
-    version_number = Column(Integer, default=1, nullable=False)  # Version tracking
+    # Assigned on insert by the trg_assign_resume_version trigger from the
+    # per-candidate counter in resume_version_counters (migration 018)
+    version_number = Column(Integer, server_default=FetchedValue(), nullable=False)
     status = Column(String(20), default='pending')
     progress = Column(Integer, default=0)  # 0-100 processing progress
-    extracted_text = Column(Text, nullable=True)
+    # Stored once per file in resume_contents (read-only here)
+    extracted_text = column_property(
+        select(ResumeContent.extracted_text)
+        .where(ResumeContent.file_hash == file_hash)
+        .correlate_except(ResumeContent)
+        .scalar_subquery()
+    )
     word_count = Column(Integer, nullable=True)
+    text_metrics = Column(JSON, nullable=True)  # Deterministic metrics (app.features.resume_upload.text_metrics)
+    search_vector = Column(TSVECTOR, nullable=True)  # Lexemes from app.features.search.tokenizer
     uploaded_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
     processed_at = Column(DateTime(timezone=True), nullable=True)
     
@@ -96,10 +112,9 @@ class Resume(Base):
         return self.original_filename.split('.')[-1].lower() if '.' in self.original_filename else ''
     
     def mark_completed(self, extracted_text: str, word_count: Optional[int] = None) -> None:
-        """Mark resume as completed with extracted content."""
+        """Mark resume as completed (the text itself is stored in resume_contents)."""
         self.status = 'completed'
         self.progress = 100
-        self.extracted_text = extracted_text
         self.word_count = word_count or len(extracted_text.split())
         self.processed_at = utc_now()
     
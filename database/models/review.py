@@ -26,6 +26,7 @@ class ReviewStatus(str, Enum):
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
 class ExperienceLevel(str, Enum):
@@ -78,6 +79,8 @@ class ReviewRequest(Base):
     status = Column(String(20), default='pending')
     requested_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
     completed_at = Column(DateTime(timezone=True), nullable=True)
+    prompt_version = Column(String(20), nullable=True)  # AI prompt version used (e.g. 'v1.1')
+    idempotency_key = Column(String(255), nullable=True)  # Client Idempotency-Key, unique per user
     
     # Relationships
     resume = relationship("Resume", back_populates="review_requests")
@@ -87,7 +90,7 @@ class ReviewRequest(Base):
     @validates('status')
     def validate_status(self, key, status):
         """Validate review status."""
-        allowed_statuses = ['pending', 'processing', 'completed', 'failed']
+        allowed_statuses = ['pending', 'processing', 'completed', 'failed', 'cancelled']
         if status not in allowed_statuses:
             raise ValueError(f"Status must be one of: {', '.join(allowed_statuses)}")
         return status
@@ -148,6 +151,7 @@ class ReviewResult(Base):
     raw_ai_response = Column(JSONB, nullable=True, doc="Complete raw AI response JSON for flexible frontend processing")
     ai_model_used = Column(String(100), nullable=True)
     processing_time_ms = Column(Integer, nullable=True)
+    config_fingerprint = Column(String(64), nullable=True)  # AI config and prompt files the result was produced with
     created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
     
     # Relationships
@@ -183,7 +187,7 @@ class ReviewFeedbackItem(Base):
     review_result_id = Column(UUID(as_uuid=True), ForeignKey('review_results.id'), nullable=False)
     resume_section_id = Column(UUID(as_uuid=True), ForeignKey('resume_sections.id'), nullable=True)  # Optional - some feedback is general
     feedback_type = Column(String(20), nullable=False)  # strength, weakness, suggestion, error
-    category = Column(String(20), nullable=False)  # content, formatting, keywords, grammar
+    category = Column(String(20), nullable=False)  # content, formatting, keywords, grammar, or an AI agent category
     feedback_text = Column(Text, nullable=False)
     severity_level = Column(Integer, default=3)  # 1-5 (1=minor, 5=critical)
     original_text = Column(Text, nullable=True)  # Text being referenced
@@ -205,7 +209,10 @@ class ReviewFeedbackItem(Base):
     @validates('category')
     def validate_category(self, key, category):
         """Validate feedback category."""
-        allowed_categories = ['content', 'formatting', 'keywords', 'grammar']
+        allowed_categories = [
+            'content', 'formatting', 'keywords', 'grammar',
+            'structure', 'scr_framework', 'quantitative_impact', 'appeal_point'
+        ]
         if category not in allowed_categories:
             raise ValueError(f"Category must be one of: {', '.join(allowed_categories)}")
         return category
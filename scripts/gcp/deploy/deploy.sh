@@ -548,6 +548,9 @@ PROJECT_ID: "$PROJECT_ID"
 ENVIRONMENT: "$env_name"
 REDIS_HOST: "none"
 ALLOWED_ORIGINS: "$ALLOWED_ORIGINS"
+WARMUP_LLM_KEEPALIVE: "true"
+BLOB_STORE_BACKEND: "gcs"
+BLOB_STORE_GCS_BUCKET: "$BLOB_STORE_GCS_BUCKET"
 EOF
     log_info "Created environment variables file: $ENV_VARS_FILE"
 
@@ -567,6 +570,8 @@ EOF
         --max-instances=5 \
         --concurrency=20 \
         --timeout=600 \
+        --startup-probe="httpGet.path=/health/startup,initialDelaySeconds=0,periodSeconds=2,timeoutSeconds=2,failureThreshold=60" \
+        --liveness-probe="httpGet.path=/health/live,periodSeconds=30,timeoutSeconds=5,failureThreshold=3" \
         --allow-unauthenticated \
         --project="$PROJECT_ID" \
         --quiet
@@ -15,7 +15,7 @@
 #   ./setup.sh --dry-run             # Preview all steps
 #
 # What it does:
-#   1. GCP Project Setup (Service Accounts, IAM, VPC, Artifact Registry)
+#   1. GCP Project Setup (Service Accounts, IAM, Artifact Registry, Storage bucket, VPC)
 #   2. Cloud SQL Setup (PostgreSQL instance, database, VPC peering)
 #   3. Secrets Setup (OpenAI API key, JWT secret, DB password)
 #
@@ -203,7 +203,35 @@ step_project_setup() {
         fi
     fi
 
-    # 1.4: VPC Network
+    # 1.4: Storage bucket for original resume files
+    log_info "Creating storage bucket for original files..."
+
+    if [ "$DRY_RUN" = true ]; then
+        log_info "[DRY-RUN] Would create bucket: gs://$BLOB_STORE_GCS_BUCKET"
+        log_info "[DRY-RUN] Would grant roles/storage.objectAdmin on the bucket to $BACKEND_SA"
+    else
+        if gcloud storage buckets describe "gs://$BLOB_STORE_GCS_BUCKET" --project="$PROJECT_ID" &>/dev/null; then
+            log_warning "Storage bucket already exists: $BLOB_STORE_GCS_BUCKET"
+        else
+            gcloud storage buckets create "gs://$BLOB_STORE_GCS_BUCKET" \
+                --location="$REGION" \
+                --uniform-bucket-level-access \
+                --public-access-prevention \
+                --project="$PROJECT_ID" \
+                --quiet
+            log_success "Created storage bucket: $BLOB_STORE_GCS_BUCKET"
+        fi
+
+        # Bucket-level binding: the backend only gets access to this bucket
+        gcloud storage buckets add-iam-policy-binding "gs://$BLOB_STORE_GCS_BUCKET" \
+            --member="serviceAccount:${BACKEND_SA}@${PROJECT_ID}.iam.gserviceaccount.com" \
+            --role="roles/storage.objectAdmin" \
+            --project="$PROJECT_ID" \
+            --quiet &>/dev/null
+        log_success "Assigned roles/storage.objectAdmin on $BLOB_STORE_GCS_BUCKET to $BACKEND_SA"
+    fi
+
+    # 1.5: VPC Network
     log_info "Creating VPC network..."
 
     if [ "$DRY_RUN" = true ]; then
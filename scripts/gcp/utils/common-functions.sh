@@ -37,6 +37,7 @@ export VPC_CONNECTOR="ai-resume-connector-v2"
 export SQL_INSTANCE_NAME="ai-resume-review-v2-db-prod"
 export SQL_INSTANCE_CONNECTION="$PROJECT_ID:$REGION:$SQL_INSTANCE_NAME"
 export ARTIFACT_REGISTRY="us-central1-docker.pkg.dev/$PROJECT_ID/ai-resume-review-v2"
+export BLOB_STORE_GCS_BUCKET="${PROJECT_ID}-ai-resume-review-v2-originals"
 
 # Database
 export DB_NAME="ai_resume_review_prod"
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Import-time profile of the backend (Cloud Run cold start).
+
+Imports app.main in a fresh interpreter with ``python -X importtime`` and
+reports the slowest top-level packages and modules, so heavy imports that
+belong behind a lazy import are easy to spot.
+
+Usage:
+    python scripts/gcp/utils/profile_startup.py [--top N] [--module app.main]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+backend_dir = project_root / "backend"
+
+
+def run_importtime(module: str) -> List[Tuple[str, int, int]]:
+    """
+    Import a module in a fresh interpreter and collect -X importtime output.
+
+    Args:
+        module: Module to import (e.g. "app.main")
+
+    Returns:
+        (module name, self microseconds, cumulative microseconds) per import
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(backend_dir), str(project_root), env.get("PYTHONPATH", "")]
+    ).rstrip(os.pathsep)
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=backend_dir,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr[-2000:], file=sys.stderr)
+        raise SystemExit(f"Importing {module} failed")
+
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if not self_us.isdigit():
+            continue  # Header line
+        imports.append((name.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def summarize(imports: List[Tuple[str, int, int]], top: int) -> None:
+    """Print the total and the slowest packages and modules."""
+    total_us = sum(self_us for _, self_us, _ in imports)
+
+    per_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in imports:
+        per_package[name.split(".")[0]] += self_us
+
+    print(f"Total import time: {total_us / 1e6:.2f}s ({len(imports)} modules)\n")
+
+    print(f"Top {top} packages (self time, all submodules):")
+    for package, self_us in sorted(per_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {self_us / 1e3:9.1f} ms  {package:<30} {self_us / total_us:6.1%}")
+
+    print(f"\nTop {top} modules (cumulative time):")
+    for name, _, cumulative_us in sorted(imports, key=lambda item: -item[2])[:top]:
+        print(f"  {cumulative_us / 1e3:9.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile backend import time")
+    parser.add_argument("--module", default="app.main", help="Module to import (default: app.main)")
+    parser.add_argument("--top", type=int, default=20, help="Number of entries to show")
+    args = parser.parse_args()
+
+    summarize(run_importtime(args.module), args.top)
+
+
+if __name__ == "__main__":
+    main()